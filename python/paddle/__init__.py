@@ -64,7 +64,6 @@ Tensor = framework.core.eager.Tensor  # noqa: F401
 Tensor.__qualname__ = 'Tensor'  # noqa: F401
 import paddle.distributed  # noqa: F401
 import paddle.sysconfig  # noqa: F401
-import paddle.distribution  # noqa: F401
 import paddle.nn  # noqa: F401
 import paddle.distributed.fleet  # noqa: F401
 import paddle.optimizer  # noqa: F401
@@ -79,13 +78,9 @@ import paddle.amp  # noqa: F401
 import paddle.dataset  # noqa: F401
 import paddle.inference  # noqa: F401
 import paddle.io  # noqa: F401
-import paddle.onnx  # noqa: F401
 import paddle.reader  # noqa: F401
 import paddle.static  # noqa: F401
 import paddle.vision  # noqa: F401
-import paddle.audio  # noqa: F401
-import paddle.geometric  # noqa: F401
-import paddle.sparse  # noqa: F401
 import paddle.quantization  # noqa: F401
 
 from .tensor.attribute import is_complex  # noqa: F401
@@ -428,7 +423,6 @@ from . import linalg  # noqa: F401
 from . import fft  # noqa: F401
 from . import signal  # noqa: F401
 
-import paddle.text  # noqa: F401
 import paddle.vision  # noqa: F401
 
 from .tensor.random import check_shape  # noqa: F401
@@ -444,6 +438,28 @@ if is_compiled_with_cinn():
         os.environ.setdefault('runtime_include_dir', runtime_include_dir)
 
 disable_static()
+
+# Subpackages which are not imported by any other module of paddle are
+# imported on first access of `paddle.<name>`, to speed up `import paddle`.
+_LAZY_SUBMODULES = frozenset(
+    ['audio', 'distribution', 'geometric', 'onnx', 'sparse', 'text']
+)
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        import importlib
+
+        module = importlib.import_module('.' + name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
+
+
 __all__ = [  # noqa
     'iinfo',
     'finfo',
@@ -17,7 +17,7 @@ from . import functional
 from . import datasets
 from . import backends
 
-from .backends.backend import info, load, save
+from .backends.backend import info, load, save, stream
 
 __all__ = [
     "functional",
@@ -27,4 +27,5 @@ __all__ = [
     "load",
     "info",
     "save",
+    "stream",
 ]
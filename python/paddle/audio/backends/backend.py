@@ -13,7 +13,7 @@
 # limitations under the License
 
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Iterator, Optional, Tuple, Union
 
 import paddle
 
@@ -73,6 +73,7 @@ def load(
     num_frames: int = -1,
     normalize: bool = True,
     channels_first: bool = True,
+    mmap: bool = False,
 ) -> Tuple[paddle.Tensor, int]:
     """Load audio data from file.Load the audio content start form frame_offset, and get num_frames.
 
@@ -85,6 +86,9 @@ def load(
 
         channels_first:
             if True: return audio with shape (channels, time)
+        mmap:
+            if True: memory map the file instead of reading it, only works for file path of PCM16 WAV.
+            Only supported by wave_backend.
 
     Return:
         Tuple[paddle.Tensor, int]: (audio_content, sample rate)
@@ -111,6 +115,57 @@ def load(
     raise NotImplementedError("please set audio backend")
 
 
+def stream(
+    filepath: Union[str, Path],
+    chunk_frames: int,
+    frame_offset: int = 0,
+    num_frames: int = -1,
+    normalize: bool = True,
+    channels_first: bool = True,
+) -> Iterator[paddle.Tensor]:
+    """Iterate audio data of a PCM16 WAV file in chunks, so that a long file is
+    processed without loading it into memory at once. Only supported by
+    wave_backend.
+
+    Args:
+        filepath: audio path or file object.
+        chunk_frames: number of frames of each chunk, the last chunk may be shorter.
+        frame_offset: from 0 to total frames,
+        num_frames: from -1 (means total frames) or number frames which want to read,
+        normalize:
+            if True: return audio which norm to (-1, 1), dtype=float32
+            if False: return audio with raw data, dtype=int16
+
+        channels_first:
+            if True: return audio with shape (channels, time)
+
+    Return:
+        Iterator[paddle.Tensor]: chunks of audio content.
+
+    Examples:
+        .. code-block:: python
+
+            import os
+            import paddle
+
+            sample_rate = 16000
+            wav_duration = 0.5
+            num_channels = 1
+            num_frames = sample_rate * wav_duration
+            wav_data = paddle.linspace(-1.0, 1.0, num_frames) * 0.1
+            waveform = wav_data.tile([num_channels, 1])
+            base_dir = os.getcwd()
+            filepath = os.path.join(base_dir, "test.wav")
+
+            paddle.audio.save(filepath, waveform, sample_rate)
+            for chunk in paddle.audio.stream(filepath, chunk_frames=1024):
+                print(chunk.shape)
+                # [1, 1024], ..., [1, 832]
+    """
+    # for API doc
+    raise NotImplementedError("please set audio backend")
+
+
 def save(
     filepath: str,
     src: paddle.Tensor,
@@ -135,6 +135,9 @@ def get_current_backend() -> str:
 def set_backend(backend_name: str):
     """Set the backend by one of the list_audio_backend return.
 
+    ``paddle.audio.stream`` and the ``mmap`` argument of ``paddle.audio.load``
+    are only supported by "wave_backend".
+
     Args:
         backend (str): one of the list_audio_backend. "wave_backend" is the default. "soundfile" imported from paddleaudio.
 
@@ -177,12 +180,26 @@ def set_backend(backend_name: str):
         paddleaudio.backends.set_audio_backend(backend_name)
         module = paddleaudio
 
-    for func in ["save", "load", "info"]:
-        setattr(backend, func, getattr(module, func))
-        setattr(paddle.audio, func, getattr(module, func))
+    for func in ["save", "load", "info", "stream"]:
+        impl = getattr(module, func, None)
+        if impl is None:
+            impl = _unsupported_func(func, backend_name)
+        setattr(backend, func, impl)
+        setattr(paddle.audio, func, impl)
+
+
+def _unsupported_func(func, backend_name):
+    def unsupported(*args, **kwargs):
+        raise NotImplementedError(
+            f"paddle.audio.{func} is not supported by {backend_name}, "
+            "please use wave_backend by "
+            "paddle.audio.backends.set_backend('wave_backend')"
+        )
+
+    return unsupported
 
 
 def _init_set_audio_backend():
     # init the default wave_backend.
-    for func in ["save", "load", "info"]:
+    for func in ["save", "load", "info", "stream"]:
         setattr(backend, func, getattr(wave_backend, func))
@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import struct
 import wave
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Iterator, Optional, Tuple, Union
 
 import numpy as np
 
@@ -34,6 +35,61 @@ def _error_message():
     return warn_msg
 
 
+def _open_wave(filepath):
+    if hasattr(filepath, 'read'):
+        file_obj = filepath
+    else:
+        file_obj = open(filepath, 'rb')
+
+    try:
+        file_ = wave.open(file_obj)
+    except wave.Error:
+        file_obj.seek(0)
+        file_obj.close()
+        err_msg = _error_message()
+        raise NotImplementedError(err_msg)
+    return file_obj, file_
+
+
+def _open_pcm16_wave(filepath):
+    file_obj, file_ = _open_wave(filepath)
+    # default_subtype = "PCM_16", only support PCM16 WAV
+    if file_.getsampwidth() != 2:
+        file_obj.close()
+        err_msg = _error_message()
+        raise NotImplementedError(err_msg)
+    return file_obj, file_
+
+
+def _data_chunk_offset(file_obj):
+    """Return the byte offset of samples in the data chunk of a WAV file."""
+    file_obj.seek(12)  # RIFF header: b'RIFF', size, b'WAVE'
+    while True:
+        header = file_obj.read(8)
+        if len(header) < 8:
+            raise NotImplementedError(_error_message())
+        chunk_id, chunk_size = struct.unpack('<4sI', header)
+        if chunk_id == b'data':
+            return file_obj.tell()
+        # chunks are aligned to 2 bytes
+        file_obj.seek(chunk_size + (chunk_size & 1), 1)
+
+
+def _to_waveform(audio_as_np16, normalize, channels_first):
+    audio_as_np32 = audio_as_np16.astype(np.float32)
+    if normalize:
+        # dtype = "float32"
+        audio_norm = audio_as_np32 / (2**15)
+    else:
+        # dtype = "int16"
+        audio_norm = audio_as_np32
+
+    waveform = paddle.to_tensor(audio_norm)
+    if channels_first:
+        waveform = paddle.transpose(waveform, perm=[1, 0])
+    return waveform
+
+
 def info(filepath: str) -> AudioInfo:
     """Get signal information of input audio file.
 
@@ -62,18 +118,7 @@ def info(filepath: str) -> AudioInfo:
             wav_info = paddle.audio.info(filepath)
     """
 
-    if hasattr(filepath, 'read'):
-        file_obj = filepath
-    else:
-        file_obj = open(filepath, 'rb')
-
-    try:
-        file_ = wave.open(file_obj)
-    except wave.Error:
-        file_obj.seek(0)
-        file_obj.close()
-        err_msg = _error_message()
-        raise NotImplementedError(err_msg)
+    file_obj, file_ = _open_wave(filepath)
 
     channels = file_.getnchannels()
     sample_rate = file_.getframerate()
@@ -92,8 +137,10 @@ def load(
     num_frames: int = -1,
     normalize: bool = True,
     channels_first: bool = True,
+    mmap: bool = False,
 ) -> Tuple[paddle.Tensor, int]:
     """Load audio data from file. load the audio content start form frame_offset, and get num_frames.
+    Only the requested frames are read from the file.
 
     Args:
         frame_offset: from 0 to total frames,
@@ -104,6 +151,9 @@ def load(
 
         channels_first:
             if True: return audio with shape (channels, time)
+        mmap:
+            if True: memory map the file instead of reading it, only works for file path.
+            Only supported by wave_backend.
 
     Return:
         Tuple[paddle.Tensor, int]: (audio_content, sample rate)
@@ -125,46 +175,128 @@ def load(
 
             paddle.audio.save(filepath, waveform, sample_rate)
             wav_data_read, sr = paddle.audio.load(filepath)
+            # read 1000 frames from the 2000th frame
+            wav_crop, sr = paddle.audio.load(
+                filepath, frame_offset=2000, num_frames=1000
+            )
     """
-    if hasattr(filepath, 'read'):
-        file_obj = filepath
-    else:
-        file_obj = open(filepath, 'rb')
-
-    try:
-        file_ = wave.open(file_obj)
-    except wave.Error:
-        file_obj.seek(0)
-        file_obj.close()
-        err_msg = _error_message()
-        raise NotImplementedError(err_msg)
+    assert frame_offset >= 0, "frame_offset should be non-negative."
+    file_obj, file_ = _open_pcm16_wave(filepath)
 
     channels = file_.getnchannels()
     sample_rate = file_.getframerate()
     frames = file_.getnframes()  # audio frame
 
-    audio_content = file_.readframes(frames)
-    file_obj.close()
+    frame_offset = min(frame_offset, frames)
+    if num_frames == -1 or frame_offset + num_frames > frames:
+        num_frames = frames - frame_offset
 
-    # default_subtype = "PCM_16", only support PCM16 WAV
-    audio_as_np16 = np.frombuffer(audio_content, dtype=np.int16)
-    audio_as_np32 = audio_as_np16.astype(np.float32)
-    if normalize:
-        # dtype = "float32"
-        audio_norm = audio_as_np32 / (2**15)
+    if mmap and not hasattr(filepath, 'read') and num_frames > 0:
+        data_offset = _data_chunk_offset(file_obj)
+        file_obj.close()
+        audio_as_np16 = np.memmap(
+            filepath,
+            dtype='<i2',
+            mode='r',
+            offset=data_offset + frame_offset * channels * 2,
+            shape=(num_frames, channels),
+        )
     else:
-        # dtype = "int16"
-        audio_norm = audio_as_np32
+        file_.setpos(frame_offset)
+        audio_content = file_.readframes(num_frames)
+        file_obj.close()
+        audio_as_np16 = np.frombuffer(audio_content, dtype=np.int16)
+        audio_as_np16 = np.reshape(audio_as_np16, (-1, channels))
 
-    waveform = np.reshape(audio_norm, (frames, channels))
-    if num_frames != -1:
-        waveform = waveform[frame_offset : frame_offset + num_frames, :]
-    waveform = paddle.to_tensor(waveform)
-    if channels_first:
-        waveform = paddle.transpose(waveform, perm=[1, 0])
+    waveform = _to_waveform(audio_as_np16, normalize, channels_first)
     return waveform, sample_rate
 
 
+def stream(
+    filepath: Union[str, Path],
+    chunk_frames: int,
+    frame_offset: int = 0,
+    num_frames: int = -1,
+    normalize: bool = True,
+    channels_first: bool = True,
+) -> Iterator[paddle.Tensor]:
+    """Iterate audio data of a PCM16 WAV file in chunks, so that a long file is
+    processed without loading it into memory at once.
+
+    Args:
+        filepath: audio path or file object.
+        chunk_frames: number of frames of each chunk, the last chunk may be shorter.
+        frame_offset: from 0 to total frames,
+        num_frames: from -1 (means total frames) or number frames which want to read,
+        normalize:
+            if True: return audio which norm to (-1, 1), dtype=float32
+            if False: return audio with raw data, dtype=int16
+
+        channels_first:
+            if True: return audio with shape (channels, time)
+
+    Return:
+        Iterator[paddle.Tensor]: chunks of audio content.
+
+    Examples:
+        .. code-block:: python
+
+            import os
+            import paddle
+
+            sample_rate = 16000
+            wav_duration = 0.5
+            num_channels = 1
+            num_frames = sample_rate * wav_duration
+            wav_data = paddle.linspace(-1.0, 1.0, num_frames) * 0.1
+            waveform = wav_data.tile([num_channels, 1])
+            base_dir = os.getcwd()
+            filepath = os.path.join(base_dir, "test.wav")
+
+            paddle.audio.save(filepath, waveform, sample_rate)
+            for chunk in paddle.audio.stream(filepath, chunk_frames=1024):
+                print(chunk.shape)
+                # [1, 1024], ..., [1, 832]
+    """
+    assert chunk_frames > 0, "chunk_frames should be a positive integer."
+    assert frame_offset >= 0, "frame_offset should be non-negative."
+    file_obj, file_ = _open_pcm16_wave(filepath)
+    frames = file_.getnframes()
+    frame_offset = min(frame_offset, frames)
+    end = frames
+    if num_frames != -1:
+        end = min(frame_offset + num_frames, frames)
+    return _iter_chunks(
+        file_obj,
+        file_,
+        chunk_frames,
+        frame_offset,
+        end,
+        normalize,
+        channels_first,
+    )
+
+
+def _iter_chunks(
+    file_obj, file_, chunk_frames, start, end, normalize, channels_first
+):
+    channels = file_.getnchannels()
+    try:
+        file_.setpos(start)
+        position = start
+        while position < end:
+            size = min(chunk_frames, end - position)
+            audio_content = file_.readframes(size)
+            audio_as_np16 = np.frombuffer(audio_content, dtype=np.int16)
+            audio_as_np16 = np.reshape(audio_as_np16, (-1, channels))
+            if audio_as_np16.shape[0] == 0:
+                break
+            position += audio_as_np16.shape[0]
+            yield _to_waveform(audio_as_np16, normalize, channels_first)
+    finally:
+        file_obj.close()
+
+
 def save(
     filepath: str,
     src: paddle.Tensor,
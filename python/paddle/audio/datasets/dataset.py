@@ -13,7 +13,10 @@
 # limitations under the License.
 from typing import List
 
+import numpy as np
+
 import paddle
+from paddle.io.dataloader.collate import default_collate_fn
 
 from ..features import MFCC, LogMelSpectrogram, MelSpectrogram, Spectrogram
 
@@ -25,6 +28,30 @@ feat_funcs = {
     'spectrogram': Spectrogram,
 }
 
+# Feature extractors keyed by feature type and arguments, so that fbank
+# matrices, DCT matrices and windows are not computed for every sample.
+_feat_extractors = {}
+
+
+def _get_feat_extractor(feat_type, sample_rate, feat_config):
+    feat_func = feat_funcs[feat_type]
+    kwargs = dict(feat_config)
+    if feat_type != 'spectrogram':
+        kwargs['sr'] = sample_rate
+    key = (feat_type, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return feat_func(**kwargs)
+    # buffers created in static graph mode can't be reused
+    if not paddle.in_dynamic_mode():
+        return feat_func(**kwargs)
+    feature_extractor = _feat_extractors.get(key, None)
+    if feature_extractor is None:
+        feature_extractor = feat_func(**kwargs)
+        _feat_extractors[key] = feature_extractor
+    return feature_extractor
+
 
 class AudioClassificationDataset(paddle.io.Dataset):
     """
@@ -37,6 +64,7 @@ class AudioClassificationDataset(paddle.io.Dataset):
         labels: List[int],
         feat_type: str = 'raw',
         sample_rate: int = None,
+        batch_feat: bool = False,
         **kwargs,
     ):
         """
@@ -45,6 +73,10 @@ class AudioClassificationDataset(paddle.io.Dataset):
             labels (:obj:`List[int]`): Labels of audio files.
             feat_type (:obj:`str`, `optional`, defaults to `raw`):
                 It identifies the feature type that user wants to extract an audio file.
+            batch_feat (:obj:`bool`, `optional`, defaults to `False`):
+                If True, `__getitem__` returns waveforms, and features are extracted
+                once per batch by :meth:`collate_fn`, which should be passed to
+                `paddle.io.DataLoader`.
         """
         super().__init__()
 
@@ -58,6 +90,7 @@ class AudioClassificationDataset(paddle.io.Dataset):
 
         self.feat_type = feat_type
         self.sample_rate = sample_rate
+        self.batch_feat = batch_feat
         self.feat_config = (
             kwargs  # Pass keyword arguments to customize feature config
         )
@@ -70,26 +103,48 @@ class AudioClassificationDataset(paddle.io.Dataset):
         waveform, sample_rate = paddle.audio.load(file)
         self.sample_rate = sample_rate
 
-        feat_func = feat_funcs[self.feat_type]
-
         record = {}
         if len(waveform.shape) == 2:
             waveform = waveform.squeeze(0)  # 1D input
         waveform = paddle.to_tensor(waveform, dtype=paddle.float32)
-        if feat_func is not None:
+        if feat_funcs[self.feat_type] is not None and not self.batch_feat:
             waveform = waveform.unsqueeze(0)  # (batch_size, T)
-            if self.feat_type != 'spectrogram':
-                feature_extractor = feat_func(
-                    sr=self.sample_rate, **self.feat_config
-                )
-            else:
-                feature_extractor = feat_func(**self.feat_config)
-            record['feat'] = feature_extractor(waveform).squeeze(0)
+            record['feat'] = self._extract_feat(waveform).squeeze(0)
         else:
             record['feat'] = waveform
         record['label'] = label
         return record
 
+    def _extract_feat(self, waveforms):
+        feature_extractor = _get_feat_extractor(
+            self.feat_type, self.sample_rate, self.feat_config
+        )
+        with paddle.no_grad():
+            return feature_extractor(waveforms)
+
+    def collate_fn(self, batch):
+        """
+        Collate samples into a batch. If `batch_feat` is True, waveforms are
+        zero padded to the longest one, and features of them are extracted at
+        once, otherwise samples are collated by the default collate function.
+
+        Args:
+            batch (list): A list of `(feat, label)` returned by `__getitem__`.
+
+        Returns:
+            tuple: Features with shape `(N, ...)` and labels with shape `(N,)`.
+        """
+        if not self.batch_feat or feat_funcs[self.feat_type] is None:
+            return default_collate_fn(batch)
+
+        waveforms, labels = zip(*batch)
+        max_length = max(waveform.shape[-1] for waveform in waveforms)
+        padded = np.zeros([len(waveforms), max_length], dtype='float32')
+        for i, waveform in enumerate(waveforms):
+            padded[i, : waveform.shape[-1]] = np.asarray(waveform)
+        feats = self._extract_feat(paddle.to_tensor(padded))
+        return feats, paddle.to_tensor(np.array(labels, dtype='int64'))
+
     def __getitem__(self, idx):
         record = self._convert_to_record(idx)
         return record['feat'], record['label']
@@ -39,6 +39,7 @@ class ESC50(AudioClassificationDataset):
        split (int, optional): It specify the fold of dev dataset. Default:1.
        feat_type (str, optional): It identifies the feature type that user wants to extract of an audio file. Default:raw.
        archive(dict, optional): it tells where to download the audio archive. Default:None.
+       batch_feat(bool, optional): if True, features are extracted once per batch by `collate_fn` instead of per sample. Default:False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of ESC50 dataset.
@@ -41,6 +41,7 @@ class TESS(AudioClassificationDataset):
        split (int, optional): It specify the fold of dev dataset. Defaults to 1.
        feat_type (str, optional): It identifies the feature type that user wants to extract of an audio file. Defaults to raw.
        archive(dict): it tells where to download the audio archive. Defaults to None.
+       batch_feat(bool, optional): if True, features are extracted once per batch by `collate_fn` instead of per sample. Defaults to False.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of TESS dataset.
@@ -0,0 +1,309 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+
+import numpy as np
+
+# bytes of fp16 params, fp16 grads and fp32 master params with adam moments
+_PARAM_BYTES = 2
+_GRAD_BYTES = 2
+_OPTIMIZER_BYTES = 12
+
+
+def _degree(cfg, name):
+    return cfg.get(name, None) or 1
+
+
+def _ring_factor(degree):
+    return 2.0 * (degree - 1) / degree
+
+
+class CostModel:
+    """
+    Analytical estimate of memory usage per GPU and time per step of a
+    config of GPT-like transformers, only used for ranking configs.
+
+    Memory consists of params, grads and optimizer states divided by
+    mp, pp and sharding degree according to sharding stage, plus
+    activations of micro batches in flight of the first pipeline stage.
+    Time consists of compute time with pipeline bubbles and a simple
+    efficiency penalty of small GEMMs, plus communication time of mp,
+    dp, sharding and pp, each of which runs on intra-node or inter-node
+    bandwidth according to whether its group spans nodes.
+
+    Model settings are read from ``tuner_cfg["model_cfg"]``, hardware
+    settings are read from ``tuner_cfg["cost_model_cfg"]``:
+
+    - gpu_tflops: peak TFLOPS of a GPU, 100 by default.
+    - intra_node_bandwidth: GB/s between GPUs in a node, 100 by default.
+    - inter_node_bandwidth: GB/s between nodes, 12.5 by default.
+    - gpu_memory: GB of memory of a GPU, None means unlimited.
+
+    Args:
+        tuner_cfg (dict): The configuration of auto tuner user defined.
+    """
+
+    def __init__(self, tuner_cfg):
+        model_cfg = tuner_cfg["model_cfg"]
+        cost_model_cfg = tuner_cfg.get("cost_model_cfg", {})
+        for name in ["hidden_size", "num_layers", "global_batch_size"]:
+            assert (
+                model_cfg.get(name, None) is not None
+            ), f"model_cfg.{name} is required by cost model."
+        self.hidden_size = model_cfg["hidden_size"]
+        self.num_layers = model_cfg["num_layers"]
+        self.global_batch_size = model_cfg["global_batch_size"]
+        self.vocab_size = model_cfg.get("vocab_size", 0)
+        self.num_heads = model_cfg.get(
+            "num_attention_heads", max(1, self.hidden_size // 128)
+        )
+        self.seq_length = model_cfg.get("seq_length", 1024)
+
+        self.num_gpus = tuner_cfg["num_gpus"]
+        self.gpus_per_node = self.num_gpus // tuner_cfg.get("nodes", 1)
+        self.flops = cost_model_cfg.get("gpu_tflops", 100) * 1e12
+        self.intra_node_bandwidth = (
+            cost_model_cfg.get("intra_node_bandwidth", 100) * 1e9
+        )
+        self.inter_node_bandwidth = (
+            cost_model_cfg.get("inter_node_bandwidth", 12.5) * 1e9
+        )
+        gpu_memory = cost_model_cfg.get("gpu_memory", None)
+        self.gpu_memory = gpu_memory * 2**30 if gpu_memory else None
+
+    def _local_batch_size(self, cfg):
+        return max(
+            1,
+            self.global_batch_size
+            // _degree(cfg, "dp_degree")
+            // _degree(cfg, "sharding_degree"),
+        )
+
+    def _micro_batch(self, cfg):
+        local_batch_size = self._local_batch_size(cfg)
+        micro_batch_size = min(
+            cfg.get("micro_batch_size", None) or local_batch_size,
+            local_batch_size,
+        )
+        return micro_batch_size, max(1, local_batch_size // micro_batch_size)
+
+    def _sharding_stage(self, cfg):
+        if _degree(cfg, "sharding_degree") == 1:
+            return 0
+        return cfg.get("sharding_stage", None) or 1
+
+    def _bandwidth(self, degree, stride):
+        # ranks are ordered as [dp, pp, sharding, mp] from outer to inner
+        if degree * stride > self.gpus_per_node:
+            return self.inter_node_bandwidth
+        return self.intra_node_bandwidth
+
+    def num_params(self, cfg):
+        """Number of params held by a GPU of the first pipeline stage."""
+        mp_degree = _degree(cfg, "mp_degree")
+        pp_degree = _degree(cfg, "pp_degree")
+        h = self.hidden_size
+        layer_params = 12 * self.num_layers * h * h / pp_degree
+        return (layer_params + self.vocab_size * h) / mp_degree
+
+    def memory(self, cfg):
+        """
+        Estimated peak memory usage in bytes of a GPU.
+
+        Args:
+            cfg (dict): A config generated by auto tuner.
+        """
+        mp_degree = _degree(cfg, "mp_degree")
+        pp_degree = _degree(cfg, "pp_degree")
+        sharding_degree = _degree(cfg, "sharding_degree")
+        sharding_stage = self._sharding_stage(cfg)
+
+        num_params = self.num_params(cfg)
+        param_bytes = _PARAM_BYTES
+        grad_bytes = _GRAD_BYTES
+        optimizer_bytes = _OPTIMIZER_BYTES
+        if sharding_stage >= 1:
+            optimizer_bytes /= sharding_degree
+        if sharding_stage >= 2:
+            grad_bytes /= sharding_degree
+        if sharding_stage >= 3:
+            param_bytes /= sharding_degree
+        static_memory = num_params * (
+            param_bytes + grad_bytes + optimizer_bytes
+        )
+
+        # activations of a layer in bytes, see "Reducing Activation
+        # Recomputation in Large Transformer Models"
+        micro_batch_size, acc_steps = self._micro_batch(cfg)
+        s, b, h = self.seq_length, micro_batch_size, self.hidden_size
+        attention = 5 * self.num_heads * s / h / mp_degree
+        layer_activation = s * b * h * (10 + 24 / mp_degree + attention)
+        layers = self.num_layers / pp_degree
+        if cfg.get("use_recompute", None):
+            if cfg.get("recompute_granularity", None) == "full_attn":
+                activation = layers * (layer_activation - s * b * h * attention)
+            else:
+                # only inputs of layers are kept, and one layer is recomputed
+                activation = layers * 2 * s * b * h + layer_activation
+        else:
+            activation = layers * layer_activation
+        # 1F1B keeps at most pp micro batches in the first stage
+        activation *= min(pp_degree, acc_steps)
+        logits = 4 * s * b * self.vocab_size / mp_degree
+
+        return static_memory + activation + logits
+
+    def step_time(self, cfg):
+        """
+        Estimated time in seconds of a step of global batch size.
+
+        Args:
+            cfg (dict): A config generated by auto tuner.
+        """
+        dp_degree = _degree(cfg, "dp_degree")
+        mp_degree = _degree(cfg, "mp_degree")
+        pp_degree = _degree(cfg, "pp_degree")
+        sharding_degree = _degree(cfg, "sharding_degree")
+        sharding_stage = self._sharding_stage(cfg)
+        micro_batch_size, acc_steps = self._micro_batch(cfg)
+        use_recompute = cfg.get("use_recompute", None)
+        granularity = cfg.get("recompute_granularity", None)
+
+        s, h, L = self.seq_length, self.hidden_size, self.num_layers
+        tokens = self.global_batch_size * s
+        dense_flops = 24 * tokens * L * h * h
+        attention_flops = 4 * tokens * s * L * h
+        logits_flops = 2 * tokens * h * self.vocab_size
+        flops = 3 * (dense_flops + attention_flops + logits_flops)
+        if use_recompute:
+            flops += attention_flops
+            if granularity != "full_attn":
+                flops += dense_flops
+
+        # small GEMMs can't saturate GPUs
+        gemm_size = micro_batch_size * s * h / mp_degree
+        efficiency = gemm_size / (gemm_size + 2**18)
+        compute_time = flops / (self.num_gpus * self.flops * efficiency)
+        compute_time *= (acc_steps + pp_degree - 1) / acc_steps
+
+        comm_time = 0.0
+        activation_bytes = 2 * micro_batch_size * s * h
+        if mp_degree > 1:
+            num_allreduce = 6 if use_recompute else 4
+            comm_time += (
+                num_allreduce
+                * L
+                / pp_degree
+                * acc_steps
+                * _ring_factor(mp_degree)
+                * activation_bytes
+                / self._bandwidth(mp_degree, 1)
+            )
+        param_bytes = self.num_params(cfg) * _PARAM_BYTES
+        if sharding_degree > 1:
+            bandwidth = self._bandwidth(sharding_degree, mp_degree)
+            # reduce scatter grads and all gather params
+            num_comm = 2
+            if sharding_stage >= 3:
+                num_comm += 2 * acc_steps
+            comm_time += (
+                num_comm
+                * _ring_factor(sharding_degree)
+                / 2
+                * param_bytes
+                / bandwidth
+            )
+        if dp_degree > 1:
+            bandwidth = self._bandwidth(
+                dp_degree, mp_degree * sharding_degree * pp_degree
+            )
+            comm_time += (
+                _ring_factor(dp_degree)
+                * param_bytes
+                / sharding_degree
+                / bandwidth
+            )
+        if pp_degree > 1:
+            bandwidth = self._bandwidth(pp_degree, mp_degree * sharding_degree)
+            comm_time += 2 * acc_steps * activation_bytes / bandwidth
+
+        return compute_time + comm_time
+
+    def fits_memory(self, cfg):
+        if self.gpu_memory is None:
+            return True
+        return self.memory(cfg) <= self.gpu_memory
+
+
+class LinearRanker:
+    """
+    Ridge regression on features of configs predicting a score, the
+    larger the better, learned from history of tuning.
+
+    Weights are regularized towards a prior which ranks configs by the
+    estimated step time of :class:`CostModel` only, so that the ranker
+    follows the cost model when history is short, and corrects it as
+    more trials finish.
+
+    Args:
+        cost_model (CostModel): The analytical cost model.
+        l2 (float, optional): Strength of the regularization. Default: 1.0.
+    """
+
+    def __init__(self, cost_model, l2=1.0):
+        self.cost_model = cost_model
+        self.l2 = l2
+        num_features = len(self.features({}))
+        self.prior = np.zeros([num_features])
+        # score is about negative log of step time
+        self.prior[1] = -1.0
+        self.weights = self.prior.copy()
+
+    def features(self, cfg):
+        step_time = self.cost_model.step_time(cfg) if cfg else 1.0
+        return [
+            1.0,
+            math.log(step_time),
+            math.log2(_degree(cfg, "dp_degree")),
+            math.log2(_degree(cfg, "mp_degree")),
+            math.log2(_degree(cfg, "pp_degree")),
+            math.log2(_degree(cfg, "sharding_degree")),
+            float(cfg.get("sharding_stage", None) or 0),
+            float(bool(cfg.get("use_recompute", None))),
+            float(cfg.get("recompute_granularity", None) == "full"),
+            math.log2(_degree(cfg, "micro_batch_size")),
+        ]
+
+    def fit(self, features, scores):
+        """
+        Fit weights by features and scores of finished trials.
+
+        Args:
+            features (numpy.ndarray): 2-D array of features of configs.
+            scores (numpy.ndarray): 1-D array of scores of configs.
+        """
+        if len(scores) == 0:
+            self.weights = self.prior.copy()
+            return
+        # the intercept is almost not regularized
+        l2 = np.full([len(self.prior)], self.l2)
+        l2[0] = 1e-6
+        residual = scores - features @ self.prior
+        self.weights = self.prior + np.linalg.solve(
+            features.T @ features + np.diag(l2), features.T @ residual
+        )
+
+    def predict(self, features):
+        return features @ self.weights
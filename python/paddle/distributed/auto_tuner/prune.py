@@ -275,3 +275,16 @@ def prune_by_num_gpus(tuner_cfg, cur_cfg, history_cfgs):
         return True
 
     return False
+
+
+@register_prune
+def prune_by_history(tuner_cfg, cur_cfg, history_cfgs):
+    """
+    Prune if the same configuration has been searched, for example, in the
+    history resumed from a previous tuning.
+    """
+    history_cfgs = [cfg for cfg in history_cfgs or [] if cfg]
+    if same_cfgs_beside(None, cur_cfg, history_cfgs):
+        return True
+
+    return False
@@ -19,6 +19,20 @@ from typing import Tuple
 import pandas as pd
 
 
+def _parse_value(value):
+    """Convert a value read from csv file to python object."""
+    if value == "":
+        return None
+    if value in ["True", "False"]:
+        return value == "True"
+    for value_type in [int, float]:
+        try:
+            return value_type(value)
+        except ValueError:
+            pass
+    return value
+
+
 class History_recorder:
     # NOTE increase extenable ablitity
     def __init__(self) -> None:
@@ -76,6 +90,9 @@ class History_recorder:
             err = True
         else:
             with open(self.store_path, "r") as f:
-                reader = csv.reader(f)
-                self.history = list(reader)
+                reader = csv.DictReader(f)
+                self.history = [
+                    {key: _parse_value(val) for key, val in row.items()}
+                    for row in reader
+                ]
         return (self.history, err)
@@ -13,8 +13,12 @@
 # limitations under the License.
 
 
+import math
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+from .cost_model import CostModel, LinearRanker
 from .prune import _PRUNE_FUNC
 from .utils import search_all
 
@@ -52,3 +56,157 @@ class GridSearch(SearchAlgo):
             else:
                 return None
         return new_cfg
+
+
+class CostModelSearch(SearchAlgo):
+    """
+    Search configs in the order of scores predicted by a ranker, which is
+    learned from history of trials on top of an analytical cost model, so
+    that the most promising configs are launched first.
+
+    Configs estimated to exceed ``gpu_memory``, or to need more memory
+    than a failed trial needing more memory than all valid trials, are
+    searched after others. Besides ``task_limit``, searching stops early
+    when the best metric is not improved in the last ``patience`` trials,
+    or when no remaining config is predicted to be better than the best
+    trial by ``stop_margin`` after ``min_trials`` valid trials. Options
+    are read from ``tuner_cfg["cost_model_cfg"]``, see :class:`CostModel`
+    for options of hardware:
+
+    - patience: 5 by default, 0 disables it.
+    - stop_margin: 0.1 by default, None disables it.
+    - min_trials: 3 by default.
+    - l2: strength of regularization of the ranker, 1.0 by default.
+
+    Args:
+        tuner_cfg (dict): The configuration of auto tuner user defined.
+    """
+
+    def __init__(self, tuner_cfg):
+        super().__init__(tuner_cfg)
+        metric_cfg = tuner_cfg["metric_cfg"]
+        self.metric_name = metric_cfg["name"]
+        self.maximize = metric_cfg["OptimizationDirection"] == "Maximize"
+        cost_model_cfg = tuner_cfg.get("cost_model_cfg", {})
+        self.patience = cost_model_cfg.get("patience", 5)
+        self.stop_margin = cost_model_cfg.get("stop_margin", 0.1)
+        self.min_trials = cost_model_cfg.get("min_trials", 3)
+
+        self.cost_model = CostModel(tuner_cfg)
+        self.ranker = LinearRanker(
+            self.cost_model, cost_model_cfg.get("l2", 1.0)
+        )
+
+        # prune rules not depending on history are applied only once
+        self.all_tasks = [
+            cfg
+            for cfg in search_all(tuner_cfg)
+            if not self.prune(tuner_cfg, cfg, [])
+        ]
+        self.keys = list(self.all_tasks[0].keys()) if self.all_tasks else []
+        self.task_index = {
+            self._cfg_key(cfg): idx for idx, cfg in enumerate(self.all_tasks)
+        }
+        self.features = np.array(
+            [self.ranker.features(cfg) for cfg in self.all_tasks]
+        ).reshape([len(self.all_tasks), -1])
+        self.memory = np.array(
+            [self.cost_model.memory(cfg) for cfg in self.all_tasks]
+        )
+        self.fits_memory = np.array(
+            [self.cost_model.fits_memory(cfg) for cfg in self.all_tasks],
+            dtype=bool,
+        )
+        self.searched = np.zeros([len(self.all_tasks)], dtype=bool)
+
+    def _cfg_key(self, cfg):
+        return tuple(cfg.get(key, None) for key in self.keys)
+
+    def _score(self, metric):
+        score = math.log(metric)
+        return score if self.maximize else -score
+
+    def _trials(self, history_cfgs):
+        """
+        Return features, scores and memory of finished trials, score of a
+        failed trial is None.
+        """
+        features, scores, memory = [], [], []
+        for cfg in history_cfgs:
+            if not cfg:
+                continue
+            idx = self.task_index.get(self._cfg_key(cfg), None)
+            if idx is not None:
+                self.searched[idx] = True
+            # the trial is not finished
+            if self.metric_name not in cfg:
+                continue
+            if idx is not None:
+                features.append(self.features[idx])
+                memory.append(self.memory[idx])
+            else:
+                features.append(self.ranker.features(cfg))
+                memory.append(self.cost_model.memory(cfg))
+            metric = cfg[self.metric_name]
+            if metric is None or metric <= 0 or cfg.get("time", 0) == -1:
+                scores.append(None)
+            else:
+                scores.append(self._score(metric))
+        return features, scores, memory
+
+    def _early_stop(self, scores, best_predicted):
+        valid_scores = [score for score in scores if score is not None]
+        if not valid_scores:
+            return False
+        best_score = max(valid_scores)
+        if self.patience:
+            best_trial = scores.index(best_score)
+            if len(scores) - 1 - best_trial >= self.patience:
+                return True
+        if (
+            self.stop_margin is not None
+            and len(valid_scores) >= self.min_trials
+            and best_predicted < best_score - math.log(1 + self.stop_margin)
+        ):
+            return True
+        return False
+
+    def search_once(self, history_cfgs):
+        features, scores, memory = self._trials(history_cfgs)
+        valid = [i for i, score in enumerate(scores) if score is not None]
+        self.ranker.fit(
+            np.array([features[i] for i in valid]).reshape(
+                [len(valid), len(self.ranker.prior)]
+            ),
+            np.array([scores[i] for i in valid]),
+        )
+
+        # a failed trial needing more memory than all valid trials is
+        # likely out of memory, so are configs needing even more memory
+        max_valid_memory = max([memory[i] for i in valid], default=0.0)
+        oom_memory = min(
+            [
+                mem
+                for mem, score in zip(memory, scores)
+                if score is None and mem > max_valid_memory
+            ],
+            default=float("inf"),
+        )
+
+        remaining = np.flatnonzero(~self.searched)
+        predicted = self.ranker.predict(self.features[remaining])
+        likely_oom = (self.memory[remaining] >= oom_memory) | (
+            ~self.fits_memory[remaining]
+        )
+        # sort by likely_oom first, then by predicted score descending
+        order = np.lexsort((-predicted, likely_oom))
+        for pos in order:
+            idx = remaining[pos]
+            self.searched[idx] = True
+            new_cfg = self.all_tasks[idx]
+            if self.prune(self.tuner_cfg, new_cfg, history_cfgs):
+                continue
+            if self._early_stop(scores, predicted[pos]):
+                return None
+            return dict(new_cfg)
+        return None
@@ -26,6 +26,7 @@ class AutoTuner:
     """
 
     def __init__(self, tuner_cfg):
+        self.tuner_cfg = tuner_cfg
         self.cur_task_id = 1
         self.task_limit = tuner_cfg.get("task_limit", 100)
 
@@ -36,6 +37,10 @@ class AutoTuner:
             from .search import GridSearch
 
             self.algo = GridSearch(tuner_cfg)
+        elif search_algo == "cost_model":
+            from .search import CostModelSearch
+
+            self.algo = CostModelSearch(tuner_cfg)
         else:
             raise NotImplementedError()
 
@@ -53,3 +58,29 @@ class AutoTuner:
     def add_cfg(self, cfg):
         """Add cfg into history cfgs"""
         self.history_cfgs.append(cfg)
+
+    def resume(self, history_cfgs):
+        """
+        Resume from history cfgs of a previous tuning, which count towards
+        the task limit and will not be searched again.
+
+        Args:
+            history_cfgs (list): cfgs loaded by `History_recorder.load_history`,
+                they are updated in place.
+        """
+        candidates = self.tuner_cfg["candidates"]
+        metric_name = self.tuner_cfg["metric_cfg"]["name"]
+        for cfg in history_cfgs:
+            # values read from csv may differ in types from candidates
+            for key, values in candidates.items():
+                if key not in cfg:
+                    continue
+                for value in values:
+                    if value == cfg[key]:
+                        cfg[key] = value
+                        break
+            # for pruner use
+            metric = cfg.get(metric_name, None)
+            cfg["time"] = metric if metric is not None else -1
+            self.add_cfg(cfg)
+            self.cur_task_id += 1
@@ -14,10 +14,16 @@
 
 import abc
 import functools
+import hashlib
 import multiprocessing
 import os
 import re
+import shlex
 import shutil
+import stat
+import subprocess
+import tempfile
+import threading
 import time
 
 # (TODO: GhostScreaming) It will be removed later.
@@ -421,6 +427,340 @@ def _handle_errors(max_time_out=None):
     return decorator
 
 
+# status of remote paths known by `_MetaCache`
+_NOT_EXIST = 0
+_IS_FILE = 1
+_IS_DIR = 2
+_EXIST = 3
+
+# max number of paths queried by a batched `hadoop fs` command
+_BATCH_SIZE = 64
+
+_SCHEME_RE = re.compile(r'^[A-Za-z][\w+.-]*:(//[^/]*)?')
+
+
+def _norm_path(fs_path):
+    return fs_path.strip().rstrip('/') or '/'
+
+
+def _strip_scheme(fs_path):
+    return _SCHEME_RE.sub('', _norm_path(fs_path))
+
+
+def _ancestors(fs_path):
+    path = _norm_path(fs_path)
+    while True:
+        idx = path.rfind('/')
+        if idx < 0:
+            return
+        if idx == 0:
+            if path != '/':
+                yield '/'
+            return
+        path = path[:idx]
+        yield path
+
+
+def _parse_ls_line(line):
+    """Returns (is_dir, path) of a line printed by `hadoop fs -ls`, or None."""
+    arr = line.split(None, 7)
+    if len(arr) != 8:
+        return None
+    return arr[0][0] == 'd', arr[7]
+
+
+class _PathMatcher:
+    """
+    Matches paths printed by `hadoop fs` to the queried ones, which may
+    differ in scheme and authority, or be printed as absolute paths of
+    relative ones.
+    """
+
+    def __init__(self, fs_paths):
+        self._paths = {}
+        for fs_path in fs_paths:
+            self._paths.setdefault(_strip_scheme(fs_path), fs_path)
+
+    def match(self, printed):
+        path = _strip_scheme(printed)
+        fs_path = self._paths.get(path)
+        if fs_path is not None:
+            return fs_path
+        # the longest relative path wins, e.g. "b/a" rather than "a"
+        matched = None
+        for key, fs_path in self._paths.items():
+            if (
+                key
+                and not key.startswith('/')
+                and path.endswith('/' + key)
+                and (matched is None or len(key) > len(matched))
+            ):
+                matched = key
+        return None if matched is None else self._paths[matched]
+
+
+class _MetaCache:
+    """
+    Metadata of remote paths, i.e. status and listing of directories,
+    queried by a client and expired after `ttl` seconds.
+
+    Writes through the client invalidate the path, its descendants and
+    listings of its ancestors, writes by other clients are only visible
+    after entries expire.
+    """
+
+    def __init__(self, ttl):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._status = {}
+        self._listing = {}
+
+    def _get(self, entries, fs_path):
+        key = _norm_path(fs_path)
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        expire, value = entry
+        if time.monotonic() >= expire:
+            del entries[key]
+            return None
+        return value
+
+    def get_status(self, fs_path):
+        with self._lock:
+            return self._get(self._status, fs_path)
+
+    def set_status(self, fs_path, status):
+        with self._lock:
+            self._status[_norm_path(fs_path)] = (
+                time.monotonic() + self._ttl,
+                status,
+            )
+
+    def get_listing(self, fs_path):
+        with self._lock:
+            return self._get(self._listing, fs_path)
+
+    def set_listing(self, fs_path, dirs, files):
+        with self._lock:
+            expire = time.monotonic() + self._ttl
+            path = _norm_path(fs_path)
+            self._listing[path] = (expire, (list(dirs), list(files)))
+            self._status[path] = (expire, _IS_DIR)
+            for names, status in [(dirs, _IS_DIR), (files, _IS_FILE)]:
+                for name in names:
+                    self._status[path + '/' + name] = (expire, status)
+
+    def invalidate(self, fs_path=None):
+        with self._lock:
+            if fs_path is None:
+                self._status.clear()
+                self._listing.clear()
+                return
+
+            path = _norm_path(fs_path)
+            prefix = path.rstrip('/') + '/'
+            for entries in [self._status, self._listing]:
+                for key in [
+                    k for k in entries if k == path or k.startswith(prefix)
+                ]:
+                    del entries[key]
+            # e.g. `mkdir -p` and `put` may create ancestors
+            for ancestor in _ancestors(path):
+                self._listing.pop(ancestor, None)
+                entry = self._status.get(ancestor)
+                if entry is not None and entry[1] == _NOT_EXIST:
+                    del self._status[ancestor]
+
+
+_FS_SHELL_SERVER = 'PaddleFsShellServer'
+
+# Reads arguments of a `hadoop fs` command separated by tabs per line from
+# stdin, runs it by `FsShell` in the same JVM, and writes
+# "<ret> <len of stdout> <len of stderr>\n<stdout><stderr>" to stdout.
+_FS_SHELL_SERVER_SOURCE = """
+import java.io.BufferedReader;
+import java.io.ByteArrayOutputStream;
+import java.io.InputStreamReader;
+import java.io.PrintStream;
+
+import org.apache.hadoop.conf.Configuration;
+import org.apache.hadoop.fs.FsShell;
+import org.apache.hadoop.util.GenericOptionsParser;
+import org.apache.hadoop.util.ToolRunner;
+
+public class PaddleFsShellServer {
+    public static void main(String[] args) throws Exception {
+        Configuration conf = new Configuration();
+        new GenericOptionsParser(conf, args);
+        PrintStream stdout = System.out;
+        PrintStream stderr = System.err;
+        BufferedReader in = new BufferedReader(
+            new InputStreamReader(System.in, "UTF-8"));
+        String line;
+        while ((line = in.readLine()) != null) {
+            ByteArrayOutputStream out = new ByteArrayOutputStream();
+            ByteArrayOutputStream err = new ByteArrayOutputStream();
+            System.setOut(new PrintStream(out, true, "UTF-8"));
+            System.setErr(new PrintStream(err, true, "UTF-8"));
+            int ret;
+            try {
+                ret = ToolRunner.run(new FsShell(conf), line.split("\\t"));
+            } catch (Throwable e) {
+                e.printStackTrace();
+                ret = -1;
+            } finally {
+                System.out.flush();
+                System.err.flush();
+                System.setOut(stdout);
+                System.setErr(stderr);
+            }
+            byte[] outBytes = out.toByteArray();
+            byte[] errBytes = err.toByteArray();
+            stdout.print(
+                ret + " " + outBytes.length + " " + errBytes.length + "\\n");
+            stdout.write(outBytes);
+            stdout.write(errBytes);
+            stdout.flush();
+        }
+    }
+}
+"""
+
+
+class _FsShellServer:
+    """
+    A long-running JVM running `hadoop fs` commands, which saves starting a
+    JVM and connecting to the name node per command.
+
+    The server is compiled by `javac` of `JAVA_HOME` against
+    `hadoop classpath` once per user into ``~/.cache/paddle/fs_shell_server``,
+    and started by `hadoop PaddleFsShellServer` so that it runs with the same
+    environment as `hadoop fs`.
+    """
+
+    def __init__(self, hadoop_bin, config_args):
+        self._hadoop_bin = hadoop_bin
+        self._config_args = config_args
+        self._lock = threading.Lock()
+        self._proc = None
+
+    @staticmethod
+    def _check_private_dir(path):
+        # the classes in a directory writable by others may be planted by
+        # them and run with the hadoop credentials of the current user
+        st = os.lstat(path)
+        if (
+            not stat.S_ISDIR(st.st_mode)
+            or st.st_uid != os.getuid()
+            or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+        ):
+            raise OSError(
+                f"{path} is not a directory only writable by the current user"
+            )
+
+    def _compile(self):
+        digest = hashlib.md5(_FS_SHELL_SERVER_SOURCE.encode()).hexdigest()
+        cache_dir = os.path.join(
+            os.path.expanduser('~'), '.cache', 'paddle', 'fs_shell_server'
+        )
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        self._check_private_dir(cache_dir)
+        class_dir = os.path.join(cache_dir, digest)
+        if os.path.lexists(class_dir):
+            self._check_private_dir(class_dir)
+            if os.path.exists(
+                os.path.join(class_dir, _FS_SHELL_SERVER + '.class')
+            ):
+                return class_dir
+
+        java_home = os.environ.get('JAVA_HOME')
+        if java_home:
+            javac = os.path.join(java_home, 'bin', 'javac')
+        else:
+            javac = shutil.which('javac')
+        if javac is None or not os.path.exists(javac):
+            raise OSError("javac is not found, please set JAVA_HOME")
+        classpath = subprocess.check_output(
+            [self._hadoop_bin, 'classpath'], stderr=subprocess.DEVNULL
+        )
+        # created with mode 0700 on the same file system as class_dir
+        tmp_dir = tempfile.mkdtemp(prefix=digest + '.', dir=cache_dir)
+        try:
+            source = os.path.join(tmp_dir, _FS_SHELL_SERVER + '.java')
+            with open(source, 'w') as f:
+                f.write(_FS_SHELL_SERVER_SOURCE)
+            subprocess.check_call(
+                [
+                    javac,
+                    '-cp',
+                    classpath.decode().strip(),
+                    '-d',
+                    tmp_dir,
+                    source,
+                ]
+            )
+            os.rename(tmp_dir, class_dir)
+        except OSError:
+            # compiled by another process at the same time
+            if not os.path.isdir(class_dir):
+                raise
+            self._check_private_dir(class_dir)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return class_dir
+
+    def start(self):
+        class_dir = self._compile()
+        env = dict(os.environ)
+        hadoop_classpath = env.get('HADOOP_CLASSPATH')
+        env['HADOOP_CLASSPATH'] = (
+            class_dir + os.pathsep + hadoop_classpath
+            if hadoop_classpath
+            else class_dir
+        )
+        self._proc = subprocess.Popen(
+            [self._hadoop_bin, _FS_SHELL_SERVER] + self._config_args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+        )
+
+    def run(self, args):
+        """
+        Runs a `hadoop fs` command, e.g. ``['-test', '-e', path]``.
+
+        Returns:
+            Tuple: return code, stdout and stderr of the command.
+        """
+        with self._lock:
+            request = '\t'.join(args) + '\n'
+            self._proc.stdin.write(request.encode())
+            self._proc.stdin.flush()
+            header = self._proc.stdout.readline().split()
+            if len(header) != 3:
+                raise OSError(f"{_FS_SHELL_SERVER} exited unexpectedly")
+            ret, out_len, err_len = (int(x) for x in header)
+            out = self._proc.stdout.read(out_len)
+            err = self._proc.stdout.read(err_len)
+            return (
+                ret,
+                out.decode(errors='replace'),
+                err.decode(errors='replace'),
+            )
+
+    def close(self):
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+        self._proc = None
+
+
 class HDFSClient(FS):
     """
     A tool of HDFS.
@@ -429,6 +769,18 @@ class HDFSClient(FS):
         hadoop_home(str): Hadoop home.
         configs(dict): Hadoop config. It is a dictionary and needs to contain the
             keys: "fs.default.name" and "hadoop.job.ugi".
+        time_out(int): Timeout in ms of retrying an operation. Default is 5 minutes.
+        sleep_inter(int): Interval in ms between retries. Default is 1000.
+        cache_ttl(int): Time in ms to cache metadata of paths, i.e. results of
+            `is_exist`, `is_dir`, `is_file` and `ls_dir`. Writes through this
+            client invalidate the cache, but writes by others are only visible
+            after `cache_ttl`. Default is 0, which means no cache.
+        persistent(bool): Whether to run commands by a long-running JVM instead
+            of a `hadoop fs` process per command. It requires `javac` in
+            `JAVA_HOME` to compile the server into
+            ``~/.cache/paddle/fs_shell_server``, which must be owned and only
+            writable by the current user, and falls back to `hadoop fs` if
+            it fails to start. Default is False.
 
     Examples:
 
@@ -444,6 +796,14 @@ class HDFSClient(FS):
 
             client = HDFSClient(hadoop_home, configs)
             client.ls_dir("hdfs:/test_hdfs_client")
+
+            # cache metadata for 10s and run commands by one JVM
+            client = HDFSClient(
+                hadoop_home, configs, cache_ttl=10 * 1000, persistent=True
+            )
+            exists = client.batch_is_exist(
+                ["hdfs:/test_hdfs_client/0", "hdfs:/test_hdfs_client/1"]
+            )
     """
 
     def __init__(
@@ -451,8 +811,10 @@ class HDFSClient(FS):
         hadoop_home,
         configs,
         time_out=5 * 60 * 1000,  # ms
-        sleep_inter=1000,
-    ):  # ms
+        sleep_inter=1000,  # ms
+        cache_ttl=0,  # ms
+        persistent=False,
+    ):
         self.pre_commands = []
         hadoop_bin = '%s/bin/hadoop' % hadoop_home
         self.pre_commands.append(hadoop_bin)
@@ -471,17 +833,106 @@ class HDFSClient(FS):
             r'\s?responseErrorMsg\s?\:.*, errorCode\:\s?[0-9]+, path\:'
         )
 
-    def _run_cmd(self, cmd, redirect_stderr=False, retry_times=5):
+        self._meta_cache = _MetaCache(cache_ttl / 1000.0) if cache_ttl else None
+        self._persistent = persistent
+        self._server = None
+        self._server_pid = None
+
+    def _get_server(self):
+        if not self._persistent:
+            return None
+        # a forked process can't share the pipes of its parent's server
+        if self._server is not None and self._server_pid == os.getpid():
+            return self._server
+
+        server = _FsShellServer(self.pre_commands[0], self.pre_commands[2:])
+        try:
+            server.start()
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(
+                f"failed to start {_FS_SHELL_SERVER}, "
+                f"fall back to hadoop fs: {e}"
+            )
+            self._persistent = False
+            return None
+        self._server = server
+        self._server_pid = os.getpid()
+        return server
+
+    @staticmethod
+    def _absolute_local_paths(args):
+        # the server keeps the working directory it was started in, while
+        # `hadoop fs` resolves local paths against the current one
+        if args[0] == 'put':
+            local_args = range(1, len(args) - 1)
+        elif args[0] == 'get':
+            local_args = [len(args) - 1]
+        else:
+            return args
+        for i in local_args:
+            if not args[i].startswith('-') and '://' not in args[i]:
+                args[i] = os.path.abspath(args[i])
+        return args
+
+    def _execute_cmd(self, cmd, redirect_stderr):
+        # shell pipes only run by shell
+        server = self._get_server() if '|' not in cmd else None
+        if server is not None:
+            args = self._absolute_local_paths(shlex.split(cmd))
+            args[0] = '-' + args[0]
+            try:
+                ret, out, err = server.run(args)
+                return ret, out + err if redirect_stderr else out
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    f"{_FS_SHELL_SERVER} failed, fall back to hadoop fs: {e}"
+                )
+                server.close()
+                self._persistent = False
+
         exe_cmd = f"{self._base_cmd} -{cmd}"
+        ret, output = core.shell_execute_cmd(exe_cmd, 0, 0, redirect_stderr)
+        return int(ret), output
+
+    def close(self):
+        """
+        Stop the long-running JVM if `persistent` is True.
+        """
+        if self._server is not None and self._server_pid == os.getpid():
+            self._server.close()
+        self._server = None
+
+    def invalidate_cache(self, fs_path=None):
+        """
+        Drop cached metadata of `fs_path` and its descendants, or of all
+        paths if `fs_path` is None. It's needed only when paths are modified
+        by others within `cache_ttl`.
+
+        Args:
+            fs_path(str, optional): The HDFS file path. Default is None.
+        """
+        if self._meta_cache is not None:
+            self._meta_cache.invalidate(fs_path)
+
+    def _cached_status(self, fs_path):
+        if self._meta_cache is None:
+            return None
+        return self._meta_cache.get_status(fs_path)
+
+    def _cache_status(self, fs_path, status):
+        if self._meta_cache is not None:
+            self._meta_cache.set_status(fs_path, status)
+
+    def _run_cmd(self, cmd, redirect_stderr=False, retry_times=5):
         ret = 0
         output = None
         retry_sleep_second = 3
         for x in range(retry_times + 1):
-            ret, output = core.shell_execute_cmd(exe_cmd, 0, 0, redirect_stderr)
-            ret = int(ret)
+            ret, output = self._execute_cmd(cmd, redirect_stderr)
             if ret == 0:
                 break
-            time.sleep(retry_sleep_second)
+            if x < retry_times:
+                time.sleep(retry_sleep_second)
         if ret == 134:
             raise FSShellCmdAborted(cmd)
 
@@ -552,6 +1003,11 @@ class HDFSClient(FS):
         return self._ls_dir(fs_path)
 
     def _ls_dir(self, fs_path):
+        if self._meta_cache is not None:
+            listing = self._meta_cache.get_listing(fs_path)
+            if listing is not None:
+                return listing
+
         cmd = f"ls {fs_path}"
         ret, lines = self._run_cmd(cmd)
 
@@ -560,6 +1016,7 @@ class HDFSClient(FS):
 
         dirs = []
         files = []
+        is_listing = True
         for line in lines:
             arr = line.split()
             if len(arr) != 8:
@@ -570,7 +1027,12 @@ class HDFSClient(FS):
                 dirs.append(p)
             else:
                 files.append(p)
+                # `ls` of a file prints the file itself
+                if _strip_scheme(arr[7]) == _strip_scheme(fs_path):
+                    is_listing = False
 
+        if self._meta_cache is not None and is_listing:
+            self._meta_cache.set_listing(fs_path, dirs, files)
         return dirs, files
 
     def _test_match(self, lines):
@@ -581,6 +1043,21 @@ class HDFSClient(FS):
 
         return None
 
+    def _test_failed(self, lines):
+        # logs like "WARN util.NativeCodeLoader" are not errors
+        return self._test_match(lines) is not None or any(
+            "Exception" in l or "ERROR" in l for l in lines
+        )
+
+    def _run_test(self, cmd):
+        # `test` prints nothing and returns 1 if the condition is false,
+        # which is an answer rather than a failure to retry
+        ret, lines = self._run_cmd(cmd, redirect_stderr=True, retry_times=0)
+        if ret != 0 and self._test_failed(lines):
+            time.sleep(3)
+            ret, lines = self._run_cmd(cmd, redirect_stderr=True, retry_times=0)
+        return ret, lines
+
     @_handle_errors()
     def is_dir(self, fs_path):
         """
@@ -613,8 +1090,12 @@ class HDFSClient(FS):
         return self._is_dir(fs_path)
 
     def _is_dir(self, fs_path):
+        status = self._cached_status(fs_path)
+        if status in (_IS_DIR, _IS_FILE):
+            return status == _IS_DIR
+
         cmd = f"test -d {fs_path}"
-        ret, lines = self._run_cmd(cmd, redirect_stderr=True, retry_times=1)
+        ret, lines = self._run_test(cmd)
         if ret:
             # other error
             if self._test_match(lines):
@@ -622,8 +1103,11 @@ class HDFSClient(FS):
                 print('\n'.join(lines))
                 raise ExecuteError(cmd)
 
+            if status == _EXIST:
+                self._cache_status(fs_path, _IS_FILE)
             return False
 
+        self._cache_status(fs_path, _IS_DIR)
         return True
 
     def is_file(self, fs_path):
@@ -683,13 +1167,230 @@ class HDFSClient(FS):
                 client = HDFSClient(hadoop_home, configs)
                 ret = client.is_exist("hdfs:/test_hdfs_client")
         """
+        status = self._cached_status(fs_path)
+        if status is not None:
+            return status != _NOT_EXIST
+
         cmd = f"test -e {fs_path} "
-        ret, out = self._run_cmd(cmd, redirect_stderr=True, retry_times=1)
+        ret, out = self._run_test(cmd)
         if ret != 0:
+            if not self._test_failed(out):
+                self._cache_status(fs_path, _NOT_EXIST)
             return False
 
+        self._cache_status(fs_path, _EXIST)
         return True
 
+    def _batch_stat(self, fs_paths):
+        statuses = [self._cached_status(p) for p in fs_paths]
+        unknown = list(
+            dict.fromkeys(
+                p
+                for p, status in zip(fs_paths, statuses)
+                if status is None or status == _EXIST
+            )
+        )
+        found = {}
+        for begin in range(0, len(unknown), _BATCH_SIZE):
+            found.update(self._ls_paths(unknown[begin : begin + _BATCH_SIZE]))
+        return [
+            found[p] if status is None or status == _EXIST else status
+            for p, status in zip(fs_paths, statuses)
+        ]
+
+    def _ls_paths(self, fs_paths):
+        # `ls -d` prints the paths themselves instead of their children
+        cmd = "ls -d " + " ".join(fs_paths)
+        # missing paths fail the command, which is not to retry
+        ret, lines = self._run_cmd(cmd, redirect_stderr=True, retry_times=0)
+        if ret != 0 and self._test_failed(lines):
+            print('raise exception: ')
+            print('\n'.join(lines))
+            raise ExecuteError(cmd)
+
+        matcher = _PathMatcher(fs_paths)
+        found = {}
+        for line in lines:
+            parsed = _parse_ls_line(line)
+            if parsed is None:
+                continue
+            fs_path = matcher.match(parsed[1])
+            if fs_path is not None:
+                found[fs_path] = _IS_DIR if parsed[0] else _IS_FILE
+                self._cache_status(fs_path, found[fs_path])
+
+        missing_lines = [
+            line for line in lines if "No such file or directory" in line
+        ]
+        for fs_path in fs_paths:
+            if fs_path in found:
+                continue
+            found[fs_path] = _NOT_EXIST
+            # not to cache paths missed by other errors
+            if any(fs_path in line for line in missing_lines):
+                self._cache_status(fs_path, _NOT_EXIST)
+        return found
+
+    @_handle_errors()
+    def batch_is_exist(self, fs_paths):
+        """
+        Whether the remote HDFS paths exist, queried by a `hadoop fs -ls -d`
+        command per 64 paths.
+
+        Args:
+            fs_paths(list): The HDFS file paths.
+
+        Returns:
+            List: A list of bool of each path.
+
+        Examples:
+
+            .. code-block:: text
+
+                from paddle.distributed.fleet.utils import HDFSClient
+
+                hadoop_home = "/home/client/hadoop-client/hadoop/"
+                configs = {
+                    "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                    "hadoop.job.ugi": "hello,hello123"
+                }
+
+                client = HDFSClient(hadoop_home, configs)
+                ret = client.batch_is_exist(["hdfs:/test_0", "hdfs:/test_1"])
+        """
+        return [status != _NOT_EXIST for status in self._batch_stat(fs_paths)]
+
+    @_handle_errors()
+    def batch_is_dir(self, fs_paths):
+        """
+        Whether the remote HDFS paths are directories, queried by a
+        `hadoop fs -ls -d` command per 64 paths.
+
+        Args:
+            fs_paths(list): The HDFS file paths.
+
+        Returns:
+            List: A list of bool of each path, true if it exists and it's a directory.
+
+        Examples:
+
+            .. code-block:: text
+
+                from paddle.distributed.fleet.utils import HDFSClient
+
+                hadoop_home = "/home/client/hadoop-client/hadoop/"
+                configs = {
+                    "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                    "hadoop.job.ugi": "hello,hello123"
+                }
+
+                client = HDFSClient(hadoop_home, configs)
+                ret = client.batch_is_dir(["hdfs:/test_0", "hdfs:/test_1"])
+        """
+        return [status == _IS_DIR for status in self._batch_stat(fs_paths)]
+
+    @_handle_errors()
+    def batch_is_file(self, fs_paths):
+        """
+        Whether the remote HDFS paths are files, queried by a
+        `hadoop fs -ls -d` command per 64 paths.
+
+        Args:
+            fs_paths(list): The HDFS file paths.
+
+        Returns:
+            List: A list of bool of each path, true if it exists and it's a file.
+
+        Examples:
+
+            .. code-block:: text
+
+                from paddle.distributed.fleet.utils import HDFSClient
+
+                hadoop_home = "/home/client/hadoop-client/hadoop/"
+                configs = {
+                    "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                    "hadoop.job.ugi": "hello,hello123"
+                }
+
+                client = HDFSClient(hadoop_home, configs)
+                ret = client.batch_is_file(["hdfs:/test_0", "hdfs:/test_1"])
+        """
+        return [status == _IS_FILE for status in self._batch_stat(fs_paths)]
+
+    @_handle_errors()
+    def batch_ls_dir(self, fs_paths):
+        """
+        List directorys and files under each of `fs_paths`, queried by a
+        `hadoop fs -ls -d` and a `hadoop fs -ls` command per 64 paths.
+
+        Args:
+            fs_paths(list): The HDFS file paths.
+
+        Returns:
+            List: A list of 2-tuple as the result of `ls_dir` of each path.
+
+        Examples:
+
+            .. code-block:: text
+
+                from paddle.distributed.fleet.utils import HDFSClient
+
+                hadoop_home = "/home/client/hadoop-client/hadoop/"
+                configs = {
+                    "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                    "hadoop.job.ugi": "hello,hello123"
+                }
+
+                client = HDFSClient(hadoop_home, configs)
+                paths = ["hdfs:/test_0", "hdfs:/test_1"]
+                for subdirs, files in client.batch_ls_dir(paths):
+                    print(subdirs, files)
+        """
+        listings = {}
+        to_list = []
+        for fs_path, status in zip(fs_paths, self._batch_stat(fs_paths)):
+            if status == _IS_DIR:
+                listing = None
+                if self._meta_cache is not None:
+                    listing = self._meta_cache.get_listing(fs_path)
+                if listing is None:
+                    to_list.append(fs_path)
+                else:
+                    listings[fs_path] = listing
+            elif status == _IS_FILE:
+                listings[fs_path] = [], [os.path.basename(_norm_path(fs_path))]
+            else:
+                listings[fs_path] = [], []
+
+        to_list = list(dict.fromkeys(to_list))
+        for begin in range(0, len(to_list), _BATCH_SIZE):
+            listings.update(self._ls_dirs(to_list[begin : begin + _BATCH_SIZE]))
+        return [listings[p] for p in fs_paths]
+
+    def _ls_dirs(self, fs_paths):
+        cmd = "ls " + " ".join(fs_paths)
+        ret, lines = self._run_cmd(cmd)
+        if ret != 0:
+            raise ExecuteError(cmd)
+
+        matcher = _PathMatcher(fs_paths)
+        listings = {fs_path: ([], []) for fs_path in fs_paths}
+        for line in lines:
+            parsed = _parse_ls_line(line)
+            if parsed is None:
+                continue
+            is_dir, printed = parsed
+            parent, _, name = printed.rstrip('/').rpartition('/')
+            fs_path = matcher.match(parent)
+            if fs_path is not None:
+                listings[fs_path][0 if is_dir else 1].append(name)
+
+        if self._meta_cache is not None:
+            for fs_path, (dirs, files) in listings.items():
+                self._meta_cache.set_listing(fs_path, dirs, files)
+        return listings
+
     def upload_dir(self, local_dir, dest_dir, overwrite=False):
         """
         upload dir to hdfs
@@ -786,11 +1487,14 @@ class HDFSClient(FS):
         # complete the processes
         for proc in procs:
             proc.join()
+        # uploaded by subprocesses with their own cache
+        self.invalidate_cache(fs_path)
 
     @_handle_errors()
     def _try_upload(self, local_path, fs_path):
         cmd = f"put {local_path} {fs_path}"
         ret = 0
+        self.invalidate_cache(fs_path)
         try:
             ret, _ = self._run_cmd(cmd)
             if ret != 0:
@@ -897,10 +1601,13 @@ class HDFSClient(FS):
         if self.is_exist(fs_path):
             return
 
+        self.invalidate_cache(fs_path)
         out_hdfs = False
 
         cmd = f"mkdir {fs_path} "
-        ret, out = self._run_cmd(cmd, redirect_stderr=True)
+        # a missing parent fails it at once, other errors are retried by
+        # _handle_errors
+        ret, out = self._run_cmd(cmd, redirect_stderr=True, retry_times=0)
         if ret != 0:
             for l in out:
                 if "No such file or directory" in l:
@@ -915,6 +1622,8 @@ class HDFSClient(FS):
             if ret != 0:
                 raise ExecuteError(cmd)
 
+        self._cache_status(fs_path, _IS_DIR)
+
     def mv(self, fs_src_path, fs_dst_path, overwrite=False, test_exists=True):
         """
         Move a remote HDFS file or directory from `fs_src_path` to `fs_dst_path` .
@@ -956,6 +1665,8 @@ class HDFSClient(FS):
     def _try_mv(self, fs_src_path, fs_dst_path):
         cmd = f"mv {fs_src_path} {fs_dst_path}"
         ret = 0
+        self.invalidate_cache(fs_src_path)
+        self.invalidate_cache(fs_dst_path)
         try:
             ret, _ = self._run_cmd(cmd, retry_times=1)
             if ret != 0:
@@ -964,6 +1675,7 @@ class HDFSClient(FS):
             if not self.is_exist(fs_src_path) and self.is_exist(fs_dst_path):
                 return
             raise e
+        self._cache_status(fs_src_path, _NOT_EXIST)
 
     def _rmr(self, fs_path):
         cmd = f"rmr {fs_path}"
@@ -1004,10 +1716,12 @@ class HDFSClient(FS):
             return
 
         is_dir = self._is_dir(fs_path)
+        self.invalidate_cache(fs_path)
         if is_dir:
-            return self._rmr(fs_path)
-
-        return self._rm(fs_path)
+            self._rmr(fs_path)
+        else:
+            self._rm(fs_path)
+        self._cache_status(fs_path, _NOT_EXIST)
 
     def touch(self, fs_path, exist_ok=True):
         """
@@ -1042,10 +1756,12 @@ class HDFSClient(FS):
 
     @_handle_errors()
     def _touchz(self, fs_path):
+        self.invalidate_cache(fs_path)
         cmd = f"touchz {fs_path}"
         ret, _ = self._run_cmd(cmd)
         if ret != 0:
             raise ExecuteError(cmd)
+        self._cache_status(fs_path, _IS_FILE)
 
     def need_upload_download(self):
         return True
@@ -342,6 +342,24 @@ def launch():
 
         # build AutoTuner to get new config
         auto_tuner = AutoTuner(tuner_cfg)
+
+        # build history recorder
+        recorder = History_recorder()
+        history_path = ctx.args.auto_tuner_json.split(".")[0] + "_history.csv"
+
+        job_id = 0
+        # resume from history of a previous tuning
+        if tuner_cfg.get("resume", False):
+            history, err = recorder.load_history(history_path)
+            if err:
+                ctx.logger.warning(f"Resume from {history_path} failed.")
+            else:
+                auto_tuner.resume(history)
+                job_id = max([cfg["job_id"] for cfg in history], default=0)
+                ctx.logger.info(
+                    f"Resume {len(history)} tasks from {history_path}."
+                )
+
         cur_cfg = auto_tuner.search_once()
         auto_tuner.add_cfg(cur_cfg)
 
@@ -357,10 +375,6 @@ def launch():
         )
 
         is_first_task = True
-        # build history recorder
-        recorder = History_recorder()
-
-        job_id = 0
         ctx.args.max_restart = -1
         raw_ctx = copy.deepcopy(ctx)
         while cur_cfg:
@@ -425,9 +439,7 @@ def launch():
             )
             if not err:
                 ctx.logger.info(f"Current best config: {cur_best_cfgs}")
-                recorder.store_history(
-                    ctx.args.auto_tuner_json.split(".")[0] + "_history.csv"
-                )
+                recorder.store_history(history_path)
             else:
                 ctx.logger.info(
                     "Get best config failed. Currently there are no appropriate configs."
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import time
 
 import httpx
@@ -58,6 +59,38 @@ class KVClient:
         except:
             return ""
 
+    def put_batch(self, kvs):
+        """
+        Puts items of dict `kvs` with one request.
+        """
+        kvs = {(k if k.startswith('/') else f"/{k}"): v for k, v in kvs.items()}
+        u = f"{self.endpoint}/?batch=1"
+        try:
+            r = httpx.post(
+                u, data=json.dumps(kvs), timeout=None, follow_redirects=True
+            )
+            if r.status_code == 200:
+                return True
+            else:
+                return False
+        except:
+            return False
+
+    def wait_prefix(self, key, size, timeout=10):
+        """
+        Gets items with prefix `key` like `get_prefix`, the server blocks
+        the request until there are at least `size` items or `timeout`
+        seconds passed, which avoids polling.
+        """
+        key = key if key.startswith('/') else f"/{key}"
+        u = f"{self.endpoint}{key}?wait={size}&timeout={timeout}"
+        try:
+            r = httpx.get(u, timeout=timeout + 10, follow_redirects=True)
+            if r.status_code == 200:
+                return r.json()
+        except:
+            return ""
+
     def delete(self, key):
         key = key if key.startswith('/') else f"/{key}"
         u = f"{self.endpoint}{key}"
@@ -12,46 +12,148 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import http.server as SimpleHTTPServer
 import json
 import threading
-from http.server import HTTPServer
+import urllib.parse
+from http.server import ThreadingHTTPServer
 from multiprocessing import Process
 
+# max seconds a wait request blocks in server
+MAX_WAIT_TIMEOUT = 60
+
+# upper bound of characters, all keys starting with `prefix` are less than
+# `prefix + _MAX_CHAR`
+_MAX_CHAR = chr(0x10FFFF)
+
+
+class KVStore:
+    """
+    Thread-safe key-value store with keys kept sorted, so that querying
+    keys with a prefix costs O(log(n) + k) instead of scanning all keys,
+    and clients can wait for a number of keys with a prefix without
+    polling.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._kv = {}
+        self._keys = []
+        self._closed = False
+
+    def _range(self, prefix):
+        lo = bisect.bisect_left(self._keys, prefix)
+        hi = bisect.bisect_left(self._keys, prefix + _MAX_CHAR, lo)
+        return lo, hi
+
+    def _get_prefix(self, prefix):
+        lo, hi = self._range(prefix)
+        return {k: self._kv[k] for k in self._keys[lo:hi]}
+
+    def put(self, items):
+        """
+        Puts items of a dict atomically and wakes up waiting clients.
+        """
+        with self._cond:
+            for k, v in items.items():
+                if k not in self._kv:
+                    bisect.insort(self._keys, k)
+                self._kv[k] = v
+            self._cond.notify_all()
+
+    def delete(self, key):
+        with self._cond:
+            if key not in self._kv:
+                return False
+            del self._kv[key]
+            del self._keys[bisect.bisect_left(self._keys, key)]
+            return True
+
+    def get_prefix(self, prefix):
+        with self._cond:
+            return self._get_prefix(prefix)
+
+    def wait_prefix(self, prefix, size, timeout):
+        """
+        Blocks until there are at least `size` keys with `prefix` or
+        timeout, and returns items with `prefix`.
+        """
+
+        def ready():
+            lo, hi = self._range(prefix)
+            return self._closed or hi - lo >= size
+
+        with self._cond:
+            self._cond.wait_for(ready, timeout)
+            return self._get_prefix(prefix)
+
+    def close(self):
+        # wake up all waiting clients
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
 
 class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
+    """
+    GET /prefix: items with prefix.
+    GET /prefix?wait=N[&timeout=T]: items with prefix, blocks until there
+        are at least N items or T seconds passed.
+    PUT|POST /key: puts value of key.
+    PUT|POST /?batch=1: puts items of a json object in request body.
+    DELETE /key: deletes key.
+    """
+
+    def parse_path(self):
+        path, _, query = self.path.partition('?')
+        return path, urllib.parse.parse_qs(query)
+
     def do_GET(self):
-        with self.server.kv_lock:
-            ret = {}
-            for k, v in self.server.kv.items():
-                if k.startswith(self.path):
-                    ret[k] = v.decode(encoding="utf-8")
-            if ret:
-                self.output(200, json.dumps(ret).encode("utf-8"))
-            else:
-                self.output(404)
+        path, query = self.parse_path()
+        store = self.server.kv_store
+        if 'wait' in query:
+            try:
+                size = int(query['wait'][0])
+                timeout = float(query.get('timeout', [MAX_WAIT_TIMEOUT])[0])
+            except ValueError:
+                self.output(400)
+                return
+            timeout = min(timeout, MAX_WAIT_TIMEOUT)
+            kv = store.wait_prefix(path, size, timeout)
+        else:
+            kv = store.get_prefix(path)
+        if kv:
+            ret = {k: v.decode(encoding="utf-8") for k, v in kv.items()}
+            self.output(200, json.dumps(ret).encode("utf-8"))
+        else:
+            self.output(404)
 
     def do_PUT(self):
         self.do_POST()
 
     def do_POST(self):
+        path, query = self.parse_path()
         content_length = int(self.headers['Content-Length'] or 0)
         try:
             value = self.rfile.read(content_length)
-            with self.server.kv_lock:
-                self.server.kv[self.path] = value
-                self.output(200)
-                return
+            if 'batch' in query:
+                items = {
+                    k: v.encode("utf-8") for k, v in json.loads(value).items()
+                }
+            else:
+                items = {path: value}
+            self.server.kv_store.put(items)
+            self.output(200)
         except:
             self.output(500)
 
     def do_DELETE(self):
-        with self.server.kv_lock:
-            if self.path in self.server.kv:
-                del self.server.kv[self.path]
-                self.output(200)
-            else:
-                self.output(404)
+        path, _ = self.parse_path()
+        if self.server.kv_store.delete(path):
+            self.output(200)
+        else:
+            self.output(404)
 
     def output(self, code, value=''):
         self.send_response(code)
@@ -65,11 +167,16 @@ class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
         return
 
 
-class KVServer(HTTPServer):
+class KVServer(ThreadingHTTPServer):
+    # requests are served in threads, so that waiting clients don't block
+    # others, and connections of hundreds of pods are not refused
+    daemon_threads = True
+    request_queue_size = 1024
+
     def __init__(self, port):
         super().__init__(('', port), KVHandler)
-        self.kv_lock = threading.Lock()
-        self.kv = {'/healthy': b'ok'}
+        self.kv_store = KVStore()
+        self.kv_store.put({'/healthy': b'ok'})
         self.port = port
         self.stopped = False
         self.started = False
@@ -80,6 +187,7 @@ class KVServer(HTTPServer):
         self.started = True
 
     def stop(self):
+        self.kv_store.close()
         self.shutdown()
         self.listen_thread.join()
         self.server_close()
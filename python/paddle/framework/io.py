@@ -46,6 +46,7 @@ from .io_utils import (
     _pickle_loads_mac,
     _unpack_saved_dict,
 )
+from .sharded_io import _is_sharded_checkpoint, _load_sharded, _save_sharded
 
 __all__ = []
 
@@ -228,6 +229,8 @@ def _parse_load_config(configs):
         'params_filename',
         'keep_name_table',
         'return_numpy',
+        'keys',
+        'mmap',
     ]
 
     # input check
@@ -248,12 +251,19 @@ def _parse_load_config(configs):
     inner_config.params_filename = configs.get('params_filename', None)
     inner_config.keep_name_table = configs.get('keep_name_table', None)
     inner_config.return_numpy = configs.get('return_numpy', False)
+    inner_config.keys = configs.get('keys', None)
+    inner_config.mmap = configs.get('mmap', False)
 
     return inner_config
 
 
 def _parse_save_config(configs):
-    supported_configs = ['use_binary_format', 'pickle_protocol']
+    supported_configs = [
+        'use_binary_format',
+        'pickle_protocol',
+        'num_shards',
+        'num_threads',
+    ]
 
     # input check
     for key in configs:
@@ -271,6 +281,8 @@ def _parse_save_config(configs):
     inner_config = _SaveLoadConfig()
     inner_config.use_binary_format = configs.get('use_binary_format', False)
     inner_config.pickle_protocol = configs.get('pickle_protocol', None)
+    inner_config.num_shards = configs.get('num_shards', None)
+    inner_config.num_threads = configs.get('num_threads', None)
 
     return inner_config
 
@@ -669,6 +681,11 @@ def save(obj, path, protocol=4, **configs):
           use_binary_format(bool): When the saved object is static graph variable, you can specify ``use_binary_for_var``.
           If True, save the file in the c++ binary format when saving a single static graph variable; otherwise, save it in pickle format.
           Default: False
+          num_shards(int): If set, save the object as a sharded checkpoint, ``path`` is used as a directory which contains
+          an index file and ``num_shards`` raw tensor shard files. Tensors are written by a thread pool one by one without
+          pickling, and the checkpoint can be loaded lazily by key with ``paddle.load``. Default: None
+          num_threads(int): The number of threads to write shard files of sharded checkpoint. Default: None, which means
+          ``min(num_shards, cpu_count)``.
 
     Returns:
         None
@@ -796,6 +813,16 @@ def save(obj, path, protocol=4, **configs):
 
     config = _parse_save_config(configs)
 
+    if config.num_shards is not None:
+        if not isinstance(config.num_shards, int) or config.num_shards < 1:
+            raise ValueError(
+                "`num_shards` should be a positive integer, but received {}.".format(
+                    config.num_shards
+                )
+            )
+        _save_sharded(obj, path, config.num_shards, config.num_threads)
+        return
+
     if not isinstance(config.use_binary_format, bool):
         raise TypeError(
             "Type of `use_binary_format` should be bool, but received {}.".format(
@@ -930,6 +957,10 @@ def load(path, **configs):
             by default.
             (3) return_numpy(bool): If specified as True, return tensor as numpy.ndarray, otherwise return tensor as paddle.Tensor.
             Default False.
+            (4) keys (list): Only for sharded checkpoint saved with ``num_shards``, load only the given keys of
+            the saved dict, data of other tensors is not read. Default None, load all keys.
+            (5) mmap (bool): Only for sharded checkpoint saved with ``num_shards``, if True, return tensors as
+            read-only numpy.ndarray memory mapped from shard files, data is read lazily on access. Default False.
 
     Returns:
         Object(Object): a target object can be used in paddle
@@ -1050,6 +1081,18 @@ def load(path, **configs):
 
     '''
 
+    if _is_sharded_checkpoint(path):
+        config = _parse_load_config(configs)
+
+        def convert_func(name, data):
+            if config.return_numpy:
+                return np.array(data)
+            if name:
+                return _tuple_to_tensor((name, data), return_numpy=False)
+            return _ndarray_to_tensor(data, return_numpy=False)
+
+        return _load_sharded(path, convert_func, config.keys, config.mmap)
+
     if _is_memory_buffer(path) or os.path.isfile(path):
         config = _parse_load_config(configs)
         exception_type = pickle.UnpicklingError
@@ -0,0 +1,277 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Sharded checkpoint format used by `paddle.save(..., num_shards=N)`, the
+# checkpoint is a directory which contains:
+#   1. `index.pdindex`: a pickled dict which holds the structure of saved
+#      object with tensors replaced by `_ShardedTensorRef`, and the shard
+#      file, offset, shape and dtype of each tensor;
+#   2. `shard_<token>_xxxxx.bin`: raw tensor data, the offset of each tensor
+#      is aligned to `_SHARD_ALIGNMENT` bytes so that tensors can be memory
+#      mapped as numpy arrays directly. The token is unique to each saving,
+#      so that saving into an existing checkpoint never overwrites shards
+#      referenced by its index.
+
+import collections
+import os
+import pickle
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from paddle.fluid import core
+
+_SHARDED_INDEX_FILE = 'index.pdindex'
+_SHARDED_FORMAT_VERSION = 1
+_SHARD_ALIGNMENT = 64
+
+
+class _ShardedTensorRef:
+    def __init__(self, tensor_id):
+        self.tensor_id = tensor_id
+
+
+def _is_sharded_checkpoint(path):
+    return isinstance(path, str) and os.path.isfile(
+        os.path.join(path, _SHARDED_INDEX_FILE)
+    )
+
+
+def _is_tensor_like(obj):
+    return isinstance(obj, (core.eager.Tensor, core.LoDTensor, np.ndarray))
+
+
+def _tensor_nbytes(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, core.LoDTensor):
+        return int(np.prod(obj.shape())) * core.size_of_dtype(obj._dtype())
+    return int(np.prod(obj.shape)) * core.size_of_dtype(obj.dtype)
+
+
+def _replace_tensors(obj, tensors):
+    # return a copy of obj with tensors replaced by _ShardedTensorRef, the
+    # original object is not modified
+    if _is_tensor_like(obj):
+        tensors.append(obj)
+        return _ShardedTensorRef(len(tensors) - 1)
+    if isinstance(obj, core.SelectedRows):
+        raise NotImplementedError(
+            "`paddle.save` do not support saving 'SelectedRows'."
+        )
+    if type(obj) in (dict, collections.OrderedDict):
+        return type(obj)(
+            (key, _replace_tensors(value, tensors))
+            for key, value in obj.items()
+        )
+    if type(obj) in (list, tuple):
+        return type(obj)(_replace_tensors(value, tensors) for value in obj)
+    return obj
+
+
+def _align(offset):
+    return (
+        (offset + _SHARD_ALIGNMENT - 1) // _SHARD_ALIGNMENT * _SHARD_ALIGNMENT
+    )
+
+
+def _plan_shards(tensors, num_shards):
+    # assign tensors to the least loaded shard from the largest one, and
+    # compute the offset of each tensor in its shard
+    shard_sizes = [0] * num_shards
+    placements = [None] * len(tensors)
+    nbytes = [_tensor_nbytes(t) for t in tensors]
+    for tensor_id in sorted(range(len(tensors)), key=lambda i: -nbytes[i]):
+        shard = shard_sizes.index(min(shard_sizes))
+        offset = _align(shard_sizes[shard])
+        placements[tensor_id] = (shard, offset)
+        shard_sizes[shard] = offset + nbytes[tensor_id]
+    return placements
+
+
+def _as_numpy(tensor):
+    # a view of the tensor buffer for CPU tensors, and a single host copy
+    # for device tensors, while np.array(tensor) copies the buffer again
+    if isinstance(tensor, core.eager.Tensor):
+        if not tensor.is_dense():
+            return tensor.numpy()
+        tensor = tensor.value().get_tensor()
+    return np.ascontiguousarray(np.asarray(tensor))
+
+
+def _write_shard(file_path, items):
+    # items is a list of (tensor_id, tensor, offset) sorted by offset,
+    # tensor is converted to numpy one by one while writing, so that at
+    # most one host copy of tensor in this shard exists at the same time
+    metas = {}
+    with open(file_path, 'wb') as f:
+        for tensor_id, tensor, offset in items:
+            name = getattr(tensor, 'name', None)
+            data = _as_numpy(tensor)
+            f.seek(offset)
+            if data.nbytes > 0:
+                f.write(memoryview(data.reshape([-1])).cast('B'))
+            metas[tensor_id] = (offset, data.shape, data.dtype.str, name)
+            del data
+        f.flush()
+        os.fsync(f.fileno())
+    return metas
+
+
+def _save_sharded(obj, path, num_shards, num_threads=None):
+    if not isinstance(path, str):
+        raise ValueError(
+            "Sharded saving only supports saving objects to a directory, "
+            "but got {}".format(type(path))
+        )
+    os.makedirs(path, exist_ok=True)
+
+    tensors = []
+    skeleton = _replace_tensors(obj, tensors)
+    num_shards = max(1, min(num_shards, len(tensors)))
+    placements = _plan_shards(tensors, num_shards)
+
+    token = uuid.uuid4().hex[:8]
+    shard_files = ['shard_%s_%05d.bin' % (token, i) for i in range(num_shards)]
+    shard_items = [[] for _ in range(num_shards)]
+    for tensor_id, (shard, offset) in enumerate(placements):
+        shard_items[shard].append((tensor_id, tensors[tensor_id], offset))
+    for items in shard_items:
+        items.sort(key=lambda item: item[2])
+
+    num_threads = num_threads or min(num_shards, os.cpu_count() or 1)
+    tensor_metas = {}
+    try:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            futures = [
+                executor.submit(
+                    _write_shard, os.path.join(path, shard_files[i]), items
+                )
+                for i, items in enumerate(shard_items)
+            ]
+            for shard, future in enumerate(futures):
+                for tensor_id, meta in future.result().items():
+                    tensor_metas[tensor_id] = (shard,) + meta
+    except BaseException:
+        _remove_shards(path, shard_files)
+        raise
+
+    index = {
+        'version': _SHARDED_FORMAT_VERSION,
+        'shards': shard_files,
+        'tensors': tensor_metas,
+        'skeleton': skeleton,
+    }
+    # NOTE: index file is written at last and replaced atomically, a
+    # checkpoint is complete only if the index file exists
+    index_path = os.path.join(path, _SHARDED_INDEX_FILE)
+    old_shard_files = _read_shard_files(path)
+    try:
+        with open(index_path + '.tmp', 'wb') as f:
+            pickle.dump(index, f, protocol=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(index_path + '.tmp', index_path)
+    except BaseException:
+        _remove_shards(path, shard_files)
+        raise
+
+    # shards of the previous checkpoint are unlinked only after the new
+    # index is published, memory maps of them opened by loading stay valid
+    _remove_shards(path, set(old_shard_files) - set(shard_files))
+
+
+def _read_shard_files(path):
+    if not _is_sharded_checkpoint(path):
+        return []
+    try:
+        with open(os.path.join(path, _SHARDED_INDEX_FILE), 'rb') as f:
+            return list(pickle.load(f)['shards'])
+    except (OSError, EOFError, KeyError, pickle.UnpicklingError):
+        return []
+
+
+def _remove_shards(path, shard_files):
+    for file_name in shard_files:
+        try:
+            os.remove(os.path.join(path, file_name))
+        except FileNotFoundError:
+            pass
+
+
+class _ShardReader:
+    def __init__(self, path, shard_files):
+        self._path = path
+        self._shard_files = shard_files
+        self._mmaps = {}
+
+    def read(self, shard, offset, shape, dtype):
+        dtype = np.dtype(dtype)
+        if int(np.prod(shape)) == 0:
+            return np.empty(shape, dtype=dtype)
+        if shard not in self._mmaps:
+            self._mmaps[shard] = np.memmap(
+                os.path.join(self._path, self._shard_files[shard]),
+                dtype=np.uint8,
+                mode='r',
+            )
+        return np.ndarray(
+            shape, dtype=dtype, buffer=self._mmaps[shard], offset=offset
+        )
+
+
+def _load_sharded(path, convert_func, keys=None, mmap=False):
+    with open(os.path.join(path, _SHARDED_INDEX_FILE), 'rb') as f:
+        index = pickle.load(f)
+    if index['version'] > _SHARDED_FORMAT_VERSION:
+        raise ValueError(
+            "Unsupported sharded checkpoint version {}.".format(
+                index['version']
+            )
+        )
+
+    skeleton = index['skeleton']
+    if keys is not None:
+        if not isinstance(skeleton, dict):
+            raise ValueError(
+                "`keys` can only be used when the saved object is a dict."
+            )
+        missing_keys = [key for key in keys if key not in skeleton]
+        if missing_keys:
+            raise KeyError(
+                "Keys {} are not found in sharded checkpoint {}.".format(
+                    missing_keys, path
+                )
+            )
+        skeleton = type(skeleton)((key, skeleton[key]) for key in keys)
+
+    reader = _ShardReader(path, index['shards'])
+    tensor_metas = index['tensors']
+
+    def restore(obj):
+        if isinstance(obj, _ShardedTensorRef):
+            shard, offset, shape, dtype, name = tensor_metas[obj.tensor_id]
+            data = reader.read(shard, offset, shape, dtype)
+            # only data of the tensors to return are read from disk
+            return data if mmap else convert_func(name, data)
+        if type(obj) in (dict, collections.OrderedDict):
+            return type(obj)(
+                (key, restore(value)) for key, value in obj.items()
+            )
+        if type(obj) in (list, tuple):
+            return type(obj)(restore(value) for value in obj)
+        return obj
+
+    return restore(skeleton)
@@ -23,6 +23,8 @@ from .reindex import reindex_graph  # noqa: F401
 from .reindex import reindex_heter_graph  # noqa: F401
 from .sampling import sample_neighbors  # noqa: F401
 from .sampling import weighted_sample_neighbors  # noqa: F401
+from .sampling import GraphStore  # noqa: F401
+from .sampling import NeighborSamplerDataset  # noqa: F401
 
 __all__ = [
     'send_u_recv',
@@ -36,4 +38,6 @@ __all__ = [
     'reindex_heter_graph',
     'sample_neighbors',
     'weighted_sample_neighbors',
+    'GraphStore',
+    'NeighborSamplerDataset',
 ]
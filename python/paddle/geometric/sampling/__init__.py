@@ -14,5 +14,7 @@
 
 from .neighbors import sample_neighbors  # noqa: F401
 from .neighbors import weighted_sample_neighbors  # noqa: F401
+from .graph_store import GraphStore  # noqa: F401
+from .graph_store import NeighborSamplerDataset  # noqa: F401
 
 __all__ = []
@@ -0,0 +1,397 @@
+#   Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import os
+
+import numpy as np
+
+import paddle
+from paddle.io import Dataset
+
+__all__ = []
+
+_ARRAY_NAMES = ['row', 'colptr', 'eids']
+
+
+def _to_numpy(x):
+    if isinstance(x, paddle.Tensor):
+        x = x.numpy()
+    return np.asarray(x).reshape([-1])
+
+
+def _sample_offsets(degrees, sample_size, rng):
+    """
+    Sample `sample_size` distinct offsets in [0, degree) for each degree in
+    `degrees`, which are all larger than `sample_size`, by Floyd's algorithm
+    vectorized over nodes.
+    """
+    chosen = np.empty([len(degrees), sample_size], dtype=degrees.dtype)
+    for i in range(sample_size):
+        upper = degrees - sample_size + i
+        candidate = (rng.random(len(degrees)) * (upper + 1)).astype(
+            degrees.dtype
+        )
+        duplicated = (chosen[:, :i] == candidate[:, None]).any(axis=1)
+        chosen[:, i] = np.where(duplicated, upper, candidate)
+    return chosen
+
+
+class GraphStore:
+    """
+    Graph held in CSC(Compressed Sparse Column) format once for multi-hop
+    neighbor sampling, the same format used by
+    :ref:`api_paddle_geometric_sample_neighbors`. Neighbors of node ``i``
+    are ``row[colptr[i]:colptr[i + 1]]``, which are the source nodes of edges
+    pointing to ``i``.
+
+    The graph is kept in numpy arrays in host memory, or memory-mapped from
+    files saved by :meth:`save` for graphs larger than RAM, so that sampling
+    can run in worker processes of :ref:`api_paddle_io_DataLoader`, see
+    :class:`NeighborSamplerDataset`.
+
+    Args:
+        row (Tensor|numpy.ndarray): Source nodes of edges in CSC format, with
+            shape [num_edges] or [num_edges, 1]. The data type is int32 or int64.
+        colptr (Tensor|numpy.ndarray): Offsets of edges of nodes in CSC format,
+            with shape [num_nodes + 1] or [num_nodes + 1, 1].
+        eids (Tensor|numpy.ndarray, optional): Edge ids of edges in CSC format.
+            Default is None, which means edge ids are not stored.
+
+    Examples:
+        .. code-block:: python
+
+            import paddle
+
+            # edges: (3, 0), (7, 0), (0, 1), (9, 1), (1, 2), (4, 3), (2, 4),
+            #        (9, 5), (3, 5), (9, 6), (1, 6), (9, 8), (7, 8)
+            src = [3, 7, 0, 9, 1, 4, 2, 9, 3, 9, 1, 9, 7]
+            dst = [0, 0, 1, 1, 2, 3, 4, 5, 5, 6, 6, 8, 8]
+            graph = paddle.geometric.GraphStore.from_edges(src, dst, num_nodes=10)
+            nodes, srcs, dsts = graph.sample_subgraph([0, 8], fanouts=[2, 2])
+            # nodes: global ids of sampled nodes, seeds [0, 8] come first
+            # srcs[i], dsts[i]: reindexed edges sampled in the i-th hop
+    """
+
+    def __init__(self, row, colptr, eids=None):
+        self.row = _to_numpy(row)
+        self.colptr = _to_numpy(colptr)
+        self.eids = None
+        if eids is not None:
+            self.eids = _to_numpy(eids)
+            if len(self.eids) != len(self.row):
+                raise ValueError(
+                    "The length of `eids` should be equal to that of `row`, "
+                    "but got {} and {}.".format(len(self.eids), len(self.row))
+                )
+        if self.row.dtype not in (np.int32, np.int64):
+            raise TypeError(
+                "The data type of `row` should be int32 or int64, but got "
+                "{}.".format(self.row.dtype)
+            )
+        if len(self.colptr) == 0 or self.colptr[-1] != len(self.row):
+            raise ValueError(
+                "The last element of `colptr` should be the number of edges "
+                "{}.".format(len(self.row))
+            )
+        self._path = None
+
+    @classmethod
+    def from_edges(cls, src, dst, num_nodes=None):
+        """
+        Build a graph store from edges ``src[i] -> dst[i]``, edge ids are
+        the positions of edges in `src` and `dst`.
+
+        Args:
+            src (Tensor|numpy.ndarray): Source nodes of edges.
+            dst (Tensor|numpy.ndarray): Destination nodes of edges.
+            num_nodes (int, optional): Number of nodes. Default is None, which
+                means the maximum node id plus one.
+
+        Returns:
+            GraphStore, the graph store.
+        """
+        src = _to_numpy(src).astype('int64')
+        dst = _to_numpy(dst).astype('int64')
+        if len(src) != len(dst):
+            raise ValueError(
+                "The length of `src` and `dst` should be equal, but got {} "
+                "and {}.".format(len(src), len(dst))
+            )
+        if num_nodes is None:
+            num_nodes = int(max(src.max(initial=-1), dst.max(initial=-1))) + 1
+        eids = np.argsort(dst, kind='stable')
+        colptr = np.zeros([num_nodes + 1], dtype='int64')
+        np.cumsum(np.bincount(dst, minlength=num_nodes), out=colptr[1:])
+        return cls(src[eids], colptr, eids)
+
+    @classmethod
+    def load(cls, path, mmap=False):
+        """
+        Load a graph store saved by :meth:`save`.
+
+        Args:
+            path (str): The directory of the graph store.
+            mmap (bool, optional): Whether to memory-map the arrays instead of
+                reading them into memory. Default is False.
+
+        Returns:
+            GraphStore, the graph store.
+        """
+        arrays = {}
+        for name in _ARRAY_NAMES:
+            file = os.path.join(path, name + '.npy')
+            if os.path.exists(file):
+                arrays[name] = np.load(file, mmap_mode='r' if mmap else None)
+        graph = cls(arrays['row'], arrays['colptr'], arrays.get('eids', None))
+        if mmap:
+            graph._path = path
+        return graph
+
+    def save(self, path):
+        """
+        Save arrays of the graph store into directory `path` in ``.npy``
+        format, which can be memory-mapped by :meth:`load`.
+
+        Args:
+            path (str): The directory to save to.
+        """
+        os.makedirs(path, exist_ok=True)
+        for name in _ARRAY_NAMES:
+            array = getattr(self, name)
+            if array is not None:
+                np.save(os.path.join(path, name + '.npy'), array)
+
+    def __getstate__(self):
+        # memory-mapped arrays are opened again instead of being copied
+        # into worker processes
+        if self._path is not None:
+            return {'_path': self._path}
+        return self.__dict__
+
+    def __setstate__(self, state):
+        if '_path' in state and len(state) == 1:
+            state = GraphStore.load(state['_path'], mmap=True).__dict__
+        self.__dict__.update(state)
+
+    @property
+    def num_nodes(self):
+        return len(self.colptr) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.row)
+
+    def _sample_neighbors(self, nodes, sample_size, rng):
+        starts = self.colptr[nodes]
+        degrees = self.colptr[nodes + 1] - starts
+        if sample_size < 0:
+            counts = degrees
+        else:
+            counts = np.minimum(degrees, sample_size)
+        total = int(counts.sum())
+        # offsets of sampled edges of each node in its neighbors
+        offsets = np.arange(total, dtype=degrees.dtype)
+        offsets -= np.repeat(np.cumsum(counts) - counts, counts)
+        if sample_size >= 0:
+            partial = degrees > sample_size
+            if partial.any():
+                mask = np.repeat(partial, counts)
+                offsets[mask] = _sample_offsets(
+                    degrees[partial], sample_size, rng
+                ).reshape([-1])
+        edges = np.repeat(starts, counts) + offsets
+        return edges, counts
+
+    def _sample_subgraph(self, seeds, fanouts, return_eids=False, rng=None):
+        if rng is None:
+            rng = np.random.default_rng()
+        if return_eids and self.eids is None:
+            raise ValueError(
+                "`eids` of the graph store should not be None if "
+                "`return_eids` is True."
+            )
+        nodes = _to_numpy(seeds).astype(self.row.dtype)
+        frontier = np.arange(len(nodes))
+        srcs, dsts, eids = [], [], []
+        for sample_size in fanouts:
+            edges, counts = self._sample_neighbors(
+                nodes[frontier], sample_size, rng
+            )
+            neighbors = self.row[edges]
+            # reindex nodes by the order of their first appearance
+            all_nodes = np.concatenate([nodes, neighbors])
+            _, first, inverse = np.unique(
+                all_nodes, return_index=True, return_inverse=True
+            )
+            order = np.argsort(first, kind='stable')
+            local_ids = np.empty_like(order)
+            local_ids[order] = np.arange(len(order))
+            local_ids = local_ids[inverse.reshape([-1])]
+
+            num_nodes = len(nodes)
+            nodes = all_nodes[np.sort(first)]
+            srcs.append(local_ids[num_nodes:])
+            dsts.append(np.repeat(frontier, counts))
+            if return_eids:
+                eids.append(np.asarray(self.eids[edges]))
+            frontier = np.arange(num_nodes, len(nodes))
+        if return_eids:
+            return nodes, srcs, dsts, eids
+        return nodes, srcs, dsts
+
+    def sample_subgraph(self, seeds, fanouts, return_eids=False):
+        """
+        Sample multi-hop neighbors of `seeds` and reindex the sampled
+        subgraph in one call, which is the same as calling
+        :ref:`api_paddle_geometric_sample_neighbors` and
+        :ref:`api_paddle_geometric_reindex_graph` for each hop.
+
+        In the i-th hop, at most ``fanouts[i]`` neighbors are sampled
+        without replacement for each node first reached in the previous hop
+        (seeds for the first hop), -1 means all neighbors.
+
+        Args:
+            seeds (Tensor|numpy.ndarray|list): Unique global ids of seed nodes.
+            fanouts (list[int]): Number of neighbors to sample of each hop.
+            return_eids (bool, optional): Whether to return edge ids of sampled
+                edges. Default is False.
+
+        Returns:
+            - out_nodes (Tensor), global ids of sampled nodes, where seeds are
+              put in the front, followed by nodes in order of being reached.
+
+            - reindex_src (list[Tensor]), source nodes of sampled edges of each
+              hop, as indices of `out_nodes`.
+
+            - reindex_dst (list[Tensor]), destination nodes of sampled edges of
+              each hop, as indices of `out_nodes`.
+
+            - out_eids (list[Tensor]), edge ids of sampled edges of each hop,
+              only returned if `return_eids` is True.
+        """
+        outputs = self._sample_subgraph(seeds, fanouts, return_eids)
+        nodes = paddle.to_tensor(outputs[0])
+        return (nodes,) + tuple(
+            [paddle.to_tensor(x) for x in output] for output in outputs[1:]
+        )
+
+
+class NeighborSamplerDataset(Dataset):
+    """
+    Dataset of subgraphs sampled by :meth:`GraphStore.sample_subgraph` for
+    mini-batches of seed nodes, so that sampling runs in worker processes of
+    :ref:`api_paddle_io_DataLoader`. Each item is a mini-batch, so it should
+    be loaded with ``batch_size=None``.
+
+    Each item is a list of numpy arrays ``[out_nodes, reindex_src_0,
+    reindex_dst_0, reindex_src_1, reindex_dst_1, ...]``, followed by edge
+    ids of each hop if `return_eids` is True.
+
+    Args:
+        graph (GraphStore): The graph to sample from.
+        seeds (Tensor|numpy.ndarray|list): Global ids of all seed nodes.
+        fanouts (list[int]): Number of neighbors to sample of each hop.
+        batch_size (int): Number of seed nodes of a mini-batch.
+        shuffle (bool, optional): Whether to shuffle seed nodes every epoch.
+            Default is False.
+        drop_last (bool, optional): Whether to drop the last incomplete
+            mini-batch. Default is False.
+        return_eids (bool, optional): Whether to return edge ids of sampled
+            edges. Default is False.
+        seed (int, optional): Random seed of shuffling and sampling. Default
+            is 0.
+
+    Examples:
+        .. code-block:: python
+
+            import paddle
+
+            src = [3, 7, 0, 9, 1, 4, 2, 9, 3, 9, 1, 9, 7]
+            dst = [0, 0, 1, 1, 2, 3, 4, 5, 5, 6, 6, 8, 8]
+            graph = paddle.geometric.GraphStore.from_edges(src, dst, num_nodes=10)
+            dataset = paddle.geometric.NeighborSamplerDataset(
+                graph, seeds=list(range(10)), fanouts=[2, 2], batch_size=4, shuffle=True
+            )
+            loader = paddle.io.DataLoader(dataset, batch_size=None, num_workers=2)
+            for epoch in range(2):
+                dataset.set_epoch(epoch)
+                for nodes, src0, dst0, src1, dst1 in loader:
+                    pass
+    """
+
+    def __init__(
+        self,
+        graph,
+        seeds,
+        fanouts,
+        batch_size,
+        shuffle=False,
+        drop_last=False,
+        return_eids=False,
+        seed=0,
+    ):
+        assert (
+            isinstance(batch_size, int) and batch_size > 0
+        ), "batch_size should be a positive integer, but got {}".format(
+            batch_size
+        )
+        self.graph = graph
+        self.seeds = _to_numpy(seeds)
+        self.fanouts = list(fanouts)
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.return_eids = return_eids
+        self.seed = seed
+        self.epoch = 0
+        self._perm = None
+
+    def set_epoch(self, epoch):
+        """
+        Sets the epoch, which decides shuffling and sampling of the epoch.
+        Workers are started with a copy of the dataset, so it should be
+        called before iterating the DataLoader of the epoch, and doesn't
+        work with ``persistent_workers=True``.
+
+        Args:
+            epoch (int): Epoch number.
+        """
+        self.epoch = epoch
+
+    def __len__(self):
+        if self.drop_last:
+            return len(self.seeds) // self.batch_size
+        return int(math.ceil(len(self.seeds) / self.batch_size))
+
+    def __getitem__(self, idx):
+        if idx < 0 or idx >= len(self):
+            raise IndexError(f"Index {idx} out of range [0, {len(self)}).")
+        batch = slice(idx * self.batch_size, (idx + 1) * self.batch_size)
+        if self.shuffle:
+            if self._perm is None or self._perm[0] != self.epoch:
+                rng = np.random.default_rng([self.seed, self.epoch])
+                self._perm = (self.epoch, rng.permutation(len(self.seeds)))
+            batch = self._perm[1][batch]
+        batch = self.seeds[batch]
+        rng = np.random.default_rng([self.seed, self.epoch, idx])
+        outputs = self.graph._sample_subgraph(
+            batch, self.fanouts, self.return_eids, rng
+        )
+        items = [outputs[0]]
+        for src, dst in zip(outputs[1], outputs[2]):
+            items.extend([src, dst])
+        if self.return_eids:
+            items.extend(outputs[3])
+        return items
@@ -0,0 +1,150 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import collections
+import os
+import queue
+import threading
+
+import numpy as np
+
+from paddle.fluid import core
+
+
+def _snapshot_state(state):
+    """
+    Copy tensors in (nested) state dict to host memory, so that the state
+    can be serialized in background while training keeps updating the
+    original tensors. Structure, tensor names and non-tensor values are
+    kept unchanged.
+    """
+    if isinstance(state, core.eager.Tensor):
+        if not state._is_initialized():
+            # leave it to `paddle.save` to report the error
+            return state
+        snapshot = state._copy_to(core.CPUPlace(), True)
+        snapshot.name = state.name
+        return snapshot
+    if isinstance(state, np.ndarray):
+        return state.copy()
+    if type(state) in (dict, collections.OrderedDict):
+        return type(state)(
+            (key, _snapshot_state(value)) for key, value in state.items()
+        )
+    if type(state) in (list, tuple):
+        return type(state)(_snapshot_state(value) for value in state)
+    return state
+
+
+def _fsync_file(path):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_file(save_func, obj, path):
+    # write to a temporary file and rename it after fsync, so that a file
+    # at `path` is always a complete one even if the process is killed
+    tmp_path = path + '.tmp'
+    save_func(obj, tmp_path)
+    _fsync_file(tmp_path)
+    os.replace(tmp_path, path)
+
+
+class _AsyncCheckpointWriter:
+    """
+    Background writer of checkpoints used by `Model.save(async_save=True)`.
+
+    A checkpoint is a list of ``(save_func, obj, path)`` which are written
+    in order by one background thread as ``save_func(obj, path)``, objects
+    should be snapshots which are not modified by training anymore. At
+    most :attr:`max_pending` checkpoints wait in the queue, `submit`
+    blocks when the queue is full to bound the host memory used by
+    snapshots.
+
+    Error of a failed checkpoint is raised by the next `submit` or `wait`.
+
+    Args:
+        max_pending(int): maximum number of checkpoints waiting to be
+            written. Default: 1.
+    """
+
+    def __init__(self, max_pending=1):
+        assert max_pending > 0, "max_pending should be positive"
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._errors = []
+        # prefixes of checkpoints which are completely written
+        self.completed = []
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        # pending checkpoints should be written before interpreter exits
+        atexit.register(self.close)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                prefix, files = item
+                try:
+                    for save_func, obj, path in files:
+                        _write_file(save_func, obj, path)
+                    self.completed.append(prefix)
+                except Exception as e:
+                    self._errors.append((prefix, e))
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self):
+        if self._errors:
+            prefix, e = self._errors.pop(0)
+            self._errors.clear()
+            raise RuntimeError(
+                "Failed to save checkpoint {} asynchronously: {}".format(
+                    prefix, e
+                )
+            ) from e
+
+    def submit(self, prefix, files):
+        """
+        Queue a checkpoint to write, blocks if :attr:`max_pending`
+        checkpoints are waiting.
+
+        Args:
+            prefix(str): name of the checkpoint used in reporting.
+            files(list): list of ``(save_func, obj, path)`` to write.
+        """
+        self._raise_error()
+        if not self._thread.is_alive():
+            raise RuntimeError("Checkpoint writer has been closed.")
+        self._queue.put((prefix, files))
+
+    def wait(self):
+        """
+        Block until all queued checkpoints are written, raise error if
+        any of them failed.
+        """
+        if self._thread.is_alive():
+            self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        atexit.unregister(self.close)
@@ -558,6 +558,11 @@ class ModelCheckpoint(Callback):
             are saved. Default: 1.
         save_dir(str|None): The directory to save checkpoint during training.
             If None, will not save checkpoint. Default: None.
+        async_save(bool): Whether to save checkpoint asynchronously. If True,
+            model states are copied to host memory at the end of epoch and
+            written to disk in background, so that training is not blocked
+            by serialization. All checkpoints are written when training ends.
+            Default: False.
 
     Examples:
         .. code-block:: python
@@ -589,9 +594,10 @@ class ModelCheckpoint(Callback):
             model.fit(train_dataset, batch_size=64, callbacks=callback)
     """
 
-    def __init__(self, save_freq=1, save_dir=None):
+    def __init__(self, save_freq=1, save_dir=None, async_save=False):
         self.save_freq = save_freq
         self.save_dir = save_dir
+        self.async_save = async_save
 
     def on_epoch_begin(self, epoch=None, logs=None):
         self.epoch = epoch
@@ -607,13 +613,21 @@ class ModelCheckpoint(Callback):
         if self._is_save() and self.epoch % self.save_freq == 0:
             path = f'{self.save_dir}/{epoch}'
             print(f'save checkpoint at {os.path.abspath(path)}')
+            self._save(path)
+
+    def _save(self, path):
+        if self.async_save:
+            self.model.save(path, async_save=True)
+        else:
             self.model.save(path)
 
     def on_train_end(self, logs=None):
         if self._is_save():
             path = f'{self.save_dir}/final'
             print(f'save checkpoint at {os.path.abspath(path)}')
-            self.model.save(path)
+            self._save(path)
+            if self.async_save:
+                self.model.wait_save()
 
 
 class LRScheduler(Callback):
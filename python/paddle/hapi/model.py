@@ -41,6 +41,7 @@ from paddle.jit.translated_layer import INFER_MODEL_SUFFIX, INFER_PARAMS_SUFFIX
 from paddle.metric import Metric
 from paddle.static import InputSpec as Input
 
+from .async_checkpoint import _AsyncCheckpointWriter, _snapshot_state
 from .callbacks import EarlyStopping, config_callbacks
 from .model_summary import summary
 
@@ -354,36 +355,43 @@ class StaticGraphAdapter:
     def parameters(self, *args, **kwargs):
         return self.model.network.parameters(*args, **kwargs)
 
-    def save(self, path):
+    def save(self, path, checkpoint_writer=None):
         def _save(state, path):
-            if not state:
-                return
-            state = {
+            with open(path, 'wb') as f:
+                pickle.dump(state, f)
+
+        def _to_numpy(state):
+            # fetching variables from scope copies them to host, so the
+            # result is a snapshot which can be written asynchronously
+            return {
                 k: to_numpy(v) if isinstance(v, Variable) else v
                 for k, v in state.items()
             }
-            with open(path, 'wb') as f:
-                pickle.dump(state, f)
 
         base = os.path.basename(path)
         assert base != "", "path should be of 'dirname/filename' format"
         dir_name = os.path.dirname(path)
         if dir_name and not os.path.exists(dir_name):
             os.makedirs(dir_name)
-        param_path = path + ".pdparams"
-        _save(self.model.network.state_dict(), param_path)
+        files = []
+        params = self.model.network.state_dict()
+        if params:
+            files.append((_save, _to_numpy(params), path + ".pdparams"))
         prog = self._progs.get('train', None)
-        if prog is None or self.model._optimizer is None:
-            return
-        # XXX `optimizer.state_dict()` only work in dygraph mode
-        optim_path = path + ".pdopt"
-        optim = {
-            p.name: p for p in filter(is_belong_to_optimizer, prog.list_vars())
-        }
-        if not optim:
-            return
+        if prog is not None and self.model._optimizer is not None:
+            # XXX `optimizer.state_dict()` only work in dygraph mode
+            optim = {
+                p.name: p
+                for p in filter(is_belong_to_optimizer, prog.list_vars())
+            }
+            if optim:
+                files.append((_save, _to_numpy(optim), path + ".pdopt"))
 
-        _save(optim, optim_path)
+        if checkpoint_writer is None:
+            for save_func, state, file_path in files:
+                save_func(state, file_path)
+        else:
+            checkpoint_writer.submit(path, files)
 
     # TODO: support save/load scaler state in static graph
     def load(self, param_state_pairs, optim_state):
@@ -792,6 +800,11 @@ class DynamicGraphAdapter:
         self._amp_custom_lists = {}
         self._use_fp16_guard = True
 
+        # when greater than 1, losses are returned as device tensors and
+        # metric outputs are buffered until `_sync_metrics` is called
+        self._sync_interval = 1
+        self._pending_metric_outs = []
+
         if self._nranks > 1:
             dist.init_parallel_env()
             stradegy = paddle.distributed.parallel.ParallelStrategy()
@@ -858,13 +871,12 @@ class DynamicGraphAdapter:
         metrics = []
         for metric in self.model._metrics:
             metric_outs = metric.compute(*(to_list(outputs) + labels))
-            m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
-            metrics.append(m)
+            metrics.append(self._update_metric(metric, metric_outs))
 
         return (
-            ([to_numpy(l) for l in losses], metrics)
+            (self._fetch_losses(losses), metrics)
             if len(metrics) > 0
-            else [to_numpy(l) for l in losses]
+            else self._fetch_losses(losses)
         )
 
     def eval_batch(self, inputs, labels=None):
@@ -919,16 +931,36 @@ class DynamicGraphAdapter:
                     self._merge_count[self.mode + '_batch'] = samples
 
             metric_outs = metric.compute(*(to_list(outputs) + labels))
-            m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
-            metrics.append(m)
+            metrics.append(self._update_metric(metric, metric_outs))
 
         if self.model._loss and len(metrics):
-            return [to_numpy(l) for l in losses], metrics
+            return self._fetch_losses(losses), metrics
         elif self.model._loss:
-            return [to_numpy(l) for l in losses]
+            return self._fetch_losses(losses)
         else:
             return metrics
 
+    def _fetch_losses(self, losses):
+        if self._sync_interval > 1:
+            return [l.detach() for l in losses]
+        return [to_numpy(l) for l in losses]
+
+    def _update_metric(self, metric, metric_outs):
+        metric_outs = to_list(metric_outs)
+        if self._sync_interval > 1:
+            self._pending_metric_outs.append(
+                (metric, [m.detach() for m in metric_outs])
+            )
+            return None
+        return metric.update(*[to_numpy(m) for m in metric_outs])
+
+    def _sync_metrics(self):
+        # feed the metric outputs buffered since the last sync to metrics,
+        # only the first fetch waits for the device
+        for metric, metric_outs in self._pending_metric_outs:
+            metric.update(*[to_numpy(m) for m in metric_outs])
+        self._pending_metric_outs = []
+
     def predict_batch(self, inputs):
         self.model.network.eval()
         self.mode = 'test'
@@ -943,17 +975,28 @@ class DynamicGraphAdapter:
     def parameters(self, *args, **kwargs):
         return self.model.network.parameters(*args, **kwargs)
 
-    def save(self, path):
-        params = self.model.network.state_dict()
-        paddle.save(params, path + '.pdparams')
+    def save(self, path, checkpoint_writer=None):
+        states = [(self.model.network.state_dict(), path + '.pdparams')]
         if self.model._optimizer is not None:
             if self.model._optimizer.state_dict():
                 optim = self.model._optimizer.state_dict()
-                paddle.save(optim, path + '.pdopt')
+                states.append((optim, path + '.pdopt'))
         if hasattr(self.model, '_scaler') and self.model._scaler is not None:
             if self.model._scaler.state_dict():
                 scaler = self.model._scaler.state_dict()
-                paddle.save(scaler, path + '.pdscaler')
+                states.append((scaler, path + '.pdscaler'))
+
+        if checkpoint_writer is None:
+            for state, file_path in states:
+                paddle.save(state, file_path)
+        else:
+            # only copying tensors to host blocks training, serialization
+            # is done by the background writer
+            files = [
+                (paddle.save, _snapshot_state(state), file_path)
+                for state, file_path in states
+            ]
+            checkpoint_writer.submit(path, files)
 
     def load(self, param_state_pairs, optim_state, scaler_state=None):
         # restore parameter states
@@ -1170,6 +1213,7 @@ class Model:
         self._is_shape_inferred = False
         self._test_dataloader = None
         self.stop_training = False
+        self._checkpoint_writer = None
 
         if not in_dynamic_mode():
             if not isinstance(inputs, (list, tuple, dict, Input)):
@@ -1346,7 +1390,7 @@ class Model:
             self._update_inputs()
         return loss
 
-    def save(self, path, training=True):
+    def save(self, path, training=True, async_save=False):
         """
 
         This function saves parameters, optimizer information or model and
@@ -1369,6 +1413,16 @@ class Model:
                 A exception will be raised.
             training (bool, optional): Whether to save for training. If not, save
                 for inference only. Default: True.
+            async_save (bool, optional): Whether to save for training
+                asynchronously. If True, parameters and optimizer states are
+                copied to host memory and this function returns, files are
+                written by a background thread. At most one checkpoint waits
+                to be written, later call blocks until it is taken by the
+                background thread. Use :code:`wait_save` to wait until all
+                checkpoints are written. Error of a failed asynchronous save
+                is raised by the next call of this function or
+                :code:`wait_save`. It is ignored if `training` is False.
+                Default: False.
 
         Returns:
             None
@@ -1422,9 +1476,44 @@ class Model:
         if paddle.distributed.ParallelEnv().local_rank == 0:
             if not training:
                 self._save_inference_model(path)
+            elif async_save:
+                if self._checkpoint_writer is None:
+                    self._checkpoint_writer = _AsyncCheckpointWriter()
+                self._adapter.save(path, self._checkpoint_writer)
             else:
                 self._adapter.save(path)
 
+    def wait_save(self):
+        """
+
+        Block until all checkpoints saved by :code:`save` with
+        `async_save=True` are written to disk.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If any of the asynchronous checkpoints failed.
+
+        Examples:
+
+            .. code-block:: python
+
+                import paddle
+
+                linear = paddle.nn.Linear(10, 1)
+                model = paddle.Model(linear)
+                optim = paddle.optimizer.Adam(
+                    learning_rate=1e-3, parameters=linear.parameters())
+                model.prepare(optim, paddle.nn.MSELoss())
+                model.save('checkpoint/test', async_save=True)
+                # training goes on while checkpoint is being written
+                model.wait_save()
+
+        """
+        if self._checkpoint_writer is not None:
+            self._checkpoint_writer.wait()
+
     def load(self, path, skip_mismatch=False, reset_optimizer=False):
         """
 
@@ -1755,6 +1844,7 @@ class Model:
         callbacks=None,
         accumulate_grad_batches=1,
         num_iters=None,
+        sync_interval=1,
     ):
         """
 
@@ -1803,6 +1893,12 @@ class Model:
             num_iters (int|None, optional): The number of iterations to evaluate the model.
                 If None, evaluate on whole input dataset, otherwise, evaluate `num_iters` times.
                 Default: None.
+            sync_interval (int, optional): The frequency, in number of steps, losses and
+                metrics are fetched from device to host. When greater than 1, losses are
+                accumulated on device and metric outputs are buffered, they are only
+                synchronized every `sync_interval` steps, at `log_freq` boundaries and at the
+                end of epoch, and callbacks receive the losses averaged over the synchronized
+                steps. Only takes effect in dynamic graph mode. Default: 1.
 
         Returns:
             None
@@ -1892,6 +1988,9 @@ class Model:
 
         """
         assert train_data is not None, "train_data must be given!"
+        assert (
+            isinstance(sync_interval, int) and sync_interval > 0
+        ), "sync_interval must be a positive integer!"
 
         if isinstance(batch_size, (tuple, list)) and all(
             isinstance(x, int) for x in batch_size
@@ -1969,7 +2068,13 @@ class Model:
         cbks.on_begin('train')
         for epoch in range(epochs):
             cbks.on_epoch_begin(epoch)
-            logs = self._run_one_epoch(train_loader, cbks, 'train')
+            logs = self._run_one_epoch(
+                train_loader,
+                cbks,
+                'train',
+                sync_interval=sync_interval,
+                log_freq=log_freq,
+            )
             cbks.on_epoch_end(epoch, logs)
 
             if do_eval and epoch % eval_freq == 0:
@@ -1979,7 +2084,13 @@ class Model:
                     {'steps': eval_steps, 'metrics': self._metrics_name()},
                 )
 
-                eval_logs = self._run_one_epoch(eval_loader, cbks, 'eval')
+                eval_logs = self._run_one_epoch(
+                    eval_loader,
+                    cbks,
+                    'eval',
+                    sync_interval=sync_interval,
+                    log_freq=log_freq,
+                )
 
                 cbks.on_end('eval', eval_logs)
             if self.stop_training:
@@ -2287,8 +2398,20 @@ class Model:
         callbacks,
         mode,
         logs={},
+        sync_interval=1,
+        log_freq=None,
     ):
         outputs = []
+        deferred = (
+            mode != 'predict'
+            and sync_interval > 1
+            and isinstance(self._adapter, DynamicGraphAdapter)
+        )
+        if isinstance(self._adapter, DynamicGraphAdapter):
+            self._adapter._sync_interval = sync_interval if deferred else 1
+            self._adapter._pending_metric_outs = []
+        loss_sums = None
+        pending_steps = 0
         for step, data in enumerate(data_loader):
             # data might come from different types of data_loader and have
             # different format, as following:
@@ -2323,21 +2446,37 @@ class Model:
 
                 outs = getattr(self, mode + '_batch')(*_inputs)
 
-                if self._metrics and self._loss:
+                if deferred:
+                    if self._loss:
+                        losses = outs[0] if self._metrics else outs
+                        loss_sums = (
+                            losses
+                            if loss_sums is None
+                            else [s + l for s, l in zip(loss_sums, losses)]
+                        )
+                    pending_steps += 1
+                    if (step + 1) % sync_interval == 0 or (
+                        log_freq and (step + 1) % log_freq == 0
+                    ):
+                        self._sync_logs(loss_sums, pending_steps, logs)
+                        loss_sums = None
+                        pending_steps = 0
+                elif self._metrics and self._loss:
                     metrics = [[float(l) for l in outs[0]]]
                 elif self._loss:
                     metrics = [[float(l) for l in outs]]
                 else:
                     metrics = []
 
-                # metrics
-                for metric in self._metrics:
-                    res = metric.accumulate()
-                    metrics.extend(to_list(res))
+                if not deferred:
+                    # metrics
+                    for metric in self._metrics:
+                        res = metric.accumulate()
+                        metrics.extend(to_list(res))
 
-                assert len(self._metrics_name()) == len(metrics)
-                for k, v in zip(self._metrics_name(), metrics):
-                    logs[k] = v
+                    assert len(self._metrics_name()) == len(metrics)
+                    for k, v in zip(self._metrics_name(), metrics):
+                        logs[k] = v
             else:
                 if self._inputs is not None:
                     outs = self.predict_batch(data[: len(self._inputs)])
@@ -2364,6 +2503,10 @@ class Model:
                     self.stop_training = True
                     del self.num_iters
                     break
+        if deferred:
+            if pending_steps > 0:
+                self._sync_logs(loss_sums, pending_steps, logs)
+            self._adapter._sync_interval = 1
         self._reset_metrics()
 
         if mode == 'predict':
@@ -2460,6 +2603,22 @@ class Model:
 
         return out_specs
 
+    def _sync_logs(self, loss_sums, num_steps, logs):
+        # materialize the losses accumulated on device and the buffered
+        # metric outputs, losses are averaged over the synchronized steps
+        self._adapter._sync_metrics()
+        if self._loss:
+            metrics = [[float(s) / num_steps for s in loss_sums]]
+        else:
+            metrics = []
+        for metric in self._metrics:
+            res = metric.accumulate()
+            metrics.extend(to_list(res))
+
+        assert len(self._metrics_name()) == len(metrics)
+        for k, v in zip(self._metrics_name(), metrics):
+            logs[k] = v
+
     def _reset_metrics(self):
         for metric in self._metrics:
             metric.reset()
@@ -44,6 +44,10 @@ def set_config(config=None):
     the origin dataloader setting. Tuning parameters are as follows:
 
     - enable(bool): Whether to enable dataloader tuning.
+    - tuning_steps(int): Number of steps to benchmark each num_workers. Default: 500.
+    - online(bool): Whether to tune num_workers and prefetch_factor of multi-process
+      dataloader continuously during training by the time waiting for data, instead
+      of benchmarking before training. Default: False.
 
     Args:
         config (dict|str|None, optional): Configuration for auto-tuning. If it is a
@@ -145,14 +149,22 @@ def set_config(config=None):
                     "The auto-tuning configuration of the dataloader is incorrect."
                     "The `enable` should be bool. Use default parameter instead."
                 )
+        tuning_steps = 500
         if "tuning_steps" in dataloader_config:
             if isinstance(dataloader_config['tuning_steps'], int):
-                paddle.io.reader.set_autotune_config(
-                    use_autoune, dataloader_config['tuning_steps']
-                )
+                tuning_steps = dataloader_config['tuning_steps']
             else:
                 warnings.warn(
                     "The auto-tuning configuration of the dataloader is incorrect."
                     "The `tuning_steps` should be int. Use default parameter instead."
                 )
-                paddle.io.reader.set_autotune_config(use_autoune)
+        online = False
+        if "online" in dataloader_config:
+            if isinstance(dataloader_config['online'], bool):
+                online = dataloader_config['online']
+            else:
+                warnings.warn(
+                    "The auto-tuning configuration of the dataloader is incorrect."
+                    "The `online` should be bool. Use default parameter instead."
+                )
+        paddle.io.reader.set_autotune_config(use_autoune, tuning_steps, online)
@@ -24,6 +24,8 @@ from .dataloader import Sampler  # noqa: F401
 from .dataloader import SequenceSampler  # noqa: F401
 from .dataloader import RandomSampler  # noqa: F401
 from .dataloader import DistributedBatchSampler  # noqa: F401
+from .dataloader import BucketBatchSampler  # noqa: F401
+from .dataloader import DistributedBucketBatchSampler  # noqa: F401
 from .dataloader import ComposeDataset  # noqa: F401
 from .dataloader import ChainDataset  # noqa: F401
 from .dataloader import WeightedRandomSampler  # noqa: F401
@@ -38,6 +40,8 @@ __all__ = [  # noqa
     'ChainDataset',
     'BatchSampler',
     'DistributedBatchSampler',
+    'BucketBatchSampler',
+    'DistributedBucketBatchSampler',
     'DataLoader',
     'get_worker_info',
     'Sampler',
@@ -22,6 +22,8 @@ from .dataset import Subset
 
 from .batch_sampler import BatchSampler
 from .batch_sampler import DistributedBatchSampler
+from .batch_sampler import BucketBatchSampler
+from .batch_sampler import DistributedBucketBatchSampler
 
 from .worker import get_worker_info
 
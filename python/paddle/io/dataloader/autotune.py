@@ -0,0 +1,135 @@
+#   Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+class _TuneAction:
+    ADD_WORKER = 'add_worker'
+    REMOVE_WORKER = 'remove_worker'
+    INCREASE_PREFETCH = 'increase_prefetch'
+    DECREASE_PREFETCH = 'decrease_prefetch'
+
+
+class _OnlineAutoTuner:
+    """
+    Online tuner of worker number and prefetch factor for multi-process
+    DataLoader, which watches the time training loop waits for data
+    against the time of each step, and decides whether to grow or shrink
+    the input pipeline once every window of steps.
+
+    If reader wait time takes more than :attr:`high_wait_ratio` of step
+    time, a worker is added, or prefetch factor is increased if worker
+    number reaches :attr:`max_num_workers`. If reader wait time takes less
+    than :attr:`low_wait_ratio` of step time for :attr:`patience` windows,
+    prefetch factor is decreased, or a worker is removed if prefetch
+    factor reaches :attr:`min_prefetch_factor`.
+
+    Args:
+        min_num_workers(int): minimum number of workers.
+        max_num_workers(int): maximum number of workers.
+        min_prefetch_factor(int): minimum prefetch factor.
+        max_prefetch_factor(int): maximum prefetch factor.
+        window(int): number of steps to make one decision.
+        high_wait_ratio(float): wait ratio to grow input pipeline.
+        low_wait_ratio(float): wait ratio to shrink input pipeline.
+        patience(int): number of low wait ratio windows to shrink.
+    """
+
+    def __init__(
+        self,
+        min_num_workers=1,
+        max_num_workers=8,
+        min_prefetch_factor=2,
+        max_prefetch_factor=8,
+        window=50,
+        high_wait_ratio=0.1,
+        low_wait_ratio=0.01,
+        patience=3,
+    ):
+        assert 0 < min_num_workers <= max_num_workers
+        assert 0 < min_prefetch_factor <= max_prefetch_factor
+        assert 0 <= low_wait_ratio < high_wait_ratio
+        self.min_num_workers = min_num_workers
+        self.max_num_workers = max_num_workers
+        self.min_prefetch_factor = min_prefetch_factor
+        self.max_prefetch_factor = max_prefetch_factor
+        self.window = window
+        self.high_wait_ratio = high_wait_ratio
+        self.low_wait_ratio = low_wait_ratio
+        self.patience = patience
+
+        # (num_workers, prefetch_factor, wait_ratio, action) of each window
+        self.history = []
+        self._reset_window()
+        self._low_windows = 0
+
+    def _reset_window(self):
+        self._wait_time = 0.0
+        self._step_time = 0.0
+        self._steps = 0
+
+    def _decide(self, wait_ratio, num_workers, prefetch_factor, removable):
+        if wait_ratio > self.high_wait_ratio:
+            self._low_windows = 0
+            if num_workers < self.max_num_workers:
+                return _TuneAction.ADD_WORKER
+            if prefetch_factor < self.max_prefetch_factor:
+                return _TuneAction.INCREASE_PREFETCH
+        elif wait_ratio < self.low_wait_ratio:
+            self._low_windows += 1
+            if self._low_windows >= self.patience:
+                self._low_windows = 0
+                if prefetch_factor > self.min_prefetch_factor:
+                    return _TuneAction.DECREASE_PREFETCH
+                if removable and num_workers > self.min_num_workers:
+                    return _TuneAction.REMOVE_WORKER
+        else:
+            self._low_windows = 0
+        return None
+
+    def step(
+        self,
+        wait_time,
+        step_time,
+        num_workers,
+        prefetch_factor,
+        removable=True,
+    ):
+        """
+        Record one step and make a decision at the end of a window.
+
+        Args:
+            wait_time(float): seconds waiting for the batch of this step.
+            step_time(float): seconds of this step except wait_time.
+            num_workers(int): current active worker number.
+            prefetch_factor(int): current prefetch factor.
+            removable(bool): whether workers can be removed.
+
+        Returns:
+            str|None: action in :code:`_TuneAction`, or None for no change.
+        """
+        self._wait_time += wait_time
+        self._step_time += step_time
+        self._steps += 1
+        if self._steps < self.window:
+            return None
+
+        total_time = self._wait_time + self._step_time
+        wait_ratio = self._wait_time / total_time if total_time > 0 else 0.0
+        self._reset_window()
+
+        action = self._decide(
+            wait_ratio, num_workers, prefetch_factor, removable
+        )
+        self.history.append((num_workers, prefetch_factor, wait_ratio, action))
+        return action
@@ -363,3 +363,374 @@ class DistributedBatchSampler(BatchSampler):
                     sampler.set_epoch(epoch)
         """
         self.epoch = epoch
+
+
+class BucketBatchSampler(BatchSampler):
+    """
+    Batch sampler which groups samples of similar lengths into the same
+    mini-batch to reduce padding of variable-length sequences, e.g. for
+    NLP and speech tasks.
+
+    Samples are split into buckets by their lengths and :attr:`boundaries`,
+    and mini-batches are formed from samples in the same bucket. If
+    :attr:`max_tokens` is set, samples are added into a mini-batch as long
+    as the padded token number, i.e. sample number multiplied by the max
+    sample length in the mini-batch, does not exceed :attr:`max_tokens`,
+    so mini-batches of short samples hold more samples than those of long
+    samples. A sample longer than :attr:`max_tokens` forms a mini-batch by
+    itself.
+
+    Mini-batches are deterministic for a given :attr:`seed` and epoch. If
+    :attr:`shuffle` is True, samples in each bucket and the order of
+    mini-batches are shuffled with :attr:`seed` plus epoch number as random
+    seed, epoch number is increased after each iteration and can be set by
+    :code:`set_epoch`.
+
+    Args:
+        lengths(list|tuple|numpy.ndarray|Dataset): lengths of all samples,
+            or a dataset whose sample lengths are computed by
+            :attr:`length_fn` once when initializing.
+        batch_size(int, optional): max sample number in a mini-batch. At
+            least one of :attr:`batch_size` and :attr:`max_tokens` should be
+            set. Default None.
+        max_tokens(int, optional): max padded token number of a mini-batch.
+            Default None.
+        boundaries(list|tuple, optional): increasing length boundaries of
+            buckets, a sample of length ``l`` is put into bucket ``i`` if
+            ``boundaries[i-1] <= l < boundaries[i]``. If None, boundaries are
+            set by quantiles of lengths to split samples into
+            :attr:`num_buckets` buckets evenly. Default None.
+        num_buckets(int, optional): bucket number when :attr:`boundaries` is
+            None. Default 10.
+        length_fn(callable, optional): function to compute length of a
+            sample if :attr:`lengths` is a dataset. Default None, use
+            ``len(sample[0])`` if the sample is a tuple or list, otherwise
+            ``len(sample)``.
+        shuffle(bool, optional): whether to shuffle samples in buckets and
+            the order of mini-batches. Default False.
+        drop_last(bool, optional): whether to drop the last mini-batch of
+            each bucket if it is incomplete, i.e. it could take another
+            sample as long as the sample is not longer than those in it
+            without exceeding :attr:`batch_size` or :attr:`max_tokens`.
+            Default False.
+        seed(int, optional): random seed for shuffling. Default 0.
+
+    Returns:
+        BucketBatchSampler: an iterable object for indices iterating
+
+    Examples:
+
+        .. code-block:: python
+
+            import numpy as np
+            from paddle.io import BucketBatchSampler
+
+            lengths = np.random.randint(1, 100, [1000])
+            bs = BucketBatchSampler(lengths,
+                                    max_tokens=1024,
+                                    num_buckets=8,
+                                    shuffle=True)
+
+            for epoch in range(2):
+                bs.set_epoch(epoch)
+                for batch_indices in bs:
+                    assert len(batch_indices) * lengths[batch_indices].max() <= 1024 \
+                        or len(batch_indices) == 1
+    """
+
+    def __init__(
+        self,
+        lengths,
+        batch_size=None,
+        max_tokens=None,
+        boundaries=None,
+        num_buckets=10,
+        length_fn=None,
+        shuffle=False,
+        drop_last=False,
+        seed=0,
+    ):
+        assert (
+            batch_size is not None or max_tokens is not None
+        ), "at least one of batch_size and max_tokens should be set"
+        assert batch_size is None or (
+            isinstance(batch_size, int) and batch_size > 0
+        ), "batch_size should be a positive integer, but got {}".format(
+            batch_size
+        )
+        assert max_tokens is None or (
+            isinstance(max_tokens, int) and max_tokens > 0
+        ), "max_tokens should be a positive integer, but got {}".format(
+            max_tokens
+        )
+        assert isinstance(
+            shuffle, bool
+        ), f"shuffle should be a boolean value, but got {type(shuffle)}"
+        assert isinstance(
+            drop_last, bool
+        ), "drop_last should be a boolean value, but got {}".format(
+            type(drop_last)
+        )
+        self.batch_size = batch_size
+        self.max_tokens = max_tokens
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.seed = seed
+        self.epoch = 0
+
+        if not isinstance(lengths, (list, tuple, np.ndarray)):
+            length_fn = length_fn or _default_length_fn
+            lengths = [length_fn(lengths[i]) for i in range(len(lengths))]
+        self.lengths = np.asarray(lengths, dtype='int64')
+        assert self.lengths.ndim == 1, "lengths should be 1-D"
+
+        if boundaries is None:
+            assert (
+                isinstance(num_buckets, int) and num_buckets > 0
+            ), "num_buckets should be a positive integer"
+            if len(self.lengths) > 0:
+                quantiles = np.linspace(0, 1, num_buckets + 1)[1:-1]
+                boundaries = np.unique(
+                    np.ceil(np.quantile(self.lengths, quantiles))
+                ).astype('int64')
+            else:
+                boundaries = []
+        else:
+            assert np.all(
+                np.diff(boundaries) > 0
+            ), "boundaries should be increasing"
+        self.boundaries = np.asarray(boundaries, dtype='int64')
+
+        bucket_ids = np.searchsorted(self.boundaries, self.lengths, 'right')
+        # sample indices of each non-empty bucket, in increasing order
+        order = np.argsort(bucket_ids, kind='stable')
+        splits = np.flatnonzero(np.diff(bucket_ids[order])) + 1
+        self._buckets = [b for b in np.split(order, splits) if len(b) > 0]
+
+        # mini-batches are cached by epoch, for __len__ of shuffled
+        # token-budget batching depends on the samples order of epoch
+        self._cached_epoch = None
+        self._cached_batches = None
+        # batch number of the epoch being iterated, whose epoch number has
+        # been increased when shuffle is True
+        self._iter_len = None
+
+    def _split_bucket(self, indices):
+        lengths = self.lengths[indices]
+        batches = []
+        start = 0
+        max_len = 0
+        for i, length in enumerate(lengths.tolist()):
+            count = i - start
+            new_max_len = max(max_len, length)
+            if count > 0 and (
+                (self.batch_size is not None and count >= self.batch_size)
+                or (
+                    self.max_tokens is not None
+                    and new_max_len * (count + 1) > self.max_tokens
+                )
+            ):
+                batches.append(indices[start:i].tolist())
+                start = i
+                new_max_len = length
+            max_len = new_max_len
+        if start < len(indices):
+            count = len(indices) - start
+            full = (
+                self.batch_size is not None and count >= self.batch_size
+            ) or (
+                self.max_tokens is not None
+                and max_len * (count + 1) > self.max_tokens
+            )
+            if full or not self.drop_last:
+                batches.append(indices[start:].tolist())
+        return batches
+
+    def _get_batches(self, epoch):
+        if self._cached_epoch == epoch:
+            return self._cached_batches
+
+        rng = np.random.RandomState(self.seed + epoch) if self.shuffle else None
+        batches = []
+        for indices in self._buckets:
+            if rng is not None:
+                indices = rng.permutation(indices)
+            batches.extend(self._split_bucket(indices))
+        if rng is not None:
+            batches = [batches[i] for i in rng.permutation(len(batches))]
+
+        self._cached_epoch = epoch
+        self._cached_batches = batches
+        return batches
+
+    def _get_epoch_batches(self, epoch):
+        return self._get_batches(epoch)
+
+    def __iter__(self):
+        batches = self._get_epoch_batches(self.epoch)
+        if self.shuffle:
+            self.epoch += 1
+        # a list as a token, not to be reset by a stale iterator
+        iter_len = self._iter_len = [len(batches)]
+        try:
+            yield from batches
+        finally:
+            if self._iter_len is iter_len:
+                self._iter_len = None
+
+    def __len__(self):
+        if self._iter_len is not None:
+            return self._iter_len[0]
+        return len(self._get_epoch_batches(self.epoch))
+
+    def set_epoch(self, epoch):
+        """
+        Sets the epoch number. When :attr:`shuffle=True`, :attr:`seed` plus
+        this number is used as random seed, mini-batches are the same for
+        the same epoch number.
+
+        Arguments:
+            epoch (int): Epoch number.
+
+        Examples:
+            .. code-block:: python
+
+                import numpy as np
+                from paddle.io import BucketBatchSampler
+
+                lengths = np.random.randint(1, 100, [1000])
+                bs = BucketBatchSampler(lengths, batch_size=32, shuffle=True)
+
+                for epoch in range(10):
+                    bs.set_epoch(epoch)
+        """
+        self.epoch = epoch
+
+
+def _default_length_fn(sample):
+    if isinstance(sample, (list, tuple)):
+        sample = sample[0]
+    return len(sample)
+
+
+class DistributedBucketBatchSampler(BucketBatchSampler):
+    """
+    Distributed version of :ref:`api_paddle_io_BucketBatchSampler`, which
+    restricts mini-batches of each process to an exclusive subset.
+
+    All processes form the same mini-batches of an epoch as
+    :ref:`api_paddle_io_BucketBatchSampler` with the same :attr:`seed`,
+    and mini-batch ``i`` is assigned to process ``i % num_replicas``. To
+    keep all processes running the same number of steps, mini-batch number
+    is rounded down to a multiple of :attr:`num_replicas` if
+    :attr:`drop_last` is True, otherwise rounded up by repeating the first
+    mini-batches.
+
+    Args:
+        lengths(list|tuple|numpy.ndarray|Dataset): see
+            :ref:`api_paddle_io_BucketBatchSampler`.
+        batch_size(int, optional): max sample number in a mini-batch.
+            Default None.
+        max_tokens(int, optional): max padded token number of a mini-batch.
+            Default None.
+        boundaries(list|tuple, optional): increasing length boundaries of
+            buckets. Default None.
+        num_buckets(int, optional): bucket number when :attr:`boundaries` is
+            None. Default 10.
+        length_fn(callable, optional): function to compute length of a
+            sample if :attr:`lengths` is a dataset. Default None.
+        num_replicas(int, optional): porcess number in distributed training.
+            If :attr:`num_replicas` is None, :attr:`num_replicas` will be
+            retrieved from :ref:`api_paddle_distributed_ParallelEnv` .
+            Default None.
+        rank(int, optional): the rank of the current process among
+            :attr:`num_replicas` processes. If :attr:`rank` is None,
+            :attr:`rank` is retrieved from
+            :ref:`api_paddle_distributed_ParallelEnv`. Default None.
+        shuffle(bool, optional): whether to shuffle samples in buckets and
+            the order of mini-batches. Default False.
+        drop_last(bool, optional): whether to drop the last mini-batch of
+            each bucket if it is incomplete, and drop mini-batches which
+            cannot be evenly assigned to processes. Default False.
+        seed(int, optional): random seed for shuffling, should be the same
+            in all processes. Default 0.
+
+    Returns:
+        DistributedBucketBatchSampler: an iterable object for indices iterating
+
+    Examples:
+        .. code-block:: python
+
+            import numpy as np
+            from paddle.io import DistributedBucketBatchSampler
+
+            lengths = np.random.randint(1, 100, [1000])
+            bs = DistributedBucketBatchSampler(lengths,
+                                               max_tokens=1024,
+                                               num_replicas=2,
+                                               rank=0,
+                                               shuffle=True)
+
+            for epoch in range(2):
+                bs.set_epoch(epoch)
+                for batch_indices in bs:
+                    pass
+    """
+
+    def __init__(
+        self,
+        lengths,
+        batch_size=None,
+        max_tokens=None,
+        boundaries=None,
+        num_buckets=10,
+        length_fn=None,
+        num_replicas=None,
+        rank=None,
+        shuffle=False,
+        drop_last=False,
+        seed=0,
+    ):
+        super().__init__(
+            lengths,
+            batch_size=batch_size,
+            max_tokens=max_tokens,
+            boundaries=boundaries,
+            num_buckets=num_buckets,
+            length_fn=length_fn,
+            shuffle=shuffle,
+            drop_last=drop_last,
+            seed=seed,
+        )
+
+        from paddle.distributed import ParallelEnv
+
+        if num_replicas is not None:
+            assert (
+                isinstance(num_replicas, int) and num_replicas > 0
+            ), "num_replicas should be a positive integer"
+            self.nranks = num_replicas
+        else:
+            self.nranks = ParallelEnv().nranks
+
+        if rank is not None:
+            assert (
+                isinstance(rank, int) and rank >= 0
+            ), "rank should be a non-negative integer"
+            self.local_rank = rank
+        else:
+            self.local_rank = ParallelEnv().local_rank
+
+    def _get_epoch_batches(self, epoch):
+        batches = self._get_batches(epoch)
+        num_batches = len(batches)
+        if self.drop_last:
+            num_batches = num_batches // self.nranks * self.nranks
+        else:
+            num_batches = (
+                int(math.ceil(num_batches * 1.0 / self.nranks)) * self.nranks
+            )
+        if num_batches > len(batches) and len(batches) > 0:
+            repeats = int(math.ceil(num_batches * 1.0 / len(batches)))
+            batches = batches * repeats
+        return batches[self.local_rank : num_batches : self.nranks]
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import numbers
+import operator
 from collections.abc import Mapping, Sequence
 
 import numpy as np
@@ -109,3 +110,226 @@ def default_convert_fn(batch):
         return [default_convert_fn(d) for d in batch]
     else:
         return batch
+
+
+_get_shape = operator.attrgetter('shape')
+_get_dtype = operator.attrgetter('dtype')
+
+
+class _SchemaCollator:
+    """
+    Collate function which outputs the same batches as
+    :code:`default_collate_fn` for batches of fixed-schema samples, e.g.
+    samples of fixed-shape images and features.
+
+    The schema of samples, i.e. the nesting structure and the shape and
+    dtype of each numpy array or number field, is inferred from the first
+    batch and compiled into a flat list of fields. Following batches are
+    collated by copying each field of each sample into preallocated batch
+    buffers in place, instead of walking samples recursively and stacking
+    each field into a newly allocated array. Batches which do not match
+    the schema, e.g. with varying shapes, fall back to
+    :code:`default_collate_fn`, and the schema is abandoned after
+    :attr:`max_mismatches` mismatched batches.
+
+    If :attr:`reuse_buffers` is True, batches are written into a ring of
+    :attr:`num_buffers` buffers, so a batch is overwritten after
+    :attr:`num_buffers` calls and should be copied out before that, which
+    is the case in DataLoader as batches are always copied into
+    LoDTensors or shared memory after collating.
+
+    Args:
+        reuse_buffers(bool): whether to reuse batch buffers. Default True.
+        num_buffers(int): number of reused buffers. Default 2.
+        max_mismatches(int): number of mismatched batches to abandon the
+            schema. Default 8.
+    """
+
+    # kinds of fields
+    _ARRAY = 0
+    _NUMBER = 1
+    _STRING = 2
+
+    def __init__(self, reuse_buffers=True, num_buffers=2, max_mismatches=8):
+        self._reuse_buffers = reuse_buffers
+        self._num_buffers = num_buffers
+        self._max_mismatches = max_mismatches
+        self._mismatches = 0
+        self._disabled = False
+        # structure of sample with fields replaced by field index
+        self._structure = None
+        # list of (getter, kind, shape, dtype) of each field
+        self._fields = None
+        # list of (getter, length) of each dict and sequence in sample
+        self._containers = None
+        self._buffers = []
+        self._buffer_idx = 0
+
+    def __getstate__(self):
+        # schema and buffers are inferred in each worker process
+        state = self.__dict__.copy()
+        state.update(
+            _structure=None,
+            _fields=None,
+            _containers=None,
+            _buffers=[],
+            _buffer_idx=0,
+        )
+        return state
+
+    def _compile(self, sample, path):
+        if isinstance(sample, np.ndarray):
+            if sample.dtype.hasobject:
+                return None
+            self._fields.append((path, self._ARRAY, sample.shape, sample.dtype))
+        elif isinstance(sample, numbers.Number):
+            self._fields.append((path, self._NUMBER, None, None))
+        elif isinstance(sample, (str, bytes)):
+            self._fields.append((path, self._STRING, None, None))
+        elif isinstance(sample, Mapping):
+            self._containers.append((path, len(sample)))
+            structure = {}
+            for key in sample:
+                child = self._compile(sample[key], path + (key,))
+                if child is None:
+                    return None
+                structure[key] = child
+            return structure
+        elif isinstance(sample, Sequence):
+            self._containers.append((path, len(sample)))
+            structure = []
+            for i, field in enumerate(sample):
+                child = self._compile(field, path + (i,))
+                if child is None:
+                    return None
+                structure.append(child)
+            return structure
+        else:
+            # paddle.Tensor and other types are collated in generic path
+            return None
+        return len(self._fields) - 1
+
+    def _infer_schema(self, sample):
+        self._fields = []
+        self._containers = []
+        self._structure = self._compile(sample, ())
+        if self._structure is None:
+            self._disabled = True
+            self._fields = None
+            self._containers = None
+            return
+        self._fields = [
+            (self._getter(path), kind, shape, dtype)
+            for path, kind, shape, dtype in self._fields
+        ]
+        self._containers = [
+            (self._getter(path), length) for path, length in self._containers
+        ]
+
+    def _new_buffers(self, batch_size):
+        buffers = []
+        for _, kind, shape, dtype in self._fields:
+            if kind == self._ARRAY:
+                buffers.append(np.empty((batch_size,) + shape, dtype=dtype))
+            else:
+                buffers.append(None)
+        return buffers
+
+    def _get_buffers(self, batch_size):
+        if not self._reuse_buffers:
+            return self._new_buffers(batch_size)
+        idx = self._buffer_idx
+        self._buffer_idx = (idx + 1) % self._num_buffers
+        if idx == len(self._buffers):
+            self._buffers.append(self._new_buffers(batch_size))
+        elif any(
+            buf is not None and len(buf) < batch_size
+            for buf in self._buffers[idx]
+        ):
+            # buffers are allocated at the max batch size seen, smaller
+            # batches are written into the leading part of buffers
+            self._buffers[idx] = self._new_buffers(batch_size)
+        return self._buffers[idx]
+
+    @staticmethod
+    def _getter(path):
+        # compile path into a function to get the field from a sample
+        if len(path) == 0:
+            return lambda sample: sample
+        if len(path) == 1:
+            return operator.itemgetter(path[0])
+
+        def get(sample):
+            for key in path:
+                sample = sample[key]
+            return sample
+
+        return get
+
+    def _fill(self, batch, buffers):
+        # returns output fields, or None if batch mismatches the schema,
+        # fields are checked by sets of their types, shapes and dtypes
+        # to keep per sample work in C loops. As all fields in schema are
+        # got from each sample, checking length of dicts and sequences is
+        # enough to make sure samples have no extra fields
+        for get, length in self._containers:
+            if set(map(len, map(get, batch))) != {length}:
+                return None
+
+        batch_size = len(batch)
+        outputs = []
+        for (get, kind, shape, dtype), buf in zip(self._fields, buffers):
+            values = list(map(get, batch))
+            if kind == self._ARRAY:
+                types = set(map(type, values))
+                if (
+                    not all(issubclass(t, np.ndarray) for t in types)
+                    or set(map(_get_shape, values)) != {shape}
+                    or set(map(_get_dtype, values)) != {dtype}
+                ):
+                    return None
+                buf = buf[:batch_size]
+                for i, value in enumerate(values):
+                    buf[i] = value
+                outputs.append(buf)
+            elif kind == self._NUMBER:
+                if not isinstance(values[0], numbers.Number):
+                    return None
+                # numbers are small, collate them as default_collate_fn
+                outputs.append(np.array(values))
+            else:
+                if not isinstance(values[0], (str, bytes)):
+                    return None
+                outputs.append(values)
+        return outputs
+
+    def _restore(self, structure, outputs):
+        if isinstance(structure, int):
+            return outputs[structure]
+        if isinstance(structure, dict):
+            return {
+                key: self._restore(child, outputs)
+                for key, child in structure.items()
+            }
+        return [self._restore(child, outputs) for child in structure]
+
+    def __call__(self, batch):
+        if self._disabled or len(batch) == 0:
+            return default_collate_fn(batch)
+        if self._structure is None:
+            self._infer_schema(batch[0])
+            if self._disabled:
+                return default_collate_fn(batch)
+
+        outputs = None
+        try:
+            outputs = self._fill(batch, self._get_buffers(len(batch)))
+        except (IndexError, KeyError, TypeError, ValueError, OverflowError):
+            pass
+        if outputs is None:
+            self._mismatches += 1
+            if self._mismatches >= self._max_mismatches:
+                self._disabled = True
+                self._buffers = []
+            return default_collate_fn(batch)
+        return self._restore(self._structure, outputs)
@@ -20,6 +20,7 @@ import sys
 import threading
 import time
 import warnings
+import weakref
 
 import numpy as np
 
@@ -35,9 +36,12 @@ from ..multiprocess_utils import (
     CleanupFuncRegistrar,
     _set_SIGCHLD_handler,
 )
+from .autotune import _OnlineAutoTuner, _TuneAction
 from .batch_sampler import _InfiniteIterableSampler
-from .collate import default_collate_fn, default_convert_fn
+from .collate import _SchemaCollator, default_convert_fn
 from .flat import _flatten_batch, _restore_batch
+from .pipeline_profiler import _now_ns, _PipelineProfiler, _Stage
+from .shm_ring import _SharedMemoryRing, _SlabBatch
 from .worker import (
     _DatasetKind,
     _IterableDatasetStopIteration,
@@ -46,6 +50,10 @@ from .worker import (
     _WorkerException,
 )
 
+# NOTE: default byte size of each slot in the shared memory ring of
+# workers, batches larger than it fall back to the mmap file transport
+_DEFAULT_SHM_RING_SLAB_SIZE = 32 * 1024 * 1024
+
 # NOTE: fix `terminate called without an active exception`
 # if for loop break and program exit immediately(with no model
 # layers processing) after iterate **the first few data** in
@@ -107,7 +115,14 @@ class _DataLoaderIterBase:
 
         self._sampler_iter = iter(self._index_sampler)
         if self._auto_collate_batch:
-            self._collate_fn = loader.collate_fn or default_collate_fn
+            # NOTE: batches collated by default are always copied into
+            # LoDTensors in reader thread or into shared memory in workers
+            # right after collating, so batch buffers can be reused in
+            # these cases, otherwise batches are pickled asynchronously by
+            # the feeder thread of result queue and cannot be reused
+            self._collate_fn = loader.collate_fn or _SchemaCollator(
+                reuse_buffers=self._num_workers == 0 or self._use_shared_memory
+            )
         else:
             self._collate_fn = loader.collate_fn or default_convert_fn
 
@@ -120,6 +135,18 @@ class _DataLoaderIterBase:
         self._thread = None
         self._thread_done_event = threading.Event()
 
+        # NOTE: latency of each stage in loading pipeline is recorded if
+        # FLAGS_dataloader_profile_pipeline is set, see pipeline_stats
+        self._pipeline_profiler = None
+        if os.environ.get('FLAGS_dataloader_profile_pipeline', False) in [
+            1,
+            '1',
+            True,
+            'True',
+            'true',
+        ]:
+            self._pipeline_profiler = _PipelineProfiler()
+
     @property
     def _index_sampler(self):
         if self._auto_collate_batch:
@@ -136,6 +163,45 @@ class _DataLoaderIterBase:
     def __len__(self):
         return len(self._batch_sampler)
 
+    def pipeline_stats(self):
+        """
+        Get latency statistics of each stage in data loading pipeline,
+        only available if environment variable
+        ``FLAGS_dataloader_profile_pipeline=1`` is set.
+
+        Stages are ``getitem``(reading samples from dataset), ``collate``
+        (collate_fn), ``fetch``(getitem and collate of a batch),
+        ``transfer``(sending a batch from worker to main process), ``push``
+        (pushing a batch into the blocking queue) and ``read``(reading a
+        batch in iteration).
+
+        Returns:
+            dict: latency summary keyed by worker id and stage name, worker
+            id of stages run in main process is -1. Each summary contains
+            ``count``, ``avg``, ``max``, ``p50``, ``p90``, ``p99`` in seconds
+            and ``buckets``, counts of latency histogram whose bucket i
+            holds latencies in [2^(i-1), 2^i) microseconds.
+        """
+        if self._pipeline_profiler is None:
+            return {}
+        return self._pipeline_profiler.stats()
+
+    def export_pipeline_trace(self, path):
+        """
+        Export recorded pipeline stages into chrome tracing file. If
+        :attr:`path` is a file exported by `paddle.profiler.Profiler` in json
+        format, stages are merged into the same timeline.
+
+        Args:
+            path(str): path of the chrome tracing file.
+        """
+        if self._pipeline_profiler is None:
+            raise RuntimeError(
+                "DataLoader pipeline profiling is not enabled, please set "
+                "environment variable FLAGS_dataloader_profile_pipeline=1."
+            )
+        self._pipeline_profiler.export_chrome_tracing(path)
+
     def _exit_thread_expectedly(self):
         self._thread_done_event.set()
         if self._blocking_queue:
@@ -225,10 +291,14 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
         core.set_current_thread_name("Dataloader_" + str(id(self)))
         _set_expected_place(legacy_expected_place)
 
+        pipeline_profiler = self._pipeline_profiler
         while not self._thread_done_event.is_set():
             try:
                 indices = next(self._sampler_iter)
 
+                if pipeline_profiler is not None:
+                    self._dataset_fetcher.profile_events = []
+                    fetch_start_ns = _now_ns()
                 # read data from dataset in mini-batch
                 # with paddle.fluid.dygraph.guard(place=paddle.CPUPlace()):
                 # read data from dataset in mini-batch
@@ -242,6 +312,15 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
             if batch is None or self._thread_done_event.is_set():
                 break
 
+            if pipeline_profiler is not None:
+                pipeline_profiler.record_events(
+                    self._dataset_fetcher.profile_events
+                )
+                pipeline_profiler.record(
+                    _Stage.FETCH, fetch_start_ns, _now_ns()
+                )
+                push_start_ns = _now_ns()
+
             # flat batch and record structure infos
             batch, structure = _flatten_batch(batch)
             self._structure_infos.append(structure)
@@ -270,6 +349,11 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                 except:
                     self._exit_thread_expectedly()
 
+                if pipeline_profiler is not None:
+                    pipeline_profiler.record(
+                        _Stage.PUSH, push_start_ns, _now_ns()
+                    )
+
             except Exception as e:
                 self._exit_thread_unexpectedly()
                 raise e
@@ -286,6 +370,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
         try:
             benchmark().check_if_need_record(self)
             benchmark().before_reader()
+            read_start_ns = _now_ns()
             if in_dynamic_mode():
                 data = core.eager.read_next_tensor_list(
                     self._reader.read_next_list()[0]
@@ -309,6 +394,10 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                         data = data[0]
                 else:
                     data = self._reader.read_next()
+            if self._pipeline_profiler is not None:
+                self._pipeline_profiler.record(
+                    _Stage.READ, read_start_ns, _now_ns()
+                )
             benchmark().after_reader()
 
             return data
@@ -361,6 +450,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
 
         self._persistent_workers = loader._persistent_workers
         self._resume_worker_cnt = 0
+        self._in_order = loader.in_order
+        self._dispatch_policy = loader.dispatch_policy
 
         assert (
             self._num_workers > 0
@@ -418,6 +509,36 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             (self._worker_shm_buffer_size) * 2 * self._num_workers
         )
 
+        # NOTE: shm ring is a ring of preallocated shared memory slabs for
+        # each worker, which are reused across batches to avoid creating
+        # memory map files, pickling and fd transfer for each batch.
+        self._use_shm_ring = self._use_shared_memory and os.environ.get(
+            'FLAGS_dataloader_use_shm_ring', False
+        ) in [1, '1', True, 'True', 'true']
+        self._shm_ring_slab_size = int(
+            os.environ.get(
+                'FLAGS_dataloader_shm_ring_slab_size',
+                _DEFAULT_SHM_RING_SLAB_SIZE,
+            )
+        )
+        self._shm_rings = []
+
+        # NOTE: online autotuning grows or shrinks the worker pool and
+        # prefetch factor in place by the reader wait time of each step,
+        # tuned values are written back to loader for next iterator.
+        self._autotuner = None
+        self._last_output_time = None
+        if (
+            getattr(loader, '_online_autotune', False)
+            and self._dataset_kind == _DatasetKind.MAP
+        ):
+            self._loader_ref = weakref.ref(loader)
+            self._autotuner = _OnlineAutoTuner(
+                max_num_workers=max(self._num_workers, os.cpu_count() or 1),
+                min_prefetch_factor=min(self._prefetch_factor, 2),
+                max_prefetch_factor=max(self._prefetch_factor, 8),
+            )
+
         # init workers and indices queues and put 2 indices in each indices queue
         self._init_workers()
         for _ in range(self._outstanding_capacity):
@@ -432,8 +553,22 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # multiprocess worker and indice queue list initial as empty
         self._workers = []
         self._worker_status = []
+        # workers deactivated by online autotuning are kept alive but
+        # not dispatched indices in round_robin dispatch policy
+        self._worker_active = []
         self._indices_queues = []
         self._workers_idx_cycle = itertools.cycle(range(self._num_workers))
+        # batch number and fetch latency of each worker, see worker_stats
+        self._worker_batches = [0] * self._num_workers
+        self._worker_latency = [0.0] * self._num_workers
+        self._worker_max_latency = [0.0] * self._num_workers
+
+        # in shared_queue dispatch policy, batch indices are put into one
+        # queue shared by all workers and idle workers pull from it
+        self._shared_indices_queue = None
+        if self._dispatch_policy == 'shared_queue':
+            self._shared_indices_queue = multiprocessing.Queue()
+            self._shared_indices_queue.cancel_join_thread()
 
         # create data_queue for workers
         self._data_queue = multiprocessing.Queue()
@@ -443,37 +578,77 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._workers_done_event = multiprocessing.Event()
         self._thread_done_event = threading.Event()
 
+        self._init_shm_rings(multiprocessing)
+
         for i in range(self._num_workers):
-            indices_queue = multiprocessing.Queue()
-            indices_queue.cancel_join_thread()
-            self._indices_queues.append(indices_queue)
-            worker = multiprocessing.Process(
-                target=_worker_loop,
-                args=(
-                    self._dataset,
-                    self._dataset_kind,
-                    indices_queue,
-                    self._data_queue,
-                    self._workers_done_event,
-                    self._auto_collate_batch,
-                    self._collate_fn,
-                    self._drop_last,
-                    self._worker_init_fn,
-                    i,
-                    self._num_workers,
-                    self._use_shared_memory,
-                    self._base_seed,
-                    self._worker_shm_buffer_size,
-                ),
-            )
-            worker.daemon = True
-            worker.start()
-            self._workers.append(worker)
-            self._worker_status.append(True)
+            self._start_worker(i, multiprocessing)
 
         core._set_process_pids(id(self), tuple(w.pid for w in self._workers))
         _set_SIGCHLD_handler()
 
+    def _start_worker(self, worker_id, multiprocessing):
+        indices_queue = multiprocessing.Queue()
+        indices_queue.cancel_join_thread()
+        self._indices_queues.append(indices_queue)
+        worker = multiprocessing.Process(
+            target=_worker_loop,
+            args=(
+                self._dataset,
+                self._dataset_kind,
+                indices_queue,
+                self._data_queue,
+                self._workers_done_event,
+                self._auto_collate_batch,
+                self._collate_fn,
+                self._drop_last,
+                self._worker_init_fn,
+                worker_id,
+                self._num_workers,
+                self._use_shared_memory,
+                self._base_seed,
+                self._worker_shm_buffer_size,
+                self._shm_rings[worker_id] if self._shm_rings else None,
+                self._shared_indices_queue,
+                self._pipeline_profiler is not None,
+            ),
+        )
+        worker.daemon = True
+        worker.start()
+        self._workers.append(worker)
+        self._worker_status.append(True)
+        self._worker_active.append(True)
+
+    def _init_shm_rings(self, multiprocessing):
+        self._shm_rings = []
+        if not self._use_shm_ring:
+            return
+        # each worker holds at most outstanding batches of its share in
+        # the result queue, one more slot for the batch in writing
+        self._shm_ring_num_slots = (
+            self._outstanding_capacity // self._num_workers + 1
+        )
+        try:
+            for _ in range(self._num_workers):
+                self._shm_rings.append(
+                    _SharedMemoryRing(
+                        self._shm_ring_num_slots,
+                        self._shm_ring_slab_size,
+                        multiprocessing,
+                    )
+                )
+        except Exception as e:
+            self._close_shm_rings()
+            warnings.warn(
+                "Failed to create shared memory ring for DataLoader "
+                "workers({}), fall back to memory map files.".format(e)
+            )
+
+    def _close_shm_rings(self):
+        for ring in self._shm_rings:
+            if ring is not None:
+                ring.close()
+        self._shm_rings = []
+
     def _clear_and_remove_data_queue(self):
         if self._data_queue is not None:
             while True:
@@ -523,6 +698,14 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # 1. Resume workers, clear worker caches
         # put _ResumeIteration to all worker as resume iteration flag
         with self._thread_lock:
+            # batch indices of last epoch left in shared indices queue
+            # should be dropped before resuming workers
+            if self._shared_indices_queue is not None:
+                while True:
+                    try:
+                        self._shared_indices_queue.get_nowait()
+                    except queue.Empty:
+                        break
             self._resume_worker_cnt = self._num_workers
             for worker_id in range(self._num_workers):
                 self._indices_queues[worker_id].put(_ResumeIteration())
@@ -546,6 +729,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     data = self._reader.read_next()
 
         # 3. reset all states
+        self._last_output_time = None
         self._send_idx = 0
         self._rcvd_idx = 0
         self._batches_outstanding = 0
@@ -587,6 +771,10 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     for q in self._indices_queues:
                         q.cancel_join_thread()
                         q.close()
+                    if self._shared_indices_queue is not None:
+                        self._shared_indices_queue.cancel_join_thread()
+                        self._shared_indices_queue.close()
+                self._close_shm_rings()
             finally:
                 core._erase_process_pids(id(self))
                 self._shutdown = True
@@ -611,6 +799,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                         self._resume_worker_cnt -= 1
                         continue
                     try:
+                        push_start_ns = _now_ns()
                         # pack as LoDTensorArray
                         array = core.LoDTensorArray()
                         if self._use_shared_memory:
@@ -632,6 +821,10 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
 
                         if not self._blocking_queue.push(array):
                             self._blocking_queue.close()
+                        if self._pipeline_profiler is not None:
+                            self._pipeline_profiler.record(
+                                _Stage.PUSH, push_start_ns, _now_ns()
+                            )
                     except Exception as e:
                         self._exit_thread_unexpectedly()
                         raise e
@@ -738,7 +931,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._try_put_indices()
                     continue
 
-                idx, batch, structure = data
+                idx, batch, structure, worker_stat = data
 
                 if (
                     isinstance(idx, _ResumeIteration)
@@ -751,7 +944,16 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._exit_thread_unexpectedly()
                     batch.reraise()
 
-                if idx == self._rcvd_idx:
+                # copy batch out of the shm ring slot as soon as received,
+                # so that the slot can be reused by worker immediately
+                if isinstance(batch, _SlabBatch):
+                    batch = self._shm_rings[batch.worker_id].read(batch)
+
+                if worker_stat is not None:
+                    self._update_worker_stat(*worker_stat)
+
+                # output batch as soon as it is received if not in order
+                if idx == self._rcvd_idx or not self._in_order:
                     if idx in self._task_infos:
                         del self._task_infos[idx]
                     self._structure_infos.append(structure)
@@ -761,9 +963,11 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     continue
 
     def _try_put_indices(self):
-        assert (
-            self._batches_outstanding <= self._outstanding_capacity
-        ), "too many indices have been put to queue"
+        # NOTE: outstanding capacity may be lowered by online autotuning
+        # below the current outstanding batch number, stop putting indices
+        # until outstanding batches are consumed in this case
+        if self._batches_outstanding >= self._outstanding_capacity:
+            return
         # In multi-process mode for IterableDataset, _try_put_indices will
         # be called both in main process(for our implement has blocking queue,
         # and blocking queue read is in main process) and thread, which may
@@ -779,18 +983,68 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             except StopIteration:
                 return
 
-            for i in range(self._num_workers):
-                worker_idx = next(self._workers_idx_cycle)
-                if self._worker_status[worker_idx]:
-                    break
+            if self._shared_indices_queue is not None:
+                # NOTE: worker is unknown until it pulls the indices, and
+                # worker index is only used by IterableDataset, which is
+                # not supported in shared_queue dispatch policy
+                worker_idx = None
+                indices_queue = self._shared_indices_queue
             else:
-                return
+                for i in range(self._num_workers):
+                    worker_idx = next(self._workers_idx_cycle)
+                    if (
+                        self._worker_status[worker_idx]
+                        and self._worker_active[worker_idx]
+                    ):
+                        break
+                else:
+                    return
+                indices_queue = self._indices_queues[worker_idx]
 
-            self._indices_queues[worker_idx].put((self._send_idx, indices))
+            indices_queue.put((self._send_idx, indices))
             self._task_infos[self._send_idx] = (worker_idx,)
             self._batches_outstanding += 1
             self._send_idx += 1
 
+    def _update_worker_stat(self, worker_id, latency, profile=None):
+        self._worker_batches[worker_id] += 1
+        self._worker_latency[worker_id] += latency
+        self._worker_max_latency[worker_id] = max(
+            self._worker_max_latency[worker_id], latency
+        )
+        if profile is not None and self._pipeline_profiler is not None:
+            events, send_ns = profile
+            pid = self._workers[worker_id].pid
+            self._pipeline_profiler.record_events(events, worker_id, pid)
+            self._pipeline_profiler.record(
+                _Stage.TRANSFER, send_ns, _now_ns(), worker_id, pid
+            )
+
+    def worker_stats(self):
+        """
+        Get batch loading statistics of each worker, which can be used to
+        find straggler workers.
+
+        Returns:
+            list(dict): statistics of each worker, contains ``worker_id``,
+            ``batches``(number of loaded batches), ``avg_latency`` and
+            ``max_latency``(average and max seconds to load a batch).
+        """
+        stats = []
+        for i in range(self._num_workers):
+            batches = self._worker_batches[i]
+            stats.append(
+                {
+                    'worker_id': i,
+                    'batches': batches,
+                    'avg_latency': self._worker_latency[i] / batches
+                    if batches > 0
+                    else 0.0,
+                    'max_latency': self._worker_max_latency[i],
+                }
+            )
+        return stats
+
     def __del__(self):
         self._try_shutdown_all()
 
@@ -807,6 +1061,8 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         try:
             benchmark().check_if_need_record(self)
             benchmark().before_reader()
+            read_start = time.time()
+            read_start_ns = _now_ns()
             # _batches_outstanding here record the total batch data number
             # in 'from after _try_put_indices to beforeoutput data', this
             # value should be _outstanding_capacity if data is not drained,
@@ -843,7 +1099,13 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                         data = data[0]
                 else:
                     data = self._reader.read_next()
+            if self._pipeline_profiler is not None:
+                self._pipeline_profiler.record(
+                    _Stage.READ, read_start_ns, _now_ns()
+                )
             self._on_output_batch()
+            if self._autotuner is not None:
+                self._autotune_step(read_start)
             benchmark().after_reader()
             return data
         except StopIteration:
@@ -859,3 +1121,88 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         for _ in range(len(self._places)):
             self._batches_outstanding -= 1
             self._try_put_indices()
+
+    def _num_active_workers(self):
+        return sum(self._worker_active)
+
+    def _autotune_step(self, read_start):
+        now = time.time()
+        if self._last_output_time is not None:
+            action = self._autotuner.step(
+                now - read_start,
+                read_start - self._last_output_time,
+                self._num_active_workers(),
+                self._prefetch_factor,
+                # workers pull indices by themselves in shared_queue
+                # dispatch policy and cannot be deactivated
+                removable=self._shared_indices_queue is None,
+            )
+            if action is not None:
+                self._apply_tune_action(action)
+        self._last_output_time = time.time()
+
+    def _apply_tune_action(self, action):
+        with self._thread_lock:
+            if action == _TuneAction.ADD_WORKER:
+                self._add_worker()
+            elif action == _TuneAction.REMOVE_WORKER:
+                # deactivate the last active worker, indices already
+                # dispatched to it are still loaded
+                for worker_id in reversed(range(self._num_workers)):
+                    if self._worker_active[worker_id]:
+                        self._worker_active[worker_id] = False
+                        break
+            elif action == _TuneAction.INCREASE_PREFETCH:
+                self._prefetch_factor += 1
+            elif action == _TuneAction.DECREASE_PREFETCH:
+                self._prefetch_factor -= 1
+            self._outstanding_capacity = self._prefetch_factor * max(
+                self._num_active_workers(), len(self._places)
+            )
+
+        logging.info(
+            "DataLoader online autotune: {}, num_workers: {}, "
+            "prefetch_factor: {}".format(
+                action, self._num_active_workers(), self._prefetch_factor
+            )
+        )
+        loader = self._loader_ref()
+        if loader is not None:
+            loader.num_workers = self._num_active_workers()
+            loader.prefetch_factor = self._prefetch_factor
+
+        # fill up the raised outstanding capacity
+        while self._batches_outstanding < self._outstanding_capacity:
+            send_idx = self._send_idx
+            self._try_put_indices()
+            if self._send_idx == send_idx:
+                break
+
+    def _add_worker(self):
+        # reactivate a deactivated worker first
+        for worker_id in range(self._num_workers):
+            if not self._worker_active[worker_id]:
+                self._worker_active[worker_id] = True
+                return
+
+        from paddle.incubate import multiprocessing
+
+        worker_id = self._num_workers
+        self._num_workers += 1
+        if self._shm_rings:
+            ring = None
+            try:
+                ring = _SharedMemoryRing(
+                    self._shm_ring_num_slots,
+                    self._shm_ring_slab_size,
+                    multiprocessing,
+                )
+            except Exception:
+                pass
+            self._shm_rings.append(ring)
+        self._worker_batches.append(0)
+        self._worker_latency.append(0.0)
+        self._worker_max_latency.append(0.0)
+        self._start_worker(worker_id, multiprocessing)
+        self._workers_idx_cycle = itertools.cycle(range(self._num_workers))
+        core._set_process_pids(id(self), tuple(w.pid for w in self._workers))
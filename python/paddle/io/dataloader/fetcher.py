@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .pipeline_profiler import _now_ns, _Stage
+
 
 class _DatasetFetcher:
     def __init__(self, dataset, auto_collate_batch, collate_fn, drop_last):
@@ -19,6 +21,26 @@ class _DatasetFetcher:
         self.auto_collate_batch = auto_collate_batch
         self.collate_fn = collate_fn
         self.drop_last = drop_last
+        # NOTE: if set as a list, (stage, start_ns, end_ns) of getitem
+        # and collate stages are appended to it by fetch for pipeline
+        # profiling, see pipeline_profiler.py
+        self.profile_events = None
+
+    def _stage_begin(self):
+        if self.profile_events is None:
+            return None
+        return _now_ns()
+
+    def _stage_end(self, stage, start_ns):
+        if start_ns is not None:
+            self.profile_events.append((stage, start_ns, _now_ns()))
+
+    def _collate(self, data):
+        if self.collate_fn:
+            start_ns = self._stage_begin()
+            data = self.collate_fn(data)
+            self._stage_end(_Stage.COLLATE, start_ns)
+        return data
 
     # NOTE: fetch function here perform the whole pipeline of dataset
     #       reading and data trasforms of a batch in each calling, this
@@ -41,6 +63,7 @@ class _IterableDatasetFetcher(_DatasetFetcher):
         self.dataset_iter = iter(dataset)
 
     def fetch(self, batch_indices, done_event=None):
+        start_ns = self._stage_begin()
         if self.auto_collate_batch:
             data = []
             for _ in batch_indices:
@@ -59,10 +82,9 @@ class _IterableDatasetFetcher(_DatasetFetcher):
 
         else:
             data = next(self.dataset_iter)
+        self._stage_end(_Stage.GETITEM, start_ns)
 
-        if self.collate_fn:
-            data = self.collate_fn(data)
-        return data
+        return self._collate(data)
 
 
 class _MapDatasetFetcher(_DatasetFetcher):
@@ -70,6 +92,7 @@ class _MapDatasetFetcher(_DatasetFetcher):
         super().__init__(dataset, auto_collate_batch, collate_fn, drop_last)
 
     def fetch(self, batch_indices, done_event=None):
+        start_ns = self._stage_begin()
         if self.auto_collate_batch:
             data = []
             for idx in batch_indices:
@@ -80,7 +103,6 @@ class _MapDatasetFetcher(_DatasetFetcher):
 
         else:
             data = self.dataset[batch_indices]
+        self._stage_end(_Stage.GETITEM, start_ns)
 
-        if self.collate_fn:
-            data = self.collate_fn(data)
-        return data
+        return self._collate(data)
@@ -0,0 +1,210 @@
+#   Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import json
+import os
+import threading
+import time
+
+# NOTE: timestamps are taken by time.time_ns(), which is CLOCK_REALTIME
+# as the host tracer of paddle.profiler, so that events recorded here are
+# aligned with events in the chrome tracing file exported by Profiler
+_now_ns = time.time_ns
+
+
+class _Stage:
+    # Dataset.__getitem__ or next(dataset_iter) of all samples in a batch
+    GETITEM = 'getitem'
+    # collate_fn of a batch
+    COLLATE = 'collate'
+    # whole loading of a batch, including getitem and collate
+    FETCH = 'fetch'
+    # from worker putting a batch into result queue to the batch received
+    # by main process, including serialization and shared memory copying
+    TRANSFER = 'transfer'
+    # packing a batch and pushing it into the blocking queue, including
+    # waiting for free space of the blocking queue
+    PUSH = 'push'
+    # reading a batch from the reader in __next__, including waiting for
+    # the batch and host to device copying of the buffered reader
+    READ = 'read'
+
+
+# NOTE: worker id of stages run in main process
+_MAIN_PROCESS = -1
+
+
+class _LatencyHistogram:
+    """
+    Histogram of latencies with log2 spaced buckets in microseconds, bucket
+    i holds latencies in [2^(i-1), 2^i) microseconds and bucket 0 holds
+    latencies less than 1 microsecond.
+    """
+
+    NUM_BUCKETS = 40
+
+    def __init__(self):
+        self.counts = [0] * self.NUM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        us = int(seconds * 1e6)
+        bucket = min(us.bit_length(), self.NUM_BUCKETS - 1)
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q):
+        """
+        Upper bound in seconds of the bucket holding the q-th percentile.
+        """
+        if self.count == 0:
+            return 0.0
+        target = self.count * q / 100.0
+        accumulated = 0
+        for bucket, count in enumerate(self.counts):
+            accumulated += count
+            if accumulated >= target:
+                return min((1 << bucket) / 1e6, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'avg': self.total / self.count if self.count > 0 else 0.0,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'buckets': list(self.counts),
+        }
+
+
+class _PipelineProfiler:
+    """
+    Recorder of per-stage latencies of DataLoader pipeline in main process.
+
+    Stages run in workers are recorded in workers as ``(stage, start_ns,
+    end_ns)`` and sent back with batches, stages run in main process are
+    recorded directly. Latencies are accumulated into a histogram for each
+    worker and stage, and latest events are kept for timeline exporting.
+
+    Args:
+        max_events(int): maximum number of events kept for timeline.
+    """
+
+    def __init__(self, max_events=100000):
+        self._lock = threading.Lock()
+        # (worker_id, stage) -> _LatencyHistogram
+        self._histograms = {}
+        # (worker_id, pid, stage, start_ns, end_ns)
+        self._events = collections.deque(maxlen=max_events)
+
+    def record(
+        self, stage, start_ns, end_ns, worker_id=_MAIN_PROCESS, pid=None
+    ):
+        key = (worker_id, stage)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _LatencyHistogram()
+            histogram.add((end_ns - start_ns) / 1e9)
+            self._events.append(
+                (worker_id, pid or os.getpid(), stage, start_ns, end_ns)
+            )
+
+    def record_events(self, events, worker_id=_MAIN_PROCESS, pid=None):
+        for stage, start_ns, end_ns in events:
+            self.record(stage, start_ns, end_ns, worker_id, pid)
+
+    def stats(self):
+        """
+        Returns:
+            dict: latency summary of each stage of each worker, keyed by
+            worker id and stage name, worker id of main process is -1.
+        """
+        stats = {}
+        with self._lock:
+            for (worker_id, stage), histogram in self._histograms.items():
+                stats.setdefault(worker_id, {})[stage] = histogram.summary()
+        return stats
+
+    def trace_events(self):
+        """
+        Returns:
+            list(dict): recorded events in chrome tracing format.
+        """
+        trace_events = []
+        names = {}
+        with self._lock:
+            events = list(self._events)
+        for worker_id, pid, stage, start_ns, end_ns in events:
+            thread = (
+                'DataLoader'
+                if worker_id == _MAIN_PROCESS
+                else f'DataLoader worker {worker_id}'
+            )
+            names[pid] = thread
+            trace_events.append(
+                {
+                    'name': f'DataLoader::{stage}',
+                    'pid': pid,
+                    'tid': f'{thread}(Python)',
+                    'ts': start_ns // 1000,
+                    'dur': (end_ns - start_ns) / 1000.0,
+                    'ph': 'X',
+                    'cat': 'Dataloader',
+                    'args': {'worker_id': worker_id},
+                }
+            )
+        for pid, thread in names.items():
+            if thread == 'DataLoader':
+                continue
+            trace_events.append(
+                {
+                    'name': 'process_name',
+                    'pid': pid,
+                    'tid': 0,
+                    'ph': 'M',
+                    'args': {'name': thread},
+                }
+            )
+        return trace_events
+
+    def export_chrome_tracing(self, path):
+        """
+        Write recorded events into a chrome tracing file. If :attr:`path` is
+        a file exported by `paddle.profiler.Profiler` in json format, events
+        are merged into its timeline, otherwise a new file is created.
+        """
+        trace = None
+        if os.path.isfile(path):
+            with open(path) as f:
+                trace = json.load(f)
+            if not isinstance(trace, dict) or not isinstance(
+                trace.get('traceEvents'), list
+            ):
+                raise ValueError(
+                    "{} is not a chrome tracing file in json object "
+                    "format.".format(path)
+                )
+        else:
+            trace = {'displayTimeUnit': 'ms', 'traceEvents': []}
+        trace['traceEvents'].extend(self.trace_events())
+        with open(path, 'w') as f:
+            json.dump(trace, f)
@@ -0,0 +1,147 @@
+#   Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from ...framework import core
+
+# NOTE: offsets of arrays in slab are aligned to 64 bytes, which is the
+# cache line size and satisfies the alignment of all numpy dtypes
+_SLAB_ALIGNMENT = 64
+
+
+def _align(offset):
+    return (offset + _SLAB_ALIGNMENT - 1) // _SLAB_ALIGNMENT * _SLAB_ALIGNMENT
+
+
+class _SlabBatch:
+    """
+    Compact descriptor of a flattened batch written into a slot of
+    worker's shared memory ring, only this descriptor is put into the
+    inter-process queue instead of the batch data.
+    """
+
+    def __init__(self, worker_id, slot, metas):
+        self.worker_id = worker_id
+        self.slot = slot
+        # list of (offset, shape, dtype) of each flattened field
+        self.metas = metas
+
+
+class _SharedMemoryRing:
+    """
+    A ring of preallocated shared memory slabs owned by one DataLoader
+    worker and reused across batches.
+
+    The ring is created in main process and inherited by the worker.
+    Worker writes flattened batch into a free slot and only sends slot
+    index and field metas back, main process copies fields out of the
+    slot when receiving the descriptor and frees the slot. As a worker
+    puts batches into the result queue in order and main process reads
+    them in the same order, slots are freed in the order they are
+    written, so a counting semaphore is enough to track free slots.
+
+    Args:
+        num_slots(int): slot number of the ring.
+        slab_size(int): byte size of each slot.
+        ctx(module): multiprocessing module to create the semaphore.
+    """
+
+    def __init__(self, num_slots, slab_size, ctx):
+        from multiprocessing import shared_memory
+
+        self._num_slots = num_slots
+        self._slab_size = slab_size
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=num_slots * slab_size
+        )
+        self._free_slots = ctx.Semaphore(num_slots)
+        # slot index to write next, only used in worker process
+        self._write_idx = 0
+        self._owner = True
+
+    def _plan(self, arrays):
+        metas = []
+        offset = 0
+        for arr in arrays:
+            if not isinstance(arr, np.ndarray) or arr.dtype.hasobject:
+                return None
+            offset = _align(offset)
+            if offset + arr.nbytes > self._slab_size:
+                return None
+            metas.append((offset, arr.shape, arr.dtype.str))
+            offset += arr.nbytes
+        return metas
+
+    def write(self, worker_id, arrays):
+        """
+        Write flattened batch into a free slot in worker process.
+
+        Returns:
+            _SlabBatch|None: descriptor of the written batch, None if batch
+            cannot be held in a slot or no slot is free, batch should be
+            put in the normal way in this case.
+        """
+        metas = self._plan(arrays)
+        if metas is None or not self._free_slots.acquire(block=False):
+            return None
+
+        slot = self._write_idx % self._num_slots
+        self._write_idx += 1
+        base = slot * self._slab_size
+        for arr, (offset, shape, dtype) in zip(arrays, metas):
+            dst = np.ndarray(
+                shape, dtype=dtype, buffer=self._shm.buf, offset=base + offset
+            )
+            np.copyto(dst, arr)
+        return _SlabBatch(worker_id, slot, metas)
+
+    def read(self, slab_batch):
+        """
+        Copy fields of the batch out of its slot as LoDTensors in main
+        process and free the slot.
+        """
+        base = slab_batch.slot * self._slab_size
+        tensors = []
+        try:
+            for offset, shape, dtype in slab_batch.metas:
+                arr = np.ndarray(
+                    shape,
+                    dtype=dtype,
+                    buffer=self._shm.buf,
+                    offset=base + offset,
+                )
+                tensor = core.LoDTensor()
+                tensor.set(arr, core.CPUPlace())
+                tensors.append(tensor)
+        finally:
+            self._free_slots.release()
+        return tensors
+
+    def close(self):
+        if self._shm is None:
+            return
+        try:
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+        except (FileNotFoundError, BufferError):
+            pass
+        finally:
+            self._shm = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_owner'] = False
+        return state
@@ -17,6 +17,7 @@ import os
 # NOTE: queue has a different name in python2 and python3
 import queue
 import sys
+import time
 import traceback
 
 import numpy as np
@@ -31,6 +32,11 @@ from ..multiprocess_utils import (
 )
 from .fetcher import _IterableDatasetFetcher, _MapDatasetFetcher
 from .flat import _flatten_batch
+from .pipeline_profiler import _now_ns, _Stage
+
+# NOTE: interval to poll the shared indices queue, worker checks its own
+# indices queue for control messages between polls
+SHARED_QUEUE_POLL_INTERVAL = 0.1
 
 
 class _IterableDatasetStopIteration:
@@ -261,6 +267,17 @@ def _generate_states(base_seed=0, worker_id=0):
     return states
 
 
+def _get_indices(indices_queue, shared_indices_queue):
+    if shared_indices_queue is None:
+        return indices_queue.get(timeout=MP_STATUS_CHECK_INTERVAL)
+    # control messages(_ResumeIteration and None) are always put into
+    # worker's own indices queue, batch indices into the shared one
+    try:
+        return indices_queue.get_nowait()
+    except queue.Empty:
+        return shared_indices_queue.get(timeout=SHARED_QUEUE_POLL_INTERVAL)
+
+
 def _worker_loop(
     dataset,
     dataset_kind,
@@ -276,6 +293,9 @@ def _worker_loop(
     use_shared_memory,
     base_seed,
     shm_cahce_size=0,
+    shm_ring=None,
+    shared_indices_queue=None,
+    profile_pipeline=False,
 ):
     try:
         # NOTE: [ mmap files clear ] When the child process exits unexpectedly,
@@ -325,12 +345,12 @@ def _worker_loop(
 
         while parent_watch_dog.is_alive():
             try:
-                data = indices_queue.get(MP_STATUS_CHECK_INTERVAL)
+                data = _get_indices(indices_queue, shared_indices_queue)
             except queue.Empty:
                 continue
 
             if isinstance(data, _ResumeIteration):
-                out_queue.put((data, None, None))
+                out_queue.put((data, None, None, None))
                 iterator_drained = False
                 fetcher = _DatasetKind.create_fetcher(
                     dataset_kind, dataset, auto_collate_batch, collate_fn, True
@@ -349,11 +369,15 @@ def _worker_loop(
                 continue
 
             idx, indices = data
+            fetch_start = time.time()
+            profile_events = [] if profile_pipeline else None
+            fetch_start_ns = _now_ns() if profile_pipeline else None
             try:
                 if init_exception is not None:
                     batch = init_exception
                     init_exception = None
                 else:
+                    fetcher.profile_events = profile_events
                     # NOTE: GPU tensor operation is not supported in sub-process
                     #       but default device is GPU in paddle-gpu version, which
                     #       may copy CPU tensor to GPU even if users want to use
@@ -369,27 +393,46 @@ def _worker_loop(
                     out_queue.put(_IterableDatasetStopIteration(worker_id))
                     iterator_drained = True
                 else:
-                    out_queue.put((idx, _WorkerException(worker_id), None))
+                    out_queue.put(
+                        (idx, _WorkerException(worker_id), None, None)
+                    )
             else:
                 if isinstance(batch, _WorkerException):
-                    out_queue.put((idx, batch, None))
+                    out_queue.put((idx, batch, None, None))
+                fetch_latency = time.time() - fetch_start
+                if profile_pipeline:
+                    profile_events.append(
+                        (_Stage.FETCH, fetch_start_ns, _now_ns())
+                    )
                 batch, structure = _flatten_batch(batch)
-                if use_shared_memory:
+                # NOTE: write batch into the reusable shared memory ring if
+                # enabled, only slot descriptor is put into out_queue then
+                slab_batch = None
+                if use_shared_memory and shm_ring is not None:
+                    slab_batch = shm_ring.write(worker_id, batch)
+                if slab_batch is not None:
+                    batch = slab_batch
+                elif use_shared_memory:
 
                     def numpy2lodtensor(arr):
                         lodtensor = core.Tensor()
                         lodtensor.set(arr, core.CPUPlace())
                         return lodtensor
 
-                    tensor_list = [
+                    batch = [
                         numpy2lodtensor(b)
                         if isinstance(b, np.ndarray)
                         else b.get_tensor()
                         for b in batch
                     ]
-                    out_queue.put((idx, tensor_list, structure))
-                else:
-                    out_queue.put((idx, batch, structure))
+                # worker id and fetch latency are sent back with batch
+                # for per-worker latency statistics, stage events and
+                # sending time are also sent if pipeline profiling enabled
+                profile = (
+                    (profile_events, _now_ns()) if profile_pipeline else None
+                )
+                worker_stat = (worker_id, fetch_latency, profile)
+                out_queue.put((idx, batch, structure, worker_stat))
     except KeyboardInterrupt:
         # NOTE: Main process will raise KeyboardInterrupt anyways, ignore it in child process
         pass
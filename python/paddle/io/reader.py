@@ -45,13 +45,18 @@ USE_PINNED_MEMORY = None
 # AutoTune Flags
 USE_AUTOTUNE = False
 TUNING_STEPS = 500
+# tune num_workers and prefetch_factor of multi-process DataLoader in
+# place during training, see _OnlineAutoTuner
+USE_ONLINE_AUTOTUNE = False
 
 
-def set_autotune_config(use_autotune, tuning_steps=500):
+def set_autotune_config(use_autotune, tuning_steps=500, online=False):
     global USE_AUTOTUNE
     USE_AUTOTUNE = use_autotune
     global TUNING_STEPS
     TUNING_STEPS = tuning_steps
+    global USE_ONLINE_AUTOTUNE
+    USE_ONLINE_AUTOTUNE = use_autotune and online
 
 
 def use_pinned_memory(*args):
@@ -88,6 +93,11 @@ class AuToTune:
         if (not USE_AUTOTUNE) or (not self.need_autotune()):
             return self.loader.num_workers
 
+        # multi-process DataLoader will be tuned online while iterating,
+        # no need to benchmark it offline
+        if self.loader._online_autotune and self.loader.num_workers > 0:
+            return self.loader.num_workers
+
         # get autotune loader
         auto_tune_loader = self.get_autotune_loader()
         if auto_tune_loader is None:
@@ -154,6 +164,7 @@ class AuToTune:
 
     def get_autotune_loader(self):
         loader = copy.copy(self.loader)
+        loader._online_autotune = False
         batch_size = self.loader.batch_sampler.batch_size
         if isinstance(
             self.loader.batch_sampler, paddle.io.DistributedBatchSampler
@@ -254,6 +265,14 @@ class DataLoader:
         When automatic batching is disabled, :attr:`default_collate_fn` will
         do nothing to data from dataset.
 
+    .. note::
+        Set environment variable ``FLAGS_dataloader_profile_pipeline=1`` to
+        record latency of each stage in data loading pipeline, statistics
+        can be got by :code:`pipeline_stats` of the iterator, and stages can
+        be exported into the chrome tracing timeline of
+        :code:`paddle.profiler.Profiler` by :code:`export_pipeline_trace`
+        of the iterator.
+
 
     Args:
         dataset(Dataset): the dataset to load data from, should be an
@@ -307,12 +326,28 @@ class DataLoader:
             as True only when the shared memory space on your machine(e.g.
             space of '/dev/shm' on Linux operating sysytem) is large enough.
             Shared memory will only be enabled in multi-process mode(num_workers
-            > 0). Default True.
+            > 0). Set environment variable ``FLAGS_dataloader_use_shm_ring=1``
+            to transport batches through a ring of preallocated shared memory
+            slabs reused across batches, slab size in bytes can be set by
+            ``FLAGS_dataloader_shm_ring_slab_size``. Default True.
         timeout(int, optional): the timeout value for getting data form output queue
             of subprocesses. Default 0.
         worker_init_fn(callable, optional): init function which will be called with
             worker id on each subproces starting if not set as None. Default
             None.
+        persistent_workers(bool, optional): whether to keep worker processes
+            alive after an epoch and reuse them in next epoch. Default False.
+        in_order(bool, optional): whether to output batches in the order of
+            batch indices in multi-process mode. If False, batches are output
+            as soon as they are loaded by workers, so that a slow batch does
+            not block other ready batches. Only takes effect for map-style
+            dataset. Default True.
+        dispatch_policy(str, optional): how batch indices are dispatched to
+            workers in multi-process mode, can be ``round_robin`` or
+            ``shared_queue``. ``round_robin`` assigns batch indices to workers
+            in turn, ``shared_queue`` puts batch indices into one queue shared
+            by all workers and idle workers pull from it. ``shared_queue`` only
+            takes effect for map-style dataset. Default ``round_robin``.
 
     Returns:
         DataLoader: an iterable object for data iterating, each elemnet of the generated data is a Tensor.
@@ -403,6 +438,8 @@ class DataLoader:
         timeout=0,
         worker_init_fn=None,
         persistent_workers=False,
+        in_order=True,
+        dispatch_policy='round_robin',
     ):
         self.return_list = return_list
         self.collate_fn = collate_fn
@@ -446,6 +483,14 @@ class DataLoader:
         assert timeout >= 0, "timeout should be a non-negative value"
         self.timeout = timeout
 
+        if dispatch_policy not in ['round_robin', 'shared_queue']:
+            raise ValueError(
+                "dispatch_policy should be 'round_robin' or 'shared_queue', "
+                "but got {}".format(dispatch_policy)
+            )
+        self.in_order = in_order
+        self.dispatch_policy = dispatch_policy
+
         if isinstance(dataset, IterableDataset):
             self.dataset_kind = _DatasetKind.ITER
             if shuffle:
@@ -458,6 +503,13 @@ class DataLoader:
                 raise ValueError(
                     "IterableDataset expect unspecified batch_sampler"
                 )
+            if not in_order or dispatch_policy != 'round_robin':
+                warnings.warn(
+                    "in_order and dispatch_policy are not supported for "
+                    "IterableDataset and will be ignored."
+                )
+                self.in_order = True
+                self.dispatch_policy = 'round_robin'
         else:
             self.dataset_kind = _DatasetKind.MAP
 
@@ -500,6 +552,9 @@ class DataLoader:
 
         self._persistent_workers = persistent_workers
         self._iterator = None
+        self._online_autotune = (
+            USE_ONLINE_AUTOTUNE and self.dataset_kind == _DatasetKind.MAP
+        )
         self.num_workers = AuToTune(self).__call__()
 
     def __len__(self):
@@ -88,6 +88,17 @@ class DygraphToStaticAst(BaseTransformer):
         # Generic transformation
         self.visit(node)
 
+        for index, transformer in enumerate(self.get_transformers()):
+            self._apply(transformer, node, log_level=index + 1)
+
+        self.translator_logger.log_transformed_code(
+            logging_utils.LOG_AllTransformer, self.root, "All Transformers"
+        )
+
+    def get_transformers(self):
+        """
+        Return transformers applied in order.
+        """
         transformers = [
             RegisterHookTransformer,
             EarlyReturnTransformer,
@@ -108,13 +119,7 @@ class DygraphToStaticAst(BaseTransformer):
         ]
 
         apply_optimization(transformers)
-
-        for index, transformer in enumerate(transformers):
-            self._apply(transformer, node, log_level=index + 1)
-
-        self.translator_logger.log_transformed_code(
-            logging_utils.LOG_AllTransformer, self.root, "All Transformers"
-        )
+        return transformers
 
     def visit_FunctionDef(self, node):
         if self.decorate_func_name is None:
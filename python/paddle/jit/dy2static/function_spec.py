@@ -478,6 +478,65 @@ def _hash_spec_names(args_specs, kwargs_specs):
     return tuple(value)
 
 
+# Types of python values guarded by value in `_input_guards`.
+_GUARDED_VALUE_TYPES = (bool, int, float, str, type(None))
+
+
+def _input_guards(args, kwargs):
+    """
+    Generates flat guards of input arguments to quickly find the traced program of
+    inputs that are exactly the same as previous ones, without constructing InputSpec
+    and CacheKey. Inputs with the same guards always generate the same CacheKey.
+
+    Tensors are guarded by shape, dtype, stop_gradient and the index of distinct
+    names as `_hash_spec_names`, numpy arrays by shape and dtype, containers by
+    type and length or keys, and python values of `_GUARDED_VALUE_TYPES` by type
+    and value.
+
+    Returns:
+        Tuple of guards, or None if any input can't be guarded.
+    """
+    guards = []
+    name_ids = {}
+
+    def visit(value):
+        value_type = type(value)
+        if value_type is core.eager.Tensor:
+            guards.append(
+                (
+                    value_type,
+                    tuple(value.shape),
+                    value.dtype,
+                    value.stop_gradient,
+                    name_ids.setdefault(value.name, len(name_ids)),
+                )
+            )
+        elif value_type is np.ndarray:
+            guards.append((value_type, value.shape, value.dtype))
+        elif value_type in _GUARDED_VALUE_TYPES:
+            guards.append((value_type, value))
+        elif value_type in (list, tuple):
+            guards.append((value_type, len(value)))
+            for item in value:
+                if not visit(item):
+                    return False
+        elif value_type is dict:
+            keys = tuple(value.keys())
+            if not all(type(key) is str for key in keys):
+                return False
+            guards.append((value_type, keys))
+            for key in keys:
+                if not visit(value[key]):
+                    return False
+        else:
+            return False
+        return True
+
+    if visit(args) and visit(kwargs):
+        return tuple(guards)
+    return None
+
+
 def spec_greater(first, other):
     def _shape_greater(first_shape, second_shape):
         if len(first_shape) != len(second_shape):
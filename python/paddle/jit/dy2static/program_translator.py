@@ -14,6 +14,8 @@
 
 import collections
 import inspect
+import itertools
+import os
 import textwrap
 import threading
 import warnings
@@ -28,22 +30,25 @@ from paddle.fluid.dygraph.base import (
 )
 from paddle.framework import in_dynamic_mode
 from paddle.nn.layer import layers
-from paddle.utils import flatten, gast
+from paddle.utils import flatten, gast, map_structure
 
 from . import error, logging_utils
 from .ast_transformer import DygraphToStaticAst
 from .function_spec import (
     FunctionSpec,
     _hash_spec_names,
+    _input_guards,
     get_buffers,
     get_parameters,
 )
 from .origin_info import (
     attach_origin_info,
     create_and_update_origin_info_map,
+    global_origin_info_map,
     update_op_callstack_with_origin_info,
 )
 from .partial_program import PartialProgramLayerHook, partial_program_from
+from .transform_cache import PersistentTransformCache
 from .utils import (
     ALREADY_D2S,
     NO_SHAPE_VAR_TYPE,
@@ -55,6 +60,7 @@ from .utils import (
     is_paddle_func,
     make_hashable,
     prim_or_cinn_is_enabled,
+    source_to_func,
     type_name,
     unwrap,
 )
@@ -65,6 +71,18 @@ __all__ = []
 # Once exceeding the threshold, we will raise warning to users to make sure the conversion is as expected.
 MAX_TRACED_PROGRAM_COUNT = 10
 
+# Max number of recently used programs of each function found by guards of inputs
+# before constructing CacheKey in `StaticFunction.__call__`. 0 means disabled.
+MAX_GUARDED_PROGRAM_COUNT = 8
+
+# Max number of cached programs of each function, the least recently used program
+# is evicted when exceeding it. 0 means unlimited.
+PROGRAM_CACHE_SIZE_ENV_NAME = 'TRANSLATOR_PROGRAM_CACHE_SIZE'
+# Max number of programs traced for inputs only differing in some dimensions of
+# shapes, the next input differing in shapes is traced with these dimensions
+# generalized into -1 instead. 0 means never generalizing.
+DYNAMIC_SHAPE_THRESHOLD_ENV_NAME = 'TRANSLATOR_DYNAMIC_SHAPE_THRESHOLD'
+
 CONVERSION_OPTIONS = "__jst_not_to_static"
 
 
@@ -89,6 +107,9 @@ class FunctionCache:
         # Caches the converted ast node for same source code. {source_code: ast_root}
         self._code_to_ast_caches = {}
         self._dygraph_to_static = DygraphToStaticAst()
+        # Caches the transformed code on disk across processes, enabled by
+        # environment variable `TRANSLATOR_CACHE_DIR`.
+        self._persistent_cache = PersistentTransformCache()
 
     def convert_with_cache(self, func):
         """
@@ -121,6 +142,10 @@ class FunctionCache:
 
         If the conversion of A.foo happens after B.foo, it will reuse the transformed ast node of B.foo
         to speed up the conversion.
+
+        If the persistent cache is enabled by environment variable `TRANSLATOR_CACHE_DIR`, the
+        transformed code of a function is loaded from the cache directory if it was written by
+        a previous process, which skips parsing and transforming the source code.
         """
         # Note: In Python2, it will raise OSError when inspect function
         # with decorator directly and function.__wrapped__ holds the actual function.
@@ -134,17 +159,62 @@ class FunctionCache:
         if source_code in self._code_to_ast_caches:
             root = self._code_to_ast_caches[source_code]
         else:
+            cache_key = self._persistent_cache_key(func, source_code)
+            if cache_key is not None:
+                entry = self._persistent_cache.load(cache_key)
+                if entry is not None:
+                    static_code, origin_infos = entry
+                    static_func, file_name = source_to_func(static_code, func)
+                    global_origin_info_map.update(
+                        PersistentTransformCache.restore_origin_info_map(
+                            origin_infos, file_name
+                        )
+                    )
+                    return static_func
+
             root = gast.parse(source_code)
             root = attach_origin_info(root, func)
             root = self._dygraph_to_static.get_static_ast(root)
             self._code_to_ast_caches[source_code] = root
 
+            if cache_key is not None:
+                static_func, file_name = ast_to_func(root, func)
+                origin_info_map = create_and_update_origin_info_map(
+                    root, static_func, is_global=False
+                )
+                with open(file_name, encoding='utf-8') as f:
+                    static_code = f.read()
+                self._persistent_cache.save(
+                    cache_key, static_code, origin_info_map
+                )
+                return static_func
+
         # Get static function from AST
         static_func, file_name = ast_to_func(root, func)
 
         create_and_update_origin_info_map(root, static_func)
         return static_func
 
+    def _persistent_cache_key(self, func, source_code):
+        """
+        Returns the key of func in persistent cache, or None if the cache is disabled.
+        """
+        if not self._persistent_cache.enabled():
+            return None
+        # transformed code is logged while transforming, skip the cache to show it
+        code_level = logging_utils.TranslatorLogger().transformed_code_level
+        if code_level != logging_utils.DEFAULT_CODE_LEVEL:
+            return None
+        return self._persistent_cache.key(
+            func, source_code, self._dygraph_to_static.get_transformers()
+        )
+
+    def persistent_cache_stats(self):
+        """
+        Returns hits, misses and errors of the persistent cache of transformed code.
+        """
+        return self._persistent_cache.stats()
+
     def exist(self, func):
         return func in self._converted_static_func_caches
 
@@ -351,6 +421,8 @@ class StaticFunction:
         self._input_spec = input_spec
         self._function_spec = FunctionSpec(function, input_spec)
         self._program_cache = ProgramCache()
+        # {guards of inputs : (hash_id, cache_key)} of recently used programs
+        self._guarded_keys = collections.OrderedDict()
         self._descriptor_cache = weakref.WeakKeyDictionary()
         # Note: Hold a reference to ProgramTranslator for switching `enable_to_static`.
         self._program_trans = ProgramTranslator()
@@ -471,9 +543,10 @@ class StaticFunction:
         args, kwargs = self._function_spec.unified_args_and_kwargs(args, kwargs)
 
         try:
-            concrete_program, partial_program_layer = self.get_concrete_program(
-                *args, **kwargs, is_train=self._is_train_mode()
-            )
+            (
+                concrete_program,
+                partial_program_layer,
+            ) = self._get_program_by_guards(args, kwargs)
             # 3. synchronize self.training attribute.
             if isinstance(self._class_instance, layers.Layer):
                 partial_program_layer.training = self._class_instance.training
@@ -504,6 +577,36 @@ class StaticFunction:
                 )
                 raise e
 
+    def _get_program_by_guards(self, args, kwargs):
+        """
+        Returns the program of inputs from `MAX_GUARDED_PROGRAM_COUNT` recently used
+        programs by checking guards of inputs, which avoids constructing InputSpec and
+        CacheKey of inputs, or traces it if not found.
+        """
+        is_train = self._is_train_mode()
+        guards = None
+        if MAX_GUARDED_PROGRAM_COUNT > 0:
+            guards = _input_guards(args, kwargs)
+        if guards is not None:
+            guards = (is_train, guards)
+            guarded_key = self._guarded_keys.get(guards)
+            if guarded_key is not None:
+                programs = self._program_cache.get_by_id(*guarded_key)
+                if programs is not None:
+                    self._guarded_keys.move_to_end(guards)
+                    return programs
+
+        programs = self.get_concrete_program(*args, **kwargs, is_train=is_train)
+        if guards is not None:
+            self._guarded_keys[guards] = (
+                self._program_cache._recent_key,
+                self._program_cache._recent_cache_key,
+            )
+            self._guarded_keys.move_to_end(guards)
+            while len(self._guarded_keys) > MAX_GUARDED_PROGRAM_COUNT:
+                self._guarded_keys.popitem(last=False)
+        return programs
+
     def _is_train_mode(self):
         if self._class_instance is not None:
             if not hasattr(self._class_instance, 'training'):
@@ -720,8 +823,16 @@ class StaticFunction:
                     )
                 )
         elif with_hook:
-            cache_key = self._program_cache._recent_cache_key
-            cache_key.kwargs["with_hook"] = True
+            # NOTE: copy the key instead of modifying it, which may be held by
+            # `_guarded_keys` and reused by following calls.
+            recent_key = self._program_cache._recent_cache_key
+            cache_key = CacheKey(
+                recent_key.function_spec,
+                recent_key.input_args_with_spec,
+                recent_key.input_kwargs_with_spec,
+                recent_key.class_instance,
+                **dict(recent_key.kwargs, with_hook=True),
+            )
             if not is_prim_infer:
                 concrete_program, _ = self._program_cache[cache_key]
                 return concrete_program
@@ -1201,17 +1312,45 @@ class FallbackProgramLayer:
 class ProgramCache:
     """
     Wrapper class for the program functions defined by dygraph function.
+
+    Programs are kept in least recently used order. If `max_size` is positive, the least
+    recently used program is evicted when the number of programs exceeds it.
+
+    If `dynamic_shape_threshold` is positive, once `dynamic_shape_threshold` programs are
+    traced for inputs which only differ in some dimensions of shapes, the dimensions differing
+    among them are generalized into -1, and inputs differing in these dimensions share the
+    program traced with the generalized InputSpec afterwards.
+
+    Args:
+        max_size(int, optional): max number of cached programs. Default None, read from
+            environment variable `TRANSLATOR_PROGRAM_CACHE_SIZE`, 0 if not set.
+        dynamic_shape_threshold(int, optional): number of programs traced before generalizing
+            dimensions. Default None, read from environment variable
+            `TRANSLATOR_DYNAMIC_SHAPE_THRESHOLD`, 0 if not set.
     """
 
     dy2static_error_file = "to_static.error"
 
-    def __init__(self):
+    def __init__(self, max_size=None, dynamic_shape_threshold=None):
         # {hash_id : (concrete_program, partial_layer)}
         self._caches = collections.OrderedDict()
         # trace mostly recent used program
         self._recent_key = None
         self._recent_cache_key = None
 
+        if max_size is None:
+            max_size = int(os.getenv(PROGRAM_CACHE_SIZE_ENV_NAME, 0))
+        if dynamic_shape_threshold is None:
+            dynamic_shape_threshold = int(
+                os.getenv(DYNAMIC_SHAPE_THRESHOLD_ENV_NAME, 0)
+            )
+        self._max_size = max_size
+        self._dynamic_shape_threshold = dynamic_shape_threshold
+        # {hash_id of shape-erased key : [shapes of traced InputSpecs]}
+        self._traced_shapes = {}
+        # {hash_id of shape-erased key : {(index of InputSpec, dim)}}
+        self._dynamic_dims = {}
+
     def _build_once(self, cache_key):
         # TODO(Aurelius84): Need a gloabl FLAGS to enable/disable to_prim
         enable_prim = cache_key.kwargs['build_strategy'].build_cinn_pass
@@ -1272,6 +1411,9 @@ class ProgramCache:
                 % type_name(item)
             )
         item_id = hash(item)
+        if item_id not in self._caches and self._dynamic_shape_threshold > 0:
+            item = self._generalize_shapes(item)
+            item_id = hash(item)
         self._recent_cache_key = item
         self._recent_key = item_id
         if item_id not in self._caches:
@@ -1285,9 +1427,119 @@ class ProgramCache:
                         current_tracing_count, MAX_TRACED_PROGRAM_COUNT
                     )
                 )
+            if self._max_size > 0:
+                while len(self._caches) > self._max_size:
+                    self._caches.popitem(last=False)
+        else:
+            self._caches.move_to_end(item_id)
 
         return self._caches[item_id]
 
+    @staticmethod
+    def _map_input_spec(cache_key, map_fn):
+        """
+        Returns a new CacheKey by replacing each InputSpec with `map_fn(index, spec)`.
+        """
+        from paddle.static import InputSpec
+
+        counter = itertools.count()
+
+        def replace(value):
+            if isinstance(value, InputSpec):
+                return map_fn(next(counter), value)
+            return value
+
+        return CacheKey(
+            cache_key.function_spec,
+            map_structure(replace, cache_key.input_args_with_spec),
+            map_structure(replace, cache_key.input_kwargs_with_spec),
+            cache_key.class_instance,
+            **cache_key.kwargs,
+        )
+
+    def _generalize_shapes(self, cache_key):
+        """
+        Returns the key with dynamic dimensions replaced by -1, and records shapes of
+        keys to trace for finding dynamic dimensions.
+        """
+        from paddle.static import InputSpec
+
+        if prim_or_cinn_is_enabled(
+            cache_key.kwargs.get('build_strategy'),
+            cache_key.kwargs.get('backend'),
+        ):
+            # prim and cinn do not support -1 shape
+            return cache_key
+
+        def erase(dims):
+            def map_fn(index, spec):
+                shape = [
+                    -1 if dims is None or (index, dim) in dims else size
+                    for dim, size in enumerate(spec.shape)
+                ]
+                return InputSpec(
+                    shape, spec.dtype, spec.name, spec.stop_gradient
+                )
+
+            return map_fn
+
+        skeleton_id = hash(self._map_input_spec(cache_key, erase(None)))
+        dims = self._dynamic_dims.get(skeleton_id)
+        if dims:
+            cache_key = self._map_input_spec(cache_key, erase(dims))
+            if hash(cache_key) in self._caches:
+                return cache_key
+
+        shapes = [
+            spec.shape
+            for spec in flatten(
+                [
+                    cache_key.input_args_with_spec,
+                    cache_key.input_kwargs_with_spec,
+                ]
+            )
+            if isinstance(spec, InputSpec)
+        ]
+        if not shapes:
+            return cache_key
+        traced_shapes = self._traced_shapes.setdefault(skeleton_id, [])
+        traced_shapes.append(shapes)
+        if len(traced_shapes) <= self._dynamic_shape_threshold:
+            return cache_key
+
+        new_dims = {
+            (index, dim)
+            for index, shape in enumerate(shapes)
+            for dim in range(len(shape))
+            if len({traced[index][dim] for traced in traced_shapes}) > 1
+        }
+        del self._traced_shapes[skeleton_id]
+        if not new_dims:
+            return cache_key
+        dims = (dims or set()) | new_dims
+        self._dynamic_dims[skeleton_id] = dims
+        logging_utils.log(
+            1,
+            "Generalize dimensions (index of InputSpec, dim) {} of {} into -1 after tracing {} programs.".format(
+                sorted(dims),
+                cache_key.function_spec,
+                self._dynamic_shape_threshold,
+            ),
+        )
+        return self._map_input_spec(cache_key, erase(dims))
+
+    def get_by_id(self, item_id, item):
+        """
+        Returns the cached program of CacheKey `item` whose hash id is `item_id`, or
+        None if it's not cached.
+        """
+        programs = self._caches.get(item_id)
+        if programs is not None:
+            self._caches.move_to_end(item_id)
+            self._recent_cache_key = item
+            self._recent_key = item_id
+        return programs
+
     def get_program_without_cache(self, cache_key):
         return self._build_once(cache_key=cache_key)
 
@@ -1319,6 +1571,8 @@ class ProgramCache:
 
     def clear(self):
         self._caches = collections.OrderedDict()
+        self._traced_shapes = {}
+        self._dynamic_dims = {}
 
 
 class PrimHooker(PartialProgramLayerHook):
@@ -0,0 +1,187 @@
+#   Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+import threading
+
+import paddle
+
+from .origin_info import Location, OriginInfo
+
+__all__ = []
+
+CACHE_DIR_ENV_NAME = 'TRANSLATOR_CACHE_DIR'
+
+# Bump it when the format of cache files changes.
+_CACHE_FORMAT_VERSION = 1
+
+
+class PersistentTransformCache:
+    """
+    On-disk cache of transformed code of dygraph functions, so that a warm
+    started process skips parsing and transforming source code of
+    functions decorated by `to_static`.
+
+    It's disabled by default, and enabled by setting environment variable
+    `TRANSLATOR_CACHE_DIR` to a directory shared by processes. A cache
+    entry is a json file holding the transformed code and the original
+    information map of it, keyed by the hash of the source code and its
+    location, Paddle version, Python version and transformers applied.
+    Entries are written atomically, so that a directory can be shared by
+    processes of distributed jobs.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    @property
+    def cache_dir(self):
+        return os.getenv(CACHE_DIR_ENV_NAME) or None
+
+    def enabled(self):
+        return self.cache_dir is not None
+
+    def key(self, func, source_code, transformers):
+        """
+        Returns the cache key of a function.
+
+        Args:
+            func(callable): the unwrapped dygraph function.
+            source_code(str): dedented source code of `func`.
+            transformers(list): transformer classes applied in order.
+        """
+        # original information refers to the file and line numbers of func
+        _, begin_lineno = inspect.getsourcelines(func)
+        items = [
+            str(_CACHE_FORMAT_VERSION),
+            paddle.__version__,
+            getattr(paddle, '__git_commit__', ''),
+            sys.version,
+            ','.join(f"{t.__module__}.{t.__qualname__}" for t in transformers),
+            inspect.getsourcefile(func) or '',
+            str(begin_lineno),
+            source_code,
+        ]
+        return hashlib.sha256('\0'.join(items).encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def load(self, key):
+        """
+        Returns ``(static_code, origin_infos)`` of the entry, or None if
+        it doesn't exist or is broken.
+        """
+        path = self._path(key)
+        entry = None
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+            if entry.get('key') != key:
+                entry = None
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            entry = None
+            with self._lock:
+                self._errors += 1
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        if entry is None:
+            return None
+        return entry['code'], entry['origin_infos']
+
+    def save(self, key, static_code, origin_info_map):
+        """
+        Writes an entry. Failures are counted and ignored since the cache
+        is only an accelerator.
+
+        Args:
+            static_code(str): source code of the transformed function.
+            origin_info_map(dict): original information map created by
+                `create_and_update_origin_info_map` for the function.
+        """
+        origin_infos = [
+            [
+                static_lineno,
+                info.location.filepath,
+                info.location.lineno,
+                info.location.col_offset,
+                info.function_name,
+                info.source_code,
+            ]
+            for (_, static_lineno), info in origin_info_map.items()
+        ]
+        entry = {'key': key, 'code': static_code, 'origin_infos': origin_infos}
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.cache_dir, prefix='.' + key, suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError:
+            with self._lock:
+                self._errors += 1
+
+    @staticmethod
+    def restore_origin_info_map(origin_infos, static_filepath):
+        """
+        Rebuilds the original information map of a function loaded from
+        `static_filepath`.
+        """
+        return {
+            (static_filepath, static_lineno): OriginInfo(
+                Location(filepath, lineno, col_offset),
+                function_name,
+                source_code,
+            )
+            for (
+                static_lineno,
+                filepath,
+                lineno,
+                col_offset,
+                function_name,
+                source_code,
+            ) in origin_infos
+        }
+
+    def stats(self):
+        """
+        Returns:
+            dict: number of hits, misses and errors of reading or writing
+            cache entries.
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'errors': self._errors,
+            }
@@ -599,7 +599,8 @@ class Auc(Metric):
     """
     The auc metric is for binary classification.
     Refer to https://en.wikipedia.org/wiki/Receiver_operating_characteristic#Area_under_the_curve.
-    Please notice that the auc metric is implemented with python, which may be a little bit slow.
+    The statistics are collected with vectorized numpy histograms and can be
+    merged across ranks with :code:`merge`.
 
     The `auc` function creates four local variables, `true_positives`,
     `true_negatives`, `false_positives` and `false_negatives` that are used to
@@ -710,14 +711,55 @@ class Auc(Metric):
         elif not _is_numpy_(preds):
             raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
 
-        for i, lbl in enumerate(labels):
-            value = preds[i, 1]
-            bin_idx = int(value * self._num_thresholds)
-            assert bin_idx <= self._num_thresholds
-            if lbl:
-                self._stat_pos[bin_idx] += 1.0
-            else:
-                self._stat_neg[bin_idx] += 1.0
+        bin_idx = (preds[:, 1] * self._num_thresholds).astype('int64')
+        assert bin_idx.size == 0 or (
+            bin_idx.min() >= 0 and bin_idx.max() <= self._num_thresholds
+        ), "The 'preds' of positive class must be in range [0, 1]."
+        is_pos = np.asarray(labels).reshape([-1]).astype('bool')
+
+        _num_pred_buckets = self._num_thresholds + 1
+        self._stat_pos += np.bincount(
+            bin_idx[is_pos], minlength=_num_pred_buckets
+        )
+        self._stat_neg += np.bincount(
+            bin_idx[~is_pos], minlength=_num_pred_buckets
+        )
+
+    def merge(self, other):
+        """
+        Merge the bucket statistics of another auc metric into this one,
+        e.g. to combine the states computed on different ranks or shards
+        before calling :code:`accumulate`.
+
+        Args:
+            other (Auc|tuple): Another :code:`Auc` instance with the same
+                :code:`num_thresholds`, or a tuple of ``(stat_pos, stat_neg)``
+                numpy arrays as returned by :code:`states`.
+        """
+        if isinstance(other, Auc):
+            other = other.states()
+        stat_pos, stat_neg = (np.asarray(s) for s in other)
+        if stat_pos.shape != self._stat_pos.shape or (
+            stat_neg.shape != self._stat_neg.shape
+        ):
+            raise ValueError(
+                "Can not merge auc states with different num_thresholds, "
+                "expect states in shape {}, but received {} and {}.".format(
+                    self._stat_pos.shape, stat_pos.shape, stat_neg.shape
+                )
+            )
+        self._stat_pos += stat_pos
+        self._stat_neg += stat_neg
+
+    def states(self):
+        """
+        Return the bucket statistics of positive and negative samples.
+
+        Return:
+            tuple: ``(stat_pos, stat_neg)``, copies of the statistics as two
+            numpy arrays in the shape of (num_thresholds + 1,).
+        """
+        return self._stat_pos.copy(), self._stat_neg.copy()
 
     @staticmethod
     def trapezoid_area(x1, x2, y1, y2):
@@ -730,21 +772,21 @@ class Auc(Metric):
         Return:
             float: the area under auc curve
         """
-        tot_pos = 0.0
-        tot_neg = 0.0
-        auc = 0.0
-
-        idx = self._num_thresholds
-        while idx >= 0:
-            tot_pos_prev = tot_pos
-            tot_neg_prev = tot_neg
-            tot_pos += self._stat_pos[idx]
-            tot_neg += self._stat_neg[idx]
-            auc += self.trapezoid_area(
-                tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
+        # walk the buckets from the highest threshold to the lowest one
+        tot_pos = np.cumsum(self._stat_pos[::-1])
+        tot_neg = np.cumsum(self._stat_neg[::-1])
+        tot_pos_prev = np.concatenate([[0.0], tot_pos[:-1]])
+        tot_neg_prev = np.concatenate([[0.0], tot_neg[:-1]])
+        auc = float(
+            np.sum(
+                self.trapezoid_area(
+                    tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
+                )
             )
-            idx -= 1
+        )
 
+        tot_pos = float(tot_pos[-1])
+        tot_neg = float(tot_neg[-1])
         return (
             auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
         )
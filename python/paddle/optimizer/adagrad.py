@@ -13,7 +13,9 @@
 # limitations under the License.
 import warnings
 
-from ..fluid import framework
+from paddle import _C_ops
+
+from ..fluid import core, framework
 from .optimizer import Optimizer
 
 __all__ = []
@@ -66,6 +68,7 @@ class Adagrad(Optimizer):
             The default value is None.
         initial_accumulator_value (float, optional): Initial value for moment accumulator.
             The default value is 0.0.
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once in dygraph mode. Default is false.
 
     Examples:
         .. code-block:: python
@@ -115,6 +118,7 @@ class Adagrad(Optimizer):
         grad_clip=None,
         name=None,
         initial_accumulator_value=0.0,
+        use_multi_tensor=False,
     ):
         assert learning_rate is not None
         assert epsilon is not None
@@ -134,6 +138,16 @@ class Adagrad(Optimizer):
             'epsilon': epsilon,
             'initial_accumulator_value': initial_accumulator_value,
         }
+        self._use_multi_tensor = use_multi_tensor
+        if self._use_multi_tensor:
+            self._param_dict = self._create_multi_tensor_dict()
+            self._moment_dict = self._create_multi_tensor_dict()
+            self._master_weight_dict = self._create_multi_tensor_dict()
+            self._master_weight_dict['FP32_LODTensor'] = None
+            if not self._multi_precision:
+                self._master_weight_dict['FP16_LODTensor'] = None
+            self._bucket_dict = self._create_multi_tensor_dict()
+            self._grad_index_dict = self._create_multi_tensor_dict()
 
     def _create_accumulators(self, block, parameters):
         assert isinstance(block, framework.Block)
@@ -212,6 +226,78 @@ class Adagrad(Optimizer):
 
         return adagrad_op
 
+    def _multi_tensor_init(self, target_block, parameters, param_group_idx):
+        """
+        All parameters used for optimizer (such as: parameters, master_weight, moment for adagrad) calculations are grouped into a python list by data type (bfloat16, float16, float32).
+        Args:
+            target_block: the block in which the loss tensor is present
+            parameters: list of parameter tensors for the optimizer
+        """
+        self._create_accumulators(target_block, parameters)
+        for param in self._add_multi_tensor_params(parameters, param_group_idx):
+            key = self._get_multi_tensor_key(param)
+            self._moment_dict[key][param_group_idx].append(
+                self._get_accumulator_master(self._moment_acc_str, param)
+            )
+            if self._master_weight_dict[key] is not None:
+                self._master_weight_dict[key][param_group_idx].append(
+                    self._master_weights[param.name]
+                )
+
+    def _append_optimize_multi_tensor_op(
+        self,
+        target_block,
+        parameters_and_grads,
+        param_group_idx,
+    ):
+        """
+        For Multi Tensor, update the parameters grouped by `_multi_tensor_init`
+        without looking up the accumulators one by one, and create the
+        learning rate once for each bucket.
+        """
+        found_inf = self._get_auxiliary_var('found_inf')
+        if found_inf:
+            if isinstance(found_inf, core.eager.Tensor):
+                self._set_auxiliary_var('found_inf', True)
+            return None
+        if isinstance(found_inf, core.eager.Tensor):
+            self._set_auxiliary_var('found_inf', False)
+
+        grad_dict = self._get_multi_tensor_grads(
+            parameters_and_grads, param_group_idx
+        )
+        if grad_dict is None:
+            self._append_optimize_op_for_each(
+                target_block, parameters_and_grads
+            )
+            return None
+        if isinstance(parameters_and_grads, dict):
+            self._update_param_group(parameters_and_grads)
+
+        for key in ['FP32_LODTensor', 'FP16_LODTensor']:
+            params = self._param_dict[key][param_group_idx]
+            grads = grad_dict[key]
+            moments = self._moment_dict[key][param_group_idx]
+            find_master = self._master_weight_dict[key] is not None
+            master_weights = (
+                self._master_weight_dict[key][param_group_idx]
+                if find_master
+                else None
+            )
+            for start, end, _ in self._bucket_dict[key][param_group_idx]:
+                lr = self._create_param_lr((params[start], None))
+                for i in range(start, end):
+                    _C_ops.adagrad_(
+                        params[i],
+                        grads[i],
+                        moments[i],
+                        lr,
+                        master_weights[i] if find_master else None,
+                        self._epsilon,
+                        find_master,
+                    )
+        return None
+
     def _update_param_group(self, parameters):
         self._epsilon = parameters.get('epsilon', self._default_dict['epsilon'])
         self.initial_accumulator_value = parameters.get(
@@ -20,7 +20,7 @@ from paddle import _C_ops
 
 from ..fluid import core, framework
 from ..fluid.dygraph import base as imperative_base
-from ..fluid.framework import Variable, in_dygraph_mode
+from ..fluid.framework import Variable
 from .optimizer import Optimizer
 
 __all__ = []
@@ -419,31 +419,16 @@ class Adam(Optimizer):
             return
 
         if not isinstance(self._parameter_list[0], dict):
-            params_grads = []
-            for param in self._parameter_list:
-                if param.stop_gradient:
-                    continue
-                if param._grad_ivar() is not None:
-                    grad_var = param._grad_ivar()
-                    if in_dygraph_mode():
-                        if (
-                            hasattr(grad_var, "is_selected_rows")
-                            and grad_var.is_selected_rows()
-                            and self.regularization is not None
-                        ):
-                            raise RuntimeError(
-                                "Adam don't support weight_decay with sparse parameters, please set it to None."
-                            )
-                    else:
-                        if (
-                            hasattr(grad_var, "_is_sparse")
-                            and grad_var._is_sparse()
-                            and self.regularization is not None
-                        ):
-                            raise RuntimeError(
-                                "Adam don't support weight_decay with sparse parameters, please set it to None."
-                            )
-                    params_grads.append((param, grad_var))
+            params_grads = self._get_params_grads(self._parameter_list)
+            if self.regularization is not None:
+                for _, grad_var in params_grads:
+                    if (
+                        hasattr(grad_var, "is_selected_rows")
+                        and grad_var.is_selected_rows()
+                    ):
+                        raise RuntimeError(
+                            "Adam don't support weight_decay with sparse parameters, please set it to None."
+                        )
 
             optimize_ops = self._apply_optimize(
                 loss=None,
@@ -455,12 +440,9 @@ class Adam(Optimizer):
             # optimize parameters in groups
             for idx, param_group in enumerate(self._param_groups):
                 params_grads = defaultdict(lambda: [])
-                for param in param_group['params']:
-                    if param.stop_gradient:
-                        continue
-                    if param._grad_ivar() is not None:
-                        grad_var = param._grad_ivar()
-                        params_grads['params'].append((param, grad_var))
+                params_grads['params'] = self._get_params_grads(
+                    param_group['params']
+                )
                 params_grads.update(
                     {k: v for k, v in param_group.items() if k != 'params'}
                 )
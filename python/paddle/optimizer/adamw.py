@@ -87,6 +87,8 @@ class AdamW(Optimizer):
             different semantics with the original Adam algorithm and may lead to different result.
             The default value is False.
         multi_precision (bool, optional): Whether to use multi-precision during weight updating. Default is false.
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once in dygraph mode,
+            the parameters sharing the weight decay and learning rate are updated by one fused_adam op. Default is false.
         name (str, optional): Normally there is no need for user to set this property.
             For more information, please refer to :ref:`api_guide_Name`.
             The default value is None.
@@ -159,6 +161,7 @@ class AdamW(Optimizer):
         grad_clip=None,
         lazy_mode=False,
         multi_precision=False,
+        use_multi_tensor=False,
         name=None,
     ):
         assert learning_rate is not None
@@ -278,7 +281,19 @@ class AdamW(Optimizer):
         else:
             self._param_groups = self._parameter_list
 
-        self._use_multi_tensor = None
+        self._use_multi_tensor = use_multi_tensor
+        if self._use_multi_tensor:
+            self._param_dict = self._create_multi_tensor_dict()
+            self._moment1_dict = self._create_multi_tensor_dict()
+            self._moment2_dict = self._create_multi_tensor_dict()
+            self._beta1_pow_acc_dict = self._create_multi_tensor_dict()
+            self._beta2_pow_acc_dict = self._create_multi_tensor_dict()
+            self._master_weight_dict = self._create_multi_tensor_dict()
+            self._master_weight_dict['FP32_LODTensor'] = None
+            if not self._multi_precision:
+                self._master_weight_dict['FP16_LODTensor'] = None
+            self._bucket_dict = self._create_multi_tensor_dict()
+            self._grad_index_dict = self._create_multi_tensor_dict()
         self.regularization = None
         self._auxiliary_vars = {}
         self._already_create_accumulater = set()
@@ -558,69 +573,160 @@ class AdamW(Optimizer):
             return
 
         if not isinstance(self._parameter_list[0], dict):
-            params_grads = []
-            for param in self._parameter_list:
-                if param.stop_gradient:
-                    continue
-                if param._grad_ivar() is not None:
-                    grad_var = param._grad_ivar()
-                    if framework.in_dygraph_mode():
-                        if (
-                            hasattr(grad_var, "is_selected_rows")
-                            and grad_var.is_selected_rows()
-                            and self.regularization is not None
-                        ):
-                            raise RuntimeError(
-                                "AdamW don't support weight_decay with sparse parameters, please set it to None."
-                            )
-                    else:
-                        if (
-                            hasattr(grad_var, "_is_sparse")
-                            and grad_var._is_sparse()
-                            and self.regularization is not None
-                        ):
-                            raise RuntimeError(
-                                "AdamW don't support weight_decay with sparse parameters, please set it to None."
-                            )
-                    params_grads.append((param, grad_var))
+            params_grads = self._get_params_grads(self._parameter_list)
+            if self.regularization is not None:
+                for _, grad_var in params_grads:
+                    if (
+                        hasattr(grad_var, "is_selected_rows")
+                        and grad_var.is_selected_rows()
+                    ):
+                        raise RuntimeError(
+                            "AdamW don't support weight_decay with sparse parameters, please set it to None."
+                        )
 
             optimize_ops = self._apply_optimize(
-                loss=None, startup_program=None, params_grads=params_grads
+                loss=None,
+                startup_program=None,
+                params_grads=params_grads,
+                param_group_idx=0,
             )
         else:
             # optimize parameters in groups
-            for param_group in self._param_groups:
+            for idx, param_group in enumerate(self._param_groups):
                 params_grads = defaultdict(lambda: [])
-                for param in param_group['params']:
-                    if param.stop_gradient:
-                        continue
-                    if param._grad_ivar() is not None:
-                        grad_var = param._grad_ivar()
-                        if framework.in_dygraph_mode():
-                            if (
-                                hasattr(grad_var, "is_selected_rows")
-                                and grad_var.is_selected_rows()
-                                and self.regularization is not None
-                            ):
-                                raise RuntimeError(
-                                    "AdamW don't support weight_decay with sparse parameters, please set it to None."
-                                )
-                        else:
-                            if (
-                                hasattr(grad_var, "_is_sparse")
-                                and grad_var._is_sparse()
-                                and self.regularization is not None
-                            ):
-                                raise RuntimeError(
-                                    "AdamW don't support weight_decay with sparse parameters, please set it to None."
-                                )
-                        params_grads['params'].append((param, grad_var))
+                params_grads['params'] = self._get_params_grads(
+                    param_group['params']
+                )
                 params_grads.update(
                     {k: v for k, v in param_group.items() if k != 'params'}
                 )
                 self._apply_optimize(
-                    loss=None, startup_program=None, params_grads=params_grads
+                    loss=None,
+                    startup_program=None,
+                    params_grads=params_grads,
+                    param_group_idx=idx,
+                )
+
+    def _multi_tensor_init(self, target_block, parameters, param_group_idx):
+        """
+        All parameters used for optimizer (such as: parameters, master_weight, moments and beta pows for adamw) calculations are grouped into a python list by data type (bfloat16, float16, float32),
+        and the parameters with different weight decay or learning rate ratio are placed in separate buckets.
+        Args:
+            target_block: the block in which the loss tensor is present
+            parameters: list of parameter tensors for the optimizer
+        """
+        self._create_accumulators(target_block, parameters)
+
+        def bucket_attrs(param):
+            with_decay = (
+                self._apply_decay_param_fun is None
+                or self._apply_decay_param_fun(param.name)
+            )
+            lr_ratio = 1.0 if self._lr_ratio is None else self._lr_ratio(param)
+            return (with_decay, lr_ratio)
+
+        for param in self._add_multi_tensor_params(
+            parameters, param_group_idx, bucket_attrs
+        ):
+            key = self._get_multi_tensor_key(param)
+            self._moment1_dict[key][param_group_idx].append(
+                self._get_accumulator_master(self._moment1_acc_str, param)
+            )
+            self._moment2_dict[key][param_group_idx].append(
+                self._get_accumulator_master(self._moment2_acc_str, param)
+            )
+            self._beta1_pow_acc_dict[key][param_group_idx].append(
+                self._get_accumulator_master(self._beta1_pow_acc_str, param)
+            )
+            self._beta2_pow_acc_dict[key][param_group_idx].append(
+                self._get_accumulator_master(self._beta2_pow_acc_str, param)
+            )
+            if self._master_weight_dict[key] is not None:
+                self._master_weight_dict[key][param_group_idx].append(
+                    self._master_weights[param.name]
+                )
+
+    def _append_optimize_multi_tensor_op(
+        self,
+        target_block,
+        parameters_and_grads,
+        param_group_idx,
+    ):
+        """
+        For Multi Tensor, append one fused_adam op for each bucket grouped by
+        `_multi_tensor_init`, the decoupled weight decay is applied by the op
+        for buckets with decay, and the lr_ratio is folded into the learning rate.
+        """
+        found_inf = self._get_auxiliary_var('found_inf')
+        if found_inf:
+            if isinstance(found_inf, core.eager.Tensor):
+                self._set_auxiliary_var('found_inf', True)
+            return None
+        if isinstance(found_inf, core.eager.Tensor):
+            self._set_auxiliary_var('found_inf', False)
+
+        grad_dict = self._get_multi_tensor_grads(
+            parameters_and_grads, param_group_idx
+        )
+        if grad_dict is None:
+            self._append_optimize_op_for_each(
+                target_block, parameters_and_grads
+            )
+            return None
+        if isinstance(parameters_and_grads, dict):
+            self._update_param_group(parameters_and_grads)
+
+        _beta1 = (
+            self._beta1
+            if not isinstance(self._beta1, Variable)
+            else self._beta1.item(0)
+        )
+        _beta2 = (
+            self._beta2
+            if not isinstance(self._beta2, Variable)
+            else self._beta2.item(0)
+        )
+        _weight_decay = (
+            self._weight_decay
+            if not isinstance(self._weight_decay, Variable)
+            else self._weight_decay.item(0)
+        )
+
+        for key in ['FP32_LODTensor', 'FP16_LODTensor']:
+            params = self._param_dict[key][param_group_idx]
+            grads = grad_dict[key]
+            find_master = self._master_weight_dict[key] is not None
+            for start, end, (with_decay, lr_ratio) in self._bucket_dict[key][
+                param_group_idx
+            ]:
+                lr = self._create_param_lr((params[start], None))
+                if lr_ratio != 1.0:
+                    lr = lr * lr_ratio
+                master_weights = (
+                    self._master_weight_dict[key][param_group_idx][start:end]
+                    if find_master
+                    else None
+                )
+                _, _, _, _, _, _ = _C_ops.fused_adam_(
+                    params[start:end],
+                    grads[start:end],
+                    lr,
+                    self._moment1_dict[key][param_group_idx][start:end],
+                    self._moment2_dict[key][param_group_idx][start:end],
+                    self._beta1_pow_acc_dict[key][param_group_idx][start:end],
+                    self._beta2_pow_acc_dict[key][param_group_idx][start:end],
+                    master_weights,
+                    None,
+                    _beta1,
+                    _beta2,
+                    self._epsilon,
+                    32 * 2048,
+                    _weight_decay if with_decay else 0.0,
+                    with_decay,
+                    find_master,
+                    False,
                 )
+        return None
 
     def _update_param_group(self, parameters):
         self._beta1 = parameters.get('beta1', self._default_dict['beta1'])
@@ -74,6 +74,7 @@ class Lamb(Optimizer):
         exclude_from_weight_decay_fn (function, optional): whether to skip weight decay for a parameter when this function returns True while take the parameter as input.
         always_adapt (bool, optional): whether to use Layer-wise LR adaptation. By default, skip adaptation on parameters that are
             excluded from weight decay, unless always_adapt == True, then always enable LR adaptation.
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once in dygraph mode. Default is false.
         name(str|None): For detailed information, please refer to
             :ref:`api_guide_Name` . Usually name is no need to set and None by default.
     Examples:
@@ -110,6 +111,7 @@ class Lamb(Optimizer):
         exclude_from_weight_decay_fn=None,
         multi_precision=False,
         always_adapt=False,
+        use_multi_tensor=False,
         name=None,
     ):
         assert learning_rate is not None
@@ -141,6 +143,19 @@ class Lamb(Optimizer):
         # TODO(zengjinle): expose API as soon as possible
         self._multi_precision = multi_precision
         self.always_adapt = always_adapt
+        self._use_multi_tensor = use_multi_tensor
+        if self._use_multi_tensor:
+            self._param_dict = self._create_multi_tensor_dict()
+            self._moment1_dict = self._create_multi_tensor_dict()
+            self._moment2_dict = self._create_multi_tensor_dict()
+            self._beta1_pow_acc_dict = self._create_multi_tensor_dict()
+            self._beta2_pow_acc_dict = self._create_multi_tensor_dict()
+            self._master_weight_dict = self._create_multi_tensor_dict()
+            self._master_weight_dict['FP32_LODTensor'] = None
+            if not self._multi_precision:
+                self._master_weight_dict['FP16_LODTensor'] = None
+            self._bucket_dict = self._create_multi_tensor_dict()
+            self._grad_index_dict = self._create_multi_tensor_dict()
 
     def _get_parameter(self, name, scope=None):
         if scope is None:
@@ -307,6 +322,114 @@ class Lamb(Optimizer):
 
             return lamb_op
 
+    def _multi_tensor_init(self, target_block, parameters, param_group_idx):
+        """
+        All parameters used for optimizer (such as: parameters, master_weight, moments and beta pows for lamb) calculations are grouped into a python list by data type (bfloat16, float16, float32),
+        and the parameters excluded from weight decay are placed in separate buckets.
+        Args:
+            target_block: the block in which the loss tensor is present
+            parameters: list of parameter tensors for the optimizer
+        """
+        self._create_accumulators(target_block, parameters)
+
+        def bucket_attrs(param):
+            with_decay = not (
+                self._exclude_from_weight_decay_fn is not None
+                and self._exclude_from_weight_decay_fn(param)
+            )
+            return (with_decay,)
+
+        for param in self._add_multi_tensor_params(
+            parameters, param_group_idx, bucket_attrs
+        ):
+            key = self._get_multi_tensor_key(param)
+            self._moment1_dict[key][param_group_idx].append(
+                self._get_accumulator_master(self._moment1_acc_str, param)
+            )
+            self._moment2_dict[key][param_group_idx].append(
+                self._get_accumulator_master(self._moment2_acc_str, param)
+            )
+            self._beta1_pow_acc_dict[key][param_group_idx].append(
+                self._get_accumulator_master(self._beta1_pow_acc_str, param)
+            )
+            self._beta2_pow_acc_dict[key][param_group_idx].append(
+                self._get_accumulator_master(self._beta2_pow_acc_str, param)
+            )
+            if self._master_weight_dict[key] is not None:
+                master_weight = self._master_weights[param.name]
+                self._used_master_weights[param.name] = master_weight.name
+                self._master_weight_dict[key][param_group_idx].append(
+                    master_weight
+                )
+
+    def _append_optimize_multi_tensor_op(
+        self,
+        target_block,
+        parameters_and_grads,
+        param_group_idx,
+    ):
+        """
+        For Multi Tensor, update the parameters grouped by `_multi_tensor_init`
+        without looking up the accumulators one by one, and create the
+        learning rate and weight decay once for each bucket.
+        """
+        found_inf = self._get_auxiliary_var('found_inf')
+        if found_inf:
+            if isinstance(found_inf, core.eager.Tensor):
+                self._set_auxiliary_var('found_inf', True)
+            return None
+        if isinstance(found_inf, core.eager.Tensor):
+            self._set_auxiliary_var('found_inf', False)
+
+        grad_dict = self._get_multi_tensor_grads(
+            parameters_and_grads, param_group_idx
+        )
+        if grad_dict is None:
+            self._append_optimize_op_for_each(
+                target_block, parameters_and_grads
+            )
+            return None
+        if isinstance(parameters_and_grads, dict):
+            self._update_param_group(parameters_and_grads)
+
+        for key in ['FP32_LODTensor', 'FP16_LODTensor']:
+            params = self._param_dict[key][param_group_idx]
+            grads = grad_dict[key]
+            moments1 = self._moment1_dict[key][param_group_idx]
+            moments2 = self._moment2_dict[key][param_group_idx]
+            beta1_pows = self._beta1_pow_acc_dict[key][param_group_idx]
+            beta2_pows = self._beta2_pow_acc_dict[key][param_group_idx]
+            find_master = self._master_weight_dict[key] is not None
+            master_weights = (
+                self._master_weight_dict[key][param_group_idx]
+                if find_master
+                else None
+            )
+            for start, end, (with_decay,) in self._bucket_dict[key][
+                param_group_idx
+            ]:
+                lr = self._create_param_lr((params[start], None))
+                weight_decay = self._lamb_weight_decay if with_decay else 0.0
+                for i in range(start, end):
+                    _C_ops.lamb_(
+                        params[i],
+                        grads[i],
+                        lr,
+                        moments1[i],
+                        moments2[i],
+                        beta1_pows[i],
+                        beta2_pows[i],
+                        master_weights[i] if find_master else None,
+                        None,
+                        weight_decay,
+                        self._beta1,
+                        self._beta2,
+                        self._epsilon,
+                        self.always_adapt,
+                        find_master,
+                    )
+        return None
+
     def _update_param_group(self, parameters):
         self._beta1 = parameters.get('beta1', self._default_dict['beta1'])
         self._beta2 = parameters.get('beta2', self._default_dict['beta2'])
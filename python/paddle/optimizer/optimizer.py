@@ -268,6 +268,7 @@ class Optimizer:
 
         # NOTE: Multi Tensor: Pass in all parameters and gradients to the op kernel of the Optimizer at one time for updating for dygraph mode.
         # Optimizer support list: [ paddle.optimizer.Momentum, paddle.optimizer.Adam].
+        # And in dygraph mode only: [ paddle.optimizer.AdamW, paddle.optimizer.Lamb, paddle.optimizer.RMSProp, paddle.optimizer.Adagrad, paddle.optimizer.SGD ].
         self._use_multi_tensor = None
 
         self._param_dict = self._create_multi_tensor_dict()
@@ -965,11 +966,16 @@ class Optimizer:
 
         self._create_global_learning_rate()
 
-        # NOTE: Multi Tensor support [ Momentum, Adam ] for dygraph mode
-        if self._use_multi_tensor and self.__class__.__name__ in [
-            'Momentum',
-            'Adam',
-        ]:
+        # NOTE: Multi Tensor support [ Momentum, Adam ] for dygraph mode,
+        # and [ AdamW, Lamb, RMSProp, Adagrad, SGD ] only for dygraph mode
+        if self._use_multi_tensor and (
+            self.__class__.__name__ in ['Momentum', 'Adam']
+            or (
+                framework.in_dygraph_mode()
+                and self.__class__.__name__
+                in ['AdamW', 'Lamb', 'RMSProp', 'Adagrad', 'SGD']
+            )
+        ):
             if (
                 len(self._param_dict['FP32_LODTensor'][param_group_idx]) == 0
                 and len(self._param_dict['FP16_LODTensor'][param_group_idx])
@@ -1556,6 +1562,25 @@ class Optimizer:
         optimize_ops = self.apply_gradients(params_grads)
         return
 
+    def _get_params_grads(self, parameters):
+        """
+        Get the (param, grad) pairs of the parameters which have gradients and
+        are not stop_gradient. The gradients are fetched by one call for all
+        parameters, in which the parameters with stop_gradient are skipped.
+
+        Args:
+            parameters (list): the parameters to get gradients.
+
+        Returns:
+            list: the (param, grad) pairs.
+        """
+        grads = core.eager.get_all_grads(parameters)
+        return [
+            (param, grad)
+            for param, grad in zip(parameters, grads)
+            if grad is not None
+        ]
+
     @imperative_base.no_grad()
     @framework.non_static_only
     def step(self):
@@ -1585,13 +1610,7 @@ class Optimizer:
             return
 
         if not isinstance(self._param_groups[0], dict):
-            params_grads = []
-            for param in self._param_groups:
-                if param.stop_gradient:
-                    continue
-                if param._grad_ivar() is not None:
-                    grad_var = param._grad_ivar()
-                    params_grads.append((param, grad_var))
+            params_grads = self._get_params_grads(self._param_groups)
 
             self._apply_optimize(
                 loss=None,
@@ -1604,12 +1623,9 @@ class Optimizer:
             # optimize parameters in groups
             for idx, param_group in enumerate(self._param_groups):
                 params_grads = defaultdict(lambda: [])
-                for param in param_group['params']:
-                    if param.stop_gradient:
-                        continue
-                    if param._grad_ivar() is not None:
-                        grad_var = param._grad_ivar()
-                        params_grads['params'].append((param, grad_var))
+                params_grads['params'] = self._get_params_grads(
+                    param_group['params']
+                )
                 params_grads.update(
                     {k: v for k, v in param_group.items() if k != 'params'}
                 )
@@ -1695,6 +1711,117 @@ class Optimizer:
         """
         pass
 
+    def _get_multi_tensor_key(self, param):
+        """
+        Get the key of the multi tensor dicts for the parameter by its data type.
+        """
+        if param.dtype == paddle.float32:
+            return 'FP32_LODTensor'
+        elif self._is_dtype_fp16_or_bf16(param.dtype):
+            return 'FP16_LODTensor'
+        raise ValueError(
+            "Now multi_tensor_{} only support fp32, fp16 or bf16 parameters and grad is LOD_TENSOR.".format(
+                self.type
+            )
+        )
+
+    def _add_multi_tensor_params(
+        self, parameters, param_group_idx, bucket_attrs=None
+    ):
+        """
+        Add parameters into `_param_dict` by data type, the parameters sharing
+        the learning rate ratio and the attributes `bucket_attrs(param)` are
+        placed adjacently as a bucket, and the range of each bucket is recorded
+        in `_bucket_dict`. The position of each parameter in `parameters` is
+        recorded in `_grad_index_dict` to gather the gradients in each step.
+
+        Args:
+            parameters: list of parameter tensors for the optimizer
+            param_group_idx: the index of the parameter group
+            bucket_attrs: a function returns a tuple of attributes which the
+                parameters in a bucket share, such as whether to decay.
+
+        Returns:
+            list: the parameters in the order they are added.
+        """
+        buckets = {}
+        for index, param in enumerate(parameters):
+            key = self._get_multi_tensor_key(param)
+            param_lr = (
+                param.optimize_attr['learning_rate']
+                if hasattr(param, 'optimize_attr')
+                else 1.0
+            )
+            attrs = bucket_attrs(param) if bucket_attrs is not None else ()
+            buckets.setdefault((key, param_lr, attrs), []).append(index)
+
+        added_params = []
+        for (key, _, attrs), indices in buckets.items():
+            param_list = self._param_dict[key][param_group_idx]
+            self._bucket_dict[key][param_group_idx].append(
+                (len(param_list), len(param_list) + len(indices), attrs)
+            )
+            for index in indices:
+                param_list.append(parameters[index])
+                self._grad_index_dict[key][param_group_idx].append(index)
+                added_params.append(parameters[index])
+        return added_params
+
+    def _get_multi_tensor_grads(self, parameters_and_grads, param_group_idx):
+        """
+        Gather the gradients in the order of the parameters added by
+        `_add_multi_tensor_params`.
+
+        Returns:
+            dict: the gradients of each data type, or None if the parameters
+            with gradients are not the ones added, e.g. some parameters get
+            no gradients in this step.
+        """
+        if isinstance(parameters_and_grads, dict):
+            parameters_and_grads = parameters_and_grads['params']
+        num_params = 0
+        for key in self._grad_index_dict:
+            num_params += len(self._grad_index_dict[key][param_group_idx])
+        if len(parameters_and_grads) != num_params:
+            return None
+
+        grad_dict = {}
+        for key in self._grad_index_dict:
+            pairs = [
+                parameters_and_grads[index]
+                for index in self._grad_index_dict[key][param_group_idx]
+            ]
+            if any(
+                pair[0] is not param
+                for pair, param in zip(
+                    pairs, self._param_dict[key][param_group_idx]
+                )
+            ):
+                return None
+            grad_dict[key] = [pair[1] for pair in pairs]
+        return grad_dict
+
+    def _append_optimize_op_for_each(self, target_block, parameters_and_grads):
+        """
+        Append the optimize op of each parameter, it is the fallback of Multi
+        Tensor when the gradients can not be gathered by
+        `_get_multi_tensor_grads`.
+        """
+        if isinstance(parameters_and_grads, dict):
+            self._update_param_group(parameters_and_grads)
+            parameters_and_grads = parameters_and_grads['params']
+        parameters_and_grads = [
+            param_and_grad
+            for param_and_grad in parameters_and_grads
+            if param_and_grad[1] is not None
+            and not param_and_grad[0].stop_gradient
+        ]
+        self._create_accumulators(
+            target_block, [p[0] for p in parameters_and_grads]
+        )
+        for param_and_grad in parameters_and_grads:
+            self._append_optimize_op(target_block, param_and_grad)
+
     def _is_dtype_fp16_or_bf16(self, dtype):
         """
         check the dtype is fp16 or the dtype is bf16
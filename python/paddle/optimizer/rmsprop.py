@@ -16,7 +16,7 @@ import warnings
 
 from paddle import _C_ops
 
-from ..fluid import framework
+from ..fluid import core, framework
 from ..fluid.framework import in_dygraph_mode
 from .optimizer import Optimizer
 
@@ -100,6 +100,7 @@ class RMSProp(Optimizer):
           some derived class of ``GradientClipBase`` . There are three cliping strategies
           ( :ref:`api_fluid_clip_GradientClipByGlobalNorm` , :ref:`api_fluid_clip_GradientClipByNorm` ,
           :ref:`api_fluid_clip_GradientClipByValue` ). Default None, meaning there is no gradient clipping.
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once in dygraph mode. Default is false.
         name (str, optional): This parameter is used by developers to print debugging information.
           For details, please refer to :ref:`api_guide_Name`. Default is None.
 
@@ -156,6 +157,7 @@ class RMSProp(Optimizer):
         parameters=None,
         weight_decay=None,
         grad_clip=None,
+        use_multi_tensor=False,
         name=None,
     ):
         if learning_rate is None:
@@ -194,6 +196,18 @@ class RMSProp(Optimizer):
             'momentum': momentum,
             'centered': centered,
         }
+        self._use_multi_tensor = use_multi_tensor
+        if self._use_multi_tensor:
+            self._param_dict = self._create_multi_tensor_dict()
+            self._momentum_dict = self._create_multi_tensor_dict()
+            self._mean_square_dict = self._create_multi_tensor_dict()
+            self._mean_grad_dict = self._create_multi_tensor_dict()
+            self._master_weight_dict = self._create_multi_tensor_dict()
+            self._master_weight_dict['FP32_LODTensor'] = None
+            if not self._multi_precision:
+                self._master_weight_dict['FP16_LODTensor'] = None
+            self._bucket_dict = self._create_multi_tensor_dict()
+            self._grad_index_dict = self._create_multi_tensor_dict()
 
     def _create_accumulators(self, block, parameters):
         if not isinstance(block, framework.Block):
@@ -302,6 +316,91 @@ class RMSProp(Optimizer):
 
             return rmsprop_op
 
+    def _multi_tensor_init(self, target_block, parameters, param_group_idx):
+        """
+        All parameters used for optimizer (such as: parameters, master_weight, momentum, mean_square and mean_grad for rmsprop) calculations are grouped into a python list by data type (bfloat16, float16, float32).
+        Args:
+            target_block: the block in which the loss tensor is present
+            parameters: list of parameter tensors for the optimizer
+        """
+        self._create_accumulators(target_block, parameters)
+        for param in self._add_multi_tensor_params(parameters, param_group_idx):
+            key = self._get_multi_tensor_key(param)
+            self._momentum_dict[key][param_group_idx].append(
+                self._get_accumulator_master(self._momentum_acc_str, param)
+            )
+            self._mean_square_dict[key][param_group_idx].append(
+                self._get_accumulator_master(self._mean_square_acc_str, param)
+            )
+            self._mean_grad_dict[key][param_group_idx].append(
+                self._get_accumulator_master(self._mean_grad_acc_str, param)
+            )
+            if self._master_weight_dict[key] is not None:
+                self._master_weight_dict[key][param_group_idx].append(
+                    self._master_weights[param.name]
+                )
+
+    def _append_optimize_multi_tensor_op(
+        self,
+        target_block,
+        parameters_and_grads,
+        param_group_idx,
+    ):
+        """
+        For Multi Tensor, update the parameters grouped by `_multi_tensor_init`
+        without looking up the accumulators one by one, and create the
+        learning rate once for each bucket.
+        """
+        found_inf = self._get_auxiliary_var('found_inf')
+        if found_inf:
+            if isinstance(found_inf, core.eager.Tensor):
+                self._set_auxiliary_var('found_inf', True)
+            return None
+        if isinstance(found_inf, core.eager.Tensor):
+            self._set_auxiliary_var('found_inf', False)
+
+        grad_dict = self._get_multi_tensor_grads(
+            parameters_and_grads, param_group_idx
+        )
+        if grad_dict is None:
+            self._append_optimize_op_for_each(
+                target_block, parameters_and_grads
+            )
+            return None
+        if isinstance(parameters_and_grads, dict):
+            self._update_param_group(parameters_and_grads)
+
+        for key in ['FP32_LODTensor', 'FP16_LODTensor']:
+            params = self._param_dict[key][param_group_idx]
+            grads = grad_dict[key]
+            momentums = self._momentum_dict[key][param_group_idx]
+            mean_squares = self._mean_square_dict[key][param_group_idx]
+            mean_grads = self._mean_grad_dict[key][param_group_idx]
+            find_master = self._master_weight_dict[key] is not None
+            master_weights = (
+                self._master_weight_dict[key][param_group_idx]
+                if find_master
+                else None
+            )
+            for start, end, _ in self._bucket_dict[key][param_group_idx]:
+                lr = self._create_param_lr((params[start], None))
+                for i in range(start, end):
+                    _C_ops.rmsprop_(
+                        params[i],
+                        mean_squares[i],
+                        grads[i],
+                        momentums[i],
+                        lr,
+                        mean_grads[i],
+                        master_weights[i] if find_master else None,
+                        self._epsilon,
+                        self._rho,
+                        self._momentum,
+                        self._centered,
+                        find_master,
+                    )
+        return None
+
     def _update_param_group(self, parameters):
         self._epsilon = parameters.get('epsilon', self._default_dict['epsilon'])
         self._rho = parameters.get('rho', self._default_dict['rho'])
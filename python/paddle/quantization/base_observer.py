@@ -30,3 +30,10 @@ class BaseObserver(BaseQuanter, metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def cal_thresholds(self):
         pass
+
+    def _sync_across_ranks(self):
+        r"""
+        Merge the statistics collected on all ranks of data parallel, so that
+        all ranks get the same scales. It does nothing by default.
+        """
+        pass
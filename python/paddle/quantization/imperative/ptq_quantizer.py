@@ -19,7 +19,7 @@ import numpy as np
 
 import paddle
 
-from ...static.quantization.cal_kl_threshold import cal_kl_threshold
+from ...static.quantization.cal_kl_threshold import cal_kl_thresholds
 from . import utils
 
 
@@ -249,15 +249,23 @@ class KLQuantizer(BaseHistQuantizer):
         super().__init__(quant_bits, bins, upsample_bins)
 
     def cal_thresholds(self):
+        indices = [
+            idx for idx in range(len(self.hists)) if self.hists[idx] is not None
+        ]
+        kl_thresholds = cal_kl_thresholds(
+            [self.hists[idx] for idx in indices],
+            [
+                self.abs_max_vals[idx] / self.hists[idx].shape[0]
+                for idx in indices
+            ],
+            self.quant_bits,
+        )
+        kl_thresholds = dict(zip(indices, kl_thresholds))
         for idx in range(len(self.hists)):
             if self.hists[idx] is None:
                 self.thresholds.append(self.abs_max_vals[idx])
             else:
-                hist = self.hists[idx]
-                abs_max_val = self.abs_max_vals[idx]
-                bin_width = abs_max_val / hist.shape[0]
-                threshold = cal_kl_threshold(hist, bin_width, self.quant_bits)
-                self.thresholds.append(threshold)
+                self.thresholds.append(kl_thresholds[idx])
 
 
 SUPPORT_ACT_QUANTIZERS = [AbsmaxQuantizer, HistQuantizer, KLQuantizer]
@@ -14,5 +14,15 @@
 # limitations under the License.
 
 from .abs_max import AbsmaxObserver
+from .channel_wise_abs_max import AbsMaxChannelWiseWeightObserver
+from .hist import HistObserver
+from .kl import KLObserver
+from .mse import MSEObserver
 
-__all__ = ["AbsmaxObserver"]
+__all__ = [
+    "AbsmaxObserver",
+    "AbsMaxChannelWiseWeightObserver",
+    "HistObserver",
+    "KLObserver",
+    "MSEObserver",
+]
@@ -62,6 +62,11 @@ class AbsmaxObserverLayer(BaseObserver):
         self.abs_max_val = paddle.maximum(abs_max_val, self.abs_max_val)
         return input
 
+    def _sync_across_ranks(self):
+        paddle.distributed.all_reduce(
+            self.abs_max_val, op=paddle.distributed.ReduceOp.MAX
+        )
+
     def cal_thresholds(self):
         self.thresholds = self.abs_max_val
 
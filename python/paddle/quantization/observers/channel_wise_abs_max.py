@@ -0,0 +1,102 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import paddle
+
+from ..base_observer import BaseObserver
+from ..factory import ObserverFactory
+from ..imperative.utils import spec_channel_axis_layers
+
+
+class AbsMaxChannelWiseWeightObserver(ObserverFactory):
+    r"""
+    It collects maximum absolute values of each output channel of weights.
+    The channel is the second axis for `Linear` and `Conv2DTranspose`,
+    whose weights are in format `Cin * Cout * ...`, and is the first axis
+    for other layers.
+
+    Args:
+        quant_bits(int, optional): Number of bits to represent an quantized integer in binary. Default: 8.
+
+    Examples:
+       .. code-block:: python
+
+            from paddle.quantization import QuantConfig
+            from paddle.quantization.observers import (
+                AbsmaxObserver,
+                AbsMaxChannelWiseWeightObserver,
+            )
+            q_config = QuantConfig(
+                activation=AbsmaxObserver(),
+                weight=AbsMaxChannelWiseWeightObserver(),
+            )
+    """
+
+    def __init__(self, quant_bits=8):
+        super().__init__(quant_bits=quant_bits)
+
+    def _get_class(self):
+        return AbsMaxChannelWiseWeightObserverLayer
+
+
+class AbsMaxChannelWiseWeightObserverLayer(BaseObserver):
+    """
+    Per-channel abs max observer for weights.
+    """
+
+    INIT_ABS_MAX = 1e-7
+
+    def __init__(self, layer, quant_bits=8):
+        super().__init__()
+        self._quant_bits = quant_bits
+        self._quant_axis = (
+            1 if isinstance(layer, tuple(spec_channel_axis_layers)) else 0
+        )
+        self.abs_max_val = None
+
+    def forward(self, input):
+        reduce_axis = [
+            axis for axis in range(len(input.shape)) if axis != self._quant_axis
+        ]
+        abs_max_val = paddle.max(paddle.abs(input.detach()), axis=reduce_axis)
+        abs_max_val = paddle.clip(
+            abs_max_val, min=AbsMaxChannelWiseWeightObserverLayer.INIT_ABS_MAX
+        )
+        if self.abs_max_val is None:
+            self.abs_max_val = abs_max_val
+        else:
+            self.abs_max_val = paddle.maximum(abs_max_val, self.abs_max_val)
+        return input
+
+    def _sync_across_ranks(self):
+        if self.abs_max_val is not None:
+            paddle.distributed.all_reduce(
+                self.abs_max_val, op=paddle.distributed.ReduceOp.MAX
+            )
+
+    def cal_thresholds(self):
+        self.thresholds = self.abs_max_val
+
+    def bit_length(self):
+        return self._quant_bits
+
+    def quant_axis(self):
+        return self._quant_axis
+
+    def scales(self):
+        return self.abs_max_val
+
+    def zero_points(self):
+        return None
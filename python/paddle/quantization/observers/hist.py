@@ -0,0 +1,193 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import abc
+import math
+
+import paddle
+
+from ...static.quantization.histogram import cal_hist_threshold, trim_hist
+from ..base_observer import BaseObserver
+from ..factory import ObserverFactory
+
+
+def _merge_bins(hist, factor):
+    r"""
+    Merge every `factor` adjacent bins of `hist` into one bin, the merged
+    bins are placed at the beginning and the rest are zeros.
+    """
+    bins = hist.shape[0]
+    num_merged = -(-bins // factor)
+    if num_merged * factor > bins:
+        hist = paddle.concat(
+            [hist, paddle.zeros([num_merged * factor - bins], dtype=hist.dtype)]
+        )
+    merged = paddle.sum(hist.reshape([num_merged, factor]), axis=1)
+    if num_merged < bins:
+        merged = paddle.concat(
+            [merged, paddle.zeros([bins - num_merged], dtype=hist.dtype)]
+        )
+    return merged
+
+
+class BaseHistObserverLayer(BaseObserver, metaclass=abc.ABCMeta):
+    r"""
+    Base observer collecting the histogram of target tensor on device.
+
+    The histogram covers `[-upper, upper]` with `bins_count` bins on each
+    side of zero, where `upper` is a power of two. When a batch exceeds
+    `upper`, `upper` is doubled as many times as needed and adjacent bins
+    are merged, so that the histogram is collected in one pass, and the
+    histograms of different ranks can be merged exactly by aligning them
+    to the largest `upper`.
+    """
+
+    INIT_ABS_MAX = 1e-7
+
+    def __init__(self, layer, quant_bits=8, bins_count=2048):
+        super().__init__()
+        assert bins_count > 0, "The bins_count should be greater than 0."
+        self._quant_bits = quant_bits
+        self._bins_count = bins_count
+        self._upper = 0.0
+        self.abs_max_val = paddle.to_tensor(BaseHistObserverLayer.INIT_ABS_MAX)
+        self.pos_hist = paddle.zeros([bins_count], dtype="int64")
+        self.neg_hist = paddle.zeros([bins_count], dtype="int64")
+        self.thresholds = None
+
+    def _grow(self, abs_max):
+        upper = 2.0 ** math.ceil(
+            math.log2(max(abs_max, BaseHistObserverLayer.INIT_ABS_MAX))
+        )
+        if self._upper > 0.0 and upper > self._upper:
+            factor = int(round(upper / self._upper))
+            self.pos_hist = _merge_bins(self.pos_hist, factor)
+            self.neg_hist = _merge_bins(self.neg_hist, factor)
+        self._upper = max(self._upper, upper)
+
+    def forward(self, input):
+        if input.size == 0:
+            return input
+        tensor = input.detach().flatten().astype("float32")
+        abs_max_val = paddle.max(paddle.abs(tensor))
+        self.abs_max_val = paddle.maximum(abs_max_val, self.abs_max_val)
+        abs_max = float(abs_max_val)
+        if self._upper == 0.0 or abs_max > self._upper:
+            self._grow(abs_max)
+        # the range of histogram op is integral, so the tensor is scaled
+        # to make a bin as wide as 1
+        bins = self._bins_count
+        hist = paddle.histogram(
+            tensor * (bins / self._upper), bins=2 * bins, min=-bins, max=bins
+        )
+        self.neg_hist = self.neg_hist + paddle.flip(hist[:bins], axis=[0])
+        self.pos_hist = self.pos_hist + hist[bins:]
+        self.thresholds = None
+        return input
+
+    def _sync_across_ranks(self):
+        group_upper = paddle.to_tensor([self._upper], dtype="float32")
+        paddle.distributed.all_reduce(
+            group_upper, op=paddle.distributed.ReduceOp.MAX
+        )
+        if float(group_upper) > 0.0:
+            self._grow(float(group_upper))
+        paddle.distributed.all_reduce(self.pos_hist)
+        paddle.distributed.all_reduce(self.neg_hist)
+        paddle.distributed.all_reduce(
+            self.abs_max_val, op=paddle.distributed.ReduceOp.MAX
+        )
+        self.thresholds = None
+
+    def _abs_hist(self):
+        r"""
+        Get the abs hist over `[0, abs_max]` and its bin width.
+        """
+        hist = trim_hist((self.pos_hist + self.neg_hist).numpy())
+        return hist, self._upper / self._bins_count
+
+    @abc.abstractmethod
+    def _cal_threshold(self):
+        pass
+
+    def cal_thresholds(self):
+        if self._upper == 0.0:
+            self.thresholds = self.abs_max_val
+        else:
+            self.thresholds = paddle.to_tensor(
+                self._cal_threshold(), dtype="float32"
+            )
+
+    def bit_length(self):
+        return self._quant_bits
+
+    def quant_axis(self):
+        return -1
+
+    def scales(self):
+        if self.thresholds is None:
+            self.cal_thresholds()
+        return self.thresholds
+
+    def zero_points(self):
+        return None
+
+
+class HistObserver(ObserverFactory):
+    r"""
+    It collects the histogram of target tensor, and takes the value of
+    `hist_percent` quantile of the abs values as the threshold.
+
+    Args:
+        quant_bits(int, optional): Number of bits to represent an quantized integer in binary. Default: 8.
+        bins_count(int, optional): Number of bins on each side of zero. Default: 2048.
+        hist_percent(float, optional): The quantile of abs values. Default: 0.99999.
+
+    Examples:
+       .. code-block:: python
+
+            from paddle.quantization import QuantConfig
+            from paddle.quantization.observers import HistObserver
+            observer = HistObserver(hist_percent=0.9999)
+            q_config = QuantConfig(activation=observer, weight=None)
+    """
+
+    def __init__(self, quant_bits=8, bins_count=2048, hist_percent=0.99999):
+        super().__init__(
+            quant_bits=quant_bits,
+            bins_count=bins_count,
+            hist_percent=hist_percent,
+        )
+
+    def _get_class(self):
+        return HistObserverLayer
+
+
+class HistObserverLayer(BaseHistObserverLayer):
+    """
+    Per-tensor percentile observer.
+    """
+
+    def __init__(
+        self, layer, quant_bits=8, bins_count=2048, hist_percent=0.99999
+    ):
+        super().__init__(layer, quant_bits=quant_bits, bins_count=bins_count)
+        assert (
+            0.0 < hist_percent <= 1.0
+        ), "The hist_percent should be in (0, 1]."
+        self._hist_percent = hist_percent
+
+    def _cal_threshold(self):
+        hist, bin_width = self._abs_hist()
+        return cal_hist_threshold(hist, bin_width, self._hist_percent)
@@ -0,0 +1,57 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from ...static.quantization.cal_kl_threshold import cal_kl_threshold
+from ..factory import ObserverFactory
+from .hist import BaseHistObserverLayer
+
+
+class KLObserver(ObserverFactory):
+    r"""
+    It collects the histogram of target tensor, and takes the threshold
+    minimizing the KL-divergence between the abs hist and its quantized
+    version.
+
+    Args:
+        quant_bits(int, optional): Number of bits to represent an quantized integer in binary. Default: 8.
+        bins_count(int, optional): Number of bins on each side of zero. Default: 2048.
+
+    Examples:
+       .. code-block:: python
+
+            from paddle.quantization import QuantConfig
+            from paddle.quantization.observers import KLObserver
+            observer = KLObserver()
+            q_config = QuantConfig(activation=observer, weight=None)
+    """
+
+    def __init__(self, quant_bits=8, bins_count=2048):
+        super().__init__(quant_bits=quant_bits, bins_count=bins_count)
+
+    def _get_class(self):
+        return KLObserverLayer
+
+
+class KLObserverLayer(BaseHistObserverLayer):
+    """
+    Per-tensor KL-divergence observer.
+    """
+
+    def __init__(self, layer, quant_bits=8, bins_count=2048):
+        super().__init__(layer, quant_bits=quant_bits, bins_count=bins_count)
+
+    def _cal_threshold(self):
+        hist, bin_width = self._abs_hist()
+        return cal_kl_threshold(hist, bin_width, self._quant_bits)
@@ -17,6 +17,7 @@ import copy
 from paddle.distributed import fleet
 from paddle.nn import Layer
 
+from .base_observer import BaseObserver
 from .config import QuantConfig
 from .quantize import Quantization
 
@@ -80,3 +81,26 @@ class PTQ(Quantization):
         self._convert_to_quant_layers(_model, self._config)
         self._insert_activation_observers(_model, self._config)
         return _model
+
+    def convert(self, model: Layer, inplace=False):
+        r"""Convert the calibrated model to onnx style. In parallel training,
+        the statistics of observers are merged across all ranks first, so
+        that every rank exports the same scales.
+        Args:
+            model(Layer) - The calibrated model to be converted.
+            inplace(bool) - Whether to modify the model in-place.
+
+        Return: The converted model
+        """
+        _model = model if inplace else copy.deepcopy(model)
+        if self._is_parallel_training():
+            self._sync_observers(_model)
+        self._convert(_model)
+        return _model
+
+    def _sync_observers(self, model: Layer):
+        # called once on the whole model, as the statistics of histograms
+        # are summed across ranks
+        for layer in model.sublayers(include_self=True):
+            if isinstance(layer, BaseObserver):
+                layer._sync_across_ranks()
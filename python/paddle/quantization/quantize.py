@@ -66,20 +66,23 @@ class Quantization(metaclass=abc.ABCMeta):
             paddle.jit.save(converted_model, "./quant_deploy", [dummy_data])
         """
         _model = model if inplace else copy.deepcopy(model)
+        self._convert(_model)
+        return _model
+
+    def _convert(self, model: Layer):
         replaced = {}
-        for name, child in _model.named_children():
+        for name, child in model.named_children():
             quant_dequant = None
             if isinstance(child, ConvertibleQuantedLayer):
                 child._convert()
             elif isinstance(child, BaseQuanter):
                 quant_dequant = LinearQuanterDequanter.from_quanter(child)
             else:
-                self.convert(child, inplace=True)
+                self._convert(child)
             if quant_dequant is not None:
                 replaced[name] = quant_dequant
         for key, value in replaced.items():
-            _model._sub_layers[key] = value
-        return _model
+            model._sub_layers[key] = value
 
     def _convert_to_quant_layers(self, model: Layer, config: QuantConfig):
         replaced = {}
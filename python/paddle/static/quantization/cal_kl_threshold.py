@@ -14,6 +14,8 @@
 
 import logging
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -78,6 +80,66 @@ def safe_entropy(reference_distr_P, P_sum, candidate_distr_Q, Q_sum):
     return (tmp_sum1 - tmp_sum2) / P_sum
 
 
+# max number of elements of temporary arrays of a chunk of candidates
+_KL_CHUNK_SIZE = 2**20
+
+
+def _kl_divergences(hist, candidates, quant_range):
+    '''
+    Calculate the KL-divergence of all candidate thresholds at once.
+
+    For a candidate `i`, the reference distribution P is `hist[0:i]` with
+    outliers added to the last bin, and Q merges `hist[0:i]` into
+    `quant_range` bins and expands them back to the non-zero bins of P,
+    as `expand_quantized_bins`. Since P and Q are constant within a merged
+    bin, sums over bins of `safe_entropy` are got from prefix sums of
+    `hist`, which costs O(quant_range) instead of O(i) per candidate.
+
+    Args:
+        hist(np.ndarray): The non-negative hist of the tensor.
+        candidates(np.ndarray): Candidates `i` with `hist[i - 1] != 0`.
+        quant_range(int): The number of merged bins.
+
+    Returns:
+        np.ndarray: The KL-divergence of each candidate.
+    '''
+    hist = hist.astype(np.float64)
+    cum_hist = np.concatenate([[0.0], np.cumsum(hist)])
+    cum_nonzero = np.concatenate([[0], np.cumsum(hist != 0)])
+    safe_hist = np.where(hist > 0, hist, 1.0)
+    cum_plogp = np.concatenate([[0.0], np.cumsum(hist * np.log(safe_hist))])
+    P_sum = cum_hist[-1]
+
+    outliers = P_sum - cum_hist[candidates]
+    last_p = hist[candidates - 1] + outliers
+    # sum of P * log(P), only the last bin of P differs from hist
+    sum_plogp = cum_plogp[candidates - 1] + last_p * np.log(last_p)
+    # Q_sum is the sum of hist[0:i] since merged bins of zeros are zeros
+    Q_sum = cum_hist[candidates]
+
+    # boundaries of merged bins, the last one ends at i
+    num_merged_bins = candidates // quant_range
+    bounds = num_merged_bins[:, None] * np.arange(quant_range + 1)
+    bounds[:, -1] = candidates
+    merged_sum = np.diff(cum_hist[bounds], axis=1)
+    merged_nonzero = np.diff(cum_nonzero[bounds], axis=1)
+    # Q of non-zero bins of a merged bin is the average of them
+    log_q = np.log(
+        np.where(
+            merged_nonzero > 0,
+            merged_sum / np.maximum(merged_nonzero, 1),
+            1.0,
+        )
+    )
+    merged_p = merged_sum
+    merged_p[:, -1] += outliers
+    sum_plogq = np.sum(merged_p * log_q, axis=1)
+
+    return (
+        sum_plogp + P_sum * np.log(Q_sum) - sum_plogq - P_sum * math.log(P_sum)
+    ) / P_sum
+
+
 def cal_kl_threshold(hist, bin_width, bits):
     '''
     Using the KL-divergenc method to get the more precise threshold.
@@ -87,52 +149,24 @@ def cal_kl_threshold(hist, bin_width, bits):
         bin_width(float): The bin width for the hist.
         bits(int): The quantization bits.
     '''
+    hist = np.asarray(hist)
     assert hist.ndim == 1
     hist_bins = hist.shape[0]
     starting_iter = int((hist_bins - 1) * 0.5)
     quant_range = 2 ** (bits - 1) - 1
 
-    P_sum = np.sum(np.array(hist).ravel())
-    min_kl_divergence = 0
+    candidates = np.arange(max(starting_iter, 1), hist_bins)
+    candidates = candidates[hist[candidates - 1] != 0]
+    min_kl_divergence = None
     min_kl_index = 0
-    kl_inited = False
-
-    for i in range(starting_iter, hist_bins):
-        reference_distr_P = hist[0:i].tolist()
-        outliers_count = sum(hist[i:])
-        if reference_distr_P[i - 1] == 0:
-            continue
-        reference_distr_P[i - 1] += outliers_count
-        reference_distr_bins = reference_distr_P[:]
-        candidate_distr_Q = hist[0:i].tolist()
-        num_merged_bins = int(i / quant_range)
-        candidate_distr_Q_quantized = [0] * quant_range
-        j_start = 0
-        j_end = num_merged_bins
-        for idx in range(quant_range):
-            candidate_distr_Q_quantized[idx] = sum(
-                candidate_distr_Q[j_start:j_end]
-            )
-            j_start += num_merged_bins
-            j_end += num_merged_bins
-            if (idx + 1) == quant_range - 1:
-                j_end = i
-        candidate_distr_Q = expand_quantized_bins(
-            candidate_distr_Q_quantized, reference_distr_bins
-        )
-        Q_sum = sum(candidate_distr_Q)
-        kl_divergence = safe_entropy(
-            reference_distr_P, P_sum, candidate_distr_Q, Q_sum
-        )
-        if not kl_inited:
-            min_kl_divergence = kl_divergence
-            min_kl_index = i
-            kl_inited = True
-        elif kl_divergence < min_kl_divergence:
-            min_kl_divergence = kl_divergence
-            min_kl_index = i
-        else:
-            pass
+    chunk_size = max(1, _KL_CHUNK_SIZE // (quant_range + 1))
+    for begin in range(0, len(candidates), chunk_size):
+        chunk = candidates[begin : begin + chunk_size]
+        kl_divergences = _kl_divergences(hist, chunk, quant_range)
+        idx = int(np.argmin(kl_divergences))
+        if min_kl_divergence is None or kl_divergences[idx] < min_kl_divergence:
+            min_kl_divergence = kl_divergences[idx]
+            min_kl_index = int(chunk[idx])
     if min_kl_index == 0:
         while starting_iter > 0:
             if hist[starting_iter] == 0:
@@ -142,3 +176,37 @@ def cal_kl_threshold(hist, bin_width, bits):
                 break
         min_kl_index = starting_iter
     return (min_kl_index + 0.5) * bin_width
+
+
+def cal_kl_thresholds(hists, bin_widths, bits, num_workers=None):
+    '''
+    Calculate thresholds of many tensors by `cal_kl_threshold` in parallel.
+    NumPy releases the GIL in array operations, so that threads work on
+    hists of different tensors at the same time.
+
+    Args:
+        hists(List): The hists of tensors.
+        bin_widths(List): The bin width for each hist.
+        bits(int): The quantization bits.
+        num_workers(int, optional): The number of threads. Default is None,
+            which means the number of CPUs.
+
+    Returns:
+        List: The threshold of each hist.
+    '''
+    assert len(hists) == len(bin_widths)
+    num_workers = num_workers or os.cpu_count() or 1
+    if num_workers == 1 or len(hists) <= 1:
+        return [
+            cal_kl_threshold(hist, bin_width, bits)
+            for hist, bin_width in zip(hists, bin_widths)
+        ]
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        return list(
+            executor.map(
+                cal_kl_threshold,
+                hists,
+                bin_widths,
+                [bits] * len(hists),
+            )
+        )
@@ -0,0 +1,213 @@
+#   Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+
+import numpy as np
+
+
+def _search_ratios(start=0.3, stop=1.0, step=0.02):
+    '''
+    The ratios of abs_max searched by mse and emd, the same as the
+    accumulated `s` of the former per-batch search.
+    '''
+    ratios = []
+    s = start
+    while s <= stop:
+        ratios.append(s)
+        s += step
+    return np.array(ratios)
+
+
+_SEARCH_RATIOS = _search_ratios()
+
+
+def _merge_bins(hist, factor):
+    '''
+    Merge every `factor` adjacent bins of `hist` into one bin, the merged
+    bins are placed at the beginning and the rest are zeros.
+    '''
+    bins = hist.shape[0]
+    num_merged = -(-bins // factor)
+    padded = np.zeros([num_merged * factor], dtype=hist.dtype)
+    padded[:bins] = hist
+    merged = np.zeros_like(hist)
+    merged[:num_merged] = padded.reshape([num_merged, factor]).sum(axis=1)
+    return merged
+
+
+def trim_hist(hist):
+    '''
+    Trim the empty bins at the end of `hist`, and keep at least one bin.
+    '''
+    nonzero = np.nonzero(hist)[0]
+    end = int(nonzero[-1]) + 1 if nonzero.size > 0 else 1
+    return hist[:end]
+
+
+def cal_hist_threshold(hist, bin_width, hist_percent):
+    '''
+    Using the hist method to get the threshold, which is the value of
+    'hist_percent' quantile of the abs hist.
+    '''
+    hist_cdf = np.cumsum(hist / float(np.sum(hist)))
+    # the cdf may end slightly below 1.0 because of rounding
+    hist_index = min(
+        int(np.searchsorted(hist_cdf, hist_percent)) + 1, len(hist)
+    )
+    return (hist_index - 0.5) * bin_width
+
+
+def search_threshold(
+    neg_hist, pos_hist, bin_width, abs_max, bits, algo="mse", onnx_format=False
+):
+    '''
+    Search the threshold among ratios of abs_max which minimizes the
+    quantization loss, where elements are represented by the centers
+    of their bins. All candidates are evaluated at once in O(bins).
+
+    Args:
+        neg_hist(np.ndarray): The hist of abs values of negative elements.
+        pos_hist(np.ndarray): The hist of non-negative elements.
+        bin_width(float): The bin width for both hists.
+        abs_max(float): The abs max of elements.
+        bits(int): The quantization bits.
+        algo(str, optional): The loss, 'mse' or 'emd'. Default is 'mse'.
+        onnx_format(bool, optional): Whether to quantize symmetrically
+            as the ONNX format, otherwise negative values are clipped
+            to zero. Default is False.
+
+    Returns:
+        tuple: The threshold and its loss.
+    '''
+    assert algo in ["mse", "emd"], "The algo should be mse or emd."
+    assert len(neg_hist) == len(pos_hist)
+    centers = (np.arange(len(pos_hist)) + 0.5) * bin_width
+    values = np.concatenate([-centers[::-1], centers])
+    counts = np.concatenate([neg_hist[::-1], pos_hist])
+    nonzero = counts > 0
+    values = values[nonzero]
+    probs = counts[nonzero] / float(counts.sum())
+
+    abs_max = abs_max if abs_max > 0.0 else 1e-8
+    scales = _SEARCH_RATIOS * abs_max
+    quant_max = 2 ** (bits - 1) - 1
+    x = values[None, :]
+    s = scales[:, None]
+    if onnx_format:
+        quant_x = np.clip(
+            np.round(x / s * quant_max), -quant_max - 1, quant_max
+        )
+        quant_dequant_x = quant_x / quant_max * s
+    else:
+        quant_dequant_x = (
+            np.round(np.clip(x, 0.0, s) / s * quant_max) / quant_max * s
+        )
+
+    if algo == "mse":
+        losses = np.sum((x - quant_dequant_x) ** 2 * probs, axis=1)
+    else:
+        mean = np.sum(values * probs)
+        std = np.sqrt(np.sum((values - mean) ** 2 * probs))
+        quant_mean = np.sum(quant_dequant_x * probs, axis=1)
+        quant_std = np.sqrt(
+            np.sum((quant_dequant_x - quant_mean[:, None]) ** 2 * probs, axis=1)
+        )
+        losses = np.abs(mean - quant_mean) + np.abs(std - quant_std)
+    # the largest one of the minimal losses as the former search
+    idx = len(losses) - 1 - int(np.argmin(losses[::-1]))
+    return float(scales[idx]), float(losses[idx])
+
+
+class StreamingHistogram:
+    '''
+    Histogram of a tensor accumulated batch by batch in one pass.
+
+    The histogram covers `[-upper, upper]` with `bins` bins on each side of
+    zero, and `upper` is initialized by the abs max of the first batch.
+    When a later batch exceeds `upper`, `upper` is multiplied by a power
+    of two `k` and every `k` adjacent bins are merged, so that the bins
+    collected before are still exact and no extra pass over the data is
+    needed to find the range.
+
+    Args:
+        bins(int, optional): The number of bins of each side. Default is 2048.
+    '''
+
+    def __init__(self, bins=2048):
+        assert bins > 0, "The bins should be greater than 0."
+        self.bins = bins
+        self.upper = 0.0
+        self.abs_max = 0.0
+        # counts of |x| in [i * bin_width, (i + 1) * bin_width)
+        self.pos_hist = np.zeros([bins], dtype=np.int64)
+        self.neg_hist = np.zeros([bins], dtype=np.int64)
+
+    @property
+    def bin_width(self):
+        return self.upper / self.bins
+
+    def _grow(self, abs_max):
+        factor = 2 ** math.ceil(math.log2(abs_max / self.upper))
+        self.pos_hist = _merge_bins(self.pos_hist, factor)
+        self.neg_hist = _merge_bins(self.neg_hist, factor)
+        self.upper *= factor
+        # guard against rounding of the multiplication
+        self.upper = max(self.upper, abs_max)
+
+    def update(self, tensor):
+        '''
+        Add all elements of `tensor` to the histogram.
+        '''
+        tensor = np.asarray(tensor).ravel()
+        if tensor.size == 0:
+            return
+        abs_max = float(max(-np.min(tensor), np.max(tensor)))
+        if self.upper == 0.0:
+            self.upper = abs_max if abs_max > 0.0 else 1e-8
+        elif abs_max > self.upper:
+            self._grow(abs_max)
+        self.abs_max = max(self.abs_max, abs_max)
+        hist, _ = np.histogram(
+            tensor, bins=2 * self.bins, range=(-self.upper, self.upper)
+        )
+        self.neg_hist += hist[self.bins - 1 :: -1]
+        self.pos_hist += hist[self.bins :]
+
+    def abs_hist(self):
+        '''
+        Get the histogram of abs values over `[0, abs_max]`, the empty
+        bins beyond abs_max left by merging are trimmed.
+
+        Returns:
+            tuple: The hist and the bin width.
+        '''
+        return trim_hist(self.pos_hist + self.neg_hist), self.bin_width
+
+    def search_threshold(self, bits, algo="mse", onnx_format=False):
+        '''
+        Search the mse or emd threshold by `search_threshold`.
+
+        Returns:
+            tuple: The threshold and its loss.
+        '''
+        return search_threshold(
+            self.neg_hist,
+            self.pos_hist,
+            self.bin_width,
+            self.abs_max,
+            bits,
+            algo,
+            onnx_format,
+        )
@@ -32,7 +32,8 @@ from ...utils import unique_name
 from ..log_helper import get_logger
 from . import utils
 from .adaround import run_adaround
-from .cal_kl_threshold import cal_kl_threshold
+from .cal_kl_threshold import cal_kl_thresholds
+from .histogram import StreamingHistogram, cal_hist_threshold
 from .quant_config import (
     SUPPORT_QUANTIZATION_OP_DICT,
     ARMCPUQuantizer,
@@ -360,8 +361,7 @@ class PostTrainingQuantization:
         self._quantized_weight_var_name = set()
         self._quantized_act_var_name = set()
         self._weight_op_pairs = {}
-        # The vars for alog = KL or hist
-        self._sampling_act_abs_min_max = {}
+        # The vars for alog = KL, hist, mse or emd
         self._sampling_act_histogram = {}
         self._sampling_data = {}
         self._quantized_var_threshold = {}
@@ -438,28 +438,6 @@ class PostTrainingQuantization:
         self._collect_target_varnames()
         self._set_activation_persistable()
 
-        if self._algo in ["KL", "hist"]:
-            batch_id = 0
-            with tqdm(
-                total=self._batch_nums,
-                bar_format='Preparation stage, Run batch:|{bar}| {n_fmt}/{total_fmt}',
-                ncols=80,
-            ) as t:
-                for data in self._data_loader():
-                    self._executor.run(
-                        program=self._program,
-                        feed=data,
-                        fetch_list=self._fetch_list,
-                        return_numpy=False,
-                        scope=self._scope,
-                    )
-                    self._collect_activation_abs_min_max()
-                    batch_id += 1
-                    t.update()
-                    if self._batch_nums and batch_id >= self._batch_nums:
-                        break
-            self._init_sampling_act_histogram()
-
         batch_id = 0
         with tqdm(
             total=self._batch_nums,
@@ -490,6 +468,8 @@ class PostTrainingQuantization:
 
         if self._algo in ["KL", "hist"]:
             self._calculate_kl_hist_threshold()
+        elif self._algo in ["mse", "emd"]:
+            self._calculate_mse_emd_threshold()
 
         if self._round_type == 'adaround':
             self._adaround_apply()
@@ -745,125 +725,11 @@ class PostTrainingQuantization:
             self._sample_avg()
         elif self._algo == "min_max":
             self._sample_min_max()
-        elif self._algo == "mse":
-            self._sample_mse()
-        elif self._algo == "emd":
-            self._sample_emd()
         elif self._algo == "ptf":
             self._sample_ptf()
-        elif self._algo in ["KL", "hist"]:
+        elif self._algo in ["KL", "hist", "mse", "emd"]:
             self._sample_histogram()
 
-    def _sample_mse(self):
-        if self._quantized_threshold == {}:
-            for var_name in self._quantized_weight_var_name:
-                var_tensor = utils.load_variable_data(self._scope, var_name)
-                if self._weight_quantize_type == "abs_max":
-                    abs_max_value = float(np.max(np.abs(var_tensor)))
-                elif self._weight_quantize_type == "channel_wise_abs_max":
-                    abs_max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[:, i])))
-                            )
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[i])))
-                            )
-                self._quantized_threshold[var_name] = abs_max_value
-        _logger.info("MSE searching stage ...")
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if var_tensor.size == 0:
-                self._zero_size_var_names.add(var_name)
-                continue
-            var_tensor = var_tensor.flatten()
-            abs_max_value = float(np.max(np.abs(var_tensor)))
-            abs_max_value = 1e-8 if abs_max_value == 0.0 else abs_max_value
-            s = 0.3
-            if var_name not in self._best_calibration_loss:
-                self._best_calibration_loss[var_name] = float('inf')
-            while s <= 1.0:
-                scale = s * abs_max_value
-                s += 0.02
-                bins = 2 ** (self._activation_bits - 1) - 1
-                if self._onnx_format:
-                    quant_var = np.clip(
-                        np.round(var_tensor / scale * bins), -bins - 1, bins
-                    )
-                    quant_dequant_var = quant_var / bins * scale
-                else:
-                    quant_dequant_var = (
-                        np.round(np.clip(var_tensor, 0.0, scale) / scale * bins)
-                        / bins
-                        * scale
-                    )
-                mse_loss = ((var_tensor - quant_dequant_var) ** 2).mean()
-                if mse_loss <= self._best_calibration_loss[var_name]:
-                    self._best_calibration_loss[var_name] = mse_loss
-                    self._quantized_threshold[var_name] = scale
-
-    def _sample_emd(self):
-        if self._quantized_threshold == {}:
-            for var_name in self._quantized_weight_var_name:
-                var_tensor = utils.load_variable_data(self._scope, var_name)
-                if self._weight_quantize_type == "abs_max":
-                    abs_max_value = float(np.max(np.abs(var_tensor)))
-                elif self._weight_quantize_type == "channel_wise_abs_max":
-                    abs_max_value = []
-                    if (
-                        self._weight_op_pairs[var_name]
-                        in utils._channelwise_quant_axis1_ops
-                    ):
-                        for i in range(var_tensor.shape[1]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[:, i])))
-                            )
-                    else:
-                        for i in range(var_tensor.shape[0]):
-                            abs_max_value.append(
-                                float(np.max(np.abs(var_tensor[i])))
-                            )
-                self._quantized_threshold[var_name] = abs_max_value
-        _logger.info("EMD searching stage ...")
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if var_tensor.size == 0:
-                self._zero_size_var_names.add(var_name)
-                continue
-            var_tensor = var_tensor.flatten()
-            abs_max_value = float(np.max(np.abs(var_tensor)))
-            abs_max_value = 1e-8 if abs_max_value == 0.0 else abs_max_value
-            s = 0.3
-            if var_name not in self._best_calibration_loss:
-                self._best_calibration_loss[var_name] = float('inf')
-            while s <= 1.0:
-                scale = s * abs_max_value
-                s += 0.02
-                bins = 2 ** (self._activation_bits - 1) - 1
-                if self._onnx_format:
-                    quant_var = np.clip(
-                        np.round(var_tensor / scale * bins), -bins - 1, bins
-                    )
-                    quant_dequant_var = quant_var / bins * scale
-                else:
-                    quant_dequant_var = (
-                        np.round(np.clip(var_tensor, 0.0, scale) / scale * bins)
-                        / bins
-                        * scale
-                    )
-                emd_loss = np.abs(
-                    np.mean(var_tensor) - np.mean(quant_dequant_var)
-                ) + np.abs(np.std(var_tensor) - np.std(quant_dequant_var))
-                if emd_loss <= self._best_calibration_loss[var_name]:
-                    self._best_calibration_loss[var_name] = emd_loss
-                    self._quantized_threshold[var_name] = scale
-
     def _sample_avg(self):
         if self._quantized_threshold == {}:
             for var_name in self._quantized_weight_var_name:
@@ -980,17 +846,20 @@ class PostTrainingQuantization:
                 self._quantized_var_max[var_name] = max_value
 
     def _sample_histogram(self):
+        '''
+        Accumulate the histogram of activations, which grows its range by
+        merging bins, so that all data is sampled in a single pass.
+        '''
         for var_name in self._quantized_act_var_name:
             var_tensor = utils.load_variable_data(self._scope, var_name)
-            if (var_tensor.size == 0) or (
-                var_name not in self._sampling_act_histogram
-            ):
+            if var_tensor.size == 0:
                 self._zero_size_var_names.add(var_name)
                 continue
-            var_tensor_abs = np.abs(var_tensor)
-            bins = self._sampling_act_histogram[var_name][1]
-            hist, _ = np.histogram(var_tensor_abs, bins=bins)
-            self._sampling_act_histogram[var_name][0] += hist
+            if var_name not in self._sampling_act_histogram:
+                self._sampling_act_histogram[var_name] = StreamingHistogram(
+                    self._histogram_bins
+                )
+            self._sampling_act_histogram[var_name].update(var_tensor)
 
     def _sample_ptf(self):
         """
@@ -1077,47 +946,6 @@ class PostTrainingQuantization:
                         )
                         op._set_attr("with_quant_attr", True)
 
-    def _collect_activation_abs_min_max(self):
-        '''
-        Collect the abs_min and abs_max for all activation. When algo = KL,
-        get the min and max value, and then calculate the threshold.
-        '''
-        for var_name in self._quantized_act_var_name:
-            var_tensor = utils.load_variable_data(self._scope, var_name)
-            if var_tensor.size == 0:
-                self._zero_size_var_names.add(var_name)
-                continue
-            var_tensor = np.abs(var_tensor)
-            min_value = float(np.min(var_tensor))
-            max_value = float(np.max(var_tensor))
-            if var_name not in self._sampling_act_abs_min_max:
-                self._sampling_act_abs_min_max[var_name] = [
-                    min_value,
-                    max_value,
-                ]
-            else:
-                if min_value < self._sampling_act_abs_min_max[var_name][0]:
-                    self._sampling_act_abs_min_max[var_name][0] = min_value
-                if max_value > self._sampling_act_abs_min_max[var_name][1]:
-                    self._sampling_act_abs_min_max[var_name][1] = max_value
-
-    def _init_sampling_act_histogram(self):
-        '''
-        Based on the min/max value, init the sampling_act_histogram.
-        '''
-        for var_name in self._quantized_act_var_name:
-            if (var_name in self._zero_size_var_names) and (
-                var_name not in self._sampling_act_abs_min_max
-            ):
-                continue
-            if var_name not in self._sampling_act_histogram:
-                min_val = self._sampling_act_abs_min_max[var_name][0]
-                max_val = self._sampling_act_abs_min_max[var_name][1]
-                hist, hist_edeges = np.histogram(
-                    [], bins=self._histogram_bins, range=(min_val, max_val)
-                )
-                self._sampling_act_histogram[var_name] = [hist, hist_edeges]
-
     def _calculate_kl_hist_threshold(self):
         '''
         Calculate the KL or hist threshold of quantized variables.
@@ -1147,21 +975,69 @@ class PostTrainingQuantization:
                         )
             self._quantized_var_threshold[var_name] = weight_threshold
 
+        kl_var_names = []
+        kl_hists = []
+        kl_bin_widths = []
         for var_name in self._quantized_act_var_name:
-            if (var_name in self._zero_size_var_names) and (
-                var_name not in self._sampling_act_histogram
-            ):
+            if var_name not in self._sampling_act_histogram:
                 continue
-            hist, hist_edeges = self._sampling_act_histogram[var_name]
+            hist, bin_width = self._sampling_act_histogram[var_name].abs_hist()
             if self._algo == "KL":
-                bin_width = hist_edeges[1] - hist_edeges[0]
-                self._quantized_var_threshold[var_name] = cal_kl_threshold(
-                    hist, bin_width, self._activation_bits
-                )
+                kl_var_names.append(var_name)
+                kl_hists.append(hist)
+                kl_bin_widths.append(bin_width)
             elif self._algo == "hist":
                 self._quantized_var_threshold[
                     var_name
-                ] = self._get_hist_scaling_factor(hist, hist_edeges)
+                ] = self._get_hist_scaling_factor(hist, bin_width)
+        # search thresholds of all activations in parallel
+        kl_thresholds = cal_kl_thresholds(
+            kl_hists, kl_bin_widths, self._activation_bits
+        )
+        for var_name, threshold in zip(kl_var_names, kl_thresholds):
+            self._quantized_var_threshold[var_name] = threshold
+
+    def _calculate_mse_emd_threshold(self):
+        '''
+        Calculate the mse or emd threshold of quantized variables. The loss
+        of all candidate thresholds is evaluated on the histograms, instead
+        of quantizing the activations of every batch for each candidate.
+        '''
+        _logger.info(f"{self._algo.upper()} searching stage ...")
+        assert self._algo in ["mse", "emd"], "The algo should be mse or emd."
+
+        # Abs_max threshold for weights
+        for var_name in self._quantized_weight_var_name:
+            var_tensor = utils.load_variable_data(self._scope, var_name)
+            if self._weight_quantize_type == "abs_max":
+                abs_max_value = float(np.max(np.abs(var_tensor)))
+            elif self._weight_quantize_type == "channel_wise_abs_max":
+                abs_max_value = []
+                if (
+                    self._weight_op_pairs[var_name]
+                    in utils._channelwise_quant_axis1_ops
+                ):
+                    for i in range(var_tensor.shape[1]):
+                        abs_max_value.append(
+                            float(np.max(np.abs(var_tensor[:, i])))
+                        )
+                else:
+                    for i in range(var_tensor.shape[0]):
+                        abs_max_value.append(
+                            float(np.max(np.abs(var_tensor[i])))
+                        )
+            self._quantized_threshold[var_name] = abs_max_value
+
+        for var_name in self._quantized_act_var_name:
+            if var_name not in self._sampling_act_histogram:
+                continue
+            threshold, loss = self._sampling_act_histogram[
+                var_name
+            ].search_threshold(
+                self._activation_bits, self._algo, self._onnx_format
+            )
+            self._quantized_threshold[var_name] = threshold
+            self._best_calibration_loss[var_name] = loss
 
     def _update_program(self):
         '''
@@ -1467,21 +1343,11 @@ class PostTrainingQuantization:
                     op._set_attr("bit_length", self._weight_bits)
                     op._set_attr("with_quant_attr", True)
 
-    def _get_hist_scaling_factor(self, hist, hist_edges):
+    def _get_hist_scaling_factor(self, hist, bin_width):
         '''
         Using the hist method to get the scaling factor.
         '''
-        threshold_rate = self._hist_percent
-        hist = hist / float(sum(hist))
-        hist_sum = 0
-        hist_index = 0
-        for i in range(len(hist)):
-            hist_sum += hist[i]
-            if hist_sum >= threshold_rate:
-                hist_index = i + 1
-                break
-        bin_width = hist_edges[1] - hist_edges[0]
-        return (hist_index - 0.5) * bin_width
+        return cal_hist_threshold(hist, bin_width, self._hist_percent)
 
 
 class PostTrainingQuantizationProgram(PostTrainingQuantization):
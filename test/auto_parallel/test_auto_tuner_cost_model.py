@@ -0,0 +1,208 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+from paddle.distributed.auto_tuner.cost_model import CostModel
+from paddle.distributed.auto_tuner.recorder import History_recorder
+from paddle.distributed.auto_tuner.tuner import AutoTuner
+
+SEARCH_KEYS = [
+    "dp_degree",
+    "sharding_degree",
+    "sharding_stage",
+    "micro_batch_size",
+    "pp_degree",
+    "mp_degree",
+    "use_recompute",
+    "recompute_granularity",
+]
+
+
+def get_tuner_cfg(**kwargs):
+    tuner_cfg = {
+        "dp_degree": "auto",
+        "mp_degree": "auto",
+        "pp_degree": "auto",
+        "micro_batch_size": "auto",
+        "sharding_degree": "auto",
+        "sharding_stage": "auto",
+        "use_recompute": "auto",
+        "recompute_granularity": "auto",
+        "search_algo": "cost_model",
+        "nodes": 1,
+        "num_gpus": 8,
+        "model_cfg": {
+            "hidden_size": 2048,
+            "global_batch_size": 64,
+            "num_layers": 24,
+            "num_attention_heads": 16,
+            "vocab_size": 50304,
+        },
+        "metric_cfg": {
+            "name": "step/s",
+            "OptimizationDirection": "Maximize",
+        },
+    }
+    tuner_cfg.update(kwargs)
+    return tuner_cfg
+
+
+def cfg_key(cfg):
+    return tuple(cfg[key] for key in SEARCH_KEYS)
+
+
+def run_tuner(auto_tuner, metric_fn):
+    cfgs = []
+    while True:
+        cfg = auto_tuner.search_once()
+        if cfg is None:
+            break
+        auto_tuner.add_cfg(cfg)
+        metric = metric_fn(cfg)
+        cfg["time"] = metric if metric is not None else -1
+        cfg["step/s"] = metric
+        cfg["job_id"] = len(auto_tuner.history_cfgs)
+        cfgs.append(cfg)
+    return cfgs
+
+
+class TestCostModel(unittest.TestCase):
+    def setUp(self):
+        tuner_cfg = get_tuner_cfg()
+        self.cost_model = CostModel(tuner_cfg)
+        self.cfg = {
+            "dp_degree": 1,
+            "sharding_degree": 8,
+            "sharding_stage": 1,
+            "micro_batch_size": 2,
+            "pp_degree": 1,
+            "mp_degree": 1,
+            "use_recompute": False,
+            "recompute_granularity": None,
+        }
+
+    def test_memory(self):
+        memory = self.cost_model.memory(self.cfg)
+        for key, value in [
+            ("sharding_stage", 2),
+            ("sharding_stage", 3),
+            ("use_recompute", True),
+        ]:
+            self.cfg[key] = value
+            self.assertLess(self.cost_model.memory(self.cfg), memory)
+            memory = self.cost_model.memory(self.cfg)
+
+        self.cfg["micro_batch_size"] = 8
+        self.assertGreater(self.cost_model.memory(self.cfg), memory)
+
+    def test_step_time(self):
+        step_time = self.cost_model.step_time(self.cfg)
+        self.cfg["use_recompute"] = True
+        self.assertGreater(self.cost_model.step_time(self.cfg), step_time)
+
+        # pipeline bubbles shrink with more micro batches
+        self.cfg.update({"sharding_degree": 2, "pp_degree": 4})
+        step_time = self.cost_model.step_time(self.cfg)
+        self.cfg["micro_batch_size"] = 8
+        self.assertGreater(self.cost_model.step_time(self.cfg), step_time)
+
+
+class TestCostModelSearch(unittest.TestCase):
+    def test_search_order(self):
+        tuner_cfg = get_tuner_cfg(
+            cost_model_cfg={"patience": 0, "stop_margin": None}
+        )
+        auto_tuner = AutoTuner(tuner_cfg)
+        cost_model = auto_tuner.algo.cost_model
+        cfgs = run_tuner(auto_tuner, lambda cfg: 1.0)
+
+        self.assertEqual(len(cfgs), len({cfg_key(cfg) for cfg in cfgs}))
+        # the ranker follows the cost model without valid trials
+        best_time = min(
+            cost_model.step_time(cfg) for cfg in auto_tuner.algo.all_tasks
+        )
+        self.assertAlmostEqual(cost_model.step_time(cfgs[0]), best_time)
+
+    def test_learn_from_history(self):
+        tuner_cfg = get_tuner_cfg(
+            task_limit=8, cost_model_cfg={"patience": 0, "stop_margin": None}
+        )
+        auto_tuner = AutoTuner(tuner_cfg)
+        cost_model = auto_tuner.algo.cost_model
+
+        # sharding is much slower than the estimate
+        def metric_fn(cfg):
+            step_time = cost_model.step_time(cfg)
+            if cfg["sharding_degree"] > 1:
+                step_time *= 4
+            return 1.0 / step_time
+
+        cfgs = run_tuner(auto_tuner, metric_fn)
+        self.assertEqual(len(cfgs), 8)
+        self.assertGreater(cfgs[0]["sharding_degree"], 1)
+        for cfg in cfgs[1:]:
+            self.assertEqual(cfg["sharding_degree"], 1)
+
+    def test_early_stop(self):
+        tuner_cfg = get_tuner_cfg(
+            cost_model_cfg={"patience": 2, "stop_margin": None}
+        )
+        auto_tuner = AutoTuner(tuner_cfg)
+        metrics = iter([3.0, 2.0, 1.0, 4.0])
+        cfgs = run_tuner(auto_tuner, lambda cfg: next(metrics))
+        self.assertEqual(len(cfgs), 3)
+
+    def test_gpu_memory(self):
+        tuner_cfg = get_tuner_cfg(cost_model_cfg={"gpu_memory": 16})
+        auto_tuner = AutoTuner(tuner_cfg)
+        cost_model = auto_tuner.algo.cost_model
+        cfg = auto_tuner.search_once()
+        self.assertLessEqual(cost_model.memory(cfg), 16 * 2**30)
+
+    def test_resume(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        history_path = os.path.join(tmp_dir.name, "history.csv")
+
+        tuner_cfg = get_tuner_cfg(task_limit=3)
+        metrics = iter([2.0, None, 1.0])
+        cfgs = run_tuner(AutoTuner(tuner_cfg), lambda cfg: next(metrics))
+        recorder = History_recorder()
+        for cfg in cfgs:
+            recorder.add_cfg(**cfg)
+        recorder.store_history(history_path)
+
+        history, err = History_recorder().load_history(history_path)
+        self.assertFalse(err)
+        tuner_cfg = get_tuner_cfg(task_limit=5)
+        auto_tuner = AutoTuner(tuner_cfg)
+        auto_tuner.resume(history)
+        self.assertEqual(auto_tuner.cur_task_id, 4)
+        for cfg, resumed_cfg in zip(cfgs, history):
+            self.assertEqual(cfg_key(cfg), cfg_key(resumed_cfg))
+            self.assertEqual(cfg["time"], resumed_cfg["time"])
+
+        new_cfgs = run_tuner(auto_tuner, lambda cfg: 1.5)
+        self.assertGreater(len(new_cfgs), 0)
+        self.assertLessEqual(len(new_cfgs), 2)
+        searched = {cfg_key(cfg) for cfg in cfgs}
+        for cfg in new_cfgs:
+            self.assertNotIn(cfg_key(cfg), searched)
+        tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
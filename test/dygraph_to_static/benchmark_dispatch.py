@@ -0,0 +1,103 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Micro-benchmark of the per-call dispatch overhead of `@to_static` functions,
+# i.e. the time spent in `StaticFunction.__call__` before running the program,
+# with and without checking guards of recently used programs.
+#
+# Usage: python benchmark_dispatch.py [--repeat 2000]
+
+import argparse
+import time
+
+import paddle
+from paddle.jit.dy2static import program_translator
+
+
+def small_net(x, y, scale=1.0, inputs=None):
+    out = paddle.matmul(x, y) * scale
+    if inputs is not None:
+        out = out + inputs['bias']
+    return out
+
+
+def time_per_call(func, args, kwargs, repeat):
+    for _ in range(10):
+        func(*args, **kwargs)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args, **kwargs)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def time_dispatch(static_func, args, kwargs, repeat):
+    # time of finding the program without running it
+    args, kwargs = static_func._function_spec.unified_args_and_kwargs(
+        args, kwargs
+    )
+
+    def dispatch():
+        static_func._get_program_by_guards(args, dict(kwargs))
+
+    return time_per_call(dispatch, (), {}, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=2000)
+    repeat = parser.parse_args().repeat
+
+    paddle.disable_static()
+    paddle.set_device('cpu')
+    x = paddle.rand([4, 8])
+    y = paddle.rand([8, 8])
+    inputs = {'bias': paddle.rand([8])}
+    cases = {
+        'tensors': ((x, y), {}),
+        'tensors+python values': ((x, y, 2.0), {}),
+        'tensors+dict': ((x, y), {'inputs': inputs}),
+    }
+
+    guarded_count = program_translator.MAX_GUARDED_PROGRAM_COUNT
+    print(
+        '{:<24}{:>16}{:>16}{:>16}{:>16}'.format(
+            'case', 'dispatch(us)', 'guarded(us)', 'call(us)', 'guarded(us)'
+        )
+    )
+    for name, (args, kwargs) in cases.items():
+        results = []
+        for count in [0, guarded_count]:
+            program_translator.MAX_GUARDED_PROGRAM_COUNT = count
+            static_func = paddle.jit.to_static(small_net)
+            static_func(*args, **kwargs)
+            results.append(
+                (
+                    time_dispatch(static_func, args, kwargs, repeat),
+                    time_per_call(static_func, args, kwargs, repeat),
+                )
+            )
+        program_translator.MAX_GUARDED_PROGRAM_COUNT = guarded_count
+        print(
+            '{:<24}{:>16.1f}{:>16.1f}{:>16.1f}{:>16.1f}'.format(
+                name,
+                results[0][0],
+                results[1][0],
+                results[0][1],
+                results[1][1],
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
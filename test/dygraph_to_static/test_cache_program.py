@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import unittest
 from collections import Counter
 
@@ -22,6 +23,10 @@ import paddle
 from paddle import fluid
 from paddle.jit.api import to_static
 from paddle.jit.dy2static import convert_to_static
+from paddle.jit.dy2static.program_translator import (
+    DYNAMIC_SHAPE_THRESHOLD_ENV_NAME,
+    PROGRAM_CACHE_SIZE_ENV_NAME,
+)
 
 
 class TestCacheProgram(unittest.TestCase):
@@ -168,5 +173,116 @@ class TestToOutputWithCache(unittest.TestCase):
             self.assertEqual(ret.numpy(), 5050)
 
 
+def sum_with_shape(x):
+    return paddle.sum(x, axis=-1) * 2
+
+
+class TestBoundedProgramCache(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        os.environ[PROGRAM_CACHE_SIZE_ENV_NAME] = '2'
+
+    def tearDown(self):
+        os.environ.pop(PROGRAM_CACHE_SIZE_ENV_NAME, None)
+
+    def test_lru(self):
+        static_func = to_static(sum_with_shape)
+        cache = static_func.program_cache
+        for seq_len in [1, 2, 1, 3, 1]:
+            x = paddle.ones([2, seq_len])
+            np.testing.assert_allclose(
+                static_func(x).numpy(), np.full([2], seq_len * 2.0)
+            )
+            self.assertLessEqual(len(cache), 2)
+        # the least recently used program of seq_len 2 is evicted
+        shapes = sorted(
+            cp.inputs[0].shape[1] for cp in cache.concrete_programs()
+        )
+        self.assertEqual(shapes, [1, 3])
+
+
+class TestDynamicShapeGeneralization(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        os.environ[DYNAMIC_SHAPE_THRESHOLD_ENV_NAME] = '2'
+
+    def tearDown(self):
+        os.environ.pop(DYNAMIC_SHAPE_THRESHOLD_ENV_NAME, None)
+
+    def test_generalize(self):
+        static_func = to_static(sum_with_shape)
+        for seq_len in range(1, 8):
+            x = paddle.ones([2, seq_len])
+            np.testing.assert_allclose(
+                static_func(x).numpy(), np.full([2], seq_len * 2.0)
+            )
+        # two programs with static shapes and a shared one with -1
+        self.assertEqual(static_func.get_traced_count(), 3)
+        shapes = [
+            list(cp.inputs[0].shape)
+            for cp in static_func.program_cache.concrete_programs()
+        ]
+        self.assertEqual(shapes, [[2, 1], [2, 2], [2, -1]])
+
+        # batch size changes in a new dimension
+        static_func(paddle.ones([4, 3]))
+        self.assertEqual(static_func.get_traced_count(), 4)
+
+
+def add_with_bias(x, bias=1.0, inputs=None):
+    if inputs is not None:
+        x = x + inputs['y']
+    return x + bias
+
+
+class TestGuardedFastPath(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.static_func = to_static(add_with_bias)
+        self.full_lookups = 0
+        get_concrete_program = self.static_func.get_concrete_program
+
+        def counted_get_concrete_program(*args, **kwargs):
+            self.full_lookups += 1
+            return get_concrete_program(*args, **kwargs)
+
+        self.static_func.get_concrete_program = counted_get_concrete_program
+
+    def check_call(self, full_lookups, *args, **kwargs):
+        out = self.static_func(*args, **kwargs)
+        np.testing.assert_allclose(
+            out.numpy(), add_with_bias(*args, **kwargs).numpy()
+        )
+        self.assertEqual(self.full_lookups, full_lookups)
+
+    def test_guards(self):
+        x = paddle.ones([2, 3])
+        y = paddle.rand([2, 3])
+        self.check_call(1, x)
+        self.check_call(1, x)
+        # same shape and dtype with another tensor
+        self.check_call(1, paddle.zeros([2, 3]))
+        self.check_call(2, paddle.ones([3, 3]))
+        self.check_call(2, x)
+        self.check_call(3, x, bias=2.0)
+        self.check_call(3, x, 2.0)
+        self.check_call(4, x, inputs={'y': y})
+        self.check_call(4, x, inputs={'y': y})
+        # the same tensor passed twice generates another program
+        self.check_call(5, x, inputs={'y': x})
+        self.assertEqual(self.static_func.get_traced_count(), 5)
+
+        self.static_func.eval()
+        self.check_call(6, x)
+        self.check_call(6, x)
+
+    def test_unguarded_inputs(self):
+        x = paddle.ones([2, 3])
+        bias = np.float32(1.0)
+        self.check_call(1, x, bias)
+        self.check_call(2, x, bias)
+        self.assertEqual(self.static_func.get_traced_count(), 1)
+
+
 if __name__ == '__main__':
     unittest.main()
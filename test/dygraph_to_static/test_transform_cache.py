@@ -0,0 +1,119 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.jit.dy2static.origin_info import global_origin_info_map
+from paddle.jit.dy2static.program_translator import FunctionCache
+from paddle.jit.dy2static.transform_cache import CACHE_DIR_ENV_NAME
+from paddle.jit.dy2static.utils import func_to_source_code
+
+
+def dyfunc_with_if(x):
+    if paddle.mean(x) > 0:
+        y = x + 1
+    else:
+        y = x - 1
+    return y
+
+
+class TestPersistentTransformCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.environ[CACHE_DIR_ENV_NAME] = self.temp_dir.name
+
+    def tearDown(self):
+        os.environ.pop(CACHE_DIR_ENV_NAME, None)
+        self.temp_dir.cleanup()
+
+    def convert(self):
+        # a new FunctionCache acts as a newly started process
+        function_cache = FunctionCache()
+        static_func = function_cache.convert_with_cache(dyfunc_with_if)
+        return function_cache, static_func
+
+    def test_warm_start(self):
+        cold_cache, cold_func = self.convert()
+        self.assertEqual(
+            cold_cache.persistent_cache_stats(),
+            {'hits': 0, 'misses': 1, 'errors': 0},
+        )
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 1)
+
+        origin_info_map = dict(global_origin_info_map)
+        global_origin_info_map.clear()
+        warm_cache, warm_func = self.convert()
+        self.assertEqual(
+            warm_cache.persistent_cache_stats(),
+            {'hits': 1, 'misses': 0, 'errors': 0},
+        )
+        # the transformed source code is not parsed again
+        self.assertEqual(len(warm_cache._code_to_ast_caches), 0)
+        self.assertEqual(
+            func_to_source_code(cold_func), func_to_source_code(warm_func)
+        )
+
+        # original information is restored for the new static function
+        warm_file = warm_func.__code__.co_filename
+        cold_file = cold_func.__code__.co_filename
+        restored = {
+            lineno: str(info)
+            for (path, lineno), info in global_origin_info_map.items()
+            if path == warm_file
+        }
+        expected = {
+            lineno: str(info)
+            for (path, lineno), info in origin_info_map.items()
+            if path == cold_file
+        }
+        self.assertGreater(len(restored), 0)
+        self.assertEqual(restored, expected)
+
+        paddle.disable_static()
+        x = paddle.to_tensor(np.ones([2, 2], 'float32'))
+        np.testing.assert_allclose(
+            warm_func(x).numpy(), dyfunc_with_if(x).numpy()
+        )
+
+    def test_broken_entry(self):
+        self.convert()
+        for name in os.listdir(self.temp_dir.name):
+            with open(os.path.join(self.temp_dir.name, name), 'w') as f:
+                f.write('{')
+        function_cache, _ = self.convert()
+        self.assertEqual(
+            function_cache.persistent_cache_stats(),
+            {'hits': 0, 'misses': 1, 'errors': 1},
+        )
+        # the broken entry is rewritten
+        function_cache, _ = self.convert()
+        self.assertEqual(function_cache.persistent_cache_stats()['hits'], 1)
+
+    def test_disabled(self):
+        os.environ.pop(CACHE_DIR_ENV_NAME)
+        function_cache, _ = self.convert()
+        self.assertEqual(
+            function_cache.persistent_cache_stats(),
+            {'hits': 0, 'misses': 0, 'errors': 0},
+        )
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
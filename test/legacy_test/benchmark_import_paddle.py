@@ -0,0 +1,107 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Startup benchmark of `import paddle`, which imports paddle in fresh
+# processes and reports the wall time, the number of modules loaded and the
+# modules spending the most time by `python -X importtime`. Pass `--access`
+# to also touch subpackages imported on first access, e.g. `paddle.text`,
+# to compare with importing everything eagerly.
+#
+# Usage: python benchmark_import_paddle.py --repeat 5 --top 20
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+import paddle
+{access}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'time': elapsed,
+    'modules': len(sys.modules),
+    'paddle_modules': sum(
+        1 for m in sys.modules if m == 'paddle' or m.startswith('paddle.')
+    ),
+}}))
+'''
+
+
+def run(access_names):
+    lines = [f'paddle.{name}' for name in access_names]
+    script = _SCRIPT.format(access='\n'.join(lines))
+    out = subprocess.check_output([sys.executable, '-c', script])
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+
+def paddle_lazy_submodules():
+    out = subprocess.check_output(
+        [
+            sys.executable,
+            '-c',
+            'import paddle; print(",".join(paddle._LAZY_SUBMODULES))',
+        ]
+    )
+    return out.decode().strip().splitlines()[-1].split(',')
+
+
+def import_time(top):
+    # each line of -X importtime is "import time: self | cumulative | name"
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import paddle'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    records = []
+    for line in proc.stderr.decode().splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:') :].split('|')
+        records.append((int(self_us), int(cumulative_us), name.strip()))
+    records.sort(reverse=True)
+    return records[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=20)
+    parser.add_argument('--access', action='store_true')
+    args = parser.parse_args()
+
+    access_names = sorted(paddle_lazy_submodules()) if args.access else []
+    results = [run(access_names) for _ in range(args.repeat)]
+    times = [r['time'] for r in results]
+    print(
+        'import paddle: median {:.3f}s, min {:.3f}s, max {:.3f}s'.format(
+            statistics.median(times), min(times), max(times)
+        )
+    )
+    print(
+        'modules loaded: {} in total, {} of paddle'.format(
+            results[-1]['modules'], results[-1]['paddle_modules']
+        )
+    )
+    print(f'top {args.top} modules by self import time:')
+    print('{:>12} {:>12}  {}'.format('self [us]', 'cumul [us]', 'module'))
+    for self_us, cumulative_us, name in import_time(args.top):
+        print(f'{self_us:>12} {cumulative_us:>12}  {name}')
+
+
+if __name__ == '__main__':
+    main()
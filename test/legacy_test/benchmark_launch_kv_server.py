@@ -0,0 +1,144 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Stress benchmark of the rendezvous of `paddle.distributed.launch` master,
+# which simulates pods joining at random times within `--spread` seconds by
+# threads, each puts its info and gathers infos of all pods as
+# `HTTPMaster.sync_peers`:
+#
+#   poll: put and query the prefix every 0.5s until all pods joined, as
+#         the rendezvous before wait requests are supported.
+#   wait: put and wait on the server until all pods joined.
+#
+# Clients use `http.client` instead of `KVClient`, since creating a httpx
+# client per request by hundreds of threads in one process costs much more
+# than the server.
+#
+# Usage: python benchmark_launch_kv_server.py --pods 64 128 256
+
+import argparse
+import http.client
+import json
+import random
+import socket
+import threading
+import time
+
+from paddle.distributed.launch.utils.kv_server import KVServer
+
+
+class Client:
+    def __init__(self, port):
+        self.port = port
+
+    def request(self, method, path, body=None, timeout=60):
+        conn = http.client.HTTPConnection(
+            '127.0.0.1', self.port, timeout=timeout
+        )
+        try:
+            conn.request(method, path, body)
+            r = conn.getresponse()
+            return r.status, r.read()
+        except OSError:
+            return None, None
+        finally:
+            conn.close()
+
+    def put(self, key, value):
+        return self.request('POST', key, value.encode())[0] == 200
+
+    def get_prefix(self, key):
+        code, body = self.request('GET', key)
+        return json.loads(body) if code == 200 else {}
+
+    def wait_prefix(self, key, size, timeout):
+        code, body = self.request(
+            'GET', f'{key}?wait={size}&timeout={timeout}', timeout=timeout + 10
+        )
+        return json.loads(body) if code == 200 else {}
+
+
+def get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('', 0))
+        return s.getsockname()[1]
+
+
+def pod(client, mode, rank, size, delay, stats):
+    time.sleep(delay)
+    prefix = '/bench/info'
+    requests = 0
+    while True:
+        requests += 1
+        if not client.put(f'{prefix}/{rank}', f'pod{rank}'):
+            time.sleep(0.1)
+            continue
+        requests += 1
+        if mode == 'wait':
+            ret = client.wait_prefix(prefix, size, timeout=5)
+        else:
+            ret = client.get_prefix(prefix)
+        if ret and len(ret) == size:
+            break
+        if mode == 'poll':
+            time.sleep(0.5)
+    stats[rank] = (time.time(), requests)
+
+
+def run(mode, size, spread):
+    server = KVServer(get_free_port())
+    server.start()
+    client = Client(server.port)
+
+    stats = [None] * size
+    delays = [random.uniform(0, spread) for _ in range(size)]
+    start = time.time()
+    threads = [
+        threading.Thread(
+            target=pod, args=(client, mode, i, size, delays[i], stats)
+        )
+        for i in range(size)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    server.stop()
+
+    last_join = start + max(delays)
+    # time from the last pod joining to all pods finishing rendezvous
+    latency = max(s[0] for s in stats) - last_join
+    requests = sum(s[1] for s in stats)
+    return latency, requests
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--pods', type=int, nargs='+', default=[64, 128, 256])
+    parser.add_argument('--spread', type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(
+        '{:>6}{:>6}{:>20}{:>12}'.format(
+            'pods', 'mode', 'after last join(s)', 'requests'
+        )
+    )
+    for size in args.pods:
+        for mode in ['poll', 'wait']:
+            latency, requests = run(mode, size, args.spread)
+            print(f'{size:>6}{mode:>6}{latency:>20.3f}{requests:>12}')
+
+
+if __name__ == '__main__':
+    main()
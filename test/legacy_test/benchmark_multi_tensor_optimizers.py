@@ -0,0 +1,98 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Benchmark of `optimizer.step()` on CPU with many small parameters, such as
+# the biases and LayerNorm weights of a large model, where the per-parameter
+# python dispatch dominates. Each optimizer is run with and without
+# `use_multi_tensor`, the gradients are set once and reused by all steps.
+#
+# Usage: python benchmark_multi_tensor_optimizers.py --params 100 1000 10000
+
+import argparse
+import time
+
+import paddle
+
+OPTIMIZERS = {
+    'AdamW': lambda **kwargs: paddle.optimizer.AdamW(
+        apply_decay_param_fun=lambda name: 'b_' not in name, **kwargs
+    ),
+    'Lamb': paddle.optimizer.Lamb,
+    'RMSProp': lambda **kwargs: paddle.optimizer.RMSProp(
+        learning_rate=0.01, **kwargs
+    ),
+    'Adagrad': lambda **kwargs: paddle.optimizer.Adagrad(
+        learning_rate=0.01, **kwargs
+    ),
+    'SGD': paddle.optimizer.SGD,
+    'Adam': paddle.optimizer.Adam,
+}
+
+
+def create_parameters(num_params, numel):
+    params = []
+    for i in range(num_params):
+        param = paddle.create_parameter(
+            shape=[numel],
+            dtype='float32',
+            attr=paddle.ParamAttr(name=f'w_{i}' if i % 2 else f'b_{i}'),
+        )
+        param._set_grad_ivar(paddle.randn([numel]))
+        params.append(param)
+    return params
+
+
+def run(name, num_params, numel, use_multi_tensor, steps):
+    params = create_parameters(num_params, numel)
+    optimizer = OPTIMIZERS[name](
+        parameters=params, use_multi_tensor=use_multi_tensor
+    )
+    # the first step creates the accumulators
+    optimizer.step()
+    start = time.perf_counter()
+    for _ in range(steps):
+        optimizer.step()
+    return (time.perf_counter() - start) / steps * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--params', type=int, nargs='+', default=[100, 1000, 10000]
+    )
+    parser.add_argument('--numel', type=int, default=64)
+    parser.add_argument('--steps', type=int, default=20)
+    parser.add_argument(
+        '--optimizers', nargs='+', default=list(OPTIMIZERS.keys())
+    )
+    args = parser.parse_args()
+
+    paddle.set_device('cpu')
+    print(
+        '{:>10}{:>8}{:>16}{:>16}{:>10}'.format(
+            'optimizer', 'params', 'per-param(ms)', 'multi(ms)', 'speedup'
+        )
+    )
+    for name in args.optimizers:
+        for num_params in args.params:
+            base = run(name, num_params, args.numel, False, args.steps)
+            multi = run(name, num_params, args.numel, True, args.steps)
+            print(
+                f'{name:>10}{num_params:>8}{base:>16.2f}{multi:>16.2f}'
+                f'{base / multi:>10.2f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
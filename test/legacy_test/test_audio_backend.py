@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import sys
+import types
 import unittest
+from unittest import mock
 
 import numpy as np
 import soundfile
@@ -158,6 +161,71 @@ class TestAudioBackends(unittest.TestCase):
         if os.path.exists(wave_wav_path):
             os.remove(wave_wav_path)
 
+    def test_partial_read(self):
+        base_dir = os.getcwd()
+        wave_wav_path = os.path.join(base_dir, "wave_partial_test.wav")
+        waveform = np.random.uniform(-0.5, 0.5, [2, 8000]).astype('float32')
+        paddle.audio.save(wave_wav_path, paddle.to_tensor(waveform), self.sr)
+        wav_data, _ = paddle.audio.load(wave_wav_path)
+
+        for mmap in [False, True]:
+            wav_crop, sr = paddle.audio.load(
+                wave_wav_path, frame_offset=1000, num_frames=500, mmap=mmap
+            )
+            self.assertEqual(sr, self.sr)
+            np.testing.assert_array_equal(wav_crop, wav_data[:, 1000:1500])
+
+            wav_crop, _ = paddle.audio.load(
+                wave_wav_path,
+                frame_offset=7900,
+                num_frames=500,
+                normalize=False,
+                channels_first=False,
+                mmap=mmap,
+            )
+            np.testing.assert_array_equal(
+                wav_crop, wav_data[:, 7900:].T * (2**15)
+            )
+
+        chunks = list(
+            paddle.audio.stream(
+                wave_wav_path, chunk_frames=1024, frame_offset=100
+            )
+        )
+        self.assertEqual(
+            [chunk.shape for chunk in chunks], [[2, 1024]] * 7 + [[2, 732]]
+        )
+        np.testing.assert_array_equal(
+            np.concatenate([chunk.numpy() for chunk in chunks], axis=1),
+            wav_data[:, 100:],
+        )
+
+        if os.path.exists(wave_wav_path):
+            os.remove(wave_wav_path)
+
+    def test_stream_unsupported_backend(self):
+        # a backend of paddleaudio without stream
+        paddleaudio = types.ModuleType('paddleaudio')
+        paddleaudio.backends = mock.Mock()
+        for func in ["save", "load", "info"]:
+            setattr(paddleaudio, func, mock.Mock())
+        with mock.patch.dict(
+            sys.modules, {'paddleaudio': paddleaudio}
+        ), mock.patch(
+            'paddle.audio.backends.init_backend.list_available_backends',
+            return_value=["wave_backend", "soundfile"],
+        ):
+            paddle.audio.backends.set_backend("soundfile")
+            try:
+                self.assertIs(paddle.audio.load, paddleaudio.load)
+                with self.assertRaises(NotImplementedError):
+                    paddle.audio.stream("test.wav", chunk_frames=1024)
+            finally:
+                paddle.audio.backends.set_backend("wave_backend")
+        self.assertIs(
+            paddle.audio.stream, paddle.audio.backends.wave_backend.stream
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
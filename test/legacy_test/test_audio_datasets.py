@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import itertools
+import os
+import tempfile
 import unittest
 
 import numpy as np
 from parameterized import parameterized
 
 import paddle
+from paddle.audio.datasets import dataset
 
 
 def parameterize(*params):
@@ -116,5 +119,71 @@ class TestAudioDatasets(unittest.TestCase):
         self.assertTrue(0 <= elem[1] <= 2)
 
 
+class TestFeatureExtraction(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.sample_rate = 16000
+        self.files = []
+        for i in range(4):
+            path = os.path.join(self.temp_dir.name, f'{i}.wav')
+            waveform = np.random.uniform(-0.5, 0.5, [1, 8000])
+            paddle.audio.save(
+                path,
+                paddle.to_tensor(waveform, dtype='float32'),
+                self.sample_rate,
+            )
+            self.files.append(path)
+        self.labels = [0, 1, 2, 3]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_cached_extractor(self):
+        dataset._feat_extractors.clear()
+        datasets = [
+            dataset.AudioClassificationDataset(
+                self.files, self.labels, feat_type='mfcc', n_mfcc=20
+            )
+            for _ in range(2)
+        ]
+        feats = [ds[i][0] for ds in datasets for i in range(len(ds))]
+        self.assertEqual(len(dataset._feat_extractors), 1)
+
+        feature_extractor = paddle.audio.features.MFCC(
+            sr=self.sample_rate, n_mfcc=20
+        )
+        waveform, _ = paddle.audio.load(self.files[-1])
+        np.testing.assert_allclose(
+            feats[-1].numpy(),
+            feature_extractor(waveform).squeeze(0).numpy(),
+            rtol=1e-5,
+        )
+
+    def test_batch_feat(self):
+        per_sample = dataset.AudioClassificationDataset(
+            self.files, self.labels, feat_type='logmelspectrogram', n_mels=32
+        )
+        batched = dataset.AudioClassificationDataset(
+            self.files,
+            self.labels,
+            feat_type='logmelspectrogram',
+            batch_feat=True,
+            n_mels=32,
+        )
+        self.assertEqual(batched[0][0].shape, [8000])
+        loader = paddle.io.DataLoader(
+            batched, batch_size=2, collate_fn=batched.collate_fn
+        )
+        for i, (feats, labels) in enumerate(loader):
+            self.assertEqual(feats.shape[:2], [2, 32])
+            for j in range(2):
+                feat, label = per_sample[i * 2 + j]
+                np.testing.assert_allclose(
+                    feats[j].numpy(), feat.numpy(), rtol=1e-5, atol=1e-4
+                )
+                self.assertEqual(int(labels[j]), label)
+
+
 if __name__ == '__main__':
     unittest.main()
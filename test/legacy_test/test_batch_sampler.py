@@ -18,7 +18,9 @@ import numpy as np
 
 from paddle.io import (
     BatchSampler,
+    BucketBatchSampler,
     Dataset,
+    DistributedBucketBatchSampler,
     RandomSampler,
     Sampler,
     SequenceSampler,
@@ -289,5 +291,181 @@ class TestWeightedRandomSampler(unittest.TestCase):
             self.assertTrue(True)
 
 
+class VarLenDataset(Dataset):
+    def __init__(self, lengths):
+        self.lengths = lengths
+
+    def __getitem__(self, idx):
+        return np.zeros([self.lengths[idx]], 'float32'), np.array([idx])
+
+    def __len__(self):
+        return len(self.lengths)
+
+
+class TestBucketBatchSampler(unittest.TestCase):
+    def setUp(self):
+        self.lengths = np.random.RandomState(1).randint(1, 200, [1000])
+        self.max_tokens = 512
+
+    def check_batches(self, batches, batch_size=None):
+        for batch in batches:
+            self.assertGreater(len(batch), 0)
+            if batch_size is not None:
+                self.assertLessEqual(len(batch), batch_size)
+            if len(batch) > 1:
+                self.assertLessEqual(
+                    len(batch) * self.lengths[batch].max(), self.max_tokens
+                )
+
+    def test_max_tokens(self):
+        bs = BucketBatchSampler(
+            self.lengths, max_tokens=self.max_tokens, num_buckets=8
+        )
+        batches = list(bs)
+        self.assertEqual(len(batches), len(bs))
+        self.check_batches(batches)
+        indices = sorted(i for batch in batches for i in batch)
+        self.assertEqual(indices, list(range(len(self.lengths))))
+        # samples of a batch come from the same bucket
+        for batch in batches:
+            buckets = np.searchsorted(
+                bs.boundaries, self.lengths[batch], 'right'
+            )
+            self.assertEqual(len(set(buckets.tolist())), 1)
+
+    def test_batch_size_and_boundaries(self):
+        bs = BucketBatchSampler(
+            self.lengths,
+            batch_size=16,
+            max_tokens=self.max_tokens,
+            boundaries=[50, 100, 150],
+            drop_last=True,
+        )
+        batches = list(bs)
+        self.check_batches(batches, batch_size=16)
+        self.assertLess(sum(len(batch) for batch in batches), len(self.lengths))
+
+    def test_drop_last(self):
+        # bucket of length 10: 0, 1, 2, 5, 6, 7, bucket of length 20: 3, 4,
+        # 8, 9, only the incomplete last batch of a bucket is dropped
+        lengths = [10, 10, 10, 20, 20] * 2
+
+        def get_batches(**kwargs):
+            return list(
+                BucketBatchSampler(
+                    lengths, boundaries=[15], drop_last=True, **kwargs
+                )
+            )
+
+        self.assertEqual(
+            get_batches(batch_size=3), [[0, 1, 2], [5, 6, 7], [3, 4, 8]]
+        )
+        self.assertEqual(
+            get_batches(max_tokens=40), [[0, 1, 2, 5], [3, 4], [8, 9]]
+        )
+        self.assertEqual(
+            get_batches(max_tokens=50), [[0, 1, 2, 5, 6], [3, 4], [8, 9]]
+        )
+        self.assertEqual(
+            get_batches(batch_size=2, max_tokens=50),
+            [[0, 1], [2, 5], [6, 7], [3, 4], [8, 9]],
+        )
+
+    def test_len_while_iterating(self):
+        bs = BucketBatchSampler(
+            self.lengths, max_tokens=self.max_tokens, shuffle=True
+        )
+        for epoch in range(3):
+            num_batches = len(bs)
+            count = 0
+            for _ in bs:
+                count += 1
+                self.assertEqual(len(bs), num_batches)
+            self.assertEqual(count, num_batches)
+            self.assertEqual(bs.epoch, epoch + 1)
+
+    def test_dataset(self):
+        lengths = self.lengths[:100]
+        bs = BucketBatchSampler(VarLenDataset(lengths), batch_size=8)
+        self.assertTrue(np.array_equal(bs.lengths, lengths))
+        self.assertTrue(all(len(batch) <= 8 for batch in bs))
+
+    def test_shuffle_deterministic(self):
+        def get_batches(epoch, seed=0):
+            bs = BucketBatchSampler(
+                self.lengths,
+                max_tokens=self.max_tokens,
+                shuffle=True,
+                seed=seed,
+            )
+            bs.set_epoch(epoch)
+            return list(bs)
+
+        self.assertEqual(get_batches(1), get_batches(1))
+        self.assertNotEqual(get_batches(1), get_batches(2))
+        self.assertNotEqual(get_batches(1), get_batches(1, seed=1))
+        self.check_batches(get_batches(3))
+
+        # epoch increases after each iteration
+        bs = BucketBatchSampler(
+            self.lengths, max_tokens=self.max_tokens, shuffle=True
+        )
+        list(bs)
+        self.assertEqual(bs.epoch, 1)
+        self.assertEqual(list(bs), get_batches(1))
+
+    def test_raise(self):
+        with self.assertRaises(AssertionError):
+            BucketBatchSampler(self.lengths)
+        with self.assertRaises(AssertionError):
+            BucketBatchSampler(self.lengths, batch_size=8, boundaries=[5, 3])
+
+
+class TestDistributedBucketBatchSampler(unittest.TestCase):
+    def setUp(self):
+        self.lengths = np.random.RandomState(2).randint(1, 200, [999])
+        self.nranks = 4
+
+    def get_rank_batches(self, drop_last, epoch=0):
+        rank_batches = []
+        for rank in range(self.nranks):
+            bs = DistributedBucketBatchSampler(
+                self.lengths,
+                max_tokens=400,
+                num_replicas=self.nranks,
+                rank=rank,
+                shuffle=True,
+                drop_last=drop_last,
+            )
+            bs.set_epoch(epoch)
+            # length of the upcoming epoch, epoch increases after iteration
+            num_batches = len(bs)
+            batches = list(bs)
+            self.assertEqual(len(batches), num_batches)
+            rank_batches.append(batches)
+        return rank_batches
+
+    def test_drop_last(self):
+        rank_batches = self.get_rank_batches(True)
+        self.assertEqual(len({len(b) for b in rank_batches}), 1)
+        indices = [i for batches in rank_batches for b in batches for i in b]
+        # exclusive subset on each rank
+        self.assertEqual(len(indices), len(set(indices)))
+
+    def test_pad(self):
+        rank_batches = self.get_rank_batches(False)
+        self.assertEqual(len({len(b) for b in rank_batches}), 1)
+        indices = {i for batches in rank_batches for b in batches for i in b}
+        self.assertEqual(indices, set(range(len(self.lengths))))
+
+    def test_set_epoch(self):
+        self.assertEqual(
+            self.get_rank_batches(False, 1), self.get_rank_batches(False, 1)
+        )
+        self.assertNotEqual(
+            self.get_rank_batches(False, 1), self.get_rank_batches(False, 2)
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -16,6 +16,7 @@ import json
 import os
 import sys
 import tempfile
+import time
 import unittest
 import warnings
 
@@ -24,6 +25,7 @@ import numpy as np
 import paddle
 from paddle import nn
 from paddle.io import DataLoader, Dataset
+from paddle.io.dataloader.autotune import _OnlineAutoTuner, _TuneAction
 
 
 class RandomDataset(Dataset):
@@ -98,6 +100,104 @@ class TestAutoTune(unittest.TestCase):
         )
 
 
+class SlowDataset(RandomDataset):
+    def __getitem__(self, idx):
+        time.sleep(0.01)
+        return super().__getitem__(idx)
+
+
+class TestOnlineAutoTuner(unittest.TestCase):
+    def test_decisions(self):
+        tuner = _OnlineAutoTuner(
+            min_num_workers=1,
+            max_num_workers=2,
+            min_prefetch_factor=2,
+            max_prefetch_factor=3,
+            window=2,
+            patience=2,
+        )
+        # reader bound, grow workers first, then prefetch factor
+        self.assertIsNone(tuner.step(1.0, 1.0, 1, 2))
+        self.assertEqual(tuner.step(1.0, 1.0, 1, 2), _TuneAction.ADD_WORKER)
+        tuner.step(1.0, 1.0, 2, 2)
+        self.assertEqual(
+            tuner.step(1.0, 1.0, 2, 2), _TuneAction.INCREASE_PREFETCH
+        )
+        tuner.step(1.0, 1.0, 2, 3)
+        self.assertIsNone(tuner.step(1.0, 1.0, 2, 3))
+
+        # compute bound, shrink prefetch factor first after patience
+        tuner.step(0.0, 1.0, 2, 3)
+        self.assertIsNone(tuner.step(0.0, 1.0, 2, 3))
+        tuner.step(0.0, 1.0, 2, 3)
+        self.assertEqual(
+            tuner.step(0.0, 1.0, 2, 3), _TuneAction.DECREASE_PREFETCH
+        )
+        for _ in range(3):
+            tuner.step(0.0, 1.0, 2, 2)
+        self.assertEqual(tuner.step(0.0, 1.0, 2, 2), _TuneAction.REMOVE_WORKER)
+        for _ in range(3):
+            tuner.step(0.0, 1.0, 2, 2, removable=False)
+        self.assertIsNone(tuner.step(0.0, 1.0, 2, 2, removable=False))
+        self.assertEqual(len(tuner.history), 9)
+
+    def test_online_autotune(self):
+        paddle.incubate.autotune.set_config(
+            config={"dataloader": {"enable": True, "online": True}}
+        )
+        try:
+            loader = DataLoader(
+                SlowDataset(400),
+                batch_size=4,
+                num_workers=1,
+                persistent_workers=True,
+            )
+            self.assertEqual(loader.num_workers, 1)
+            for _ in range(2):
+                count = 0
+                for data in loader:
+                    count += 1
+                self.assertEqual(count, 100)
+            if sys.platform != 'darwin' and sys.platform != 'win32':
+                self.assertTrue(loader._iterator._autotuner.history)
+        finally:
+            paddle.incubate.autotune.set_config(
+                config={"dataloader": {"enable": False}}
+            )
+
+    def test_decrease_prefetch(self):
+        paddle.incubate.autotune.set_config(
+            config={"dataloader": {"enable": True, "online": True}}
+        )
+        try:
+            loader = DataLoader(
+                RandomDataset(400),
+                batch_size=4,
+                num_workers=2,
+                prefetch_factor=3,
+            )
+            iterator = iter(loader)
+            # only the tune action applied below
+            iterator._autotuner = None
+            next(iterator)
+            iterator._apply_tune_action(_TuneAction.DECREASE_PREFETCH)
+            self.assertEqual(iterator._outstanding_capacity, 4)
+            count = 1
+            for data in iterator:
+                count += 1
+                # batches dispatched before the action are consumed
+                if count > 6:
+                    self.assertLessEqual(
+                        iterator._batches_outstanding,
+                        iterator._outstanding_capacity,
+                    )
+            self.assertEqual(count, 100)
+        finally:
+            paddle.incubate.autotune.set_config(
+                config={"dataloader": {"enable": False}}
+            )
+
+
 class TestAutoTuneAPI(unittest.TestCase):
     def test_set_config_warnings(self):
         with warnings.catch_warnings(record=True) as w:
@@ -0,0 +1,138 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+from paddle.io.dataloader.pipeline_profiler import _LatencyHistogram
+
+
+class SleepDataset(Dataset):
+    def __init__(self, sample_num, sleep_time=0.001):
+        self.sample_num = sample_num
+        self.sleep_time = sleep_time
+
+    def __getitem__(self, idx):
+        time.sleep(self.sleep_time)
+        return np.full([4], idx, dtype='float32'), np.array([idx])
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_main(self):
+        histogram = _LatencyHistogram()
+        for latency in [0.5e-6, 3e-6, 3e-6, 1e-3, 2e-3]:
+            histogram.add(latency)
+        summary = histogram.summary()
+        self.assertEqual(summary['count'], 5)
+        self.assertEqual(sum(summary['buckets']), 5)
+        self.assertEqual(summary['buckets'][0], 1)
+        self.assertEqual(summary['buckets'][2], 2)
+        self.assertAlmostEqual(summary['max'], 2e-3)
+        self.assertLessEqual(summary['p50'], 4e-6)
+        self.assertEqual(summary['p99'], 2e-3)
+
+
+class TestDataLoaderPipelineProfiler(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.sample_num = 32
+        self.batch_size = 4
+        self.temp_dir = tempfile.TemporaryDirectory()
+        os.environ['FLAGS_dataloader_profile_pipeline'] = '1'
+
+    def tearDown(self):
+        os.environ.pop('FLAGS_dataloader_profile_pipeline', None)
+        self.temp_dir.cleanup()
+
+    def run_loader(self, num_workers):
+        loader = DataLoader(
+            SleepDataset(self.sample_num),
+            batch_size=self.batch_size,
+            num_workers=num_workers,
+        )
+        loader_iter = iter(loader)
+        for _ in loader_iter:
+            pass
+        return loader_iter
+
+    def check_stats(self, stats, worker_ids, worker_stages):
+        batch_num = self.sample_num // self.batch_size
+        self.assertEqual(stats[-1]['read']['count'], batch_num)
+        self.assertEqual(stats[-1]['push']['count'], batch_num)
+        for stage in worker_stages:
+            count = sum(stats[i][stage]['count'] for i in worker_ids)
+            self.assertEqual(count, batch_num)
+        for i in worker_ids:
+            # each batch sleeps batch_size milliseconds in getitem
+            self.assertGreaterEqual(
+                stats[i]['getitem']['avg'], self.batch_size * 1e-3
+            )
+            self.assertGreaterEqual(
+                stats[i]['fetch']['avg'], stats[i]['getitem']['avg']
+            )
+
+    def test_single_process(self):
+        loader_iter = self.run_loader(0)
+        stats = loader_iter.pipeline_stats()
+        self.check_stats(stats, [-1], ['getitem', 'collate', 'fetch'])
+
+    def test_multi_process(self):
+        loader_iter = self.run_loader(2)
+        stats = loader_iter.pipeline_stats()
+        self.check_stats(
+            stats, [0, 1], ['getitem', 'collate', 'fetch', 'transfer']
+        )
+
+    def test_export_chrome_tracing(self):
+        path = os.path.join(self.temp_dir.name, 'trace.json')
+        # merge into an existing chrome tracing file
+        with open(path, 'w') as f:
+            json.dump({'displayTimeUnit': 'ms', 'traceEvents': [{}]}, f)
+        loader_iter = self.run_loader(2)
+        loader_iter.export_pipeline_trace(path)
+        with open(path) as f:
+            trace = json.load(f)
+        events = trace['traceEvents']
+        names = {e.get('name') for e in events}
+        for stage in ['getitem', 'collate', 'fetch', 'transfer', 'push']:
+            self.assertIn('DataLoader::' + stage, names)
+        self.assertIn({}, events)
+        for e in events:
+            if e.get('ph') == 'X':
+                self.assertGreaterEqual(e['dur'], 0)
+                # timestamps in microseconds of the same clock as profiler
+                self.assertLess(abs(e['ts'] / 1e6 - time.time()), 600)
+
+    def test_disabled(self):
+        os.environ.pop('FLAGS_dataloader_profile_pipeline', None)
+        loader_iter = self.run_loader(0)
+        self.assertEqual(loader_iter.pipeline_stats(), {})
+        with self.assertRaises(RuntimeError):
+            loader_iter.export_pipeline_trace(
+                os.path.join(self.temp_dir.name, 'trace.json')
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
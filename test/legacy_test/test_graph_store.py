@@ -0,0 +1,125 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+import paddle
+
+
+class TestGraphStore(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        rng = np.random.default_rng(2023)
+        self.num_nodes = 500
+        self.src = rng.integers(0, self.num_nodes, 5000)
+        self.dst = rng.integers(0, self.num_nodes, 5000)
+        self.graph = paddle.geometric.GraphStore.from_edges(
+            self.src, self.dst, num_nodes=self.num_nodes
+        )
+        self.seeds = rng.choice(self.num_nodes, 32, replace=False)
+        self.fanouts = [10, 5, -1]
+        self.degrees = np.bincount(self.dst, minlength=self.num_nodes)
+
+    def check_subgraph(self, nodes, srcs, dsts, eids):
+        nodes = np.asarray(nodes)
+        np.testing.assert_array_equal(nodes[: len(self.seeds)], self.seeds)
+        self.assertEqual(len(np.unique(nodes)), len(nodes))
+        expanded = np.zeros([len(nodes)], dtype=bool)
+        for fanout, src, dst, eid in zip(self.fanouts, srcs, dsts, eids):
+            src, dst, eid = np.asarray(src), np.asarray(dst), np.asarray(eid)
+            # sampled edges are edges of the graph
+            np.testing.assert_array_equal(self.src[eid], nodes[src])
+            np.testing.assert_array_equal(self.dst[eid], nodes[dst])
+            self.assertEqual(len(np.unique(eid)), len(eid))
+            # nodes are expanded only once
+            centers = np.unique(dst)
+            self.assertFalse(expanded[centers].any())
+            expanded[centers] = True
+            counts = np.bincount(dst, minlength=len(nodes))[centers]
+            degrees = self.degrees[nodes[centers]]
+            if fanout >= 0:
+                degrees = np.minimum(degrees, fanout)
+            np.testing.assert_array_equal(counts, degrees)
+
+    def test_sample_subgraph(self):
+        self.assertEqual(self.graph.num_nodes, self.num_nodes)
+        self.assertEqual(self.graph.num_edges, len(self.src))
+        nodes, srcs, dsts, eids = self.graph.sample_subgraph(
+            paddle.to_tensor(self.seeds), self.fanouts, return_eids=True
+        )
+        self.assertEqual(len(srcs), len(self.fanouts))
+        self.check_subgraph(nodes, srcs, dsts, eids)
+
+    def test_same_as_one_hop_apis(self):
+        row = paddle.to_tensor(self.graph.row)
+        colptr = paddle.to_tensor(self.graph.colptr)
+        seeds = paddle.to_tensor(self.seeds)
+        neighbors, count = paddle.geometric.sample_neighbors(row, colptr, seeds)
+        src, dst, out_nodes = paddle.geometric.reindex_graph(
+            seeds, neighbors, count.astype('int32')
+        )
+        nodes, srcs, dsts = self.graph.sample_subgraph(self.seeds, [-1])
+        np.testing.assert_array_equal(nodes.numpy(), out_nodes.numpy())
+        np.testing.assert_array_equal(srcs[0].numpy(), src.numpy())
+        np.testing.assert_array_equal(dsts[0].numpy(), dst.numpy())
+
+    def test_mmap(self):
+        with tempfile.TemporaryDirectory() as path:
+            self.graph.save(path)
+            graph = paddle.geometric.GraphStore.load(path, mmap=True)
+            # memory-mapped arrays are not copied when pickled
+            state = pickle.dumps(graph)
+            self.assertLess(len(state), 1024)
+            graph = pickle.loads(state)
+            self.assertEqual(graph.num_edges, len(self.src))
+            outputs = graph._sample_subgraph(
+                self.seeds, self.fanouts, return_eids=True
+            )
+            self.check_subgraph(*outputs)
+
+    def test_dataloader(self):
+        dataset = paddle.geometric.NeighborSamplerDataset(
+            self.graph,
+            np.arange(self.num_nodes),
+            fanouts=[10, 5],
+            batch_size=64,
+            shuffle=True,
+        )
+        self.assertEqual(len(dataset), 8)
+        for num_workers in [0, 2]:
+            loader = paddle.io.DataLoader(
+                dataset, batch_size=None, num_workers=num_workers
+            )
+            seeds = []
+            for i, (nodes, src0, dst0, src1, dst1) in enumerate(loader):
+                batch_size = min(64, self.num_nodes - 64 * i)
+                seeds.append(nodes.numpy()[:batch_size])
+                self.assertLess(int(dst0.max()), batch_size)
+            seeds = np.concatenate(seeds)
+            np.testing.assert_array_equal(
+                np.sort(seeds), np.arange(self.num_nodes)
+            )
+
+        first = dataset[0][0]
+        np.testing.assert_array_equal(dataset[0][0], first)
+        dataset.set_epoch(1)
+        self.assertFalse(np.array_equal(dataset[0][0], first))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,347 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import stat
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from paddle.distributed.fleet.utils.fs import HDFSClient
+
+# A fake `hadoop` serving `hadoop fs` commands on a local directory, and
+# the long-running server of HDFSClient. Each process logs its command.
+FAKE_HADOOP = '''#!{python}
+import io
+import os
+import re
+import shutil
+import sys
+
+ROOT = os.environ['FAKE_HDFS_ROOT']
+
+
+def local(path):
+    path = re.sub(r'^hdfs:(//[^/]*)?', '', path)
+    return os.path.join(ROOT, path.lstrip('/'))
+
+
+def ls_line(printed, path):
+    if os.path.isdir(path):
+        return 'drwxr-xr-x   - user group 0 2023-01-01 00:00 ' + printed
+    size = os.path.getsize(path)
+    return '-rw-r--r--   3 user group %d 2023-01-01 00:00 %s' % (size, printed)
+
+
+def run(args, out, err):
+    cmd, args = args[0], args[1:]
+    if cmd == '-test':
+        check = {{'-e': os.path.exists, '-d': os.path.isdir}}[args[0]]
+        return 0 if check(local(args[1])) else 1
+    if cmd == '-ls':
+        only_self = args[:1] == ['-d']
+        ret = 0
+        for path in args[1:] if only_self else args:
+            if not os.path.exists(local(path)):
+                err.write("ls: `%s': No such file or directory\\n" % path)
+                ret = 1
+            elif only_self or not os.path.isdir(local(path)):
+                out.write(ls_line(path, local(path)) + '\\n')
+            else:
+                names = sorted(os.listdir(local(path)))
+                out.write('Found %d items\\n' % len(names))
+                for name in names:
+                    out.write(ls_line(
+                        path.rstrip('/') + '/' + name,
+                        os.path.join(local(path), name),
+                    ) + '\\n')
+        return ret
+    if cmd == '-mkdir':
+        path = local(args[-1])
+        if args[0] != '-p' and not os.path.isdir(os.path.dirname(path)):
+            err.write("mkdir: `%s': No such file or directory\\n" % args[-1])
+            return 1
+        os.makedirs(path, exist_ok=True)
+        return 0
+    if cmd == '-touchz':
+        open(local(args[0]), 'a').close()
+        return 0
+    if cmd in ['-rm', '-rmr']:
+        path = local(args[0])
+        shutil.rmtree(path) if os.path.isdir(path) else os.remove(path)
+        return 0
+    if cmd == '-mv':
+        os.rename(local(args[0]), local(args[1]))
+        return 0
+    if cmd == '-put':
+        shutil.copy(args[0], local(args[1]))
+        return 0
+    if cmd == '-get':
+        shutil.copy(local(args[0]), args[1])
+        return 0
+    err.write('%s: Unknown command\\n' % cmd)
+    return 255
+
+
+with open(os.environ['FAKE_HADOOP_LOG'], 'a') as f:
+    f.write(' '.join(sys.argv[1:3]) + '\\n')
+
+if sys.argv[1] == 'classpath':
+    print('/fake/hadoop/classpath')
+elif sys.argv[1] == 'PaddleFsShellServer':
+    class_dir = os.environ['HADOOP_CLASSPATH'].split(os.pathsep)[0]
+    assert os.path.exists(os.path.join(class_dir, 'PaddleFsShellServer.class'))
+    for line in sys.stdin:
+        out, err = io.StringIO(), io.StringIO()
+        ret = run(line.rstrip('\\n').split('\\t'), out, err)
+        out, err = out.getvalue().encode(), err.getvalue().encode()
+        header = '%d %d %d\\n' % (ret, len(out), len(err))
+        sys.stdout.buffer.write(header.encode() + out + err)
+        sys.stdout.buffer.flush()
+else:
+    args = [arg for arg in sys.argv[2:] if not arg.startswith('-D')]
+    sys.exit(run(args, sys.stdout, sys.stderr))
+'''
+
+FAKE_JAVAC = '''#!{python}
+import os
+import sys
+
+out_dir = sys.argv[sys.argv.index('-d') + 1]
+open(os.path.join(out_dir, 'PaddleFsShellServer.class'), 'w').close()
+'''
+
+
+def write_executable(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content.format(python=sys.executable))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+
+
+class TestHDFSClientCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.hadoop_home = os.path.join(self.temp_dir.name, 'hadoop')
+        self.java_home = os.path.join(self.temp_dir.name, 'java')
+        self.root = os.path.join(self.temp_dir.name, 'root')
+        self.log = os.path.join(self.temp_dir.name, 'hadoop.log')
+        os.makedirs(self.root)
+        write_executable(
+            os.path.join(self.hadoop_home, 'bin', 'hadoop'), FAKE_HADOOP
+        )
+        write_executable(
+            os.path.join(self.java_home, 'bin', 'javac'), FAKE_JAVAC
+        )
+
+        self.old_environ = dict(os.environ)
+        os.environ['FAKE_HDFS_ROOT'] = self.root
+        os.environ['FAKE_HADOOP_LOG'] = self.log
+        os.environ['JAVA_HOME'] = self.java_home
+        # the server is compiled into ~/.cache/paddle
+        os.environ['HOME'] = self.temp_dir.name
+        self.class_dir = os.path.join(
+            self.temp_dir.name, '.cache', 'paddle', 'fs_shell_server'
+        )
+        self.old_cwd = os.getcwd()
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        os.environ.clear()
+        os.environ.update(self.old_environ)
+        self.temp_dir.cleanup()
+
+    def commands(self):
+        if not os.path.exists(self.log):
+            return []
+        with open(self.log) as f:
+            commands = f.read().splitlines()
+        os.remove(self.log)
+        return commands
+
+    def client(self, **kwargs):
+        return HDFSClient(
+            self.hadoop_home, None, time_out=6 * 1000, sleep_inter=100, **kwargs
+        )
+
+    def test_cache(self):
+        fs = self.client(cache_ttl=60 * 1000)
+        fs.mkdirs("hdfs:/a/b")
+        fs.touch("hdfs:/a/b/f")
+        fs.invalidate_cache()
+        self.commands()
+
+        for _ in range(3):
+            self.assertTrue(fs.is_exist("hdfs:/a/b"))
+            self.assertTrue(fs.is_dir("hdfs:/a/b"))
+            self.assertTrue(fs.is_file("hdfs:/a/b/f"))
+            self.assertFalse(fs.is_exist("hdfs:/a/c"))
+            self.assertEqual(fs.ls_dir("hdfs:/a/b"), ([], ["f"]))
+        self.assertEqual(
+            self.commands(),
+            ["fs -test", "fs -test", "fs -test", "fs -test", "fs -test"]
+            + ["fs -ls"],
+        )
+
+        # children of a listed directory are known
+        self.assertEqual(fs.ls_dir("hdfs:/a"), (["b"], []))
+        self.commands()
+        self.assertTrue(fs.is_dir("hdfs:/a/b"))
+        self.assertEqual(self.commands(), [])
+
+        # writes through the client invalidate the cache
+        fs.touch("hdfs:/a/b/g")
+        self.assertTrue(fs.is_file("hdfs:/a/b/g"))
+        self.assertEqual(fs.ls_dir("hdfs:/a/b"), ([], ["f", "g"]))
+        fs.mv("hdfs:/a/b", "hdfs:/a/c")
+        self.assertFalse(fs.is_exist("hdfs:/a/b/f"))
+        self.assertTrue(fs.is_file("hdfs:/a/c/f"))
+        self.assertEqual(fs.ls_dir("hdfs:/a"), (["c"], []))
+        fs.delete("hdfs:/a/c")
+        self.assertFalse(fs.is_exist("hdfs:/a/c"))
+        self.assertFalse(fs.is_exist("hdfs:/a/c/f"))
+        fs.mkdirs("hdfs:/a/d/e")
+        self.assertEqual(fs.ls_dir("hdfs:/a"), (["d"], []))
+
+        # writes by others are visible after invalidation
+        self.assertFalse(fs.is_exist("hdfs:/x"))
+        os.makedirs(os.path.join(self.root, "x"))
+        os.makedirs(os.path.join(self.root, "a", "y"))
+        self.assertFalse(fs.is_exist("hdfs:/x"))
+        self.assertEqual(fs.ls_dir("hdfs:/a"), (["d"], []))
+        fs.invalidate_cache()
+        self.assertEqual(fs.ls_dir("hdfs:/a"), (["d", "y"], []))
+        self.assertTrue(fs.is_exist("hdfs:/x"))
+
+    def test_ttl(self):
+        fs = self.client(cache_ttl=200)
+        self.assertFalse(fs.is_exist("hdfs:/x"))
+        os.makedirs(os.path.join(self.root, "x"))
+        self.assertFalse(fs.is_exist("hdfs:/x"))
+        time.sleep(0.3)
+        self.assertTrue(fs.is_exist("hdfs:/x"))
+
+    def test_no_cache(self):
+        fs = self.client()
+        fs.mkdirs("hdfs:/a")
+        self.commands()
+        self.assertTrue(fs.is_dir("hdfs:/a"))
+        self.assertTrue(fs.is_dir("hdfs:/a"))
+        self.assertEqual(len(self.commands()), 4)
+
+    def test_batch(self):
+        fs = self.client(cache_ttl=60 * 1000)
+        paths = ["hdfs:/d%d" % i for i in range(100)]
+        for i in range(0, 100, 2):
+            os.makedirs(os.path.join(self.root, "d%d" % i, "sub"))
+            open(os.path.join(self.root, "d%d" % i, "f"), 'w').close()
+            open(os.path.join(self.root, "d%d" % (i + 1)), 'w').close()
+        paths.append("hdfs:/missing")
+
+        self.assertEqual(fs.batch_is_exist(paths), [True] * 100 + [False])
+        # a command per 64 paths
+        self.assertEqual(self.commands(), ["fs -ls", "fs -ls"])
+        self.assertEqual(fs.batch_is_dir(paths), [True, False] * 50 + [False])
+        self.assertEqual(fs.batch_is_file(paths), [False, True] * 50 + [False])
+        self.assertEqual(self.commands(), [])
+
+        listings = fs.batch_ls_dir(paths)
+        self.assertEqual(len(self.commands()), 1)
+        for i in range(0, 100, 2):
+            self.assertEqual(listings[i], (["sub"], ["f"]))
+            self.assertEqual(listings[i], fs.ls_dir(paths[i]))
+            self.assertEqual(listings[i + 1], ([], ["d%d" % (i + 1)]))
+        self.assertEqual(listings[-1], ([], []))
+        self.assertEqual(self.commands(), [])
+
+        # without cache
+        fs = self.client()
+        self.assertEqual(fs.batch_is_dir(paths[:4]), [True, False, True, False])
+        self.assertEqual(fs.batch_ls_dir(paths[:2])[0], (["sub"], ["f"]))
+        self.assertEqual(len(self.commands()), 3)
+
+    def test_persistent(self):
+        fs = self.client(persistent=True)
+        fs.mkdirs("hdfs:/a/b")
+        fs.touch("hdfs:/a/b/f")
+        self.assertTrue(fs.is_dir("hdfs:/a/b"))
+        self.assertTrue(fs.is_file("hdfs:/a/b/f"))
+        self.assertFalse(fs.is_exist("hdfs:/a/c"))
+        self.assertEqual(fs.ls_dir("hdfs:/a/b"), ([], ["f"]))
+        self.assertEqual(fs.batch_is_dir(["hdfs:/a", "hdfs:/c"]), [True, False])
+        fs.delete("hdfs:/a")
+        self.assertFalse(fs.is_exist("hdfs:/a"))
+        fs.close()
+        # all commands run by one server
+        self.assertEqual(self.commands(), ["classpath", "PaddleFsShellServer"])
+
+        # the compiled server is reused
+        fs = self.client(persistent=True)
+        self.assertFalse(fs.is_exist("hdfs:/a"))
+        fs.close()
+        self.assertEqual(self.commands(), ["PaddleFsShellServer"])
+
+    def test_persistent_private_dir(self):
+        fs = self.client(persistent=True)
+        self.assertFalse(fs.is_exist("hdfs:/a"))
+        fs.close()
+        mode = stat.S_IMODE(os.stat(self.class_dir).st_mode)
+        self.assertEqual(mode & (stat.S_IRWXG | stat.S_IRWXO), 0)
+        self.commands()
+
+        # a directory writable by others isn't used
+        os.chmod(self.class_dir, 0o777)
+        fs = self.client(persistent=True)
+        self.assertFalse(fs.is_exist("hdfs:/a"))
+        self.assertNotIn("PaddleFsShellServer", self.commands())
+        os.chmod(self.class_dir, 0o700)
+
+        # nor is a directory owned by another user
+        with mock.patch('os.getuid', return_value=os.getuid() + 1):
+            fs = self.client(persistent=True)
+            self.assertFalse(fs.is_exist("hdfs:/a"))
+        self.assertNotIn("PaddleFsShellServer", self.commands())
+
+    def test_persistent_relative_path(self):
+        work_dir = os.path.join(self.temp_dir.name, 'work')
+        os.makedirs(os.path.join(work_dir, 'sub'))
+        os.chdir(work_dir)
+        fs = self.client(persistent=True)
+        self.assertFalse(fs.is_exist("hdfs:/f"))
+
+        # local paths are resolved against the current working directory
+        # instead of the one the server is started in
+        os.chdir('sub')
+        with open('f', 'w') as f:
+            f.write('data')
+        fs._try_upload('f', 'hdfs:/f')
+        self.assertTrue(os.path.exists(os.path.join(self.root, 'f')))
+        fs.download('hdfs:/f', 'g')
+        with open('g') as f:
+            self.assertEqual(f.read(), 'data')
+        fs.close()
+        self.assertEqual(self.commands(), ["classpath", "PaddleFsShellServer"])
+
+    def test_persistent_fallback(self):
+        os.environ['JAVA_HOME'] = os.path.join(self.temp_dir.name, 'none')
+        fs = self.client(persistent=True)
+        fs.mkdirs("hdfs:/a")
+        self.assertTrue(fs.is_dir("hdfs:/a"))
+        self.assertNotIn("PaddleFsShellServer", self.commands())
+
+
+if __name__ == '__main__':
+    unittest.main()
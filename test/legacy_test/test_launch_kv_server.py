@@ -0,0 +1,130 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import threading
+import time
+import unittest
+
+from paddle.distributed.launch.utils.kv_client import KVClient
+from paddle.distributed.launch.utils.kv_server import KVServer, KVStore
+
+
+def get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('', 0))
+        return s.getsockname()[1]
+
+
+class TestKVStore(unittest.TestCase):
+    def test_prefix(self):
+        store = KVStore()
+        store.put({'/a/1': b'1', '/ab': b'2', '/a/0': b'0', '/b': b'3'})
+        self.assertEqual(store.get_prefix('/a/'), {'/a/0': b'0', '/a/1': b'1'})
+        self.assertEqual(len(store.get_prefix('/a')), 3)
+        self.assertEqual(len(store.get_prefix('/')), 4)
+        self.assertEqual(store.get_prefix('/c'), {})
+        self.assertTrue(store.delete('/a/0'))
+        self.assertFalse(store.delete('/a/0'))
+        self.assertEqual(store.get_prefix('/a/'), {'/a/1': b'1'})
+        store.put({'/a/1': b'4'})
+        self.assertEqual(store.get_prefix('/a/'), {'/a/1': b'4'})
+
+    def test_wait(self):
+        store = KVStore()
+
+        def put():
+            for i in range(4):
+                time.sleep(0.05)
+                store.put({f'/w/{i}': b''})
+
+        thread = threading.Thread(target=put)
+        thread.start()
+        self.assertEqual(len(store.wait_prefix('/w/', 4, timeout=10)), 4)
+        thread.join()
+        # timeout returns current items
+        self.assertEqual(len(store.wait_prefix('/w/', 5, timeout=0.1)), 4)
+
+
+class TestKVServer(unittest.TestCase):
+    def setUp(self):
+        self.server = KVServer(get_free_port())
+        self.server.start()
+        self.client = KVClient(f"127.0.0.1:{self.server.port}")
+        self.assertTrue(self.client.wait_server_ready(timeout=10))
+
+    def tearDown(self):
+        if not self.server.stopped:
+            self.server.stop()
+
+    def test_put_get(self):
+        self.assertTrue(self.client.put('/job/1', 'v1'))
+        self.assertTrue(self.client.put('job/2', 'v2'))
+        self.assertTrue(self.client.put('/jobs', 'v3'))
+        self.assertEqual(self.client.get('/job/1'), 'v1')
+        self.assertEqual(
+            self.client.get_prefix('/job/'), {'/job/1': 'v1', '/job/2': 'v2'}
+        )
+        self.assertTrue(self.client.delete('/job/1'))
+        self.assertEqual(self.client.get_prefix('/job/'), {'/job/2': 'v2'})
+
+    def test_put_batch(self):
+        kvs = {f'/batch/{i}': str(i) for i in range(100)}
+        self.assertTrue(self.client.put_batch(kvs))
+        self.assertEqual(self.client.get_prefix('/batch/'), kvs)
+
+    def test_wait_prefix(self):
+        size = 16
+        results = [None] * size
+
+        def peer(rank):
+            self.client.put(f'/peers/{rank}', str(rank))
+            results[rank] = self.client.wait_prefix('/peers/', size)
+
+        threads = [
+            threading.Thread(target=peer, args=(i,)) for i in range(size)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        expected = {f'/peers/{i}': str(i) for i in range(size)}
+        for result in results:
+            self.assertEqual(result, expected)
+
+        # timeout
+        start = time.time()
+        self.assertEqual(
+            len(self.client.wait_prefix('/peers/', size + 1, timeout=0.2)),
+            size,
+        )
+        self.assertLess(time.time() - start, 5)
+
+    def test_stop_wakes_waiting(self):
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(
+                self.client.wait_prefix('/never/', 1, timeout=30)
+            )
+        )
+        thread.start()
+        time.sleep(0.2)
+        start = time.time()
+        self.server.stop()
+        thread.join()
+        self.assertLess(time.time() - start, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+import unittest
+
+import paddle
+
+
+class TestLazySubmodules(unittest.TestCase):
+    def run_script(self, script):
+        out = subprocess.check_output([sys.executable, '-c', script])
+        return out.decode().strip().splitlines()[-1]
+
+    def test_not_imported_eagerly(self):
+        script = (
+            'import sys, paddle; '
+            'print(",".join(sorted(name for name in paddle._LAZY_SUBMODULES '
+            'if "paddle." + name in sys.modules)))'
+        )
+        self.assertEqual(self.run_script(script), '')
+
+    def test_imported_on_access(self):
+        script = (
+            'import sys, paddle; '
+            'x = paddle.sparse.sparse_coo_tensor; '
+            'print("paddle.sparse" in sys.modules, "paddle.text" in sys.modules)'
+        )
+        self.assertEqual(self.run_script(script), 'True False')
+
+    def test_public_api(self):
+        for name in paddle._LAZY_SUBMODULES:
+            module = getattr(paddle, name)
+            self.assertEqual(module.__name__, 'paddle.' + name)
+            self.assertIs(sys.modules['paddle.' + name], module)
+            self.assertIn(name, dir(paddle))
+        from paddle import text
+
+        self.assertIs(text, paddle.text)
+        self.assertTrue(hasattr(paddle.distribution, 'Normal'))
+        self.assertFalse(hasattr(paddle, 'no_such_submodule'))
+        with self.assertRaises(AttributeError):
+            paddle.__getattr__('no_such_submodule')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -355,6 +355,49 @@ class TestAuc(unittest.TestCase):
         m.reset()
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_auc_merge(self):
+        x = np.random.random(size=(64, 1))
+        x = np.concatenate((1 - x, x), axis=1)
+        y = np.random.randint(2, size=(64, 1))
+
+        m = paddle.metric.Auc()
+        m.update(x, y)
+
+        m0 = paddle.metric.Auc()
+        m0.update(x[:32], y[:32])
+        m1 = paddle.metric.Auc()
+        m1.update(x[32:], y[32:])
+        m0.merge(m1)
+        self.assertAlmostEqual(m0.accumulate(), m.accumulate())
+
+        m2 = paddle.metric.Auc(num_thresholds=255)
+        with self.assertRaises(ValueError):
+            m2.merge(m)
+
+    def test_auc_states(self):
+        x = np.random.random(size=(64, 1))
+        x = np.concatenate((1 - x, x), axis=1)
+        y = np.random.randint(2, size=(64, 1))
+
+        m = paddle.metric.Auc()
+        m.update(x[:32], y[:32])
+        auc = m.accumulate()
+        stat_pos, stat_neg = m.states()
+        expected_pos, expected_neg = stat_pos.copy(), stat_neg.copy()
+
+        # states are snapshots, not changed by later updates
+        m.update(x[32:], y[32:])
+        np.testing.assert_array_equal(stat_pos, expected_pos)
+        np.testing.assert_array_equal(stat_neg, expected_neg)
+
+        # and changing them doesn't change the metric
+        m.reset()
+        m.update(x[:32], y[:32])
+        stat_pos, stat_neg = m.states()
+        stat_pos += 1
+        stat_neg[:] = 0
+        self.assertAlmostEqual(m.accumulate(), auc)
+
 
 if __name__ == '__main__':
     unittest.main()
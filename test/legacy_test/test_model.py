@@ -578,6 +578,64 @@ class TestModelFunction(unittest.TestCase):
             fluid.disable_dygraph() if dynamic else None
         shutil.rmtree(path)
 
+    def test_async_save_load(self):
+        save_dir = tempfile.mkdtemp()
+        for dynamic in [True, False]:
+            device = paddle.set_device('cpu')
+            fluid.enable_dygraph(device) if dynamic else None
+            net = MyModel()
+            inputs = [InputSpec([None, 20], 'float32', 'x')]
+            labels = [InputSpec([None, 1], 'int64', 'label')]
+            optim = paddle.optimizer.Adam(
+                learning_rate=0.001, parameters=net.parameters()
+            )
+            model = Model(net, inputs, labels)
+            model.prepare(
+                optimizer=optim, loss=CrossEntropyLoss(reduction="sum")
+            )
+            checkpoint = paddle.callbacks.ModelCheckpoint(
+                save_dir=save_dir, async_save=True
+            )
+            model.fit(
+                MyDataset(),
+                batch_size=4,
+                epochs=2,
+                verbose=0,
+                callbacks=[checkpoint],
+            )
+            # all checkpoints are written when fit returns
+            for prefix in ['0', '1', 'final']:
+                path = os.path.join(save_dir, prefix)
+                self.assertTrue(os.path.exists(path + '.pdparams'))
+                self.assertTrue(os.path.exists(path + '.pdopt'))
+                self.assertFalse(os.path.exists(path + '.pdparams.tmp'))
+
+            # snapshot is taken when save returns
+            path = os.path.join(save_dir, 'snapshot')
+            expect = {k: v.numpy() for k, v in net.state_dict().items()}
+            model.save(path, async_save=True)
+            model.train_batch(
+                [np.random.random((4, 20)).astype('float32')],
+                [np.random.randint(0, 10, (4, 1)).astype('int64')],
+            )
+            model.wait_save()
+            if dynamic:
+                state = paddle.load(path + '.pdparams')
+                for key, value in expect.items():
+                    np.testing.assert_array_equal(state[key].numpy(), value)
+            model.load(path)
+
+            # failure is reported by wait_save
+            bad_path = os.path.join(save_dir, 'not_a_dir')
+            with open(bad_path, 'w') as f:
+                f.write('')
+            model.save(os.path.join(bad_path, 'ckpt'), async_save=True)
+            with self.assertRaises(RuntimeError):
+                model.wait_save()
+            model.wait_save()
+            fluid.disable_dygraph() if dynamic else None
+        shutil.rmtree(save_dir)
+
     def test_dynamic_load(self):
         mnist_data = MnistDataset(mode='train')
 
@@ -954,6 +1012,54 @@ class TestModelFunction(unittest.TestCase):
             np.testing.assert_almost_equal(losses[0], losses[1], decimal=4)
             np.testing.assert_almost_equal(losses[0], losses[2], decimal=4)
 
+    def test_fit_with_sync_interval(self):
+        paddle.disable_static()
+        self.set_seed()
+        dim = 20
+        net = MyModel()
+        optim = paddle.optimizer.SGD(
+            learning_rate=0.001, parameters=net.parameters()
+        )
+        inputs = [InputSpec([None, dim], 'float32', 'x')]
+        labels = [InputSpec([None, 1], 'int64', 'label')]
+        model = Model(net, inputs, labels)
+        model.prepare(
+            optim, loss=CrossEntropyLoss(reduction="sum"), metrics=Accuracy()
+        )
+
+        class LogsRecorder(paddle.callbacks.Callback):
+            def __init__(self):
+                super().__init__()
+                self.logs = []
+
+            def on_train_batch_end(self, step, logs=None):
+                self.logs.append(dict(logs))
+
+        recorder = LogsRecorder()
+        model.fit(
+            MyDataset(),
+            MyDataset(),
+            batch_size=4,
+            epochs=1,
+            log_freq=5,
+            sync_interval=3,
+            verbose=0,
+            callbacks=[recorder],
+        )
+        # logs are only materialized at step 3, 5, 6, 9 and 10
+        self.assertIn('loss', recorder.logs[2])
+        self.assertIsInstance(recorder.logs[2]['loss'][0], float)
+        self.assertIsInstance(recorder.logs[4]['acc'], float)
+
+        # train_batch returns numpy arrays after fit
+        data = np.random.random(size=(4, dim)).astype(np.float32)
+        label = np.random.randint(0, 10, size=(4, 1)).astype(np.int64)
+        loss, _ = model.train_batch([data], [label])
+        self.assertIsInstance(loss[0], np.ndarray)
+
+        with self.assertRaises(AssertionError):
+            model.fit(MyDataset(), batch_size=4, sync_interval=0)
+
 
 class TestModelWithLRScheduler(unittest.TestCase):
     def test_fit_by_step(self):
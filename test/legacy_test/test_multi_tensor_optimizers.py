@@ -0,0 +1,210 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+
+
+def no_decay_bias(name):
+    return 'b_' not in name
+
+
+def exclude_bias(param):
+    return 'b_' in param.name
+
+
+class TestMultiTensorOptimizers(unittest.TestCase):
+    def setUp(self):
+        self.places = ['cpu']
+        if paddle.is_compiled_with_cuda():
+            self.places.append('gpu')
+
+    def _get_optimizers(self):
+        return {
+            'AdamW': (
+                paddle.optimizer.AdamW,
+                {'weight_decay': 0.1, 'apply_decay_param_fun': no_decay_bias},
+                {'weight_decay': 0.02, 'beta1': 0.8},
+            ),
+            'Lamb': (
+                paddle.optimizer.Lamb,
+                {
+                    'lamb_weight_decay': 0.1,
+                    'exclude_from_weight_decay_fn': exclude_bias,
+                },
+                {'lamb_weight_decay': 0.02, 'beta2': 0.99},
+            ),
+            'RMSProp': (
+                paddle.optimizer.RMSProp,
+                {'learning_rate': 0.01, 'momentum': 0.9, 'centered': True},
+                {'rho': 0.9, 'epsilon': 1e-4},
+            ),
+            'Adagrad': (
+                paddle.optimizer.Adagrad,
+                {'learning_rate': 0.1, 'initial_accumulator_value': 0.1},
+                {'epsilon': 1e-4},
+            ),
+            'SGD': (paddle.optimizer.SGD, {'learning_rate': 0.1}, {}),
+        }
+
+    def _optimize(
+        self,
+        place,
+        opt_class,
+        opt_kwargs,
+        group_kwargs,
+        use_param_attr=False,
+        use_param_group=False,
+        skip_layer=False,
+        use_amp=False,
+        use_multi_tensor=False,
+    ):
+        paddle.disable_static()
+        paddle.seed(10)
+        paddle.set_device(place)
+
+        input = paddle.randn((4, 5))
+        weight_attr = (
+            paddle.ParamAttr(learning_rate=0.5) if use_param_attr else None
+        )
+        model = paddle.nn.Sequential(
+            paddle.nn.Linear(5, 5, weight_attr=weight_attr),
+            paddle.nn.Linear(5, 5),
+            paddle.nn.Linear(5, 3),
+        )
+        kwargs = dict(opt_kwargs)
+        if use_amp:
+            kwargs['multi_precision'] = True
+        parameters = list(model.parameters())
+        if use_param_group:
+            optimizer = opt_class(
+                parameters=[
+                    {'params': parameters[:2]},
+                    dict(
+                        {'params': parameters[2:], 'learning_rate': 0.5},
+                        **group_kwargs,
+                    ),
+                ],
+                use_multi_tensor=use_multi_tensor,
+                **kwargs,
+            )
+        else:
+            optimizer = opt_class(
+                parameters=parameters,
+                use_multi_tensor=use_multi_tensor,
+                **kwargs,
+            )
+
+        if place == 'gpu' and use_amp:
+            model = paddle.amp.decorate(models=model, level='O2')
+            scaler = paddle.amp.GradScaler(init_loss_scaling=1024)
+
+        for idx in range(3):
+            # the last layer gets no gradients in the second step
+            layers = model[:2] if skip_layer and idx == 1 else model
+            if place == 'gpu' and use_amp:
+                with paddle.amp.auto_cast(level='O2'):
+                    loss = paddle.mean(layers(input))
+                scaler.scale(loss).backward()
+                scaler.step(optimizer)
+                scaler.update()
+            else:
+                loss = paddle.mean(layers(input))
+                loss.backward()
+                optimizer.step()
+            optimizer.clear_grad(set_to_zero=False)
+
+        return [param.astype('float32').numpy() for param in parameters]
+
+    def _check(self, place, name, use_amp=False, **kwargs):
+        opt_class, opt_kwargs, group_kwargs = self._get_optimizers()[name]
+        params1 = self._optimize(
+            place,
+            opt_class,
+            opt_kwargs,
+            group_kwargs,
+            use_amp=use_amp,
+            use_multi_tensor=True,
+            **kwargs,
+        )
+        params2 = self._optimize(
+            place,
+            opt_class,
+            opt_kwargs,
+            group_kwargs,
+            use_amp=use_amp,
+            use_multi_tensor=False,
+            **kwargs,
+        )
+        for param1, param2 in zip(params1, params2):
+            np.testing.assert_allclose(
+                param1, param2, rtol=1e-05, atol=1e-06, err_msg=name
+            )
+
+    def test_main(self):
+        for place in self.places:
+            use_amp_list = [False, True] if place == 'gpu' else [False]
+            for name in self._get_optimizers():
+                for use_amp in use_amp_list:
+                    self._check(place, name, use_amp)
+                    self._check(place, name, use_amp, use_param_attr=True)
+                    self._check(place, name, use_amp, use_param_group=True)
+
+    def test_parameters_without_grad(self):
+        for name in self._get_optimizers():
+            self._check('cpu', name, skip_layer=True)
+            self._check('cpu', name, use_param_group=True, skip_layer=True)
+
+    def test_buckets(self):
+        paddle.disable_static()
+        model = paddle.nn.Sequential(
+            paddle.nn.Linear(
+                5, 5, weight_attr=paddle.ParamAttr(learning_rate=0.5)
+            ),
+            paddle.nn.Linear(5, 5),
+        )
+        optimizer = paddle.optimizer.AdamW(
+            parameters=model.parameters(),
+            apply_decay_param_fun=no_decay_bias,
+            use_multi_tensor=True,
+        )
+        loss = paddle.mean(model(paddle.randn((4, 5))))
+        loss.backward()
+        optimizer.step()
+        # weights with lr 0.5 and 1.0, biases without decay
+        buckets = optimizer._bucket_dict['FP32_LODTensor'][0]
+        self.assertEqual(
+            [(start, end) for start, end, _ in buckets],
+            [(0, 1), (1, 3), (3, 4)],
+        )
+        self.assertEqual(
+            [attrs[0] for _, _, attrs in buckets], [True, False, True]
+        )
+        params = optimizer._param_dict['FP32_LODTensor'][0]
+        self.assertEqual(
+            [param.name for param in params],
+            [
+                model[0].weight.name,
+                model[0].bias.name,
+                model[1].bias.name,
+                model[1].weight.name,
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
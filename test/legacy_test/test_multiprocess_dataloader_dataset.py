@@ -26,6 +26,7 @@ from paddle.io import (
     IterableDataset,
     TensorDataset,
 )
+from paddle.io.dataloader.collate import _SchemaCollator, default_collate_fn
 
 IMAGE_SIZE = 32
 
@@ -440,5 +441,100 @@ class TestDatasetWithDropLast(unittest.TestCase):
         self.run_main(dataset, 10, 3)
 
 
+class FixedShapeDataset(Dataset):
+    def __init__(self, sample_num, varying_shape=False):
+        self.sample_num = sample_num
+        self.varying_shape = varying_shape
+
+    def __len__(self):
+        return self.sample_num
+
+    def __getitem__(self, idx):
+        # shape varies among batches of 4 samples
+        size = idx // 4 % 3 + 1 if self.varying_shape else IMAGE_SIZE
+        return {
+            'image': np.full([3, size], idx, dtype='float32'),
+            'label': idx,
+            'name': str(idx),
+            'extra': [np.array([idx, idx], dtype='int64'), float(idx)],
+        }
+
+
+class TestSchemaCollator(unittest.TestCase):
+    def check_equal(self, data, expect):
+        if isinstance(expect, dict):
+            self.assertEqual(set(data.keys()), set(expect.keys()))
+            for key in expect:
+                self.check_equal(data[key], expect[key])
+        elif isinstance(expect, np.ndarray):
+            self.assertEqual(data.dtype, expect.dtype)
+            np.testing.assert_array_equal(data, expect)
+        else:
+            self.assertEqual(len(data), len(expect))
+            for d, e in zip(data, expect):
+                self.check_equal(d, e)
+
+    def test_same_as_default_collate(self):
+        for varying_shape in [False, True]:
+            dataset = FixedShapeDataset(20, varying_shape)
+            collate_fn = _SchemaCollator()
+            outputs = []
+            for start in range(0, 20, 4):
+                batch = [dataset[i] for i in range(start, start + 4)]
+                outputs.append(collate_fn(batch))
+                self.check_equal(outputs[-1], default_collate_fn(batch))
+            # batches from reused buffers are overwritten
+            if not varying_shape:
+                self.assertEqual(outputs[0]['image'][0, 0, 0], 8)
+
+    def test_mismatch(self):
+        collate_fn = _SchemaCollator(max_mismatches=2)
+        batch = [{'a': np.zeros([2]), 'b': 1}, {'a': np.ones([2]), 'b': 2}]
+        self.check_equal(collate_fn(batch), default_collate_fn(batch))
+        for batch in [
+            [{'a': np.zeros([2]), 'b': 1}, {'a': np.ones([3]), 'b': 2}],
+            [{'a': np.zeros([2]), 'b': 1, 'c': 2}, {'a': np.ones([2]), 'b': 2}],
+        ]:
+            with self.assertRaises((KeyError, ValueError)):
+                default_collate_fn(batch)
+            with self.assertRaises((KeyError, ValueError)):
+                collate_fn(batch)
+        batch = [{'a': np.zeros([2]), 'b': 1}, {'a': np.ones([2]), 'b': 2.5}]
+        self.check_equal(collate_fn(batch), default_collate_fn(batch))
+        self.assertTrue(collate_fn._disabled)
+
+    def run_main(self, num_workers, use_shared_memory, varying_shape):
+        place = paddle.CPUPlace()
+        with fluid.dygraph.guard(place):
+            dataset = FixedShapeDataset(20, varying_shape)
+            dataloader = DataLoader(
+                dataset,
+                places=place,
+                num_workers=num_workers,
+                batch_size=4,
+                use_shared_memory=use_shared_memory,
+            )
+            for i, data in enumerate(dataloader()):
+                expect = default_collate_fn(
+                    [dataset[j] for j in range(i * 4, i * 4 + 4)]
+                )
+                np.testing.assert_array_equal(
+                    data['image'].numpy(), expect['image']
+                )
+                np.testing.assert_array_equal(
+                    data['label'].numpy(), expect['label']
+                )
+                self.assertEqual(data['name'], expect['name'])
+                np.testing.assert_array_equal(
+                    data['extra'][0].numpy(), expect['extra'][0]
+                )
+
+    def test_dataloader(self):
+        for num_workers in [0, 2]:
+            for use_shared_memory in [True, False]:
+                for varying_shape in [False, True]:
+                    self.run_main(num_workers, use_shared_memory, varying_shape)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,119 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset, IterableDataset
+
+
+class SlowSampleDataset(Dataset):
+    def __init__(self, sample_num, slow_idx=(), sleep_time=0.5):
+        self.sample_num = sample_num
+        self.slow_idx = set(slow_idx)
+        self.sleep_time = sleep_time
+
+    def __getitem__(self, idx):
+        if idx in self.slow_idx:
+            time.sleep(self.sleep_time)
+        return np.array([idx], dtype='int64')
+
+    def __len__(self):
+        return self.sample_num
+
+
+class RangeIterableDataset(IterableDataset):
+    def __iter__(self):
+        for i in range(8):
+            yield np.array([i], dtype='int64')
+
+
+class TestDataLoaderDispatchPolicy(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.sample_num = 40
+        self.batch_size = 2
+
+    def run_loader(self, in_order, dispatch_policy, persistent_workers=False):
+        dataset = SlowSampleDataset(self.sample_num, slow_idx=[0])
+        loader = DataLoader(
+            dataset,
+            batch_size=self.batch_size,
+            num_workers=2,
+            in_order=in_order,
+            dispatch_policy=dispatch_policy,
+            persistent_workers=persistent_workers,
+        )
+        epoch_num = 2 if persistent_workers else 1
+        for _ in range(epoch_num):
+            loader_iter = iter(loader)
+            ids = [data.numpy().flatten() for data in loader_iter]
+            ids = np.concatenate(ids)
+        return ids, loader_iter
+
+    def test_in_order(self):
+        for dispatch_policy in ['round_robin', 'shared_queue']:
+            ids, _ = self.run_loader(True, dispatch_policy)
+            np.testing.assert_array_equal(ids, np.arange(self.sample_num))
+
+    def test_not_in_order(self):
+        for dispatch_policy in ['round_robin', 'shared_queue']:
+            ids, loader_iter = self.run_loader(False, dispatch_policy)
+            # the slow first batch does not block other batches
+            self.assertNotEqual(ids[0], 0)
+            np.testing.assert_array_equal(
+                np.sort(ids), np.arange(self.sample_num)
+            )
+
+    def test_persistent_workers(self):
+        for dispatch_policy in ['round_robin', 'shared_queue']:
+            ids, loader_iter = self.run_loader(
+                True, dispatch_policy, persistent_workers=True
+            )
+            np.testing.assert_array_equal(ids, np.arange(self.sample_num))
+
+    def test_worker_stats(self):
+        ids, loader_iter = self.run_loader(True, 'shared_queue')
+        stats = loader_iter.worker_stats()
+        self.assertEqual(len(stats), 2)
+        self.assertEqual(
+            sum(s['batches'] for s in stats),
+            self.sample_num // self.batch_size,
+        )
+        self.assertGreaterEqual(max(s['max_latency'] for s in stats), 0.5)
+
+    def test_invalid_dispatch_policy(self):
+        with self.assertRaises(ValueError):
+            DataLoader(
+                SlowSampleDataset(self.sample_num),
+                num_workers=2,
+                dispatch_policy='random',
+            )
+
+    def test_iterable_dataset(self):
+        loader = DataLoader(
+            RangeIterableDataset(),
+            batch_size=2,
+            num_workers=1,
+            dispatch_policy='shared_queue',
+        )
+        self.assertEqual(loader.dispatch_policy, 'round_robin')
+        self.assertEqual(len(list(loader)), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+
+
+class RangeDataset(Dataset):
+    def __init__(self, sample_num, shape):
+        self.sample_num = sample_num
+        self.shape = shape
+
+    def __getitem__(self, idx):
+        image = np.full(self.shape, idx, dtype='float32')
+        label = np.array([idx], dtype='int64')
+        return image, {'label': label, 'id': idx}
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestDataLoaderShmRing(unittest.TestCase):
+    def setUp(self):
+        self.sample_num = 100
+        self.batch_size = 4
+        self.shape = [3, 8, 8]
+        self.slab_size = 1024 * 1024
+        os.environ['FLAGS_dataloader_use_shm_ring'] = '1'
+        os.environ['FLAGS_dataloader_shm_ring_slab_size'] = str(self.slab_size)
+
+    def tearDown(self):
+        os.environ.pop('FLAGS_dataloader_use_shm_ring', None)
+        os.environ.pop('FLAGS_dataloader_shm_ring_slab_size', None)
+
+    def check_loader(self, persistent_workers=False, epoch_num=2):
+        paddle.disable_static()
+        dataset = RangeDataset(self.sample_num, self.shape)
+        loader = DataLoader(
+            dataset,
+            batch_size=self.batch_size,
+            num_workers=2,
+            persistent_workers=persistent_workers,
+        )
+        for _ in range(epoch_num):
+            for i, (image, info) in enumerate(loader()):
+                expect = np.arange(
+                    i * self.batch_size, (i + 1) * self.batch_size
+                )
+                self.assertEqual(
+                    list(image.shape), [self.batch_size] + self.shape
+                )
+                np.testing.assert_array_equal(
+                    image.numpy()[:, 0, 0, 0], expect.astype('float32')
+                )
+                np.testing.assert_array_equal(
+                    info['label'].numpy().flatten(), expect
+                )
+                np.testing.assert_array_equal(info['id'].numpy(), expect)
+            self.assertEqual(i + 1, len(loader))
+
+    def test_main(self):
+        self.check_loader()
+
+    def test_persistent_workers(self):
+        self.check_loader(persistent_workers=True, epoch_num=3)
+
+    def test_fall_back_large_batch(self):
+        # batches larger than slab fall back to memory map files
+        self.shape = [3, 256, 256]
+        self.check_loader(epoch_num=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+
+
+class TestOptimizerParamsGrads(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        paddle.seed(2023)
+        self.model = paddle.nn.Sequential(
+            paddle.nn.Linear(4, 4), paddle.nn.Linear(4, 2)
+        )
+        self.input = paddle.randn([3, 4])
+
+    def backward(self, layers=None):
+        layers = layers if layers is not None else self.model
+        paddle.mean(layers(self.input)).backward()
+
+    def test_get_params_grads(self):
+        params = self.model.parameters()
+        optimizer = paddle.optimizer.SGD(parameters=params)
+        # the second layer gets no gradients
+        self.backward(self.model[:1])
+        params_grads = optimizer._get_params_grads(params)
+        self.assertEqual(
+            [p.name for p, _ in params_grads], [p.name for p in params[:2]]
+        )
+        for param, grad in params_grads:
+            np.testing.assert_array_equal(
+                grad.numpy(), param._grad_ivar().numpy()
+            )
+
+        # stop_gradient changed after the gradients are computed
+        params[0].stop_gradient = True
+        params_grads = optimizer._get_params_grads(params)
+        self.assertEqual([p.name for p, _ in params_grads], [params[1].name])
+        params[0].stop_gradient = False
+        params_grads = optimizer._get_params_grads(params)
+        self.assertEqual(len(params_grads), 2)
+
+    def check_frozen(self, optimizer, frozen):
+        for step in range(2):
+            # toggle the stop_gradient after the backward between steps
+            before = [p.numpy() for p in self.model.parameters()]
+            self.backward()
+            frozen.stop_gradient = step == 0
+            optimizer.step()
+            optimizer.clear_grad()
+            after = [p.numpy() for p in self.model.parameters()]
+            for param, value, new_value in zip(
+                self.model.parameters(), before, after
+            ):
+                if param is frozen and step == 0:
+                    np.testing.assert_array_equal(value, new_value)
+                else:
+                    self.assertFalse(np.array_equal(value, new_value))
+
+    def test_step_with_stop_gradient(self):
+        for opt_class in [
+            paddle.optimizer.SGD,
+            paddle.optimizer.Adam,
+            paddle.optimizer.AdamW,
+        ]:
+            self.setUp()
+            optimizer = opt_class(
+                learning_rate=0.1, parameters=self.model.parameters()
+            )
+            self.check_frozen(optimizer, self.model[1].weight)
+
+    def test_step_with_param_groups(self):
+        for opt_class in [
+            paddle.optimizer.SGD,
+            paddle.optimizer.Adam,
+            paddle.optimizer.AdamW,
+        ]:
+            self.setUp()
+            optimizer = opt_class(
+                learning_rate=0.1,
+                parameters=[
+                    {'params': self.model[0].parameters()},
+                    {
+                        'params': self.model[1].parameters(),
+                        'learning_rate': 0.5,
+                    },
+                ],
+            )
+            self.check_frozen(optimizer, self.model[0].bias)
+
+
+if __name__ == '__main__':
+    unittest.main()
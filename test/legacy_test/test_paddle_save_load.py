@@ -16,6 +16,7 @@ import os
 import tempfile
 import unittest
 from io import BytesIO
+from unittest import mock
 
 import numpy as np
 from test_imperative_base import new_program_scope
@@ -25,6 +26,7 @@ import paddle.optimizer as opt
 from paddle import fluid, nn
 from paddle.fluid import framework
 from paddle.fluid.optimizer import Adam
+from paddle.framework import sharded_io
 from paddle.optimizer.lr import LRScheduler
 
 BATCH_SIZE = 16
@@ -119,6 +121,110 @@ class TestSaveLoadLargeParameters(unittest.TestCase):
             np.testing.assert_array_equal(dict_load[key], value.numpy())
 
 
+class TestSaveLoadSharded(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_sharded_save_load(self):
+        paddle.disable_static()
+        paddle.set_device("cpu")
+        layer = LinearNet()
+        adam = opt.Adam(learning_rate=0.001, parameters=layer.parameters())
+        x = paddle.randn([4, IMAGE_SIZE], dtype='float32')
+        paddle.mean(layer(x)).backward()
+        adam.step()
+        obj = {
+            'model': layer.state_dict(),
+            'opt': adam.state_dict(),
+            'epoch': 10,
+            'array': np.arange(6).reshape([2, 3]),
+        }
+        path = os.path.join(self.temp_dir.name, "sharded_ckpt")
+        paddle.save(obj, path, num_shards=3, num_threads=2)
+        self.assertTrue(os.path.isdir(path))
+
+        load_obj = paddle.load(path)
+        self.assertEqual(load_obj['epoch'], 10)
+        for key, value in obj['model'].items():
+            self.assertIsInstance(load_obj['model'][key], paddle.Tensor)
+            self.assertEqual(load_obj['model'][key].name, value.name)
+            np.testing.assert_array_equal(
+                load_obj['model'][key].numpy(), value.numpy()
+            )
+        for key, value in obj['opt'].items():
+            if isinstance(value, paddle.Tensor):
+                np.testing.assert_array_equal(
+                    load_obj['opt'][key].numpy(), value.numpy()
+                )
+        np.testing.assert_array_equal(load_obj['array'].numpy(), obj['array'])
+
+        # load partially and memory mapped
+        load_obj = paddle.load(path, keys=['model'], mmap=True)
+        self.assertEqual(list(load_obj.keys()), ['model'])
+        for key, value in obj['model'].items():
+            self.assertIsInstance(load_obj['model'][key], np.ndarray)
+            self.assertFalse(load_obj['model'][key].flags.writeable)
+            np.testing.assert_array_equal(load_obj['model'][key], value.numpy())
+
+        with self.assertRaises(KeyError):
+            paddle.load(path, keys=['not_exist'])
+        with self.assertRaises(ValueError):
+            paddle.save(obj, path, num_shards=0)
+
+    def shard_files(self, path):
+        return sorted(f for f in os.listdir(path) if f.startswith('shard_'))
+
+    def test_resave_fewer_shards(self):
+        paddle.disable_static()
+        obj = {'w%d' % i: paddle.randn([4, 4]) for i in range(4)}
+        path = os.path.join(self.temp_dir.name, "sharded_ckpt")
+        paddle.save(obj, path, num_shards=4)
+        self.assertEqual(len(self.shard_files(path)), 4)
+        paddle.save({'w0': obj['w0']}, path, num_shards=4)
+        # shards of the previous checkpoint are removed
+        self.assertEqual(len(self.shard_files(path)), 1)
+        load_obj = paddle.load(path)
+        self.assertEqual(list(load_obj.keys()), ['w0'])
+        np.testing.assert_array_equal(load_obj['w0'].numpy(), obj['w0'].numpy())
+
+    def test_resave_keeps_previous_checkpoint(self):
+        paddle.disable_static()
+        obj = {'w%d' % i: paddle.randn([4, 4]) for i in range(4)}
+        path = os.path.join(self.temp_dir.name, "sharded_ckpt")
+        paddle.save(obj, path, num_shards=2)
+        shard_files = self.shard_files(path)
+        mmap_obj = paddle.load(path, mmap=True)
+
+        # a failed saving leaves the previous checkpoint intact
+        write_shard = sharded_io._write_shard
+
+        def failed_write_shard(file_path, items):
+            write_shard(file_path, items)
+            raise OSError("disk full")
+
+        new_obj = {key: value + 1 for key, value in obj.items()}
+        with mock.patch.object(sharded_io, '_write_shard', failed_write_shard):
+            with self.assertRaises(OSError):
+                paddle.save(new_obj, path, num_shards=2)
+        self.assertEqual(self.shard_files(path), shard_files)
+        load_obj = paddle.load(path)
+        for key, value in obj.items():
+            np.testing.assert_array_equal(load_obj[key].numpy(), value.numpy())
+
+        # memory mapped tensors of the previous checkpoint are unchanged
+        paddle.save(new_obj, path, num_shards=2)
+        self.assertEqual(set(self.shard_files(path)) & set(shard_files), set())
+        load_obj = paddle.load(path)
+        for key, value in obj.items():
+            np.testing.assert_array_equal(mmap_obj[key], value.numpy())
+            np.testing.assert_array_equal(
+                load_obj[key].numpy(), new_obj[key].numpy()
+            )
+
+
 class TestSaveLoadPickle(unittest.TestCase):
     def setUp(self):
         self.temp_dir = tempfile.TemporaryDirectory()
@@ -0,0 +1,78 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Benchmark of the KL threshold search of post-training quantization on
+# hists of activations of `--vars` variables, comparing the search looping
+# in Python, the vectorized search and the vectorized search running in
+# parallel across variables. The Python loop is only run on `--ref-vars`
+# variables since it takes seconds per variable.
+#
+# Usage: python benchmark_cal_kl_threshold.py --vars 200 --bins 2048
+
+import argparse
+import time
+
+from test_cal_kl_threshold import random_hists, reference_cal_kl_threshold
+
+from paddle.static.quantization.cal_kl_threshold import (
+    cal_kl_threshold,
+    cal_kl_thresholds,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--vars', type=int, default=200)
+    parser.add_argument('--ref-vars', type=int, default=2)
+    parser.add_argument('--bins', type=int, default=2048)
+    parser.add_argument('--bits', type=int, default=8)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    hists = random_hists(0, args.vars, args.bins)
+    bin_widths = [0.01] * args.vars
+
+    start = time.perf_counter()
+    ref_thresholds = [
+        reference_cal_kl_threshold(hist, 0.01, args.bits)
+        for hist in hists[: args.ref_vars]
+    ]
+    ref_time = (time.perf_counter() - start) / max(args.ref_vars, 1)
+
+    start = time.perf_counter()
+    thresholds = [cal_kl_threshold(hist, 0.01, args.bits) for hist in hists]
+    vec_time = (time.perf_counter() - start) / args.vars
+
+    start = time.perf_counter()
+    parallel_thresholds = cal_kl_thresholds(
+        hists, bin_widths, args.bits, args.workers
+    )
+    parallel_time = (time.perf_counter() - start) / args.vars
+
+    assert thresholds[: args.ref_vars] == ref_thresholds
+    assert parallel_thresholds == thresholds
+    print(f'{args.vars} vars, {args.bins} bins, {args.bits} bits')
+    for name, t in [
+        ('python loop', ref_time),
+        ('vectorized', vec_time),
+        ('vectorized parallel', parallel_time),
+    ]:
+        print(
+            f'{name:>20}: {t * 1000:10.3f} ms/var, '
+            f'{t * args.vars:8.3f} s for all vars'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+from paddle.static.quantization import cal_kl_threshold as kl
+
+
+def reference_cal_kl_threshold(hist, bin_width, bits):
+    # the search looping over candidates and bins in Python
+    hist_bins = hist.shape[0]
+    starting_iter = int((hist_bins - 1) * 0.5)
+    quant_range = 2 ** (bits - 1) - 1
+    P_sum = np.sum(np.array(hist).ravel())
+    min_kl_divergence = 0
+    min_kl_index = 0
+    kl_inited = False
+    for i in range(starting_iter, hist_bins):
+        reference_distr_P = hist[0:i].tolist()
+        outliers_count = sum(hist[i:])
+        if reference_distr_P[i - 1] == 0:
+            continue
+        reference_distr_P[i - 1] += outliers_count
+        reference_distr_bins = reference_distr_P[:]
+        candidate_distr_Q = hist[0:i].tolist()
+        num_merged_bins = int(i / quant_range)
+        candidate_distr_Q_quantized = [0] * quant_range
+        j_start = 0
+        j_end = num_merged_bins
+        for idx in range(quant_range):
+            candidate_distr_Q_quantized[idx] = sum(
+                candidate_distr_Q[j_start:j_end]
+            )
+            j_start += num_merged_bins
+            j_end += num_merged_bins
+            if (idx + 1) == quant_range - 1:
+                j_end = i
+        candidate_distr_Q = kl.expand_quantized_bins(
+            candidate_distr_Q_quantized, reference_distr_bins
+        )
+        Q_sum = sum(candidate_distr_Q)
+        kl_divergence = kl.safe_entropy(
+            reference_distr_P, P_sum, candidate_distr_Q, Q_sum
+        )
+        if not kl_inited or kl_divergence < min_kl_divergence:
+            min_kl_divergence = kl_divergence
+            min_kl_index = i
+            kl_inited = True
+    if min_kl_index == 0:
+        while starting_iter > 0:
+            if hist[starting_iter] == 0:
+                starting_iter -= 1
+                continue
+            else:
+                break
+        min_kl_index = starting_iter
+    return (min_kl_index + 0.5) * bin_width
+
+
+def random_hists(seed, num_hists, bins):
+    rng = np.random.RandomState(seed)
+    hists = []
+    for i in range(num_hists):
+        if i % 3 == 0:
+            x = np.abs(rng.randn(10000))
+        elif i % 3 == 1:
+            x = np.abs(rng.laplace(size=10000))
+        else:
+            x = np.abs(rng.standard_cauchy(10000))
+        hist, _ = np.histogram(x, bins=bins)
+        # sparse hists with zero bins
+        if i % 2 == 1:
+            hist[rng.rand(bins) < 0.3] = 0
+        hists.append(hist)
+    return hists
+
+
+class TestCalKLThreshold(unittest.TestCase):
+    def test_same_as_reference(self):
+        for bits in [2, 4, 8]:
+            for bins in [5, 64, 300, 1024]:
+                for hist in random_hists(bins + bits, 4, bins):
+                    self.assertEqual(
+                        kl.cal_kl_threshold(hist, 0.01, bits),
+                        reference_cal_kl_threshold(hist, 0.01, bits),
+                    )
+
+    def test_chunks(self):
+        chunk_size = kl._KL_CHUNK_SIZE
+        kl._KL_CHUNK_SIZE = 100
+        try:
+            for hist in random_hists(0, 4, 300):
+                self.assertEqual(
+                    kl.cal_kl_threshold(hist, 0.01, 8),
+                    reference_cal_kl_threshold(hist, 0.01, 8),
+                )
+        finally:
+            kl._KL_CHUNK_SIZE = chunk_size
+
+    def test_no_candidate(self):
+        hist = np.zeros([100])
+        hist[10] = 5
+        self.assertEqual(kl.cal_kl_threshold(hist, 0.1, 8), 10.5 * 0.1)
+        self.assertEqual(
+            kl.cal_kl_threshold(hist, 0.1, 8),
+            reference_cal_kl_threshold(hist, 0.1, 8),
+        )
+
+    def test_parallel(self):
+        hists = random_hists(1, 8, 512)
+        bin_widths = [0.1 * (i + 1) for i in range(8)]
+        expected = [
+            kl.cal_kl_threshold(hist, bin_width, 8)
+            for hist, bin_width in zip(hists, bin_widths)
+        ]
+        for num_workers in [1, 4]:
+            self.assertEqual(
+                kl.cal_kl_thresholds(hists, bin_widths, 8, num_workers),
+                expected,
+            )
+        self.assertEqual(kl.cal_kl_thresholds([], [], 8), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
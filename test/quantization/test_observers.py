@@ -0,0 +1,203 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import paddle
+from paddle.nn import Conv2D, Linear
+from paddle.nn.quant.format import LinearDequanter
+from paddle.quantization import PTQ, QuantConfig
+from paddle.quantization.observers import (
+    AbsMaxChannelWiseWeightObserver,
+    HistObserver,
+    KLObserver,
+    MSEObserver,
+)
+from paddle.quantization.observers.hist import BaseHistObserverLayer
+from paddle.static.quantization.cal_kl_threshold import cal_kl_threshold
+from paddle.static.quantization.histogram import search_threshold
+
+
+class TestHistObservers(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(2023)
+        # the range of later batches grows, so that bins are merged
+        self.batches = [
+            np.random.standard_t(4, size=[8, 256]).astype("float32") * i
+            for i in [1.0, 1.5, 5.0, 0.5, 40.0]
+        ]
+        self.data = np.concatenate([batch.ravel() for batch in self.batches])
+        self.abs_max = float(np.max(np.abs(self.data)))
+        self.upper = 2.0 ** math.ceil(math.log2(self.abs_max))
+        self.bins = 2048
+
+    def observe(self, factory):
+        observer = factory._instance(Linear(4, 4))
+        for batch in self.batches:
+            out = observer(paddle.to_tensor(batch))
+            np.testing.assert_array_equal(out.numpy(), batch)
+        return observer
+
+    def expected_hist(self, data):
+        hist, _ = np.histogram(data, bins=self.bins, range=(0.0, self.upper))
+        nonzero = np.nonzero(hist)[0]
+        return hist[: nonzero[-1] + 1], self.upper / self.bins
+
+    def test_hist_state(self):
+        observer = self.observe(KLObserver())
+        self.assertEqual(observer._upper, self.upper)
+        self.assertAlmostEqual(
+            float(observer.abs_max_val), self.abs_max, places=4
+        )
+        pos_hist = observer.pos_hist.numpy()
+        neg_hist = observer.neg_hist.numpy()
+        self.assertEqual(int(pos_hist.sum()), int(np.sum(self.data >= 0)))
+        self.assertEqual(int(neg_hist.sum()), int(np.sum(self.data < 0)))
+        # merged bins are the bins of the final width, except elements
+        # on the edges of bins rounded to the neighbours
+        expected_pos, _ = self.expected_hist(self.data[self.data >= 0])
+        np.testing.assert_allclose(
+            pos_hist[: len(expected_pos)], expected_pos, atol=2
+        )
+
+    def test_kl_observer(self):
+        observer = self.observe(KLObserver())
+        hist, bin_width = self.expected_hist(np.abs(self.data))
+        expected = cal_kl_threshold(hist, bin_width, 8)
+        self.assertAlmostEqual(
+            float(observer.scales()), expected, delta=2 * bin_width
+        )
+        self.assertEqual(observer.quant_axis(), -1)
+        self.assertEqual(observer.bit_length(), 8)
+
+    def test_hist_observer(self):
+        observer = self.observe(HistObserver(hist_percent=0.999))
+        _, bin_width = self.expected_hist(np.abs(self.data))
+        # the smallest value whose cdf reaches the percent
+        sorted_data = np.sort(np.abs(self.data))
+        expected = sorted_data[int(math.ceil(0.999 * len(sorted_data))) - 1]
+        self.assertAlmostEqual(
+            float(observer.scales()), expected, delta=2 * bin_width
+        )
+
+    def test_mse_observer(self):
+        observer = self.observe(MSEObserver())
+        expected, _ = search_threshold(
+            observer.neg_hist.numpy(),
+            observer.pos_hist.numpy(),
+            self.upper / self.bins,
+            self.abs_max,
+            8,
+            algo="mse",
+            onnx_format=True,
+        )
+        scale = float(observer.scales())
+        self.assertAlmostEqual(scale, expected, places=3)
+        self.assertLessEqual(scale, self.abs_max * 1.0001)
+
+    def test_scales_updated(self):
+        observer = self.observe(HistObserver(hist_percent=1.0))
+        first_scale = float(observer.scales())
+        observer(paddle.to_tensor(self.batches[-1] * 4.0))
+        self.assertGreater(float(observer.scales()), first_scale)
+
+
+class TestAbsMaxChannelWiseWeightObserver(unittest.TestCase):
+    def check(self, layer, axis):
+        observer = AbsMaxChannelWiseWeightObserver()._instance(layer)
+        weight = layer.weight
+        observer(weight)
+        observer(weight * 0.5)
+        reduce_axis = tuple(i for i in range(len(weight.shape)) if i != axis)
+        expected = np.max(np.abs(weight.numpy()), axis=reduce_axis)
+        np.testing.assert_allclose(observer.scales().numpy(), expected)
+        self.assertEqual(observer.quant_axis(), axis)
+
+    def test_linear(self):
+        self.check(Linear(6, 3), 1)
+
+    def test_conv2d(self):
+        self.check(Conv2D(2, 5, 3), 0)
+
+
+class TestPTQWithHistObservers(unittest.TestCase):
+    def test_convert(self):
+        model = paddle.nn.Sequential(
+            Conv2D(1, 4, 3),
+            paddle.nn.ReLU(),
+            paddle.nn.Flatten(),
+            Linear(36, 2),
+        )
+        model.eval()
+        q_config = QuantConfig(
+            activation=KLObserver(),
+            weight=AbsMaxChannelWiseWeightObserver(),
+        )
+        ptq = PTQ(q_config)
+        quant_model = ptq.quantize(model)
+        for _ in range(4):
+            quant_model(paddle.rand([2, 1, 5, 5], dtype="float32"))
+        converted_model = ptq.convert(quant_model)
+        image = paddle.rand([1, 1, 5, 5], dtype="float32")
+        out = converted_model(image)
+        self.assertEqual(out.shape, [1, 2])
+        self.assertGreater(
+            len(
+                [
+                    layer
+                    for layer in converted_model.sublayers(True)
+                    if isinstance(layer, LinearDequanter)
+                ]
+            ),
+            0,
+        )
+
+    def test_sync_once(self):
+        # the quantized layer is nested two levels deep
+        model = paddle.nn.Sequential(
+            paddle.nn.Sequential(paddle.nn.Sequential(Linear(4, 4)))
+        )
+        model.eval()
+        ptq = PTQ(QuantConfig(activation=HistObserver(), weight=None))
+        quant_model = ptq.quantize(model)
+        quant_model(paddle.rand([8, 4], dtype="float32"))
+        observers = [
+            layer
+            for layer in quant_model.sublayers()
+            if isinstance(layer, BaseHistObserverLayer)
+        ]
+        self.assertEqual(len(observers), 1)
+        count = int(observers[0].pos_hist.sum() + observers[0].neg_hist.sum())
+
+        def all_reduce(tensor, op=paddle.distributed.ReduceOp.SUM):
+            # the sum of 2 ranks with the same statistics
+            if op == paddle.distributed.ReduceOp.SUM:
+                tensor.set_value(tensor * 2)
+
+        with mock.patch.object(
+            PTQ, '_is_parallel_training', return_value=True
+        ), mock.patch('paddle.distributed.all_reduce', all_reduce):
+            ptq.convert(quant_model, inplace=True)
+        observer = observers[0]
+        self.assertEqual(
+            int(observer.pos_hist.sum() + observer.neg_hist.sum()), 2 * count
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
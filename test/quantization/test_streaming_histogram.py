@@ -0,0 +1,139 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+from paddle.static.quantization.histogram import StreamingHistogram
+
+
+def quant_dequant(x, scale, bits, onnx_format):
+    bins = 2 ** (bits - 1) - 1
+    if onnx_format:
+        quant_x = np.clip(np.round(x / scale * bins), -bins - 1, bins)
+        return quant_x / bins * scale
+    return np.round(np.clip(x, 0.0, scale) / scale * bins) / bins * scale
+
+
+def reference_loss(x, scale, bits, algo, onnx_format):
+    quant_dequant_x = quant_dequant(x, scale, bits, onnx_format)
+    if algo == "mse":
+        return ((x - quant_dequant_x) ** 2).mean()
+    return np.abs(np.mean(x) - np.mean(quant_dequant_x)) + np.abs(
+        np.std(x) - np.std(quant_dequant_x)
+    )
+
+
+def reference_search(x, bits, algo, onnx_format):
+    # quantize the data once for each candidate
+    abs_max = float(np.max(np.abs(x)))
+    best_loss = float('inf')
+    best_scale = None
+    s = 0.3
+    while s <= 1.0:
+        scale = s * abs_max
+        s += 0.02
+        loss = reference_loss(x, scale, bits, algo, onnx_format)
+        if loss <= best_loss:
+            best_loss = loss
+            best_scale = scale
+    return best_scale, best_loss
+
+
+class TestStreamingHistogram(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(2023)
+        # the range of later batches grows, so that bins are merged
+        self.batches = [
+            np.random.standard_t(4, size=[8, 256]).astype("float32") * i
+            for i in [1.0, 1.5, 5.0, 0.5, 40.0]
+        ]
+        self.data = np.concatenate([batch.ravel() for batch in self.batches])
+
+    def build(self, bins=2048):
+        histogram = StreamingHistogram(bins)
+        for batch in self.batches:
+            histogram.update(batch)
+        return histogram
+
+    def test_counts(self):
+        histogram = self.build()
+        abs_max = float(np.max(np.abs(self.data)))
+        self.assertAlmostEqual(histogram.abs_max, abs_max, places=5)
+        self.assertGreaterEqual(histogram.upper, abs_max)
+        self.assertEqual(
+            int(histogram.pos_hist.sum()), int(np.sum(self.data >= 0))
+        )
+        self.assertEqual(
+            int(histogram.neg_hist.sum()), int(np.sum(self.data < 0))
+        )
+
+    def test_abs_hist(self):
+        histogram = self.build()
+        hist, bin_width = histogram.abs_hist()
+        self.assertGreater(hist[-1], 0)
+        self.assertEqual(int(hist.sum()), self.data.size)
+        # merged bins are the bins of the final width, except elements
+        # on the edges of bins rounded to the neighbours
+        expected, _ = np.histogram(
+            np.abs(self.data),
+            bins=histogram.bins,
+            range=(0.0, histogram.upper),
+        )
+        np.testing.assert_allclose(hist, expected[: len(hist)], atol=2)
+        self.assertAlmostEqual(bin_width, histogram.upper / histogram.bins)
+
+    def test_merge_beyond_bins(self):
+        histogram = StreamingHistogram(16)
+        histogram.update(np.array([0.5, -1.0]))
+        histogram.update(np.array([1e6]))
+        hist, bin_width = histogram.abs_hist()
+        self.assertEqual(int(hist.sum()), 3)
+        self.assertEqual(int(hist[0]), 2)
+        self.assertGreaterEqual(bin_width * len(hist), 1e6)
+
+    def test_zeros(self):
+        histogram = StreamingHistogram(16)
+        histogram.update(np.zeros([4]))
+        histogram.update(np.array([], dtype="float32"))
+        hist, _ = histogram.abs_hist()
+        self.assertEqual(int(hist.sum()), 4)
+        threshold, _ = histogram.search_threshold(8, "mse")
+        self.assertGreater(threshold, 0.0)
+
+    def test_search_threshold(self):
+        histogram = self.build()
+        for algo in ["mse", "emd"]:
+            for onnx_format in [False, True]:
+                threshold, loss = histogram.search_threshold(
+                    8, algo, onnx_format
+                )
+                _, best_loss = reference_search(self.data, 8, algo, onnx_format)
+                # the loss of the threshold on the exact data is close to
+                # the best one of the exhaustive search
+                exact_loss = reference_loss(
+                    self.data, threshold, 8, algo, onnx_format
+                )
+                if algo == "mse":
+                    self.assertLessEqual(exact_loss, best_loss * 1.05)
+                else:
+                    self.assertLessEqual(
+                        exact_loss - best_loss, 1e-3 * np.std(self.data)
+                    )
+                self.assertGreater(loss, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()